@@ -189,6 +189,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=CORS_METHODS,
     allow_headers=CORS_HEADERS,
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Configure rate limiting
@@ -208,6 +209,16 @@ from backend.services.external.firebase_logging import (
 )
 
 
+@app.on_event("shutdown")
+async def dispose_async_database():
+    """Close pooled async database connections on shutdown."""
+    from backend.infrastructure.persistence.async_database import (
+        dispose_async_engine,
+    )
+
+    await dispose_async_engine()
+
+
 # Configure security logging middleware
 @app.middleware("http")
 async def security_logging_middleware(request: Request, call_next):
@@ -19,14 +19,14 @@ from backend.database import SessionLocal
 from backend.infrastructure.persistence.simulation_repository import (
     SimulationRepository,
 )
-from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.api.dependencies import get_container
 from backend.models import AnalysisResult
 from backend.schemas import DetailedAnalysisResult
 
 logger = logging.getLogger(__name__)
 
 # Shared orchestrator instance
-orchestrator = SimulationOrchestrator(use_parallel=True, max_concurrent=12)
+orchestrator = SimulationOrchestrator(use_parallel=True)
 
 
 async def resolve_simulation(simulation_id: str) -> SimulationResponse:
@@ -37,7 +37,7 @@ async def resolve_simulation(simulation_id: str) -> SimulationResponse:
         return cached
 
     # Fallback to persisted simulation in the database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with get_container().get_async_unit_of_work() as uow:
         repo = SimulationRepository(uow.session)
         db_simulation = await repo.get_by_simulation_id(simulation_id)
 
@@ -51,7 +51,7 @@ from backend.infrastructure.persistence.simulation_repository import (
 from backend.infrastructure.persistence.pipeline_run_repository import (
     PipelineRunRepository,
 )
-from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.api.dependencies import get_container
 from backend.models import AnalysisResult
 from backend.schemas import DetailedAnalysisResult
 from backend.services.adapters.persona_adapters import from_ssot_to_frontend
@@ -78,7 +78,7 @@ async def _resolve_simulation(simulation_id: str) -> SimulationResponse:
         return cached
 
     # 2) Fallback to persisted simulation in the database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with get_container().get_async_unit_of_work() as uow:
         repo = SimulationRepository(uow.session)
         db_simulation = await repo.get_by_simulation_id(simulation_id)
 
@@ -374,7 +374,7 @@ async def _load_analysis(analysis_id: str) -> Dict[str, Any]:
 
 
 # Reuse the same orchestrator configuration as the Simulation Bridge router.
-orchestrator = SimulationOrchestrator(use_parallel=True, max_concurrent=12)
+orchestrator = SimulationOrchestrator(use_parallel=True)
 
 
 def _simulation_to_nlp_format(simulation: SimulationResponse) -> Dict[str, Any]:
@@ -1442,7 +1442,7 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
     created_at = datetime.utcnow()
 
     # Persist pipeline run to database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with get_container().get_async_unit_of_work() as uow:
         repo = PipelineRunRepository(uow.session)
         await repo.create_pipeline_run(
             job_id=job_id,
@@ -1465,7 +1465,7 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
         job.started_at = started_at.isoformat()
 
         # Update status in database
-        async with UnitOfWork(SessionLocal) as uow:
+        async with get_container().get_async_unit_of_work() as uow:
             repo = PipelineRunRepository(uow.session)
             await repo.update_pipeline_run_status(
                 job_id=job_id,
@@ -1502,7 +1502,7 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
                         persona_count = stage.outputs.get("persona_count")
 
             # Persist results to database
-            async with UnitOfWork(SessionLocal) as uow:
+            async with get_container().get_async_unit_of_work() as uow:
                 repo = PipelineRunRepository(uow.session)
                 await repo.update_pipeline_run_status(
                     job_id=job_id,
@@ -1535,7 +1535,7 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
             job.completed_at = completed_at.isoformat()
 
             # Persist failure to database
-            async with UnitOfWork(SessionLocal) as uow:
+            async with get_container().get_async_unit_of_work() as uow:
                 repo = PipelineRunRepository(uow.session)
                 await repo.update_pipeline_run_status(
                     job_id=job_id,
@@ -1574,7 +1574,7 @@ async def get_pipeline_job(job_id: str) -> PipelineJobStatus:
         return job
 
     # Fall back to database for historical runs
-    async with UnitOfWork(SessionLocal) as uow:
+    async with get_container().get_async_unit_of_work() as uow:
         repo = PipelineRunRepository(uow.session)
         db_run = await repo.get_by_job_id(job_id)
 
@@ -1631,7 +1631,7 @@ async def list_pipeline_runs(
     # Enforce maximum limit
     limit = min(limit, 100)
 
-    async with UnitOfWork(SessionLocal) as uow:
+    async with get_container().get_async_unit_of_work() as uow:
         repo = PipelineRunRepository(uow.session)
 
         # Get pipeline runs
@@ -1704,7 +1704,7 @@ async def get_pipeline_run_detail(job_id: str) -> PipelineRunDetail:
     """
 
     try:
-        async with UnitOfWork(SessionLocal) as uow:
+        async with get_container().get_async_unit_of_work() as uow:
             repo = PipelineRunRepository(uow.session)
             db_run = await repo.get_by_job_id(job_id)
 
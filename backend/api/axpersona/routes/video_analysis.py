@@ -6,14 +6,15 @@ It processes video URLs and generates department-specific annotations
 (Security, Marketing, Operations) using Gemini multimodal video understanding.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import uuid
-import subprocess
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -22,6 +23,86 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# yt-dlp metadata lookups kept per URL
+METADATA_CACHE_SIZE = 256
+METADATA_TIMEOUT_SECONDS = 30
+
+# Annotations from adjacent segments with the same text starting this close
+# together are the same event reported twice at a segment boundary
+BOUNDARY_TOLERANCE_SECONDS = 5
+
+
+# ============================================================================
+# Video Metadata Resolution
+# ============================================================================
+
+class VideoMetadataError(RuntimeError):
+    """yt-dlp exited with an error for a video URL."""
+
+
+_metadata_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_metadata_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+async def _run_yt_dlp(video_url: str) -> Dict[str, Any]:
+    """Run ``yt-dlp --dump-json`` without blocking the event loop."""
+    process = await asyncio.create_subprocess_exec(
+        "yt-dlp",
+        "--dump-json",
+        "--no-download",
+        "--no-warnings",
+        video_url,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(), timeout=METADATA_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    if process.returncode != 0:
+        raise VideoMetadataError(stderr.decode(errors="replace"))
+    return json.loads(stdout)
+
+
+async def fetch_video_metadata(video_url: str) -> Dict[str, Any]:
+    """Fetch yt-dlp metadata for a URL, cached per URL.
+
+    Concurrent lookups of the same URL share one yt-dlp process. Failures are
+    not cached.
+
+    Raises:
+        asyncio.TimeoutError: yt-dlp did not finish in time
+        FileNotFoundError: yt-dlp is not installed
+        VideoMetadataError: yt-dlp reported an error
+    """
+    metadata = _metadata_cache.get(video_url)
+    if metadata is not None:
+        _metadata_cache.move_to_end(video_url)
+        return metadata
+
+    inflight = _metadata_inflight.get(video_url)
+    if inflight is None:
+        inflight = _metadata_inflight[video_url] = asyncio.ensure_future(
+            _run_yt_dlp(video_url)
+        )
+        inflight.add_done_callback(lambda task: _finish_metadata_lookup(video_url, task))
+    # A cancelled caller must not cancel the lookup shared with others
+    return await asyncio.shield(inflight)
+
+
+def _finish_metadata_lookup(video_url: str, task: "asyncio.Future[Dict[str, Any]]") -> None:
+    _metadata_inflight.pop(video_url, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    _metadata_cache[video_url] = task.result()
+    while len(_metadata_cache) > METADATA_CACHE_SIZE:
+        _metadata_cache.popitem(last=False)
+
 
 # ============================================================================
 # Gemini Video Analysis Service
@@ -78,32 +159,93 @@ class GeminiVideoAnalyzer:
             secs = seconds % 60
             return f"{minutes:02d}:{secs:02d}"
 
-    def _resolve_video_duration(self, video_url: str) -> Optional[int]:
+    async def _resolve_video_duration(self, video_url: str) -> Optional[int]:
         """Resolve video duration using yt-dlp if possible."""
         try:
-            cmd = [
-                "yt-dlp",
-                "--dump-json",
-                "--no-download",
-                "--no-warnings",
-                video_url
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                metadata = json.loads(result.stdout)
-                duration = metadata.get("duration")
-                if duration:
-                    return int(duration)
+            metadata = await fetch_video_metadata(video_url)
+            duration = metadata.get("duration")
+            if duration:
+                return int(duration)
         except Exception as e:
-            logger.warning(f"[GeminiVideoAnalyzer] Failed to resolve duration for {video_url}: {e}")
+            logger.warning(f"[GeminiVideoAnalyzer] Failed to resolve duration for {video_url}: {e!r}")
         return None
 
+    async def _analyze_segments(
+        self,
+        video_duration_seconds: int,
+        segment_size: int,
+        analyze_segment: Callable[..., Awaitable[List[Dict[str, Any]]]],
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Analyze fixed-size segments concurrently and merge their annotations.
+
+        At most ``settings.video_segment_concurrency`` segments are in flight.
+        A failed segment is logged and skipped; if every segment fails the
+        first error is raised.
+        """
+        from backend.infrastructure.config.settings import settings
+
+        total_duration = self._seconds_to_timestamp(video_duration_seconds)
+        num_segments = (video_duration_seconds + segment_size - 1) // segment_size
+        semaphore = asyncio.Semaphore(max(1, settings.video_segment_concurrency))
+
+        async def run(i: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await analyze_segment(
+                    start_offset=i * segment_size,
+                    end_offset=min((i + 1) * segment_size, video_duration_seconds),
+                    segment_num=i + 1,
+                    total_segments=num_segments,
+                    total_duration=total_duration,
+                    **kwargs,
+                )
+
+        results = await asyncio.gather(
+            *(run(i) for i in range(num_segments)), return_exceptions=True
+        )
+
+        segment_annotations = []
+        errors = []
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(f"[GeminiVideoAnalyzer] Segment {i + 1}/{num_segments} failed: {result}")
+                errors.append(result)
+            else:
+                segment_annotations.append(result)
+        if errors and not segment_annotations:
+            raise errors[0]
+
+        return self._merge_segment_annotations(segment_annotations)
+
+    def _merge_segment_annotations(
+        self, segment_annotations: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Concatenate per-segment annotations in time order, dropping boundary duplicates."""
+        merged = []
+        seen: Dict[Any, List[int]] = {}
+        for annotations in segment_annotations:
+            for ann in annotations:
+                if not isinstance(ann, dict):
+                    continue
+                start = self._parse_duration_to_seconds(
+                    str(ann.get("timestamp_start", ann.get("timestamp", "")))
+                )
+                text = " ".join(
+                    str(ann.get("description") or ann.get("summary") or "").lower().split()
+                )
+                if text:
+                    key, tolerance = text, BOUNDARY_TOLERANCE_SECONDS
+                else:
+                    key, tolerance = (None, str(ann.get("timestamp_end", ""))), 0
+                starts = seen.setdefault(key, [])
+                if any(abs(start - other) <= tolerance for other in starts):
+                    continue
+                starts.append(start)
+                merged.append((start, ann))
+
+        merged.sort(key=lambda item: item[0])
+        return [ann for _, ann in merged]
+
 
     async def _analyze_video_segment(
         self,
@@ -259,7 +401,7 @@ Return ONLY the JSON array, no other text."""
         # Validate/Resolve video duration
         if not video_duration_seconds:
             logger.info("[GeminiVideoAnalyzer] Duration not provided, attempting to resolve...")
-            video_duration_seconds = self._resolve_video_duration(video_url)
+            video_duration_seconds = await self._resolve_video_duration(video_url)
             if video_duration_seconds:
                 logger.info(f"[GeminiVideoAnalyzer] Resolved duration: {video_duration_seconds}s")
             else:
@@ -272,28 +414,15 @@ Return ONLY the JSON array, no other text."""
         if video_duration_seconds and video_duration_seconds > SEGMENT_SIZE:
             logger.info(f"[GeminiVideoAnalyzer] Using chunked analysis for {video_duration_seconds}s video")
 
-            total_duration = self._seconds_to_timestamp(video_duration_seconds)
-            all_annotations = []
-
-            # Calculate segments
-            num_segments = (video_duration_seconds + SEGMENT_SIZE - 1) // SEGMENT_SIZE
-
-            for i in range(num_segments):
-                start_offset = i * SEGMENT_SIZE
-                end_offset = min((i + 1) * SEGMENT_SIZE, video_duration_seconds)
-
-                segment_annotations = await self._analyze_video_segment(
-                    video_url=video_url,
-                    start_offset=start_offset,
-                    end_offset=end_offset,
-                    segment_num=i + 1,
-                    total_segments=num_segments,
-                    total_duration=total_duration,
-                    personas=personas
-                )
-                all_annotations.extend(segment_annotations)
+            all_annotations = await self._analyze_segments(
+                video_duration_seconds,
+                SEGMENT_SIZE,
+                self._analyze_video_segment,
+                video_url=video_url,
+                personas=personas,
+            )
 
-            logger.info(f"[GeminiVideoAnalyzer] Total annotations from {num_segments} segments: {len(all_annotations)}")
+            logger.info(f"[GeminiVideoAnalyzer] Total annotations from chunked analysis: {len(all_annotations)}")
             return all_annotations
 
         # For shorter videos or unknown duration, use single-pass analysis
@@ -527,7 +656,8 @@ Return ONLY a valid JSON array. No additional text."""
 
         Args:
             video_url: YouTube URL or other video URL
-            video_duration_seconds: Optional known video duration
+            video_duration_seconds: Optional known video duration; resolved
+                with yt-dlp when missing
 
         Returns:
             List of technical annotation dictionaries
@@ -537,6 +667,9 @@ Return ONLY a valid JSON array. No additional text."""
 
         from google.genai import types
 
+        if not video_duration_seconds:
+            video_duration_seconds = await self._resolve_video_duration(video_url)
+
         # Segment size in seconds (10 minutes per segment)
         SEGMENT_SIZE = 600
 
@@ -544,27 +677,14 @@ Return ONLY a valid JSON array. No additional text."""
         if video_duration_seconds and video_duration_seconds > SEGMENT_SIZE:
             logger.info(f"[GeminiVideoAnalyzer] Using chunked technical analysis for {video_duration_seconds}s video")
 
-            total_duration = self._seconds_to_timestamp(video_duration_seconds)
-            all_annotations = []
-
-            # Calculate segments
-            num_segments = (video_duration_seconds + SEGMENT_SIZE - 1) // SEGMENT_SIZE
-
-            for i in range(num_segments):
-                start_offset = i * SEGMENT_SIZE
-                end_offset = min((i + 1) * SEGMENT_SIZE, video_duration_seconds)
-
-                segment_annotations = await self._analyze_technical_segment(
-                    video_url=video_url,
-                    start_offset=start_offset,
-                    end_offset=end_offset,
-                    segment_num=i + 1,
-                    total_segments=num_segments,
-                    total_duration=total_duration
-                )
-                all_annotations.extend(segment_annotations)
+            all_annotations = await self._analyze_segments(
+                video_duration_seconds,
+                SEGMENT_SIZE,
+                self._analyze_technical_segment,
+                video_url=video_url,
+            )
 
-            logger.info(f"[GeminiVideoAnalyzer] Total technical annotations from {num_segments} segments: {len(all_annotations)}")
+            logger.info(f"[GeminiVideoAnalyzer] Total technical annotations from chunked analysis: {len(all_annotations)}")
             return all_annotations
 
         # For shorter videos or unknown duration, use single-pass analysis
@@ -1244,9 +1364,6 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
     **Output**
     - ``VideoMetadataResponse`` with title, duration, thumbnail, etc.
     """
-    import subprocess
-    import json as json_module
-
     logger.info(f"[Video Metadata] Fetching metadata for: {request.video_url}")
 
     # Extract video ID if it's a YouTube URL
@@ -1258,33 +1375,8 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
             video_id = request.video_url.split("youtu.be/")[1].split("?")[0]
 
     try:
-        # Use yt-dlp to extract metadata (no download)
-        cmd = [
-            "yt-dlp",
-            "--dump-json",
-            "--no-download",
-            "--no-warnings",
-            request.video_url
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            logger.error(f"[Video Metadata] yt-dlp error: {result.stderr}")
-            return VideoMetadataResponse(
-                success=False,
-                video_url=request.video_url,
-                video_id=video_id,
-                error=f"Failed to fetch metadata: {result.stderr[:200]}"
-            )
-
-        # Parse JSON output
-        metadata = json_module.loads(result.stdout)
+        # Use yt-dlp to extract metadata (no download), cached per URL
+        metadata = await fetch_video_metadata(request.video_url)
 
         # Extract duration
         duration_seconds = metadata.get("duration")
@@ -1312,7 +1404,15 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
             channel=metadata.get("channel") or metadata.get("uploader"),
         )
 
-    except subprocess.TimeoutExpired:
+    except VideoMetadataError as e:
+        logger.error(f"[Video Metadata] yt-dlp error: {e}")
+        return VideoMetadataResponse(
+            success=False,
+            video_url=request.video_url,
+            video_id=video_id,
+            error=f"Failed to fetch metadata: {str(e)[:200]}"
+        )
+    except asyncio.TimeoutError:
         logger.error("[Video Metadata] yt-dlp timeout")
         return VideoMetadataResponse(
             success=False,
@@ -1390,12 +1490,21 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
             ),
         )
 
+    technical_task: Optional[asyncio.Task] = None
     try:
         # Use Gemini multimodal video analysis
         logger.info("[Video Analysis] Starting Gemini multimodal analysis...")
         if request.video_duration_seconds:
             logger.info(f"[Video Analysis] Video duration: {request.video_duration_seconds}s (chunked analysis enabled)")
 
+        # Technical analysis for signs & navigation runs alongside the main pass
+        technical_task = asyncio.create_task(
+            analyzer.analyze_technical(
+                video_url=request.video_url,
+                video_duration_seconds=request.video_duration_seconds
+            )
+        )
+
         raw_annotations = await analyzer.analyze_video(
             video_url=request.video_url,
             custom_prompt=request.analysis_prompt,
@@ -1449,14 +1558,11 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
             logger.warning("[Video Analysis] No valid annotations, using demo")
             annotations = DEMO_ANNOTATIONS
 
-        # Now run technical analysis for signs & navigation
+        # Collect technical analysis for signs & navigation
         technical_annotations: List[TechnicalAnnotation] = []
         try:
-            logger.info("[Video Analysis] Starting technical analysis for signs & navigation...")
-            raw_technical = await analyzer.analyze_technical(
-                video_url=request.video_url,
-                video_duration_seconds=request.video_duration_seconds
-            )
+            logger.info("[Video Analysis] Waiting for technical analysis for signs & navigation...")
+            raw_technical = await technical_task
 
             for tech_ann in raw_technical:
                 try:
@@ -1544,6 +1650,8 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
 
     except Exception as e:
         logger.exception(f"[Video Analysis] Gemini analysis failed: {e}")
+        if technical_task and not technical_task.done():
+            technical_task.cancel()
         # Return demo data on error with error info
         return VideoAnalysisResponse(
             success=True,
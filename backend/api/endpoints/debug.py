@@ -6,6 +6,7 @@ These endpoints are useful for development, testing, and troubleshooting.
 """
 
 from fastapi import APIRouter, HTTPException, Request, Depends, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import logging
@@ -217,6 +218,128 @@ async def get_config():
         raise HTTPException(status_code=500, detail=f"Error getting config: {str(e)}")
 
 
+@router.get(
+    "/debug/llm-cache",
+    summary="Get LLM response cache statistics",
+    description="Get hit/miss/byte counters and per-tier sizes of the shared LLM response cache",
+)
+async def get_llm_cache_stats():
+    """Get statistics for the shared LLM response cache."""
+    try:
+        from backend.services.llm.response_cache import get_llm_response_cache
+
+        return {
+            "status": "success",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "cache": get_llm_response_cache().stats(),
+        }
+    except Exception as e:
+        logger.error(f"Error getting LLM cache stats: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Error getting LLM cache stats: {str(e)}"
+        )
+
+
+@router.get(
+    "/debug/perf/metrics",
+    summary="Pipeline metrics in Prometheus format",
+    description="Stage and LLM latency histograms, retries, tokens and cache hits for this process",
+    response_class=PlainTextResponse,
+)
+async def get_pipeline_metrics():
+    """Expose process-wide pipeline metrics in the Prometheus text format."""
+    from backend.infrastructure.tracing import pipeline_metrics
+
+    return PlainTextResponse(
+        pipeline_metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get(
+    "/debug/perf/{result_id}",
+    summary="Per-stage performance breakdown of an analysis",
+    description="Stage wall times, LLM latency, tokens, retries and queue wait for one analysis",
+)
+async def get_analysis_performance(
+    result_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get the recorded trace of an analysis, slowest stages first."""
+    try:
+        from backend.infrastructure.persistence.pipeline_run_repository import (
+            PipelineRunRepository,
+        )
+        from backend.infrastructure.tracing import pipeline_metrics
+
+        analysis_result = (
+            db.query(AnalysisResult)
+            .filter(
+                AnalysisResult.result_id == result_id,
+                AnalysisResult.data_id.in_(
+                    db.query(InterviewData.id).filter(
+                        InterviewData.user_id == current_user.user_id
+                    )
+                ),
+            )
+            .first()
+        )
+
+        if not analysis_result:
+            raise HTTPException(status_code=404, detail="Analysis result not found")
+
+        results = analysis_result.results or {}
+        if isinstance(results, str):
+            try:
+                results = json.loads(results)
+            except json.JSONDecodeError:
+                results = {}
+        performance = results.get("performance") if isinstance(results, dict) else None
+
+        # Process-wide percentiles for the stages this analysis went through
+        percentiles = {}
+        for stage in (performance or {}).get("stages", {}):
+            histogram = pipeline_metrics.stage_seconds.get(stage)
+            if histogram is not None:
+                percentiles[stage] = {
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "count": histogram.count,
+                }
+
+        job = None
+        run = await PipelineRunRepository(db).get_latest_for_analysis(str(result_id))
+        if run is not None:
+            queued_seconds = None
+            if run.started_at and run.created_at:
+                queued_seconds = (run.started_at - run.created_at).total_seconds()
+            job = {
+                "job_id": run.job_id,
+                "job_type": run.job_type,
+                "status": run.status,
+                "attempts": run.attempts,
+                "queued_seconds": queued_seconds,
+                "duration_seconds": run.total_duration_seconds,
+                "execution_trace": run.execution_trace,
+            }
+
+        return {
+            "status": "success",
+            "result_id": result_id,
+            "analysis_status": analysis_result.status,
+            "performance": performance,
+            "stage_percentiles": percentiles,
+            "job": job,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving performance for analysis {result_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
 @router.post(
     "/debug/test-llm",
     summary="Test LLM service",
@@ -112,7 +112,7 @@ async def test_jira_connection(
 
         # Create Jira exporter and test connection
         jira_exporter = JiraExporter(db, current_user)
-        result = jira_exporter.test_connection(credentials)
+        result = await jira_exporter.test_connection_async(credentials)
         return result
 
     except Exception as e:
@@ -58,68 +58,6 @@ async def get_research_sessions(
         # Convert to summary format
         session_summaries = []
         for session in sessions:
-            message_count = len(session.messages) if session.messages else 0
-
-            # Extract question and stakeholder counts from research_questions
-            question_count = 0
-            stakeholder_count = 0
-            if session.research_questions:
-                try:
-                    questions_data = session.research_questions
-                    if isinstance(questions_data, dict):
-                        for stakeholder_type in [
-                            "primaryStakeholders",
-                            "secondaryStakeholders",
-                        ]:
-                            if stakeholder_type in questions_data:
-                                stakeholders = questions_data[stakeholder_type]
-                                if isinstance(stakeholders, list):
-                                    stakeholder_count += len(stakeholders)
-                                    for stakeholder in stakeholders:
-                                        if (
-                                            isinstance(stakeholder, dict)
-                                            and "questions" in stakeholder
-                                        ):
-                                            stakeholder_questions = stakeholder[
-                                                "questions"
-                                            ]
-                                            if isinstance(stakeholder_questions, dict):
-                                                for category in [
-                                                    "problemDiscovery",
-                                                    "solutionValidation",
-                                                    "followUp",
-                                                ]:
-                                                    if (
-                                                        category
-                                                        in stakeholder_questions
-                                                    ):
-                                                        category_questions = (
-                                                            stakeholder_questions[
-                                                                category
-                                                            ]
-                                                        )
-                                                        if isinstance(
-                                                            category_questions, list
-                                                        ):
-                                                            question_count += len(
-                                                                category_questions
-                                                            )
-                except Exception as e:
-                    logger.warning(
-                        f"Error parsing research_questions for session {session.session_id}: {e}"
-                    )
-
-            last_message_at = None
-            if session.messages and len(session.messages) > 0:
-                try:
-                    last_message = session.messages[-1]
-                    if isinstance(last_message, dict) and "timestamp" in last_message:
-                        last_message_at = last_message["timestamp"]
-                    else:
-                        last_message_at = session.updated_at
-                except Exception:
-                    last_message_at = session.updated_at
-
             questionnaire_exported = False
             try:
                 service = ResearchSessionService(db)
@@ -150,11 +88,13 @@ async def get_research_sessions(
                 created_at=session.created_at,
                 updated_at=session.updated_at,
                 completed_at=session.completed_at,
-                message_count=message_count,
-                question_count=question_count,
-                stakeholder_count=stakeholder_count,
-                last_message_at=last_message_at,
-                messages=session.messages or [],
+                # Summary counts are maintained on write, so listing never
+                # reads message bodies
+                message_count=session.message_count or 0,
+                question_count=session.question_count or 0,
+                stakeholder_count=session.stakeholder_count or 0,
+                last_message_at=session.last_message_at or session.updated_at,
+                messages=[],
                 research_questions=session.research_questions,
             )
             session_summaries.append(summary)
@@ -223,7 +163,7 @@ async def get_research_session(
             industry=session.industry,
             stage=session.stage,
             status=session.status,
-            messages=session.messages or [],
+            messages=service.get_messages(session.session_id)[0],
             conversation_context=session.conversation_context,
             research_questions=session.research_questions,
             questions_generated=session.questions_generated,
@@ -290,7 +230,7 @@ async def create_research_session(
             industry=session.industry,
             stage=session.stage,
             status=session.status,
-            messages=session.messages or [],
+            messages=service.get_messages(session.session_id)[0],
             conversation_context=session.conversation_context,
             research_questions=session.research_questions,
             questions_generated=session.questions_generated,
@@ -361,7 +301,7 @@ async def update_research_session(
             industry=session.industry,
             stage=session.stage,
             status=session.status,
-            messages=session.messages or [],
+            messages=service.get_messages(session.session_id)[0],
             conversation_context=session.conversation_context,
             research_questions=session.research_questions,
             questions_generated=session.questions_generated,
@@ -737,10 +677,16 @@ async def export_questionnaire(
 @router.get("/sessions/{session_id}/messages")
 async def get_session_messages(
     session_id: str,
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Page size; omit to return every message"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from a previous page's next_cursor"
+    ),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ) -> Dict[str, Any]:
-    """Get all messages for a research session."""
+    """Get messages for a research session, optionally one page at a time."""
     try:
         logger.info(f"📋 Getting messages for session: {session_id}")
 
@@ -759,14 +705,15 @@ async def get_session_messages(
                 detail="Access denied: You can only access your own sessions",
             )
 
-        messages = session.messages or []
+        messages, next_cursor = service.get_messages(session_id, limit, cursor)
 
         logger.info(f"✅ Retrieved {len(messages)} messages for session: {session_id}")
         return {
             "success": True,
             "session_id": session_id,
             "messages": messages,
-            "message_count": len(messages),
+            "message_count": session.message_count or 0,
+            "next_cursor": next_cursor,
         }
 
     except HTTPException:
@@ -810,7 +757,7 @@ async def add_session_message(
         return {
             "success": True,
             "session_id": session_id,
-            "message_count": len(session.messages) if session.messages else 0,
+            "message_count": session.message_count or 0,
         }
 
     except HTTPException:
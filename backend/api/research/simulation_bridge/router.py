@@ -48,7 +48,7 @@ router = APIRouter(
 
 # Global orchestrator instance with enhanced capabilities
 # Increase concurrency to align with user preferences (10–15)
-orchestrator = SimulationOrchestrator(use_parallel=True, max_concurrent=12)
+orchestrator = SimulationOrchestrator(use_parallel=True)
 
 
 @router.get("/health")
@@ -434,6 +434,95 @@ async def get_simulation_progress(
         )
 
 
+@router.post("/simulate/{simulation_id}/resume")
+async def resume_simulation(
+    simulation_id: str,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Resume an interrupted simulation in the background.
+
+    Interviews checkpointed before the interruption are reused; only the
+    personas without an interview are simulated again.
+    """
+    endpoint = "/api/research/simulation-bridge/simulate/{simulation_id}/resume"
+    start = request_start(endpoint, user_id=user.user_id, simulation_id=simulation_id)
+    try:
+        try:
+            from backend.services.external.auth_middleware import ENABLE_CLERK_VALIDATION
+        except Exception:
+            ENABLE_CLERK_VALIDATION = False
+
+        from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+        from backend.infrastructure.persistence.simulation_repository import (
+            SimulationRepository,
+        )
+        from backend.database import SessionLocal
+
+        async with UnitOfWork(SessionLocal) as uow:
+            simulation_repo = SimulationRepository(uow.session)
+            db_simulation = await simulation_repo.get_by_simulation_id(simulation_id)
+            if not db_simulation:
+                raise HTTPException(status_code=404, detail="Simulation not found")
+            if ENABLE_CLERK_VALIDATION and db_simulation.user_id != user.user_id:
+                raise HTTPException(
+                    status_code=403,
+                    detail="Access denied: You can only access your own simulations",
+                )
+            if db_simulation.status == "completed":
+                raise HTTPException(
+                    status_code=409, detail="Simulation already completed"
+                )
+            checkpointed = len(await simulation_repo.get_interviews(simulation_id))
+
+        progress = orchestrator.get_simulation_progress(simulation_id)
+        if progress and progress.stage not in ("completed", "failed"):
+            raise HTTPException(status_code=409, detail="Simulation is still running")
+
+        background_tasks.add_task(orchestrator.resume_simulation, simulation_id)
+
+        request_end(
+            endpoint,
+            start,
+            user_id=user.user_id,
+            http_status=202,
+            simulation_id=simulation_id,
+        )
+
+        base = "/api/research/simulation-bridge"
+        return JSONResponse(
+            status_code=202,
+            content={
+                "success": True,
+                "message": "Simulation resume started in background",
+                "simulation_id": simulation_id,
+                "checkpointed_interviews": checkpointed,
+                "next_steps": {
+                    "progress_url": f"{base}/simulate/{simulation_id}/progress",
+                    "result_url": f"{base}/completed/{simulation_id}",
+                },
+            },
+        )
+
+    except HTTPException as he:
+        request_error(
+            endpoint,
+            start,
+            user_id=user.user_id,
+            http_status=getattr(he, "status_code", 500),
+            error=str(getattr(he, "detail", he)),
+        )
+        raise
+    except Exception as e:
+        request_error(
+            endpoint, start, user_id=user.user_id, http_status=500, error=str(e)
+        )
+        raise HTTPException(
+            status_code=500, detail=f"Failed to resume simulation: {str(e)}"
+        )
+
+
 @router.delete("/simulate/{simulation_id}")
 async def cancel_simulation(simulation_id: str) -> Dict[str, Any]:
     """
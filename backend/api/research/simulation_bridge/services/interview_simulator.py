@@ -4,7 +4,7 @@ Interview Simulator for generating realistic interview responses.
 
 import logging
 import random
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
 
@@ -215,8 +215,15 @@ Create a realistic interview that feels like a genuine conversation with this pe
         stakeholders: Dict[str, List[Stakeholder]],
         business_context: BusinessContext,
         config: SimulationConfig,
+        on_interview_complete: Optional[
+            Callable[[AIPersona, SimulatedInterview], Awaitable[None]]
+        ] = None,
     ) -> List[SimulatedInterview]:
-        """Simulate interviews for all personas."""
+        """Simulate interviews for all personas.
+
+        ``on_interview_complete`` is awaited with each interview as soon as it
+        completes, e.g. to checkpoint it; its failures are logged.
+        """
 
         all_interviews = []
 
@@ -242,6 +249,13 @@ Create a realistic interview that feels like a genuine conversation with this pe
                     persona, stakeholder, business_context, config
                 )
                 all_interviews.append(interview)
+                if on_interview_complete:
+                    try:
+                        await on_interview_complete(persona, interview)
+                    except Exception as e:
+                        logger.error(
+                            f"Interview completion hook failed for {persona.name}: {str(e)}"
+                        )
             else:
                 logger.warning(
                     f"❌ No stakeholder found for persona '{persona.name}' with type '{persona.stakeholder_type}'"
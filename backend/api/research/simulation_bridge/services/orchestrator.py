@@ -6,6 +6,7 @@ Coordinates persona generation, interview simulation, and data formatting.
 import logging
 import uuid
 import asyncio
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -24,6 +25,7 @@ from ..models import (
     QuestionsData,
     BusinessContext,
     Stakeholder,
+    SimulationConfig,
 )
 from .persona_generator import PersonaGenerator
 from .interview_simulator import InterviewSimulator
@@ -37,11 +39,14 @@ from backend.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Recent results kept in memory; older ones are served from the database
+COMPLETED_SIMULATIONS_CACHE_SIZE = 32
+
 
 class SimulationOrchestrator:
     """Orchestrates the complete simulation process."""
 
-    def __init__(self, use_parallel: bool = True, max_concurrent: int = 2):
+    def __init__(self, use_parallel: bool = True, max_concurrent: Optional[int] = None):
         # Initialize Google model for PydanticAI.
         # NOTE: GoogleModel requires GEMINI_API_KEY from the environment when used.
         # We intentionally do not enforce the presence of the key here so that tests
@@ -64,10 +69,13 @@ class SimulationOrchestrator:
         )
         self.data_formatter = DataFormatter()
         self.active_simulations: Dict[str, SimulationProgress] = {}
-        self.completed_simulations: Dict[str, SimulationResponse] = (
-            {}
-        )  # Keep for backward compatibility
+        # Keep for backward compatibility; bounded LRU by simulation id
+        self.completed_simulations: "OrderedDict[str, SimulationResponse]" = (
+            OrderedDict()
+        )
         self.use_parallel = use_parallel
+        # Serializes per-interview checkpoint writes across concurrent interviews
+        self._checkpoint_lock = asyncio.Lock()
 
     async def parse_raw_questionnaire(self, content: str, config) -> SimulationRequest:
         """Parse raw questionnaire content using PydanticAI."""
@@ -327,7 +335,7 @@ class SimulationOrchestrator:
             )
 
             # Save completed simulation for later retrieval
-            self.completed_simulations[simulation_id] = response
+            self._remember_completed(response)
 
             logger.info(f"Simulation completed successfully: {simulation_id}")
             logger.info(f"Saved simulation results for ID: {simulation_id}")
@@ -353,6 +361,9 @@ class SimulationOrchestrator:
     ) -> SimulationResponse:
         """
         Enhanced simulation with database persistence and parallel processing.
+
+        Personas and each completed interview are checkpointed as they become
+        available so ``resume_simulation`` can continue an interrupted run.
         """
         simulation_id = simulation_id or str(uuid.uuid4())
 
@@ -424,158 +435,336 @@ class SimulationOrchestrator:
             logger.info(
                 f"Generated {len(personas)} personas for simulation {simulation_id}"
             )
+            await self._checkpoint_personas(simulation_id, personas)
 
-            # Step 2: Simulate interviews (parallel or sequential)
-            await self._update_progress(
-                simulation_id,
-                "simulating_interviews",
-                30,
-                "Conducting simulated interviews",
+            return await self._complete_persisted_simulation(
+                simulation_id, request, personas, completed_interviews=[]
             )
 
-            if self.use_parallel and self.parallel_interview_simulator:
-                # Use parallel processing
-                def progress_callback(
-                    message: str, completed: int, total: int, failed: int
-                ):
-                    progress = 30 + int((completed / total) * 40)  # 30-70% range
-                    asyncio.create_task(
-                        self._update_progress_with_counts(
-                            simulation_id,
-                            "simulating_interviews",
-                            progress,
-                            message,
-                            completed_interviews=completed,
-                            failed_interviews=failed,
-                        )
-                    )
+        except Exception as e:
+            return await self._fail_persisted_simulation(simulation_id, e)
 
-                interviews = await self.parallel_interview_simulator.simulate_all_interviews_parallel(
-                    personas,
-                    request.questions_data.stakeholders,
-                    request.business_context,
-                    request.config,
-                    progress_callback,
+    async def resume_simulation(self, simulation_id: str) -> SimulationResponse:
+        """
+        Resume an interrupted persisted simulation.
+
+        Reuses the checkpointed personas and interviews and only simulates the
+        personas that have no interview yet.
+        """
+        try:
+            progress = self.active_simulations.get(simulation_id)
+            if progress and progress.stage not in ("completed", "failed"):
+                return SimulationResponse(
+                    success=False,
+                    message="Simulation is still running",
+                    simulation_id=simulation_id,
                 )
+
+            async with UnitOfWork(SessionLocal) as uow:
+                simulation_repo = SimulationRepository(uow.session)
+                simulation = await simulation_repo.get_by_simulation_id(simulation_id)
+                if not simulation:
+                    return SimulationResponse(
+                        success=False,
+                        message="Simulation not found",
+                        simulation_id=simulation_id,
+                    )
+                if simulation.status == "completed":
+                    return SimulationResponse(
+                        success=False,
+                        message="Simulation already completed",
+                        simulation_id=simulation_id,
+                    )
+                request = SimulationRequest(
+                    questions_data=QuestionsData.model_validate(
+                        simulation.questions_data
+                    ),
+                    business_context=BusinessContext.model_validate(
+                        simulation.business_context
+                    ),
+                    config=SimulationConfig.model_validate(
+                        simulation.simulation_config or {}
+                    ),
+                )
+                saved_personas = list(simulation.personas or [])
+                saved_interviews = [
+                    record.interview
+                    for record in await simulation_repo.get_interviews(simulation_id)
+                ]
+
+            logger.info(
+                f"Resuming simulation {simulation_id}: {len(saved_personas)} personas, "
+                f"{len(saved_interviews)} interviews checkpointed"
+            )
+            total_personas = self._calculate_total_personas(request)
+            self.active_simulations[simulation_id] = SimulationProgress(
+                simulation_id=simulation_id,
+                stage="initializing",
+                progress_percentage=0,
+                current_task="Resuming simulation",
+                total_people=total_personas,
+                total_interviews=total_personas,
+                completed_people=0,
+                completed_interviews=len(saved_interviews),
+                estimated_time_remaining=self._estimate_simulation_time(request),
+            )
+
+            if saved_personas:
+                personas = [AIPersona.model_validate(p) for p in saved_personas]
             else:
-                # Use sequential processing (fallback)
-                interviews = await self.interview_simulator.simulate_all_interviews(
-                    personas,
+                await self._update_progress(
+                    simulation_id, "generating_personas", 10, "Generating AI personas"
+                )
+                personas = await self.persona_generator.generate_all_personas(
                     request.questions_data.stakeholders,
                     request.business_context,
                     request.config,
                 )
+                await self._checkpoint_personas(simulation_id, personas)
 
-            logger.info(
-                f"Generated {len(interviews)} interviews for simulation {simulation_id}"
+            await self._update_progress_with_counts(
+                simulation_id,
+                "generating_personas",
+                25,
+                f"Loaded {len(personas)} AI personas",
+                completed_personas=len(personas),
             )
 
-            # Step 3: Generate insights
-            await self._update_progress(
-                simulation_id, "generating_insights", 70, "Analyzing simulation results"
-            )
-            insights = await self._generate_insights(
-                interviews, request.business_context
+            return await self._complete_persisted_simulation(
+                simulation_id,
+                request,
+                personas,
+                completed_interviews=[
+                    SimulatedInterview.model_validate(i) for i in saved_interviews
+                ],
             )
 
-            # Step 4: Format data for analysis
-            await self._update_progress(
-                simulation_id, "formatting_data", 85, "Preparing data for analysis"
-            )
-            formatted_data = self.data_formatter.format_for_analysis(
-                personas, interviews, request.business_context, simulation_id
+        except Exception as e:
+            return await self._fail_persisted_simulation(simulation_id, e)
+
+    async def _complete_persisted_simulation(
+        self,
+        simulation_id: str,
+        request: SimulationRequest,
+        personas: List[AIPersona],
+        completed_interviews: List[SimulatedInterview],
+    ) -> SimulationResponse:
+        """Simulate the personas without an interview, then derive and save results."""
+        persona_ids = {p.id for p in personas}
+        interviews_by_persona = {
+            i.person_id: i for i in completed_interviews if i.person_id in persona_ids
+        }
+        remaining = [p for p in personas if p.id not in interviews_by_persona]
+        already_done = len(interviews_by_persona)
+
+        # Step 2: Simulate interviews (parallel or sequential)
+        await self._update_progress(
+            simulation_id,
+            "simulating_interviews",
+            30,
+            "Conducting simulated interviews",
+        )
+        if already_done:
+            logger.info(
+                f"Skipping {already_done} checkpointed interviews for simulation {simulation_id}"
             )
 
-            # Step 4.5: Create separate stakeholder files
-            await self._update_progress(
-                simulation_id,
-                "creating_files",
-                90,
-                "Creating stakeholder interview files",
+        async def checkpoint(persona: AIPersona, interview: SimulatedInterview):
+            await self._checkpoint_interview(simulation_id, persona, interview)
+
+        if not remaining:
+            new_interviews = []
+        elif self.use_parallel and self.parallel_interview_simulator:
+            # Use parallel processing
+            def progress_callback(
+                message: str, completed: int, total: int, failed: int
+            ):
+                done = already_done + completed
+                progress = 30 + int(
+                    (done / max(already_done + total, 1)) * 40
+                )  # 30-70% range
+                asyncio.create_task(
+                    self._update_progress_with_counts(
+                        simulation_id,
+                        "simulating_interviews",
+                        progress,
+                        message,
+                        completed_interviews=done,
+                        failed_interviews=failed,
+                    )
+                )
+
+            new_interviews = await self.parallel_interview_simulator.simulate_all_interviews_parallel(
+                remaining,
+                request.questions_data.stakeholders,
+                request.business_context,
+                request.config,
+                progress_callback,
+                on_interview_complete=checkpoint,
             )
-            stakeholder_files = self.data_formatter.create_stakeholder_files(
-                personas, interviews, request.business_context, simulation_id
+        else:
+            # Use sequential processing (fallback)
+            new_interviews = await self.interview_simulator.simulate_all_interviews(
+                remaining,
+                request.questions_data.stakeholders,
+                request.business_context,
+                request.config,
+                on_interview_complete=checkpoint,
             )
-            logger.info(f"Created {len(stakeholder_files)} stakeholder files")
 
-            # Step 5: Save results to database
-            await self._update_progress(
-                simulation_id, "saving_results", 95, "Saving results to database"
+        for interview in new_interviews:
+            interviews_by_persona[interview.person_id] = interview
+        interviews = [
+            interviews_by_persona[p.id] for p in personas if p.id in interviews_by_persona
+        ]
+
+        logger.info(
+            f"Generated {len(new_interviews)} interviews for simulation {simulation_id} "
+            f"({len(interviews)} total)"
+        )
+
+        # Step 3: Generate insights
+        await self._update_progress(
+            simulation_id, "generating_insights", 70, "Analyzing simulation results"
+        )
+        insights = await self._generate_insights(
+            interviews, request.business_context
+        )
+
+        # Step 4: Format data for analysis
+        await self._update_progress(
+            simulation_id, "formatting_data", 85, "Preparing data for analysis"
+        )
+        formatted_data = self.data_formatter.format_for_analysis(
+            personas, interviews, request.business_context, simulation_id
+        )
+
+        # Step 4.5: Create separate stakeholder files
+        await self._update_progress(
+            simulation_id,
+            "creating_files",
+            90,
+            "Creating stakeholder interview files",
+        )
+        stakeholder_files = self.data_formatter.create_stakeholder_files(
+            personas, interviews, request.business_context, simulation_id
+        )
+        logger.info(f"Created {len(stakeholder_files)} stakeholder files")
+
+        # Step 5: Save results to database
+        await self._update_progress(
+            simulation_id, "saving_results", 95, "Saving results to database"
+        )
+
+        async with UnitOfWork(SessionLocal) as uow:
+            simulation_repo = SimulationRepository(uow.session)
+            await simulation_repo.update_simulation_results(
+                simulation_id=simulation_id,
+                personas=[p.model_dump() for p in personas],
+                interviews=[i.model_dump() for i in interviews],
+                insights=insights.model_dump() if insights else None,
+                formatted_data=formatted_data,
             )
+            await uow.commit()
+            logger.info(f"Saved simulation results to database: {simulation_id}")
 
+        # Step 6: Complete
+        await self._update_progress(
+            simulation_id, "completed", 100, "Simulation completed"
+        )
+
+        # Create response
+        response = SimulationResponse(
+            success=True,
+            message="Enhanced simulation completed successfully",
+            simulation_id=simulation_id,
+            data=formatted_data,
+            metadata={
+                "total_personas": len(personas),
+                "total_interviews": len(interviews),
+                "simulation_config": request.config.model_dump(),
+                "created_at": datetime.utcnow().isoformat(),
+                "processing_mode": (
+                    "parallel" if self.use_parallel else "sequential"
+                ),
+                "stakeholder_files": stakeholder_files,
+                "stakeholders_processed": list(stakeholder_files.keys()),
+                "resumed_interviews": already_done,
+            },
+            personas=personas,
+            interviews=interviews,
+            simulation_insights=insights,
+            recommendations=insights.recommendations if insights else [],
+        )
+
+        # Keep in memory for backward compatibility
+        self._remember_completed(response)
+
+        logger.info(f"Enhanced simulation completed successfully: {simulation_id}")
+        return response
+
+    async def _fail_persisted_simulation(
+        self, simulation_id: str, error: Exception
+    ) -> SimulationResponse:
+        """Record a failed persisted simulation; checkpoints are kept for resuming."""
+        logger.error(f"Enhanced simulation failed: {simulation_id} - {str(error)}")
+
+        # Mark as failed in database
+        try:
             async with UnitOfWork(SessionLocal) as uow:
                 simulation_repo = SimulationRepository(uow.session)
-                await simulation_repo.update_simulation_results(
-                    simulation_id=simulation_id,
-                    personas=[p.model_dump() for p in personas],
-                    interviews=[i.model_dump() for i in interviews],
-                    insights=insights.model_dump() if insights else None,
-                    formatted_data=formatted_data,
-                )
+                await simulation_repo.mark_simulation_failed(simulation_id, str(error))
                 await uow.commit()
-                logger.info(f"Saved simulation results to database: {simulation_id}")
-
-            # Step 6: Complete
-            await self._update_progress(
-                simulation_id, "completed", 100, "Simulation completed"
-            )
-
-            # Create response
-            response = SimulationResponse(
-                success=True,
-                message="Enhanced simulation completed successfully",
-                simulation_id=simulation_id,
-                data=formatted_data,
-                metadata={
-                    "total_personas": len(personas),
-                    "total_interviews": len(interviews),
-                    "simulation_config": request.config.model_dump(),
-                    "created_at": datetime.utcnow().isoformat(),
-                    "processing_mode": (
-                        "parallel" if self.use_parallel else "sequential"
-                    ),
-                    "stakeholder_files": stakeholder_files,
-                    "stakeholders_processed": list(stakeholder_files.keys()),
-                },
-                personas=personas,
-                interviews=interviews,
-                simulation_insights=insights,
-                recommendations=insights.recommendations if insights else [],
+        except Exception as db_error:
+            logger.error(
+                f"Failed to mark simulation as failed in database: {db_error}"
             )
 
-            # Keep in memory for backward compatibility
-            self.completed_simulations[simulation_id] = response
+        await self._update_progress(
+            simulation_id, "failed", 0, f"Simulation failed: {str(error)}"
+        )
 
-            logger.info(f"Enhanced simulation completed successfully: {simulation_id}")
-            return response
+        return SimulationResponse(
+            success=False,
+            message=f"Enhanced simulation failed: {str(error)}",
+            simulation_id=simulation_id,
+        )
 
-        except Exception as e:
-            logger.error(f"Enhanced simulation failed: {simulation_id} - {str(e)}")
-
-            # Mark as failed in database
-            try:
-                async with UnitOfWork(SessionLocal) as uow:
-                    simulation_repo = SimulationRepository(uow.session)
-                    await simulation_repo.mark_simulation_failed(simulation_id, str(e))
-                    await uow.commit()
-            except Exception as db_error:
-                logger.error(
-                    f"Failed to mark simulation as failed in database: {db_error}"
+    async def _checkpoint_personas(
+        self, simulation_id: str, personas: List[AIPersona]
+    ) -> None:
+        """Persist generated personas so a resumed run does not regenerate them."""
+        try:
+            async with UnitOfWork(SessionLocal) as uow:
+                simulation_repo = SimulationRepository(uow.session)
+                await simulation_repo.save_personas(
+                    simulation_id, [p.model_dump() for p in personas]
                 )
+                await uow.commit()
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint personas for {simulation_id}: {e}")
 
-            await self._update_progress(
-                simulation_id, "failed", 0, f"Simulation failed: {str(e)}"
-            )
+    async def _checkpoint_interview(
+        self, simulation_id: str, persona: AIPersona, interview: SimulatedInterview
+    ) -> None:
+        """Persist one completed interview as soon as it is available."""
+        async with self._checkpoint_lock:
+            async with UnitOfWork(SessionLocal) as uow:
+                simulation_repo = SimulationRepository(uow.session)
+                await simulation_repo.save_interview(
+                    simulation_id,
+                    persona.id,
+                    interview.model_dump(),
+                    stakeholder_type=persona.stakeholder_type,
+                )
+                await uow.commit()
 
-            return SimulationResponse(
-                success=False,
-                message=f"Enhanced simulation failed: {str(e)}",
-                simulation_id=simulation_id,
-            )
-        finally:
-            # Keep progress tracking for a bit longer to allow frontend to read final status
-            # Don't immediately delete - let it be cleaned up later or by explicit calls
-            pass
+    def _remember_completed(self, response: SimulationResponse) -> None:
+        """Keep a completed simulation in the bounded in-memory LRU."""
+        self.completed_simulations[response.simulation_id] = response
+        self.completed_simulations.move_to_end(response.simulation_id)
+        while len(self.completed_simulations) > COMPLETED_SIMULATIONS_CACHE_SIZE:
+            self.completed_simulations.popitem(last=False)
 
     async def _generate_insights(
         self, interviews: List[SimulatedInterview], business_context
@@ -808,7 +997,10 @@ class SimulationOrchestrator:
         self, simulation_id: str
     ) -> Optional[SimulationResponse]:
         """Get a completed simulation result."""
-        return self.completed_simulations.get(simulation_id)
+        response = self.completed_simulations.get(simulation_id)
+        if response is not None:
+            self.completed_simulations.move_to_end(simulation_id)
+        return response
 
     def list_completed_simulations(self) -> Dict[str, Dict[str, Any]]:
         """List all completed simulations with basic info."""
@@ -842,4 +1034,5 @@ class SimulationOrchestrator:
         return {
             "cached_simulations": list(self.completed_simulations.keys()),
             "cache_size": len(self.completed_simulations),
+            "max_cache_size": COMPLETED_SIMULATIONS_CACHE_SIZE,
         }
@@ -2,14 +2,22 @@
 Parallel Interview Simulator for improved performance and scalability.
 """
 
+import hashlib
+import json
 import logging
 import asyncio
 import random
-from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
 
+from backend.services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+)
+
 from ..models import (
     AIPersona,
     Stakeholder,
@@ -21,22 +29,37 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Completed interviews kept for reuse across simulations in this process
+RESPONSE_CACHE_SIZE = 256
+
 
 class ParallelInterviewSimulator:
     """
     Enhanced interview simulator with parallel processing capabilities.
     """
 
-    def __init__(self, model: Model, max_concurrent: int = 2):
+    def __init__(
+        self,
+        model: Model,
+        max_concurrent: Optional[int] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
         self.model = model
+        # Optional per-simulator cap on top of the shared adaptive limit
         self.max_concurrent = max_concurrent
         self.agent = Agent(
             model=model,
             output_type=SimulatedInterview,
             system_prompt=self._get_system_prompt(),
         )
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._response_cache = {}  # Simple in-memory cache
+        # Shared with every simulation and Gemini client in the process, so
+        # parallelism follows the provider's headroom rather than a fixed number
+        self._limiter = limiter or get_concurrency_limiter("gemini")
+        self._semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        # LRU keyed by (persona id, question set hash)
+        self._response_cache: "OrderedDict[Tuple[str, str], SimulatedInterview]" = (
+            OrderedDict()
+        )
 
     def _get_system_prompt(self) -> str:
         return """You are an expert interview simulator that generates realistic customer interview responses.
@@ -73,6 +96,10 @@ Return a complete SimulatedInterview object with all responses and metadata."""
         """
         Simulate interview with concurrency control.
         """
+        if self._semaphore is None:
+            return await self._simulate_interview_internal(
+                persona, stakeholder, business_context, config, progress_callback
+            )
         async with self._semaphore:
             return await self._simulate_interview_internal(
                 persona, stakeholder, business_context, config, progress_callback
@@ -100,9 +127,11 @@ Return a complete SimulatedInterview object with all responses and metadata."""
             cache_key = self._generate_cache_key(
                 persona, stakeholder, business_context, config
             )
-            if cache_key in self._response_cache:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
                 logger.info(f"Using cached response for {persona.name}")
-                return self._response_cache[cache_key]
+                return cached
 
             prompt = self._build_interview_prompt(
                 persona, stakeholder, business_context, config
@@ -121,9 +150,10 @@ Return a complete SimulatedInterview object with all responses and metadata."""
                         )
 
                     # Use user's temperature for creative interview responses
-                    result = await self.agent.run(
-                        prompt, model_settings={"temperature": config.temperature}
-                    )
+                    async with self._limiter.slot():
+                        result = await self.agent.run(
+                            prompt, model_settings={"temperature": config.temperature}
+                        )
 
                     interview = result.output
                     break  # Success, exit retry loop
@@ -138,9 +168,10 @@ Return a complete SimulatedInterview object with all responses and metadata."""
 
                         # Try with temperature 0 for stability on retry
                         if "MALFORMED_FUNCTION_CALL" in str(e):
-                            result = await self.agent.run(
-                                prompt, model_settings={"temperature": 0.0}
-                            )
+                            async with self._limiter.slot():
+                                result = await self.agent.run(
+                                    prompt, model_settings={"temperature": 0.0}
+                                )
                             interview = result.output
                             break
                     else:
@@ -158,6 +189,9 @@ Return a complete SimulatedInterview object with all responses and metadata."""
 
             # Cache the result
             self._response_cache[cache_key] = interview
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
             if progress_callback:
                 progress_callback(f"Completed interview with {persona.name}", 100)
@@ -181,6 +215,9 @@ Return a complete SimulatedInterview object with all responses and metadata."""
         business_context: BusinessContext,
         config: SimulationConfig,
         progress_callback: Optional[Callable[[str, int, int, int], None]] = None,
+        on_interview_complete: Optional[
+            Callable[[AIPersona, SimulatedInterview], Awaitable[None]]
+        ] = None,
     ) -> List[SimulatedInterview]:
         """
         Simulate all interviews in parallel with progress tracking.
@@ -191,6 +228,8 @@ Return a complete SimulatedInterview object with all responses and metadata."""
             business_context: Business context
             config: Simulation configuration
             progress_callback: Optional callback for progress updates (message, completed, total, failed)
+            on_interview_complete: Optional coroutine awaited with each interview as
+                soon as it completes, e.g. to checkpoint it; its failures are logged
 
         Returns:
             List of completed interviews
@@ -240,15 +279,25 @@ Return a complete SimulatedInterview object with all responses and metadata."""
 
             return callback
 
-        for persona, stakeholder in valid_personas:
-            task = self.simulate_interview_with_semaphore(
+        async def run_one(persona: AIPersona, stakeholder: Stakeholder):
+            interview = await self.simulate_interview_with_semaphore(
                 persona,
                 stakeholder,
                 business_context,
                 config,
                 create_progress_callback(persona.name),
             )
-            tasks.append(task)
+            if on_interview_complete:
+                try:
+                    await on_interview_complete(persona, interview)
+                except Exception as e:
+                    logger.error(
+                        f"Interview completion hook failed for {persona.name}: {str(e)}"
+                    )
+            return interview
+
+        for persona, stakeholder in valid_personas:
+            tasks.append(run_one(persona, stakeholder))
 
         # Execute all tasks with error handling
         results = []
@@ -282,12 +331,21 @@ Return a complete SimulatedInterview object with all responses and metadata."""
         stakeholder: Stakeholder,
         business_context: BusinessContext,
         config: SimulationConfig,
-    ) -> str:
-        """Generate cache key for response caching."""
-        import hashlib
-
-        key_data = f"{persona.id}_{stakeholder.id}_{business_context.business_idea}_{config.temperature}_{config.response_style.value}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    ) -> Tuple[str, str]:
+        """Generate the (persona id, question set hash) response cache key."""
+        question_set = json.dumps(
+            [
+                stakeholder.id,
+                stakeholder.questions,
+                business_context.business_idea,
+                business_context.target_customer,
+                business_context.problem,
+                config.temperature,
+                config.response_style.value,
+            ],
+            default=str,
+        )
+        return persona.id, hashlib.md5(question_set.encode()).hexdigest()
 
     def _build_interview_prompt(
         self,
@@ -363,9 +421,11 @@ Create a realistic interview that feels like a genuine conversation with this pe
         self._response_cache.clear()
         logger.info("Response cache cleared")
 
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
             "cache_size": len(self._response_cache),
+            "max_cache_size": RESPONSE_CACHE_SIZE,
             "max_concurrent": self.max_concurrent,
+            "concurrency": self._limiter.stats(),
         }
@@ -6,6 +6,7 @@ This module contains the core analysis endpoints:
 - POST /api/analyze - Trigger analysis
 - POST /api/analyses/{result_id}/restart - Restart analysis
 - GET /api/results/{result_id} - Get analysis results
+- GET /api/analysis/{result_id}/stream - Stream partial results (SSE)
 - GET /api/results/{result_id}/personas/simplified - Get simplified personas
 - GET /api/analyses - List user analyses
 - POST /api/persona/generate - Generate persona
@@ -13,15 +14,26 @@ This module contains the core analysis endpoints:
 Extracted from app.py to improve maintainability.
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, Request, Depends, Form
-from fastapi.responses import JSONResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    UploadFile,
+    HTTPException,
+    Request,
+    Depends,
+    Form,
+    Query,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional, Literal
+import asyncio
 import logging
 import os
 import time
 
-from backend.database import get_db
+from backend.database import SessionLocal, get_db
 from backend.models import User, InterviewData, AnalysisResult
 from backend.services.external.auth_middleware import get_current_user
 from backend.schemas import (
@@ -34,11 +46,15 @@ from backend.schemas import (
 from backend.infrastructure.config.settings import settings
 from backend.utils.timezone_utils import format_iso_utc
 from backend.api.routes.results_helpers import (
-    build_concat_and_spans,
     should_hydrate_personas,
     should_revalidate_personas,
-    hydrate_persona_evidence,
 )
+from backend.services.results.hydration import (
+    HYDRATION_KEY,
+    is_hydration_current,
+    refresh_persona_hydration,
+)
+from backend.infrastructure.events.analysis_stream import stream_analysis_events
 
 logger = logging.getLogger(__name__)
 
@@ -257,11 +273,16 @@ async def restart_analysis_endpoint(
 async def get_results(
     result_id: int,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Retrieves analysis results with optional hydration and revalidation.
+    Retrieves analysis results with materialized persona hydration.
+
+    Hydration and validation are computed when the analysis completes; a stale
+    or missing stamp schedules a background recompute instead of rescanning
+    the transcript on the request path.
     """
     try:
         from backend.api.dependencies import get_container
@@ -273,13 +294,8 @@ async def get_results(
         # Get formatted results
         result = results_service.get_analysis_result(result_id)
 
-        # Optional on-read hydration for personas
-        if should_hydrate_personas() and isinstance(result, dict):
-            _hydrate_result_personas(result)
-
-        # Optional on-read revalidation
-        if should_revalidate_personas() and isinstance(result, dict):
-            _revalidate_result_personas(result)
+        if isinstance(result, dict):
+            _apply_materialized_hydration(result, result_id, background_tasks)
 
         return result
 
@@ -290,114 +306,83 @@ async def get_results(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-def _hydrate_result_personas(result: Dict[str, Any]) -> None:
-    """Hydrate personas with evidence document IDs and offsets."""
+def _apply_materialized_hydration(
+    result: Dict[str, Any], result_id: int, background_tasks: BackgroundTasks
+) -> None:
+    """Serve stored persona validation, or schedule a recompute when stale."""
     try:
-        results_obj = result.get("results") or {}
-        personas = results_obj.get("personas")
-        if not isinstance(personas, list) or not personas:
+        results_obj = result.get("results")
+        if not isinstance(results_obj, dict):
             return
 
-        source_payload = results_obj.get("source") or {}
-        transcript = (
-            source_payload.get("transcript")
-            if isinstance(source_payload, dict)
-            else None
-        )
-
-        scoped_text, doc_spans = None, None
-        if isinstance(transcript, list) and transcript:
-            txt, spans = build_concat_and_spans(transcript)
-            if txt and spans:
-                scoped_text, doc_spans = txt, spans
-        if not scoped_text:
-            scoped_text = source_payload.get("original_text") or ""
-
-        if scoped_text:
-            hydrate_persona_evidence(personas, scoped_text, doc_spans)
-
-    except Exception as err:
-        logger.warning(f"[FULL_RESULTS_HYDRATION] Skipped due to error: {err}")
-
-
-def _revalidate_result_personas(result: Dict[str, Any]) -> None:
-    """Revalidate persona evidence on read."""
-    try:
-        from backend.services.validation.persona_evidence_validator import (
-            PersonaEvidenceValidator,
-        )
+        stamp = results_obj.pop(HYDRATION_KEY, None)
+        if is_hydration_current(stamp):
+            summary = stamp.get("validation_summary")
+            if should_revalidate_personas() and isinstance(summary, dict):
+                results_obj["validation_summary"] = summary
+            return
 
-        results_obj = result.get("results") or {}
         personas = results_obj.get("personas")
         if not isinstance(personas, list) or not personas:
             return
+        if should_hydrate_personas() or should_revalidate_personas():
+            background_tasks.add_task(refresh_persona_hydration, result_id)
+    except Exception as err:
+        logger.warning(f"[PERSONA_HYDRATION] Skipped due to error: {err}")
 
-        source_payload = results_obj.get("source") or {}
-        transcript = (
-            source_payload.get("transcript")
-            if isinstance(source_payload, dict)
-            else None
-        )
-        source_text = (
-            source_payload.get("original_text")
-            if isinstance(source_payload, dict)
-            else None
-        )
 
-        validator = PersonaEvidenceValidator()
-        all_matches = []
-        any_cross_trait = False
-        speaker_mismatch_count = 0
+@router.get(
+    "/api/analysis/{result_id}/stream",
+    summary="Stream analysis results",
+    description=(
+        "Server-sent events for a running analysis: progress, then themes, "
+        "patterns, sentiment, personas and insights as each stage finishes, "
+        "and a final complete or error event."
+    ),
+)
+async def stream_analysis(
+    result_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Streams partial results of an analysis instead of polling /api/results.
+
+    Once the terminal event arrives the client fetches the full result once.
+    """
+    analysis = (
+        db.query(AnalysisResult.result_id)
+        .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+        .filter(
+            AnalysisResult.result_id == result_id,
+            InterviewData.user_id == current_user.user_id,
+        )
+        .first()
+    )
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
 
-        if not (isinstance(transcript, list) and transcript):
-            transcript = None
+    def _read_status() -> Optional[str]:
+        session = SessionLocal()
+        try:
+            row = (
+                session.query(AnalysisResult.status)
+                .filter(AnalysisResult.result_id == result_id)
+                .first()
+            )
+            return row[0] if row else "failed"
+        finally:
+            session.close()
 
-        for p in personas:
-            if not isinstance(p, dict):
-                continue
-            try:
-                matches = validator.match_evidence(
-                    persona_ssot=p,
-                    source_text=source_text,
-                    transcript=transcript,
-                )
-                all_matches.extend(matches)
-
-                dup = PersonaEvidenceValidator.detect_duplication(p)
-                ctr = dup.get("cross_trait_reuse")
-                if isinstance(ctr, list):
-                    any_cross_trait = any_cross_trait or bool(ctr)
-                elif ctr:
-                    any_cross_trait = True
-
-                sc = PersonaEvidenceValidator.check_speaker_consistency(p, transcript)
-                sm = sc.get("speaker_mismatches")
-                if isinstance(sm, list):
-                    speaker_mismatch_count += len(sm)
-                elif isinstance(sm, int):
-                    speaker_mismatch_count += sm
-            except (TypeError, KeyError, AttributeError):
-                continue
+    async def load_status() -> Optional[str]:
+        return await asyncio.to_thread(_read_status)
 
-        contamination = PersonaEvidenceValidator.detect_contamination(personas)
-        summary = PersonaEvidenceValidator.summarize(
-            all_matches,
-            {"cross_trait_reuse": any_cross_trait},
-            {"speaker_mismatches": speaker_mismatch_count},
-            contamination,
-        )
-        confidence = PersonaEvidenceValidator.compute_confidence_components(summary)
-
-        # Shape similar to previous payloads
-        results_obj["validation_summary"] = {
-            "counts": summary.get("counts", {}),
-            "method": "persona_evidence_validator_v1",
-            "speaker_mismatches": speaker_mismatch_count,
-            "contamination": contamination,
-            "confidence_components": confidence,
-        }
-    except Exception as err:
-        logger.warning(f"[ON_READ_REVALIDATION] Skipped due to error: {err}")
+    return StreamingResponse(
+        stream_analysis_events(result_id, load_status, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -530,13 +515,23 @@ def _quality_for_trait(trait: Dict[str, Any]) -> Dict[str, Any]:
 @router.get(
     "/api/analyses",
     summary="List analyses",
-    description="Retrieve a list of all analyses performed by the current user.",
+    description=(
+        "Retrieve a list of all analyses performed by the current user. "
+        "Use view=summary for the lightweight projection (counts, top themes, "
+        "sentiment overview), fields= to trim item keys, and limit/cursor for "
+        "keyset pagination; the next cursor is returned in the X-Next-Cursor header."
+    ),
 )
 async def list_analyses(
     request: Request,
     sortBy: Optional[str] = None,
     sortDirection: Optional[Literal["asc", "desc"]] = "desc",
     status: Optional[Literal["pending", "completed", "failed"]] = None,
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    offset: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -564,12 +559,25 @@ async def list_analyses(
         factory = container.get_results_service()
         results_service = factory(db, current_user)
 
-        analyses = results_service.get_all_analyses(
-            sort_by=sortBy, sort_direction=sortDirection, status=status
+        field_list = (
+            [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        )
+        analyses, next_cursor = results_service.get_analyses_page(
+            sort_by=sortBy,
+            sort_direction=sortDirection,
+            status=status,
+            view=view,
+            fields=field_list,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
         )
 
-        return JSONResponse(content=analyses)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return JSONResponse(content=analyses, headers=headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving analyses: {str(e)}")
         return JSONResponse(
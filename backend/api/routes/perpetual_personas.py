@@ -3,7 +3,7 @@ Perpetual Personas media endpoints (avatars, Berlin profiles, dialogue).
 
 Design goals:
 - Minimal, self‑contained, safe fallbacks (works without Google SDK)
-- Persist into AnalysisResult.results.personas[] without DB migrations
+- Persist into AnalysisResult.results.personas[]; image bytes go to the asset store
 - Unique style: deterministic per persona seed with gradient SVG when SDK unavailable
 - Photorealistic 85mm headshots with consistent camera angle
 """
@@ -14,13 +14,15 @@ import re
 import time
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
-from backend.database import get_db
+from backend.database import SessionLocal, get_db
 from backend.models import AnalysisResult, InterviewData, User
 from backend.services.external.auth_middleware import get_current_user
+from backend.services.generative.asset_store import AssetStore, is_valid_digest
 from backend.services.generative.helpers import (
     svg_avatar_data_uri,
     upsert_persona_fields,
@@ -198,6 +200,9 @@ async def generate_persona_avatar(
         seed = f"{result_id}:{persona_id}:{persona_name}:{style_desc}"
         data_uri = svg_avatar_data_uri(persona_name, seed=seed)
 
+    # Keep image bytes out of the results blob; store them once and reference by hash
+    data_uri = AssetStore(db).put_data_uri(data_uri)
+
     upsert_persona_fields(
         results,
         persona_id,
@@ -585,7 +590,9 @@ async def generate_food_image(
             # Use temperature=0.9 for more variation in food images
             b64 = gimg.generate_avatar_base64(prompt, temperature=0.9)
             if b64:
-                image_data_uri = f"data:image/png;base64,{b64}"
+                image_data_uri = AssetStore(db).put_data_uri(
+                    f"data:image/png;base64,{b64}"
+                )
         except Exception as e:
             print(f"[ERROR] Food image generation failed: {e}")
 
@@ -660,6 +667,50 @@ async def clear_food_images(
     return {"ok": True, "result_id": result_id, "persona_id": persona_id, "cleared": cleared}
 
 
+@router.get("/assets/{digest}")
+async def get_asset(
+    digest: str,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """Stream a stored image by its SHA-256 digest.
+
+    Unauthenticated so it can back plain <img> tags; the digest is only known to
+    whoever can read the results that reference it. Content never changes for a
+    digest, so responses are cacheable forever and revalidate via ETag.
+    """
+    if not is_valid_digest(digest):
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    metadata = AssetStore(db).get_metadata(digest)
+    if metadata is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    content_type, size = metadata
+
+    etag = f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "X-Content-Type-Options": "nosniff",
+        # Stored SVGs must not run scripts when opened directly
+        "Content-Security-Policy": "default-src 'none'; style-src 'unsafe-inline'; sandbox",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    def _stream():
+        # The request's session is closed before the body is sent
+        stream_db = SessionLocal()
+        try:
+            yield from AssetStore(stream_db).iter_chunks(digest, size)
+        finally:
+            stream_db.close()
+
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(_stream(), media_type=content_type, headers=headers)
+
+
 @router.get("/results")
 async def list_analysis_results(
     limit: int = 25,
@@ -8,6 +8,8 @@ import os
 import json  # Import json for logging
 from typing import Dict, Any, List
 
+from backend.infrastructure.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,9 +127,10 @@ async def process_data(
         # Extract analysis_id from config if available for quality tracking
         analysis_id = config.get("analysis_id") if config else None
 
-        results = await nlp_processor.process_interview_data(
-            data, llm_service, config, progress_callback, analysis_id
-        )
+        with span("nlp_pipeline"):
+            results = await nlp_processor.process_interview_data(
+                data, llm_service, config, progress_callback, analysis_id
+            )
 
         # Progress updates are now handled inside the NLP processor
 
@@ -150,7 +153,8 @@ async def process_data(
         # Progress updates are now handled inside the NLP processor
 
         # Use the new return type (is_valid, missing_fields)
-        is_valid, missing_fields = await nlp_processor.validate_results(results)
+        with span("result_validation"):
+            is_valid, missing_fields = await nlp_processor.validate_results(results)
 
         if not is_valid:
             logger.warning(f"Validation issues: {missing_fields}")
@@ -190,15 +194,16 @@ async def process_data(
                 )
 
                 # Enhance personas with stakeholder intelligence features
-                enhancement_result = await persona_enhancement_service.enhance_personas_with_stakeholder_intelligence(
-                    personas=results["personas"],
-                    stakeholder_intelligence=stakeholder_intelligence,
-                    analysis_context={
-                        "themes": results.get("themes", []),
-                        "patterns": results.get("patterns", []),
-                        "insights": results.get("insights", []),
-                    },
-                )
+                with span("persona_enhancement"):
+                    enhancement_result = await persona_enhancement_service.enhance_personas_with_stakeholder_intelligence(
+                        personas=results["personas"],
+                        stakeholder_intelligence=stakeholder_intelligence,
+                        analysis_context={
+                            "themes": results.get("themes", []),
+                            "patterns": results.get("patterns", []),
+                            "insights": results.get("insights", []),
+                        },
+                    )
 
                 # Update results with enhanced personas
                 if enhancement_result.enhanced_personas:
@@ -270,9 +275,10 @@ async def process_data(
         # Pass the progress_callback to extract_insights
         insights_config = {"progress_callback": progress_callback}
 
-        insights = await nlp_processor.extract_insights(
-            results, llm_service, insights_config
-        )
+        with span("insight_extraction"):
+            insights = await nlp_processor.extract_insights(
+                results, llm_service, insights_config
+            )
 
         logger.info("Returned from nlp_processor.extract_insights.")
 
@@ -344,6 +344,7 @@ def create_tables():
                         llm_model VARCHAR(50),
                         status VARCHAR(50),
                         error_message TEXT,
+                        summary TEXT,
                         FOREIGN KEY (data_id) REFERENCES interview_data(id)
                     )
                     """
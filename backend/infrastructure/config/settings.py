@@ -68,6 +68,52 @@ class Settings:
         self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
         self.db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 
+        # Async database engine (asyncpg/aiosqlite); sized separately from the sync pool
+        self.async_db_enabled = os.getenv("ASYNC_DB_ENABLED", "true").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        self.async_database_url = os.getenv("ASYNC_DATABASE_URL", "")
+        self.async_db_pool_size = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+        self.async_db_max_overflow = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
+        self.async_db_pool_timeout = int(os.getenv("ASYNC_DB_POOL_TIMEOUT", "30"))
+
+        # Durable analysis job queue (pipeline_runs table) and worker settings.
+        # When disabled, analyses run as in-process background tasks.
+        self.analysis_queue_enabled = os.getenv(
+            "ANALYSIS_QUEUE_ENABLED", "false"
+        ).lower() in ("1", "true", "yes")
+        self.job_max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+        self.job_lease_seconds = int(os.getenv("JOB_LEASE_SECONDS", "120"))
+        self.job_heartbeat_seconds = int(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+        self.job_retry_delay_seconds = int(os.getenv("JOB_RETRY_DELAY_SECONDS", "30"))
+        self.job_global_concurrency = int(os.getenv("JOB_GLOBAL_CONCURRENCY", "8"))
+        self.job_per_user_concurrency = int(os.getenv("JOB_PER_USER_CONCURRENCY", "2"))
+        self.worker_concurrency = int(os.getenv("WORKER_CONCURRENCY", "2"))
+        self.worker_poll_seconds = float(os.getenv("WORKER_POLL_SECONDS", "2"))
+
+        # LLM-bound analysis stages (themes, patterns, personas, ...) allowed to
+        # run at once within one analysis
+        self.analysis_stage_concurrency = int(
+            os.getenv("ANALYSIS_STAGE_CONCURRENCY", "3")
+        )
+
+        # Adaptive (AIMD) limit on concurrent requests to one LLM provider,
+        # shared by every caller in the process
+        self.llm_concurrency_initial = int(os.getenv("LLM_CONCURRENCY_INITIAL", "4"))
+        self.llm_concurrency_min = int(os.getenv("LLM_CONCURRENCY_MIN", "1"))
+        self.llm_concurrency_max = int(os.getenv("LLM_CONCURRENCY_MAX", "32"))
+        # Route AsyncGenAIClient requests through the shared Gemini limiter
+        self.genai_adaptive_concurrency = os.getenv(
+            "GENAI_ADAPTIVE_CONCURRENCY", "false"
+        ).lower() in ("1", "true", "yes")
+
+        # Video segments analyzed at once within one video analysis request
+        self.video_segment_concurrency = int(
+            os.getenv("VIDEO_SEGMENT_CONCURRENCY", "4")
+        )
+
         # LLM Provider Configurations
         self.llm_providers = {
             "openai": {
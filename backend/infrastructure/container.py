@@ -12,6 +12,10 @@ from typing import Callable, Optional, Any
 from sqlalchemy.orm import Session
 
 from backend.database import SessionLocal
+from backend.infrastructure.persistence.async_database import (
+    get_async_session_factory,
+    is_async_db_available,
+)
 from backend.infrastructure.persistence.unit_of_work import UnitOfWork
 from backend.services.stakeholder.agent_factory import StakeholderAgentFactory
 
@@ -71,6 +75,42 @@ class Container:
         """
         return UnitOfWork(self.get_session_factory())
 
+    def get_async_session_factory(self) -> Callable[[], Any]:
+        """
+        Get the async session factory.
+
+        Falls back to the synchronous factory when async sessions are disabled
+        (ASYNC_DB_ENABLED=false) or the async driver is not installed.
+
+        Returns:
+            Factory function that creates a new AsyncSession (or Session)
+        """
+        if is_async_db_available():
+            return get_async_session_factory()
+        return self.get_session_factory()
+
+    def get_async_unit_of_work(self) -> UnitOfWork:
+        """
+        Get a new Unit of Work backed by an AsyncSession.
+
+        Must be used with ``async with``.
+
+        Returns:
+            New Unit of Work instance
+        """
+        return UnitOfWork(self.get_async_session_factory())
+
+    def get_job_queue(self) -> Any:
+        """
+        Get the durable background job queue.
+
+        Returns:
+            JobQueue bound to the async session factory
+        """
+        from backend.services.jobs.queue import JobQueue
+
+        return JobQueue(self.get_async_session_factory())
+
     def register_service(self, name: str, service_instance: Any):
         """
         Register a service instance with the container.
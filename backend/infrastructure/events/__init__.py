@@ -7,6 +7,13 @@ from .event_system import (
     event_manager
 )
 
+from .analysis_stream import (
+    AnalysisStreamBroker,
+    analysis_stream,
+    publish_analysis_event,
+    stream_analysis_events
+)
+
 from .processing_events import (
     ProcessingStage,
     ProcessingStatus,
@@ -19,6 +26,10 @@ __all__ = [
     'Event',
     'EventManager',
     'event_manager',
+    'AnalysisStreamBroker',
+    'analysis_stream',
+    'publish_analysis_event',
+    'stream_analysis_events',
     'ProcessingStage',
     'ProcessingStatus',
     'QualityMetrics',
@@ -0,0 +1,157 @@
+"""
+Streaming of partial analysis results.
+
+The analysis pipeline publishes artifacts (themes, patterns, sentiment,
+personas, insights) and progress through the event manager as each stage
+finishes. ``AnalysisStreamBroker`` fans them out to per-analysis subscriber
+queues, and ``stream_analysis_events`` renders them as server-sent events.
+
+Events are process-local. Analyses executed by a separate job worker are not
+visible to the API process, so the stream falls back to checking the stored
+status on every keepalive and still delivers the terminal event.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from .event_system import Event, EventManager, EventType, event_manager
+
+logger = logging.getLogger(__name__)
+
+# Artifacts in the order the pipeline produces them
+PARTIAL_ARTIFACTS = ("themes", "patterns", "sentiment", "personas", "insights")
+PROGRESS_EVENT = "progress"
+COMPLETE_EVENT = "complete"
+ERROR_EVENT = "error"
+TERMINAL_EVENTS = (COMPLETE_EVENT, ERROR_EVENT)
+
+# Stored AnalysisResult status -> terminal stream event
+_TERMINAL_STATUSES = {"completed": COMPLETE_EVENT, "failed": ERROR_EVENT}
+
+
+async def publish_analysis_event(
+    analysis_id: Optional[int], kind: str, data: Any = None
+) -> None:
+    """Publish a partial result or lifecycle event for a running analysis."""
+    if analysis_id is None:
+        return
+    try:
+        await event_manager.emit(
+            EventType.PARTIAL_RESULT,
+            {"stage": kind, "analysis_id": analysis_id, "data": data},
+        )
+    except Exception as e:
+        # Streaming is best-effort; never fail the pipeline over it
+        logger.warning(f"Failed to publish {kind} for analysis {analysis_id}: {e}")
+
+
+class AnalysisStreamBroker:
+    """Fans out PARTIAL_RESULT events to subscribers of each analysis."""
+
+    def __init__(self, manager: EventManager = event_manager):
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        # Latest message per kind for analyses in flight, replayed to late subscribers
+        self._snapshots: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        manager.on(EventType.PARTIAL_RESULT, self._on_event)
+
+    async def _on_event(self, event: Event) -> None:
+        analysis_id = event.data.get("analysis_id")
+        if analysis_id is None:
+            return
+        message = {"event": event.stage, "data": event.data.get("data")}
+
+        if event.stage in TERMINAL_EVENTS:
+            self._snapshots.pop(analysis_id, None)
+        else:
+            self._snapshots.setdefault(analysis_id, {})[event.stage] = message
+
+        for queue in self._subscribers.get(analysis_id, ()):
+            queue.put_nowait(message)
+
+    def subscribe(self, analysis_id: int) -> asyncio.Queue:
+        """Register a subscriber; artifacts already produced are queued first."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for message in self._snapshots.get(analysis_id, {}).values():
+            queue.put_nowait(message)
+        self._subscribers.setdefault(analysis_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, analysis_id: int, queue: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(analysis_id)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[analysis_id]
+
+
+# Global broker instance
+analysis_stream = AnalysisStreamBroker()
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    return str(obj)
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Render one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n"
+
+
+async def stream_analysis_events(
+    analysis_id: int,
+    load_status: Callable[[], Awaitable[Optional[str]]],
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    keepalive_seconds: float = 15.0,
+    broker: Optional[AnalysisStreamBroker] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield server-sent events for an analysis until it completes or fails.
+
+    Args:
+        analysis_id: ID of the analysis result
+        load_status: Returns the stored AnalysisResult status
+        is_disconnected: Returns True once the client went away
+        keepalive_seconds: Idle interval between keepalives and status checks
+        broker: Broker to subscribe to (defaults to the global one)
+    """
+    broker = broker or analysis_stream
+    # Subscribe before reading the status so no event is lost in between
+    queue = broker.subscribe(analysis_id)
+
+    def _terminal(status: Optional[str]) -> Optional[str]:
+        event = _TERMINAL_STATUSES.get(status)
+        if event:
+            return format_sse(event, {"result_id": analysis_id, "status": status})
+        return None
+
+    try:
+        terminal = _terminal(await load_status())
+        if terminal:
+            yield terminal
+            return
+
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+            except asyncio.TimeoutError:
+                if is_disconnected and await is_disconnected():
+                    return
+                terminal = _terminal(await load_status())
+                if terminal:
+                    yield terminal
+                    return
+                yield ": keepalive\n\n"
+                continue
+
+            yield format_sse(message["event"], message["data"])
+            if message["event"] in TERMINAL_EVENTS:
+                return
+    finally:
+        broker.unsubscribe(analysis_id, queue)
@@ -18,6 +18,7 @@ class EventType(Enum):
     STATE_CHANGED = auto()
     TASK_COMPLETED = auto()
     CONFIG_LOADED = auto()
+    PARTIAL_RESULT = auto()
 
 class Event:
     """Event data structure"""
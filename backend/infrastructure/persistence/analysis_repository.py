@@ -7,14 +7,16 @@ using SQLAlchemy for database access.
 
 import json
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timezone
 
 from backend.domain.repositories.analysis_repository import IAnalysisRepository
 from backend.infrastructure.persistence.base_repository import BaseRepository
-from backend.models import AnalysisResult
+from backend.models import AnalysisResult, InterviewData
 from backend.utils.timezone_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -28,15 +30,24 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
     using SQLAlchemy for database access.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Union[Session, AsyncSession]):
         """
         Initialize the repository.
 
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (sync or async)
         """
         super().__init__(session, AnalysisResult)
 
+    @staticmethod
+    def _owned_by(user_id: str):
+        """Select analysis results whose interview data belongs to the user."""
+        return (
+            select(AnalysisResult)
+            .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+            .where(InterviewData.user_id == user_id)
+        )
+
     async def create(
         self,
         user_id: str,
@@ -68,9 +79,9 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
             }
 
             # Create new AnalysisResult instance
+            # Ownership is tracked on the interview data row
             analysis_result = AnalysisResult(
                 data_id=data_id,
-                user_id=user_id,
                 analysis_date=utc_now(),
                 llm_provider=llm_provider,
                 llm_model=llm_model,
@@ -100,13 +111,8 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.result_id == result_id,
-                    AnalysisResult.user_id == user_id,
-                )
-                .first()
+            analysis_result = await self._first(
+                self._owned_by(user_id).where(AnalysisResult.result_id == result_id)
             )
 
             if not analysis_result:
@@ -114,6 +120,7 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
 
             # Convert to dictionary
             result = self.to_dict(analysis_result)
+            result["user_id"] = user_id
 
             # Ensure results is a dictionary
             if isinstance(result.get("results"), str):
@@ -143,13 +150,11 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for analysis results with user_id filter
-            analysis_results = (
-                self.session.query(AnalysisResult)
-                .filter(AnalysisResult.user_id == user_id)
+            analysis_results = await self._all(
+                self._owned_by(user_id)
                 .order_by(AnalysisResult.analysis_date.desc())
                 .limit(limit)
                 .offset(offset)
-                .all()
             )
 
             # Convert to list of dictionaries
@@ -207,13 +212,8 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.result_id == result_id,
-                    AnalysisResult.user_id == user_id,
-                )
-                .first()
+            analysis_result = await self._first(
+                self._owned_by(user_id).where(AnalysisResult.result_id == result_id)
             )
 
             if not analysis_result:
@@ -227,8 +227,9 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
                 analysis_result.completed_at = utc_now()
 
             # Update results dictionary
+            # Copy so the JSON column sees a new value and is flagged dirty
             results = (
-                analysis_result.results
+                dict(analysis_result.results)
                 if isinstance(analysis_result.results, dict)
                 else {}
             )
@@ -241,12 +242,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
             analysis_result.results = results
 
             # Flush changes
-            self.session.flush()
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error updating analysis status: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def update_results(
@@ -265,13 +266,8 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.result_id == result_id,
-                    AnalysisResult.user_id == user_id,
-                )
-                .first()
+            analysis_result = await self._first(
+                self._owned_by(user_id).where(AnalysisResult.result_id == result_id)
             )
 
             if not analysis_result:
@@ -289,12 +285,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
                     analysis_result.completed_at = utc_now()
 
             # Flush changes
-            self.session.flush()
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error updating analysis results: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def delete(self, result_id: int, user_id: str) -> bool:
@@ -310,26 +306,21 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.result_id == result_id,
-                    AnalysisResult.user_id == user_id,
-                )
-                .first()
+            analysis_result = await self._first(
+                self._owned_by(user_id).where(AnalysisResult.result_id == result_id)
             )
 
             if not analysis_result:
                 return False
 
             # Delete the analysis result
-            self.session.delete(analysis_result)
-            self.session.flush()
+            await self._delete(analysis_result)
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error deleting analysis result: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def get_by_data_id(self, data_id: int, user_id: str) -> List[Dict[str, Any]]:
@@ -345,13 +336,10 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for analysis results with data_id and user_id filters
-            analysis_results = (
-                self.session.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.data_id == data_id, AnalysisResult.user_id == user_id
-                )
+            analysis_results = await self._all(
+                self._owned_by(user_id)
+                .where(AnalysisResult.data_id == data_id)
                 .order_by(AnalysisResult.analysis_date.desc())
-                .all()
             )
 
             # Convert to list of dictionaries
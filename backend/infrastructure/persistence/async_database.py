@@ -0,0 +1,166 @@
+"""
+Async database engine and session factory.
+
+Provides an ``AsyncEngine``/``AsyncSession`` path next to the synchronous engine
+in ``backend.database`` so repositories can be awaited without blocking the
+event loop. PostgreSQL URLs are mapped to asyncpg and SQLite URLs to aiosqlite.
+The engine is created lazily on first use and has its own pool sizing
+(``ASYNC_DB_POOL_SIZE``, ``ASYNC_DB_MAX_OVERFLOW``, ``ASYNC_DB_POOL_TIMEOUT``).
+"""
+
+import logging
+from typing import AsyncIterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from backend.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a synchronous database URL to its async driver equivalent.
+
+    Args:
+        url: Database URL, e.g. ``postgresql://...`` or ``sqlite:///./axwise.db``
+
+    Returns:
+        URL using ``postgresql+asyncpg`` or ``sqlite+aiosqlite``
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        raise ValueError(f"Invalid database URL: {url!r}")
+
+    dialect = scheme.split("+", 1)[0]
+    if dialect in ("postgresql", "postgres"):
+        async_url = f"postgresql+asyncpg://{rest}"
+        # asyncpg takes ``ssl`` instead of libpq's ``sslmode``
+        parts = urlsplit(async_url)
+        if parts.query:
+            query = [
+                ("ssl" if k == "sslmode" else k, v)
+                for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            ]
+            async_url = urlunsplit(parts._replace(query=urlencode(query)))
+        return async_url
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    raise ValueError(f"No async driver configured for database dialect {dialect!r}")
+
+
+def create_async_db_engine(url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create an async engine for the configured database.
+
+    Args:
+        url: Optional database URL; defaults to ``ASYNC_DATABASE_URL`` or the
+            URL resolved by ``backend.database``
+
+    Returns:
+        AsyncEngine instance
+    """
+    if url is None:
+        url = settings.async_database_url
+    if not url:
+        from backend.database import DATABASE_URL
+
+        url = DATABASE_URL
+
+    async_url = url
+    if "+asyncpg" not in url and "+aiosqlite" not in url:
+        async_url = to_async_url(url)
+
+    if async_url.startswith("sqlite"):
+        engine = create_async_engine(async_url, pool_pre_ping=True)
+        logger.info("Using async SQLite database (aiosqlite)")
+    else:
+        engine = create_async_engine(
+            async_url,
+            pool_size=settings.async_db_pool_size,
+            max_overflow=settings.async_db_max_overflow,
+            pool_timeout=settings.async_db_pool_timeout,
+            pool_pre_ping=True,
+            pool_reset_on_return="rollback",
+            connect_args={"server_settings": {"application_name": "DesignAId Backend"}},
+        )
+        logger.info(
+            f"Using async PostgreSQL database (asyncpg), pool_size={settings.async_db_pool_size}"
+        )
+    return engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the shared async engine, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Get the shared ``AsyncSession`` factory.
+
+    Sessions don't expire objects on commit, since expired attributes cannot be
+    lazily reloaded outside an awaited context.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+def is_async_db_available() -> bool:
+    """Return True if async sessions are enabled and the driver can be loaded."""
+    if not settings.async_db_enabled:
+        return False
+    try:
+        get_async_session_factory()
+        return True
+    except Exception as e:
+        logger.warning(f"Async database engine unavailable, using sync sessions: {e}")
+        return False
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function to get an async database session.
+
+    Yields:
+        AsyncSession: A SQLAlchemy async database session
+    """
+    session = get_async_session_factory()()
+    try:
+        yield session
+    except Exception:
+        try:
+            await session.rollback()
+        except Exception:
+            pass
+        raise
+    finally:
+        await session.close()
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections (call on application shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
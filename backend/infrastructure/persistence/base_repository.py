@@ -3,13 +3,18 @@ Base repository implementation.
 
 This module provides a base implementation of the repository pattern that can be
 extended by concrete repository implementations.
+
+Repositories accept either a synchronous ``Session`` or an ``AsyncSession``.
+All database access goes through the ``_execute``/``_flush``/... helpers, which
+await the async session so queries don't block the event loop.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import inspect
+from sqlalchemy import inspect, select, func
 
 # Type variable for SQLAlchemy model
 T = TypeVar('T')
@@ -25,16 +30,70 @@ class BaseRepository(Generic[T]):
     for SQLAlchemy models.
     """
     
-    def __init__(self, session: Session, model_class: Type[T]):
+    def __init__(self, session: Union[Session, AsyncSession], model_class: Type[T]):
         """
         Initialize the repository.
         
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (sync or async)
             model_class: SQLAlchemy model class
         """
         self.session = session
         self.model_class = model_class
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the repository is bound to an AsyncSession."""
+        return isinstance(self.session, AsyncSession)
+
+    async def _execute(self, statement: Any) -> Any:
+        """Execute a statement on the bound session."""
+        if self.is_async:
+            return await self.session.execute(statement)
+        return self.session.execute(statement)
+
+    async def _first(self, statement: Any) -> Optional[Any]:
+        """Return the first ORM entity selected by a statement, or None."""
+        result = await self._execute(statement)
+        return result.scalars().first()
+
+    async def _all(self, statement: Any) -> List[Any]:
+        """Return all ORM entities selected by a statement."""
+        result = await self._execute(statement)
+        return list(result.scalars().all())
+
+    async def _scalar(self, statement: Any) -> Any:
+        """Return a single scalar value selected by a statement."""
+        result = await self._execute(statement)
+        return result.scalar()
+
+    async def _flush(self) -> None:
+        if self.is_async:
+            await self.session.flush()
+        else:
+            self.session.flush()
+
+    async def _rollback(self) -> None:
+        if self.is_async:
+            await self.session.rollback()
+        else:
+            self.session.rollback()
+
+    async def _delete(self, entity: Any) -> None:
+        if self.is_async:
+            await self.session.delete(entity)
+        else:
+            self.session.delete(entity)
+
+    async def _get(self, entity_id: Any) -> Optional[T]:
+        if self.is_async:
+            return await self.session.get(self.model_class, entity_id)
+        return self.session.get(self.model_class, entity_id)
+
+    async def _merge(self, entity: T) -> T:
+        if self.is_async:
+            return await self.session.merge(entity)
+        return self.session.merge(entity)
     
     def _get_primary_key_name(self) -> str:
         """
@@ -61,11 +120,11 @@ class BaseRepository(Generic[T]):
         """
         try:
             self.session.add(entity)
-            self.session.flush()  # Flush to get the ID without committing
+            await self._flush()  # Flush to get the ID without committing
             return entity
         except SQLAlchemyError as e:
             logger.error(f"Error adding entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def get_by_id(self, entity_id: Any) -> Optional[T]:
@@ -79,7 +138,7 @@ class BaseRepository(Generic[T]):
             The entity if found, None otherwise
         """
         try:
-            return self.session.query(self.model_class).get(entity_id)
+            return await self._get(entity_id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting entity by ID: {str(e)}")
             raise
@@ -96,7 +155,9 @@ class BaseRepository(Generic[T]):
             List of entities
         """
         try:
-            return self.session.query(self.model_class).limit(limit).offset(offset).all()
+            return await self._all(
+                select(self.model_class).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting all entities: {str(e)}")
             raise
@@ -112,12 +173,12 @@ class BaseRepository(Generic[T]):
             The updated entity
         """
         try:
-            self.session.merge(entity)
-            self.session.flush()
+            await self._merge(entity)
+            await self._flush()
             return entity
         except SQLAlchemyError as e:
             logger.error(f"Error updating entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def delete(self, entity_id: Any) -> bool:
@@ -131,15 +192,15 @@ class BaseRepository(Generic[T]):
             True if deletion was successful, False otherwise
         """
         try:
-            entity = await self.get_by_id(entity_id)
+            entity = await self._get(entity_id)
             if entity:
-                self.session.delete(entity)
-                self.session.flush()
+                await self._delete(entity)
+                await self._flush()
                 return True
             return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def count(self) -> int:
@@ -150,7 +211,9 @@ class BaseRepository(Generic[T]):
             Number of entities
         """
         try:
-            return self.session.query(self.model_class).count()
+            return await self._scalar(
+                select(func.count()).select_from(self.model_class)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error counting entities: {str(e)}")
             raise
@@ -8,7 +8,9 @@ using SQLAlchemy for database access.
 import json
 import logging
 from typing import List, Optional, Dict, Any, Union
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 
@@ -27,12 +29,12 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
     using SQLAlchemy for database access.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Union[Session, AsyncSession]):
         """
         Initialize the repository.
 
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (sync or async)
         """
         super().__init__(session, InterviewData)
 
@@ -93,10 +95,10 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
         """
         try:
             # Query for the interview data with user_id filter
-            interview_data = (
-                self.session.query(InterviewData)
-                .filter(InterviewData.id == data_id, InterviewData.user_id == user_id)
-                .first()
+            interview_data = await self._first(
+                select(InterviewData).where(
+                    InterviewData.id == data_id, InterviewData.user_id == user_id
+                )
             )
 
             if not interview_data:
@@ -133,13 +135,12 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
         """
         try:
             # Query for interview data with user_id filter
-            interview_data_list = (
-                self.session.query(InterviewData)
-                .filter(InterviewData.user_id == user_id)
+            interview_data_list = await self._all(
+                select(InterviewData)
+                .where(InterviewData.user_id == user_id)
                 .order_by(InterviewData.upload_date.desc())
                 .limit(limit)
                 .offset(offset)
-                .all()
             )
 
             # Convert to list of dictionaries
@@ -168,23 +169,23 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
         """
         try:
             # Query for the interview data with user_id filter
-            interview_data = (
-                self.session.query(InterviewData)
-                .filter(InterviewData.id == data_id, InterviewData.user_id == user_id)
-                .first()
+            interview_data = await self._first(
+                select(InterviewData).where(
+                    InterviewData.id == data_id, InterviewData.user_id == user_id
+                )
             )
 
             if not interview_data:
                 return False
 
             # Delete the interview data
-            self.session.delete(interview_data)
-            self.session.flush()
+            await self._delete(interview_data)
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error deleting interview data: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def update_metadata(
@@ -203,10 +204,10 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
         """
         try:
             # Query for the interview data with user_id filter
-            interview_data = (
-                self.session.query(InterviewData)
-                .filter(InterviewData.id == data_id, InterviewData.user_id == user_id)
-                .first()
+            interview_data = await self._first(
+                select(InterviewData).where(
+                    InterviewData.id == data_id, InterviewData.user_id == user_id
+                )
             )
 
             if not interview_data:
@@ -222,12 +223,12 @@ class InterviewRepository(BaseRepository[InterviewData], IInterviewRepository):
             # Add more metadata fields as needed
 
             # Flush changes
-            self.session.flush()
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error updating interview data metadata: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     # Implementation of IInterviewRepository abstract methods
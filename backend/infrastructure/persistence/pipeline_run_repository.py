@@ -1,18 +1,26 @@
 """
 Repository for AxPersona pipeline run persistence.
+
+The ``pipeline_runs`` table also backs the durable background job queue
+(``backend.services.jobs``): queued jobs carry a ``job_type`` other than
+``PIPELINE_JOB_TYPE`` and are claimed by workers under a time-limited lease.
 """
 
+import json
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import datetime, timedelta
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select, update
 
-from backend.models import PipelineRun
+from backend.models import AnalysisResult, PipelineRun
 from backend.infrastructure.persistence.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# job_type of AxPersona pipeline runs (executed in-process, never claimed by workers)
+PIPELINE_JOB_TYPE = "axpersona_pipeline"
+
 
 class PipelineRunRepository(BaseRepository[PipelineRun]):
     """Repository for managing AxPersona pipeline run persistence."""
@@ -89,7 +97,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             if error:
                 pipeline_run.error = error
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated pipeline run status: {job_id} -> {status}")
             return pipeline_run
             
@@ -141,7 +149,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             pipeline_run.persona_count = persona_count
             pipeline_run.interview_count = interview_count
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated pipeline run results: {job_id}")
             return pipeline_run
 
@@ -160,9 +168,9 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             Pipeline run or None if not found
         """
         try:
-            return self.session.query(PipelineRun).filter(
-                PipelineRun.job_id == job_id
-            ).first()
+            return await self._first(
+                select(PipelineRun).where(PipelineRun.job_id == job_id)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting pipeline run by job ID: {str(e)}")
             raise
@@ -172,7 +180,8 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
         user_id: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        job_type: Optional[str] = PIPELINE_JOB_TYPE,
     ) -> List[PipelineRun]:
         """
         Get all pipeline runs with optional filtering.
@@ -182,20 +191,26 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             status: Optional status filter (pending, running, completed, failed)
             limit: Maximum number of results
             offset: Offset for pagination
+            job_type: Job type filter (None for all, including queued jobs)
 
         Returns:
             List of pipeline runs ordered by creation date (newest first)
         """
         try:
-            query = self.session.query(PipelineRun)
+            query = select(PipelineRun)
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
             if status:
-                query = query.filter(PipelineRun.status == status)
+                query = query.where(PipelineRun.status == status)
+
+            if job_type:
+                query = query.where(PipelineRun.job_type == job_type)
 
-            return query.order_by(desc(PipelineRun.created_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                query.order_by(desc(PipelineRun.created_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting pipeline runs: {str(e)}")
             raise
@@ -204,7 +219,8 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
         self,
         user_id: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        job_type: Optional[str] = PIPELINE_JOB_TYPE,
     ) -> List[PipelineRun]:
         """
         Get completed pipeline runs.
@@ -213,19 +229,23 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             user_id: Optional user filter
             limit: Maximum number of results
             offset: Offset for pagination
+            job_type: Job type filter (None for all, including queued jobs)
 
         Returns:
             List of completed pipeline runs
         """
         try:
-            query = self.session.query(PipelineRun).filter(
-                PipelineRun.status == "completed"
-            )
+            query = select(PipelineRun).where(PipelineRun.status == "completed")
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
-            return query.order_by(desc(PipelineRun.completed_at)).limit(limit).offset(offset).all()
+            if job_type:
+                query = query.where(PipelineRun.job_type == job_type)
+
+            return await self._all(
+                query.order_by(desc(PipelineRun.completed_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting completed pipeline runs: {str(e)}")
             raise
@@ -233,7 +253,8 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
     async def count_pipeline_runs(
         self,
         user_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        job_type: Optional[str] = PIPELINE_JOB_TYPE,
     ) -> int:
         """
         Count pipeline runs with optional filtering.
@@ -241,20 +262,24 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
         Args:
             user_id: Optional user filter
             status: Optional status filter
+            job_type: Job type filter (None for all, including queued jobs)
 
         Returns:
             Count of matching pipeline runs
         """
         try:
-            query = self.session.query(PipelineRun)
+            query = select(func.count()).select_from(PipelineRun)
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
             if status:
-                query = query.filter(PipelineRun.status == status)
+                query = query.where(PipelineRun.status == status)
+
+            if job_type:
+                query = query.where(PipelineRun.job_type == job_type)
 
-            return query.count()
+            return await self._scalar(query)
         except SQLAlchemyError as e:
             logger.error(f"Error counting pipeline runs: {str(e)}")
             raise
@@ -268,7 +293,8 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
 
         This should be called on server startup to clean up jobs that were
         interrupted when the server restarted. In-memory asyncio tasks don't
-        survive restarts, so any 'running' jobs in the DB are orphaned.
+        survive restarts, so any 'running' jobs in the DB are orphaned. Queued
+        jobs are recovered through lease expiry instead and are not touched.
 
         Args:
             stale_threshold_minutes: Jobs running longer than this are considered stale
@@ -277,20 +303,21 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             Number of jobs marked as failed
         """
         try:
-            from datetime import timedelta
-
             cutoff_time = datetime.utcnow() - timedelta(minutes=stale_threshold_minutes)
 
             # Find stale jobs: status is 'running' or 'pending' AND
             # (started_at is old OR created_at is old for pending jobs)
-            stale_runs = self.session.query(PipelineRun).filter(
-                PipelineRun.status.in_(["running", "pending"]),
-                # Either started_at is before cutoff, or created_at for pending jobs
-                (
-                    (PipelineRun.started_at.isnot(None) & (PipelineRun.started_at < cutoff_time)) |
-                    (PipelineRun.started_at.is_(None) & (PipelineRun.created_at < cutoff_time))
+            stale_runs = await self._all(
+                select(PipelineRun).where(
+                    PipelineRun.job_type == PIPELINE_JOB_TYPE,
+                    PipelineRun.status.in_(["running", "pending"]),
+                    # Either started_at is before cutoff, or created_at for pending jobs
+                    (
+                        (PipelineRun.started_at.isnot(None) & (PipelineRun.started_at < cutoff_time)) |
+                        (PipelineRun.started_at.is_(None) & (PipelineRun.created_at < cutoff_time))
+                    )
                 )
-            ).all()
+            )
 
             count = 0
             for run in stale_runs:
@@ -301,7 +328,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
                 logger.info(f"Marked stale pipeline run as failed: {run.job_id}")
 
             if count > 0:
-                self.session.flush()
+                await self._flush()
                 logger.info(f"Recovered {count} stale pipeline runs (marked as failed)")
 
             return count
@@ -309,3 +336,366 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
         except SQLAlchemyError as e:
             logger.error(f"Error marking stale runs as failed: {str(e)}")
             raise
+
+    # ------------------------------------------------------------------
+    # Job queue
+    # ------------------------------------------------------------------
+
+    async def enqueue_job(
+        self,
+        job_id: str,
+        job_type: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: int = 1,
+        analysis_id: Optional[str] = None,
+    ) -> PipelineRun:
+        """
+        Create a pending job for workers to claim.
+
+        Args:
+            job_id: Unique job identifier
+            job_type: Handler key used by workers
+            payload: Job-type specific arguments
+            user_id: Optional owner, used for per-user concurrency caps
+            priority: Higher values are claimed first
+            max_attempts: Total attempts before the job is marked failed
+            analysis_id: Optional reference to the AnalysisResult the job produces
+
+        Returns:
+            Created job record
+        """
+        try:
+            now = datetime.utcnow()
+            job = PipelineRun(
+                job_id=job_id,
+                job_type=job_type,
+                user_id=user_id,
+                status="pending",
+                business_context={},
+                payload=payload,
+                priority=priority,
+                attempts=0,
+                max_attempts=max(1, max_attempts),
+                available_at=now,
+                created_at=now,
+                analysis_id=analysis_id,
+            )
+            await self.add(job)
+            logger.info(f"Enqueued {job_type} job {job_id} (priority={priority})")
+            return job
+        except SQLAlchemyError as e:
+            logger.error(f"Error enqueuing job: {str(e)}")
+            raise
+
+    async def record_job_trace(
+        self, job_id: str, execution_trace: List[Dict[str, Any]]
+    ) -> Optional[PipelineRun]:
+        """
+        Store the per-stage execution trace of a job.
+
+        Returns:
+            Updated job or None if not found
+        """
+        try:
+            job = await self.get_by_job_id(job_id)
+            if not job:
+                return None
+            job.execution_trace = execution_trace
+            await self._flush()
+            return job
+        except SQLAlchemyError as e:
+            logger.error(f"Error recording job trace: {str(e)}")
+            raise
+
+    async def get_latest_for_analysis(self, analysis_id: str) -> Optional[PipelineRun]:
+        """Most recent run or job that references an analysis result."""
+        try:
+            return await self._first(
+                select(PipelineRun)
+                .where(PipelineRun.analysis_id == analysis_id)
+                .order_by(desc(PipelineRun.created_at))
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting pipeline run for analysis: {str(e)}")
+            raise
+
+    async def _running_counts(self, job_types: Sequence[str]) -> Dict[Optional[str], int]:
+        """Running job counts per user for the given job types."""
+        result = await self._execute(
+            select(PipelineRun.user_id, func.count())
+            .where(
+                PipelineRun.job_type.in_(list(job_types)),
+                PipelineRun.status == "running",
+            )
+            .group_by(PipelineRun.user_id)
+        )
+        return {user_id: count for user_id, count in result.all()}
+
+    async def claim_next_job(
+        self,
+        worker_id: str,
+        job_types: Sequence[str],
+        lease_seconds: int,
+        global_limit: Optional[int] = None,
+        per_user_limit: Optional[int] = None,
+        batch_size: int = 20,
+    ) -> Optional[PipelineRun]:
+        """
+        Lease the highest-priority claimable job.
+
+        Candidates are pending jobs whose ``available_at`` has passed, in
+        priority then FIFO order, skipping users at their concurrency cap. The
+        claim is a conditional update on ``status == 'pending'``, so concurrent
+        workers never lease the same job. Caps are checked before claiming and
+        may overshoot by the number of workers claiming at the same instant.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            job_types: Job types this worker can execute
+            lease_seconds: Lease duration; renew with ``heartbeat_job``
+            global_limit: Maximum running jobs across all workers
+            per_user_limit: Maximum running jobs per user
+            batch_size: Number of candidates inspected per call
+
+        Returns:
+            The leased job, or None if nothing is claimable
+        """
+        try:
+            running = await self._running_counts(job_types)
+            if global_limit and sum(running.values()) >= global_limit:
+                return None
+
+            now = datetime.utcnow()
+            candidates = await self._all(
+                select(PipelineRun)
+                .where(
+                    PipelineRun.job_type.in_(list(job_types)),
+                    PipelineRun.status == "pending",
+                    (PipelineRun.available_at.is_(None)) | (PipelineRun.available_at <= now),
+                )
+                .order_by(
+                    desc(PipelineRun.priority),
+                    PipelineRun.created_at,
+                    PipelineRun.id,
+                )
+                .limit(batch_size)
+            )
+
+            for candidate in candidates:
+                if (
+                    per_user_limit
+                    and candidate.user_id is not None
+                    and running.get(candidate.user_id, 0) >= per_user_limit
+                ):
+                    continue
+                result = await self._execute(
+                    update(PipelineRun)
+                    .where(
+                        PipelineRun.id == candidate.id,
+                        PipelineRun.status == "pending",
+                    )
+                    .values(
+                        status="running",
+                        lease_owner=worker_id,
+                        lease_expires_at=now + timedelta(seconds=lease_seconds),
+                        heartbeat_at=now,
+                        attempts=PipelineRun.attempts + 1,
+                        started_at=func.coalesce(PipelineRun.started_at, now),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 1:
+                    job = await self._first(
+                        select(PipelineRun)
+                        .where(PipelineRun.id == candidate.id)
+                        .execution_options(populate_existing=True)
+                    )
+                    logger.info(
+                        f"Worker {worker_id} claimed {job.job_type} job {job.job_id} "
+                        f"(attempt {job.attempts}/{job.max_attempts})"
+                    )
+                    return job
+            return None
+        except SQLAlchemyError as e:
+            logger.error(f"Error claiming job: {str(e)}")
+            raise
+
+    async def heartbeat_job(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        """
+        Extend the lease on a running job.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        try:
+            now = datetime.utcnow()
+            result = await self._execute(
+                update(PipelineRun)
+                .where(
+                    PipelineRun.job_id == job_id,
+                    PipelineRun.lease_owner == worker_id,
+                    PipelineRun.status == "running",
+                )
+                .values(
+                    heartbeat_at=now,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount == 1
+        except SQLAlchemyError as e:
+            logger.error(f"Error renewing job lease: {str(e)}")
+            raise
+
+    async def _get_leased(self, job_id: str, worker_id: str) -> Optional[PipelineRun]:
+        return await self._first(
+            select(PipelineRun)
+            .where(
+                PipelineRun.job_id == job_id,
+                PipelineRun.lease_owner == worker_id,
+                PipelineRun.status == "running",
+            )
+            .execution_options(populate_existing=True)
+        )
+
+    async def complete_job(self, job_id: str, worker_id: str) -> bool:
+        """
+        Mark a leased job completed.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        try:
+            job = await self._get_leased(job_id, worker_id)
+            if not job:
+                return False
+            now = datetime.utcnow()
+            job.status = "completed"
+            job.completed_at = now
+            job.error = None
+            job.lease_owner = None
+            job.lease_expires_at = None
+            if job.started_at:
+                job.total_duration_seconds = (now - job.started_at).total_seconds()
+            await self._flush()
+            return True
+        except SQLAlchemyError as e:
+            logger.error(f"Error completing job: {str(e)}")
+            raise
+
+    def _release_for_retry(self, job: PipelineRun, error: str, retry_delay_seconds: float) -> None:
+        now = datetime.utcnow()
+        job.error = error
+        job.lease_owner = None
+        job.lease_expires_at = None
+        if job.attempts < job.max_attempts:
+            job.status = "pending"
+            job.available_at = now + timedelta(seconds=retry_delay_seconds)
+        else:
+            job.status = "failed"
+            job.completed_at = now
+
+    async def _fail_analysis(self, job: PipelineRun) -> None:
+        """Mark the AnalysisResult of a job that exhausted its attempts as failed.
+
+        Without this the result stays "processing" forever: the handler never
+        reached the code that records analysis errors.
+        """
+        if job.status != "failed" or not job.analysis_id:
+            return
+        try:
+            result_id = int(job.analysis_id)
+        except (TypeError, ValueError):
+            return
+        analysis = await self._first(
+            select(AnalysisResult).where(
+                AnalysisResult.result_id == result_id,
+                AnalysisResult.status == "processing",
+            )
+        )
+        if not analysis:
+            return
+
+        results = analysis.results
+        if isinstance(results, str):
+            try:
+                results = json.loads(results)
+            except (json.JSONDecodeError, TypeError):
+                results = None
+        results = dict(results) if isinstance(results, dict) else {}
+        results.update(
+            {
+                "status": "error",
+                "message": f"Analysis failed: {job.error}",
+                "error_details": job.error,
+                "error_code": "ANALYSIS_JOB_FAILED",
+                "error_time": job.completed_at.isoformat(),
+            }
+        )
+        analysis.results = results
+        analysis.status = "failed"
+        analysis.error_message = job.error
+        analysis.completed_at = job.completed_at
+        logger.info(f"Marked analysis {result_id} failed after job {job.job_id} gave up")
+
+    async def fail_job(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry_delay_seconds: float = 0,
+    ) -> Optional[PipelineRun]:
+        """
+        Record a failed attempt; requeue with a delay if attempts remain.
+
+        A job that has no attempts left also fails its AnalysisResult.
+
+        Returns:
+            The updated job, or None if the worker no longer holds the lease
+        """
+        try:
+            job = await self._get_leased(job_id, worker_id)
+            if not job:
+                return None
+            self._release_for_retry(job, error, retry_delay_seconds)
+            await self._fail_analysis(job)
+            await self._flush()
+            logger.info(f"Job {job_id} attempt {job.attempts} failed -> {job.status}: {error}")
+            return job
+        except SQLAlchemyError as e:
+            logger.error(f"Error failing job: {str(e)}")
+            raise
+
+    async def requeue_expired_leases(self, job_types: Sequence[str]) -> int:
+        """
+        Release running jobs whose lease expired (e.g. the worker died).
+
+        Jobs with attempts left become pending again; the rest are failed,
+        together with the analysis they were producing.
+
+        Returns:
+            Number of jobs released
+        """
+        try:
+            now = datetime.utcnow()
+            expired = await self._all(
+                select(PipelineRun).where(
+                    PipelineRun.job_type.in_(list(job_types)),
+                    PipelineRun.status == "running",
+                    PipelineRun.lease_expires_at < now,
+                )
+            )
+            for job in expired:
+                self._release_for_retry(
+                    job, f"Lease held by {job.lease_owner} expired", retry_delay_seconds=0
+                )
+                await self._fail_analysis(job)
+                logger.warning(f"Released expired lease on job {job.job_id} -> {job.status}")
+            if expired:
+                await self._flush()
+            return len(expired)
+        except SQLAlchemyError as e:
+            logger.error(f"Error releasing expired job leases: {str(e)}")
+            raise
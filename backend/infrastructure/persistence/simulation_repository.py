@@ -7,9 +7,9 @@ import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc
+from sqlalchemy import delete, desc, select
 
-from backend.models import SimulationData
+from backend.models import SimulationData, SimulationInterview
 from backend.infrastructure.persistence.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -97,7 +97,7 @@ class SimulationRepository(BaseRepository[SimulationData]):
             simulation.status = "completed"
             simulation.completed_at = datetime.utcnow()
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated simulation results: {simulation_id}")
             return simulation
             
@@ -105,6 +105,101 @@ class SimulationRepository(BaseRepository[SimulationData]):
             logger.error(f"Error updating simulation results: {str(e)}")
             raise
 
+    async def save_personas(
+        self,
+        simulation_id: str,
+        personas: List[Dict[str, Any]],
+    ) -> Optional[SimulationData]:
+        """
+        Checkpoint generated personas before interviews start.
+        
+        Args:
+            simulation_id: Simulation identifier
+            personas: Generated personas
+            
+        Returns:
+            Updated simulation data or None if not found
+        """
+        try:
+            simulation = await self.get_by_simulation_id(simulation_id)
+            if not simulation:
+                logger.warning(f"Simulation not found: {simulation_id}")
+                return None
+            
+            simulation.personas = personas
+            simulation.total_personas = len(personas)
+            
+            await self._flush()
+            logger.info(f"Checkpointed {len(personas)} personas: {simulation_id}")
+            return simulation
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving simulation personas: {str(e)}")
+            raise
+
+    async def save_interview(
+        self,
+        simulation_id: str,
+        persona_id: str,
+        interview: Dict[str, Any],
+        stakeholder_type: Optional[str] = None,
+    ) -> SimulationInterview:
+        """
+        Checkpoint one completed interview, replacing any earlier one for the persona.
+        
+        Args:
+            simulation_id: Simulation identifier
+            persona_id: Interviewed persona
+            interview: Completed interview
+            stakeholder_type: Persona's stakeholder type
+            
+        Returns:
+            Stored interview record
+        """
+        try:
+            record = await self._first(
+                select(SimulationInterview).where(
+                    SimulationInterview.simulation_id == simulation_id,
+                    SimulationInterview.persona_id == persona_id,
+                )
+            )
+            if record is None:
+                record = SimulationInterview(
+                    simulation_id=simulation_id,
+                    persona_id=persona_id,
+                    created_at=datetime.utcnow(),
+                )
+                self.session.add(record)
+            record.stakeholder_type = stakeholder_type
+            record.interview = interview
+            
+            await self._flush()
+            return record
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving simulation interview: {str(e)}")
+            raise
+
+    async def get_interviews(self, simulation_id: str) -> List[SimulationInterview]:
+        """
+        Get checkpointed interviews in completion order.
+        
+        Args:
+            simulation_id: Simulation identifier
+            
+        Returns:
+            List of interview records
+        """
+        try:
+            return await self._all(
+                select(SimulationInterview)
+                .where(SimulationInterview.simulation_id == simulation_id)
+                .order_by(SimulationInterview.id)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting simulation interviews: {str(e)}")
+            raise
+
     async def mark_simulation_failed(
         self,
         simulation_id: str,
@@ -130,7 +225,7 @@ class SimulationRepository(BaseRepository[SimulationData]):
             simulation.error_message = error_message
             simulation.completed_at = datetime.utcnow()
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Marked simulation as failed: {simulation_id}")
             return simulation
             
@@ -149,9 +244,11 @@ class SimulationRepository(BaseRepository[SimulationData]):
             Simulation data or None if not found
         """
         try:
-            return self.session.query(SimulationData).filter(
-                SimulationData.simulation_id == simulation_id
-            ).first()
+            return await self._first(
+                select(SimulationData).where(
+                    SimulationData.simulation_id == simulation_id
+                )
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting simulation by ID: {str(e)}")
             raise
@@ -174,9 +271,13 @@ class SimulationRepository(BaseRepository[SimulationData]):
             List of user's simulations
         """
         try:
-            return self.session.query(SimulationData).filter(
-                SimulationData.user_id == user_id
-            ).order_by(desc(SimulationData.created_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                select(SimulationData)
+                .where(SimulationData.user_id == user_id)
+                .order_by(desc(SimulationData.created_at))
+                .limit(limit)
+                .offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting user simulations: {str(e)}")
             raise
@@ -199,14 +300,14 @@ class SimulationRepository(BaseRepository[SimulationData]):
             List of completed simulations
         """
         try:
-            query = self.session.query(SimulationData).filter(
-                SimulationData.status == "completed"
-            )
+            query = select(SimulationData).where(SimulationData.status == "completed")
             
             if user_id:
-                query = query.filter(SimulationData.user_id == user_id)
+                query = query.where(SimulationData.user_id == user_id)
             
-            return query.order_by(desc(SimulationData.completed_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                query.order_by(desc(SimulationData.completed_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting completed simulations: {str(e)}")
             raise
@@ -226,8 +327,13 @@ class SimulationRepository(BaseRepository[SimulationData]):
             if not simulation:
                 return False
             
-            self.session.delete(simulation)
-            self.session.flush()
+            await self._execute(
+                delete(SimulationInterview).where(
+                    SimulationInterview.simulation_id == simulation_id
+                )
+            )
+            await self._delete(simulation)
+            await self._flush()
             logger.info(f"Deleted simulation: {simulation_id}")
             return True
             
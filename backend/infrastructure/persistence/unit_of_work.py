@@ -2,16 +2,25 @@
 Unit of Work pattern implementation.
 
 This module provides an implementation of the Unit of Work pattern for managing
-database transactions.
+database transactions. The session factory may produce either a synchronous
+``Session`` or an ``AsyncSession``; with the latter, ``async with`` commits,
+rolls back and closes without blocking the event loop.
 """
 
 import logging
-from typing import Callable, Type
+from typing import Callable, Type, Union
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.infrastructure.persistence.interview_repository import InterviewRepository
 from backend.infrastructure.persistence.analysis_repository import AnalysisRepository
+from backend.infrastructure.persistence.pipeline_run_repository import (
+    PipelineRunRepository,
+)
+from backend.infrastructure.persistence.simulation_repository import (
+    SimulationRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +34,13 @@ class UnitOfWork:
     lifecycle.
     """
 
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(self, session_factory: Callable[[], Union[Session, AsyncSession]]):
         """
         Initialize the Unit of Work.
 
         Args:
             session_factory: Factory function that creates a new SQLAlchemy session
+                (sync or async)
         """
         self.session_factory = session_factory
         self.session = None
@@ -38,9 +48,24 @@ class UnitOfWork:
         # Repositories will be initialized in __enter__
         self.interviews = None
         self.analyses = None
+        self.pipeline_runs = None
+        self.simulations = None
         self.personas = None
         self.prds = None
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the current session is an AsyncSession."""
+        return isinstance(self.session, AsyncSession)
+
+    def _init_repositories(self):
+        """Bind repositories to the current session."""
+        self.interviews = InterviewRepository(self.session)
+        self.analyses = AnalysisRepository(self.session)
+        self.pipeline_runs = PipelineRunRepository(self.session)
+        self.simulations = SimulationRepository(self.session)
+        # TODO: Initialize other repositories
+
     def __enter__(self):
         """
         Enter the context manager.
@@ -52,11 +77,14 @@ class UnitOfWork:
             The UnitOfWork instance
         """
         self.session = self.session_factory()
+        if self.is_async:
+            self.session = None
+            raise TypeError(
+                "UnitOfWork with an async session factory must be used with 'async with'"
+            )
 
         # Initialize repositories with the session
-        self.interviews = InterviewRepository(self.session)
-        self.analyses = AnalysisRepository(self.session)
-        # TODO: Initialize other repositories
+        self._init_repositories()
 
         return self
 
@@ -94,7 +122,9 @@ class UnitOfWork:
         Returns:
             The UnitOfWork instance
         """
-        return self.__enter__()
+        self.session = self.session_factory()
+        self._init_repositories()
+        return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
@@ -118,7 +148,10 @@ class UnitOfWork:
                 await self.rollback()
                 logger.error(f"Transaction rolled back due to commit error: {str(e)}")
 
-        self.session.close()
+        if self.is_async:
+            await self.session.close()
+        else:
+            self.session.close()
 
     async def commit(self):
         """
@@ -127,7 +160,10 @@ class UnitOfWork:
         This method commits the current transaction, making all changes permanent.
         """
         try:
-            self.session.commit()
+            if self.is_async:
+                await self.session.commit()
+            else:
+                self.session.commit()
             logger.debug("Transaction committed successfully")
         except SQLAlchemyError as e:
             logger.error(f"Error committing transaction: {str(e)}")
@@ -140,7 +176,10 @@ class UnitOfWork:
         This method rolls back the current transaction, discarding all changes.
         """
         try:
-            self.session.rollback()
+            if self.is_async:
+                await self.session.rollback()
+            else:
+                self.session.rollback()
             logger.debug("Transaction rolled back")
         except SQLAlchemyError as e:
             logger.error(f"Error rolling back transaction: {str(e)}")
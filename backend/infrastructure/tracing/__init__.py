@@ -0,0 +1,25 @@
+"""Tracing and metrics for the analysis pipeline"""
+
+from .metrics import Histogram, PipelineMetrics, pipeline_metrics
+from .spans import (
+    LLMCall,
+    PipelineTrace,
+    current_trace,
+    llm_span,
+    record_llm_cache_hit,
+    span,
+    trace_pipeline,
+)
+
+__all__ = [
+    'Histogram',
+    'PipelineMetrics',
+    'pipeline_metrics',
+    'LLMCall',
+    'PipelineTrace',
+    'current_trace',
+    'llm_span',
+    'record_llm_cache_hit',
+    'span',
+    'trace_pipeline',
+]
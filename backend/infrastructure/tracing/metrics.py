@@ -0,0 +1,167 @@
+"""
+Process-wide pipeline metrics with a Prometheus text exporter.
+
+Every finished stage span and LLM call is folded into a small set of
+histograms and counters, labelled by stage or task name, so p95s can be
+scraped from ``/api/debug/perf/metrics``.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Upper bounds in seconds; LLM-heavy stages range from sub-second to minutes
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus data model."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Bucket upper bound containing the q-quantile (None when empty)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, count in zip(self.buckets, self.counts):
+            if count >= rank:
+                return bound
+        return float("inf")
+
+
+def _labels(**labels: str) -> str:
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class PipelineMetrics:
+    """Aggregates stage and LLM timings across all analyses in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stage_seconds: Dict[str, Histogram] = {}
+            self.stage_errors: Dict[str, int] = {}
+            self.llm_seconds: Dict[str, Histogram] = {}
+            self.llm_errors: Dict[str, int] = {}
+            self.llm_retries: Dict[str, int] = {}
+            self.llm_tokens: Dict[Tuple[str, str], int] = {}
+            self.llm_cache_hits = 0
+
+    def observe_stage(self, stage: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self.stage_seconds.setdefault(stage, Histogram()).observe(seconds)
+            if error:
+                self.stage_errors[stage] = self.stage_errors.get(stage, 0) + 1
+
+    def observe_llm(
+        self,
+        task: str,
+        seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        retries: int = 0,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            self.llm_seconds.setdefault(task, Histogram()).observe(seconds)
+            if error:
+                self.llm_errors[task] = self.llm_errors.get(task, 0) + 1
+            if retries:
+                self.llm_retries[task] = self.llm_retries.get(task, 0) + retries
+            for kind, tokens in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+                if tokens:
+                    key = (task, kind)
+                    self.llm_tokens[key] = self.llm_tokens.get(key, 0) + tokens
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            self.llm_cache_hits += 1
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def histogram(name: str, help_text: str, label: str, series: Dict[str, Histogram]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for value, hist in sorted(series.items()):
+                for bound, count in zip(hist.buckets, hist.counts):
+                    lines.append(
+                        f"{name}_bucket{_labels(**{label: value, 'le': repr(float(bound))})} {count}"
+                    )
+                lines.append(f"{name}_bucket{_labels(**{label: value, 'le': '+Inf'})} {hist.count}")
+                lines.append(f"{name}_sum{_labels(**{label: value})} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_labels(**{label: value})} {hist.count}")
+
+        def counter(name: str, help_text: str, label_names: Tuple[str, ...], series: Dict):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                if not isinstance(key, tuple):
+                    key = (key,)
+                lines.append(f"{name}{_labels(**dict(zip(label_names, key)))} {value}")
+
+        with self._lock:
+            histogram(
+                "axwise_pipeline_stage_seconds",
+                "Wall time of analysis pipeline stages.",
+                "stage",
+                self.stage_seconds,
+            )
+            counter(
+                "axwise_pipeline_stage_errors_total",
+                "Analysis pipeline stages that raised.",
+                ("stage",),
+                self.stage_errors,
+            )
+            histogram(
+                "axwise_llm_call_seconds",
+                "Latency of LLM calls including retries.",
+                "task",
+                self.llm_seconds,
+            )
+            counter(
+                "axwise_llm_call_errors_total",
+                "LLM calls that failed after retries.",
+                ("task",),
+                self.llm_errors,
+            )
+            counter(
+                "axwise_llm_retries_total",
+                "LLM call retries.",
+                ("task",),
+                self.llm_retries,
+            )
+            counter(
+                "axwise_llm_tokens_total",
+                "LLM tokens by task and kind.",
+                ("task", "kind"),
+                self.llm_tokens,
+            )
+            lines.append("# HELP axwise_llm_cache_hits_total LLM responses served from cache.")
+            lines.append("# TYPE axwise_llm_cache_hits_total counter")
+            lines.append(f"axwise_llm_cache_hits_total {self.llm_cache_hits}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics instance
+pipeline_metrics = PipelineMetrics()
@@ -0,0 +1,281 @@
+"""
+Span context managers for the analysis pipeline.
+
+``trace_pipeline`` binds a ``PipelineTrace`` to the current context for one
+analysis. Inside it, ``span`` times a pipeline stage and ``llm_span`` times
+one LLM request (including its retries); LLM latency, tokens, retries and
+cache hits are attributed to the innermost enclosing stage. Tasks created
+inside a span inherit the trace and the stage through contextvars.
+
+Spans also work without an active trace; they then only feed the
+process-wide ``pipeline_metrics``.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from .metrics import pipeline_metrics
+
+# Cap on individual spans kept per trace; stage aggregates are always complete
+MAX_SPANS = 500
+
+_current_trace: ContextVar[Optional["PipelineTrace"]] = ContextVar(
+    "pipeline_trace", default=None
+)
+_current_stage: ContextVar[Optional[str]] = ContextVar("pipeline_stage", default=None)
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings for one stage of one analysis."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    errors: int = 0
+    llm_calls: int = 0
+    llm_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    # Seconds from trace start to the first span start / last span end
+    first_start: Optional[float] = None
+    last_end: Optional[float] = None
+
+
+class PipelineTrace:
+    """Per-analysis record of stage spans and LLM calls."""
+
+    def __init__(self, analysis_id: Optional[Any] = None):
+        self.analysis_id = analysis_id
+        self.started_at = datetime.now(timezone.utc)
+        self._origin = time.perf_counter()
+        self._finished: Optional[float] = None
+        self.stages: Dict[str, StageStats] = {}
+        self.spans: List[Dict[str, Any]] = []
+
+    def _stage(self, name: Optional[str]) -> StageStats:
+        return self.stages.setdefault(name or "unattributed", StageStats())
+
+    def _add_span(self, span: Dict[str, Any]) -> None:
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append(span)
+
+    def _mark(self, stats: StageStats, start: float, seconds: float) -> None:
+        offset = start - self._origin
+        if stats.first_start is None or offset < stats.first_start:
+            stats.first_start = offset
+        if stats.last_end is None or offset + seconds > stats.last_end:
+            stats.last_end = offset + seconds
+
+    def record_stage(
+        self, name: str, parent: Optional[str], start: float, seconds: float, error: bool
+    ) -> None:
+        stats = self._stage(name)
+        stats.calls += 1
+        stats.wall_seconds += seconds
+        stats.errors += int(error)
+        self._mark(stats, start, seconds)
+        self._add_span(
+            {
+                "kind": "stage",
+                "name": name,
+                "parent": parent,
+                "start": round(start - self._origin, 4),
+                "seconds": round(seconds, 4),
+                "error": error,
+            }
+        )
+
+    def record_llm(
+        self, stage: Optional[str], call: "LLMCall", start: float, seconds: float, error: bool
+    ) -> None:
+        stats = self._stage(stage)
+        stats.llm_calls += 1
+        stats.llm_seconds += seconds
+        stats.prompt_tokens += call.prompt_tokens
+        stats.completion_tokens += call.completion_tokens
+        stats.retries += call.retries
+        stats.errors += int(error)
+        self._mark(stats, start, seconds)
+        self._add_span(
+            {
+                "kind": "llm",
+                "name": call.task,
+                "model": call.model,
+                "parent": stage,
+                "start": round(start - self._origin, 4),
+                "seconds": round(seconds, 4),
+                "prompt_tokens": call.prompt_tokens,
+                "completion_tokens": call.completion_tokens,
+                "retries": call.retries,
+                "error": error,
+            }
+        )
+
+    def record_cache_hit(self, stage: Optional[str]) -> None:
+        self._stage(stage).cache_hits += 1
+
+    def finish(self) -> None:
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+    @property
+    def total_seconds(self) -> float:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return end - self._origin
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable summary, stages ordered by wall time."""
+        stages = sorted(self.stages.items(), key=lambda kv: kv[1].wall_seconds, reverse=True)
+        llm_totals = StageStats()
+        for _, stats in stages:
+            llm_totals.llm_calls += stats.llm_calls
+            llm_totals.llm_seconds += stats.llm_seconds
+            llm_totals.prompt_tokens += stats.prompt_tokens
+            llm_totals.completion_tokens += stats.completion_tokens
+            llm_totals.retries += stats.retries
+            llm_totals.cache_hits += stats.cache_hits
+        return {
+            "analysis_id": self.analysis_id,
+            "started_at": self.started_at.isoformat(),
+            "total_seconds": round(self.total_seconds, 4),
+            "stages": {
+                name: {k: round(v, 4) if isinstance(v, float) else v for k, v in asdict(stats).items()}
+                for name, stats in stages
+            },
+            "llm": {
+                "calls": llm_totals.llm_calls,
+                "seconds": round(llm_totals.llm_seconds, 4),
+                "prompt_tokens": llm_totals.prompt_tokens,
+                "completion_tokens": llm_totals.completion_tokens,
+                "retries": llm_totals.retries,
+                "cache_hits": llm_totals.cache_hits,
+            },
+            "spans": list(self.spans),
+        }
+
+    def to_stage_traces(self) -> List[Dict[str, Any]]:
+        """Stage entries shaped like ``PipelineRun.execution_trace``, in start order."""
+        entries = []
+        stages = sorted(self.stages.items(), key=lambda kv: kv[1].first_start or 0.0)
+        for name, stats in stages:
+            started = self.started_at + timedelta(seconds=stats.first_start or 0.0)
+            completed = self.started_at + timedelta(seconds=stats.last_end or 0.0)
+            entries.append(
+                {
+                    "stage_name": name,
+                    "status": "failed" if stats.errors else "completed",
+                    "started_at": started.isoformat(),
+                    "completed_at": completed.isoformat(),
+                    "duration_seconds": round(stats.wall_seconds, 4),
+                    "outputs": {
+                        "calls": stats.calls,
+                        "llm_calls": stats.llm_calls,
+                        "llm_seconds": round(stats.llm_seconds, 4),
+                        "prompt_tokens": stats.prompt_tokens,
+                        "completion_tokens": stats.completion_tokens,
+                        "retries": stats.retries,
+                        "cache_hits": stats.cache_hits,
+                    },
+                    "error": None,
+                }
+            )
+        return entries
+
+
+class LLMCall:
+    """Mutable handle yielded by ``llm_span`` to record usage and retries."""
+
+    def __init__(self, task: str, model: Optional[str] = None):
+        self.task = task
+        self.model = model
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def retry(self) -> None:
+        self.retries += 1
+
+    def record_usage(self, response: Any) -> None:
+        """Read token counts from a GenAI response's usage metadata."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        self.prompt_tokens = int(getattr(usage, "prompt_token_count", 0) or 0)
+        self.completion_tokens = int(getattr(usage, "candidates_token_count", 0) or 0)
+
+
+def current_trace() -> Optional[PipelineTrace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_pipeline(analysis_id: Optional[Any] = None) -> Iterator[PipelineTrace]:
+    """Collect spans for one analysis run."""
+    trace = PipelineTrace(analysis_id)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.finish()
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a pipeline stage."""
+    trace = _current_trace.get()
+    parent = _current_stage.get()
+    token = _current_stage.set(name)
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        _current_stage.reset(token)
+        pipeline_metrics.observe_stage(name, seconds, error)
+        if trace is not None:
+            trace.record_stage(name, parent, start, seconds, error)
+
+
+@contextmanager
+def llm_span(task: str, model: Optional[str] = None) -> Iterator[LLMCall]:
+    """Time one LLM request, including retries."""
+    call = LLMCall(task, model)
+    start = time.perf_counter()
+    error = False
+    try:
+        yield call
+    except BaseException:
+        error = True
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        pipeline_metrics.observe_llm(
+            task,
+            seconds,
+            prompt_tokens=call.prompt_tokens,
+            completion_tokens=call.completion_tokens,
+            retries=call.retries,
+            error=error,
+        )
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.record_llm(_current_stage.get(), call, start, seconds, error)
+
+
+def record_llm_cache_hit() -> None:
+    """Count an LLM response served from cache."""
+    pipeline_metrics.record_cache_hit()
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record_cache_hit(_current_stage.get())
@@ -0,0 +1,161 @@
+"""Add summary projection column to analysis_results
+
+Revision ID: add_analysis_result_summary
+Revises: add_pipeline_runs_table
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+import logging
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_analysis_result_summary'
+down_revision = 'add_pipeline_runs_table'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 200
+
+
+# Frozen copy of backend.services.results.summary.build_analysis_summary at
+# projection version 1. Migrations must not import application code, whose
+# later changes would silently alter what this revision does.
+SUMMARY_VERSION = 1
+TOP_THEME_LIMIT = 5
+DEFAULT_SENTIMENT_OVERVIEW = {"positive": 0.33, "neutral": 0.34, "negative": 0.33}
+
+
+def _load_results(results):
+    if results is None:
+        return None
+    if isinstance(results, (str, bytes)):
+        try:
+            results = json.loads(results)
+        except (TypeError, ValueError):
+            return None
+    return results if isinstance(results, dict) else None
+
+
+def _list_len(data, key) -> int:
+    value = data.get(key)
+    return len(value) if isinstance(value, list) else 0
+
+
+def _top_theme_names(data, limit):
+    themes = data.get("enhanced_themes")
+    if not isinstance(themes, list) or not themes:
+        themes = data.get("themes")
+    if not isinstance(themes, list):
+        return []
+
+    ranked = []
+    for index, theme in enumerate(themes):
+        if isinstance(theme, dict):
+            name = theme.get("name") or theme.get("title")
+            try:
+                frequency = float(theme.get("frequency") or 0.0)
+            except (TypeError, ValueError):
+                frequency = 0.0
+        elif isinstance(theme, str):
+            name, frequency = theme, 0.0
+        else:
+            continue
+        if name:
+            ranked.append((-frequency, index, str(name)))
+
+    ranked.sort()
+    return [name for _, _, name in ranked[:limit]]
+
+
+def build_analysis_summary(results, status=None):
+    data = _load_results(results) or {}
+
+    sentiment_overview = data.get("sentimentOverview")
+    if not isinstance(sentiment_overview, dict):
+        sentiment_overview = DEFAULT_SENTIMENT_OVERVIEW
+
+    summary = {
+        "version": SUMMARY_VERSION,
+        "themeCount": _list_len(data, "themes"),
+        "enhancedThemeCount": _list_len(data, "enhanced_themes"),
+        "patternCount": _list_len(data, "patterns"),
+        "personaCount": _list_len(data, "personas"),
+        "insightCount": _list_len(data, "insights"),
+        "topThemes": _top_theme_names(data, TOP_THEME_LIMIT),
+        "sentimentOverview": sentiment_overview,
+    }
+
+    error = data.get("error")
+    if status in ("failed", "error") and error:
+        summary["error"] = str(error)
+
+    return summary
+
+
+def _backfill_summaries(conn) -> None:
+    """Compute the summary projection for existing rows in id batches."""
+    last_id = 0
+    updated = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT result_id, results, status FROM analysis_results "
+                "WHERE result_id > :last_id ORDER BY result_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+
+        for result_id, results, status in rows:
+            last_id = result_id
+            try:
+                summary = build_analysis_summary(results, status)
+            except Exception as e:
+                logger.warning(f"Skipping summary backfill for {result_id}: {e}")
+                continue
+            conn.execute(
+                sa.text(
+                    "UPDATE analysis_results SET summary = :summary "
+                    "WHERE result_id = :result_id"
+                ),
+                {"summary": json.dumps(summary), "result_id": result_id},
+            )
+            updated += 1
+
+    logger.info(f"Backfilled summary projection for {updated} analysis results")
+
+
+def upgrade() -> None:
+    """Add analysis_results.summary, the keyset index, and backfill existing rows."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {c["name"] for c in inspector.get_columns("analysis_results")}
+    if "summary" not in columns:
+        op.add_column("analysis_results", sa.Column("summary", sa.JSON(), nullable=True))
+
+    indexes = {i["name"] for i in inspector.get_indexes("analysis_results")}
+    if "ix_analysis_results_date_id" not in indexes:
+        op.create_index(
+            "ix_analysis_results_date_id",
+            "analysis_results",
+            ["analysis_date", "result_id"],
+            unique=False,
+        )
+
+    _backfill_summaries(conn)
+
+
+def downgrade() -> None:
+    """Drop the summary projection column and keyset index."""
+    try:
+        op.drop_index("ix_analysis_results_date_id", table_name="analysis_results")
+    except Exception:
+        pass
+    op.drop_column("analysis_results", "summary")
@@ -0,0 +1,58 @@
+"""Add job queue columns to pipeline_runs
+
+Revision ID: add_pipeline_run_job_queue
+Revises: add_analysis_result_summary
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_pipeline_run_job_queue'
+down_revision = 'add_analysis_result_summary'
+branch_labels = None
+depends_on = None
+
+QUEUE_COLUMNS = [
+    ("job_type", lambda: sa.Column("job_type", sa.String(), nullable=False, server_default="axpersona_pipeline")),
+    ("priority", lambda: sa.Column("priority", sa.Integer(), nullable=False, server_default="0")),
+    ("attempts", lambda: sa.Column("attempts", sa.Integer(), nullable=False, server_default="0")),
+    ("max_attempts", lambda: sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="1")),
+    ("available_at", lambda: sa.Column("available_at", sa.DateTime(), nullable=True)),
+    ("lease_owner", lambda: sa.Column("lease_owner", sa.String(), nullable=True)),
+    ("lease_expires_at", lambda: sa.Column("lease_expires_at", sa.DateTime(), nullable=True)),
+    ("heartbeat_at", lambda: sa.Column("heartbeat_at", sa.DateTime(), nullable=True)),
+    ("payload", lambda: sa.Column("payload", sa.JSON(), nullable=True)),
+]
+
+
+def upgrade() -> None:
+    """Add leasing/priority/retry columns and the claim-order index."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {c["name"] for c in inspector.get_columns("pipeline_runs")}
+    for name, make_column in QUEUE_COLUMNS:
+        if name not in columns:
+            op.add_column("pipeline_runs", make_column())
+
+    indexes = {i["name"] for i in inspector.get_indexes("pipeline_runs")}
+    if "ix_pipeline_runs_queue" not in indexes:
+        op.create_index(
+            "ix_pipeline_runs_queue",
+            "pipeline_runs",
+            ["job_type", "status", "priority", "created_at"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop the job queue columns and index."""
+    try:
+        op.drop_index("ix_pipeline_runs_queue", table_name="pipeline_runs")
+    except Exception:
+        pass
+    for name, _ in reversed(QUEUE_COLUMNS):
+        op.drop_column("pipeline_runs", name)
@@ -0,0 +1,62 @@
+"""Add simulation_interviews table for per-interview checkpoints
+
+Revision ID: add_simulation_interviews
+Revises: add_pipeline_run_job_queue
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_simulation_interviews'
+down_revision = 'add_pipeline_run_job_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create simulation_interviews, one row per completed simulated interview."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "simulation_interviews" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "simulation_interviews",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("simulation_id", sa.String(), nullable=False),
+        sa.Column("persona_id", sa.String(), nullable=False),
+        sa.Column("stakeholder_type", sa.String(), nullable=True),
+        sa.Column("interview", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["simulation_id"],
+            ["simulation_data.simulation_id"],
+            name="fk_simulation_interviews_simulation_id",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_simulation_interviews_simulation_id",
+        "simulation_interviews",
+        ["simulation_id"],
+        unique=False,
+    )
+    op.create_index(
+        "uq_simulation_interviews_persona",
+        "simulation_interviews",
+        ["simulation_id", "persona_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the simulation_interviews table."""
+    for index in ("uq_simulation_interviews_persona", "ix_simulation_interviews_simulation_id"):
+        try:
+            op.drop_index(index, table_name="simulation_interviews")
+        except Exception:
+            pass
+    op.drop_table("simulation_interviews")
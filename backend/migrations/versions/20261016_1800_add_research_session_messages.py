@@ -0,0 +1,208 @@
+"""Move research session messages into an append-only table
+
+Revision ID: add_research_session_messages
+Revises: add_simulation_interviews
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+import logging
+from datetime import datetime, timezone
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_research_session_messages'
+down_revision = 'add_simulation_interviews'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 200
+
+SUMMARY_COLUMNS = ("message_count", "question_count", "stakeholder_count")
+
+
+# Frozen copies of the helpers in backend.services.research_session_service.
+# Migrations must not import application code, whose later changes would
+# silently alter what this revision does.
+STAKEHOLDER_GROUPS = ("primaryStakeholders", "secondaryStakeholders")
+QUESTION_CATEGORIES = ("problemDiscovery", "solutionValidation", "followUp")
+
+
+def count_research_questions(research_questions):
+    """Count (questions, stakeholders) in a generated questionnaire."""
+    question_count = 0
+    stakeholder_count = 0
+    if not isinstance(research_questions, dict):
+        return question_count, stakeholder_count
+
+    for group in STAKEHOLDER_GROUPS:
+        stakeholders = research_questions.get(group)
+        if not isinstance(stakeholders, list):
+            continue
+        stakeholder_count += len(stakeholders)
+        for stakeholder in stakeholders:
+            questions = stakeholder.get("questions") if isinstance(stakeholder, dict) else None
+            if not isinstance(questions, dict):
+                continue
+            for category in QUESTION_CATEGORIES:
+                if isinstance(questions.get(category), list):
+                    question_count += len(questions[category])
+    return question_count, stakeholder_count
+
+
+def parse_message_timestamp(message):
+    """Parse a message's ISO timestamp as naive UTC, if it has one."""
+    value = message.get("timestamp") if isinstance(message, dict) else None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _load_json(value):
+    """JSON columns come back as text on some backends."""
+    if isinstance(value, (str, bytes)):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _backfill_messages(conn) -> None:
+    """Copy each session's messages array into rows and fill its summary fields."""
+    last_id = 0
+    migrated = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, session_id, messages, research_questions, updated_at "
+                "FROM research_sessions WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+
+        for row_id, session_id, messages, research_questions, updated_at in rows:
+            last_id = row_id
+            messages = _load_json(messages)
+            if not isinstance(messages, list):
+                messages = []
+            question_count, stakeholder_count = count_research_questions(
+                _load_json(research_questions)
+            )
+
+            now = datetime.utcnow()
+            if messages:
+                conn.execute(
+                    sa.text(
+                        "INSERT INTO research_session_messages "
+                        "(session_id, role, message, created_at) "
+                        "VALUES (:session_id, :role, :message, :created_at)"
+                    ),
+                    [
+                        {
+                            "session_id": session_id,
+                            "role": m.get("role") if isinstance(m, dict) else None,
+                            "message": json.dumps(m),
+                            "created_at": now,
+                        }
+                        for m in messages
+                    ],
+                )
+
+            last_message_at = None
+            if messages:
+                last_message_at = parse_message_timestamp(messages[-1]) or updated_at
+            conn.execute(
+                sa.text(
+                    "UPDATE research_sessions SET message_count = :message_count, "
+                    "last_message_at = :last_message_at, "
+                    "question_count = :question_count, "
+                    "stakeholder_count = :stakeholder_count WHERE id = :id"
+                ),
+                {
+                    "message_count": len(messages),
+                    "last_message_at": last_message_at,
+                    "question_count": question_count,
+                    "stakeholder_count": stakeholder_count,
+                    "id": row_id,
+                },
+            )
+            migrated += len(messages)
+
+    logger.info(f"Moved {migrated} research session messages into their own table")
+
+
+def upgrade() -> None:
+    """Create research_session_messages, add summary columns, and backfill."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {c["name"] for c in inspector.get_columns("research_sessions")}
+    for name in SUMMARY_COLUMNS:
+        if name not in columns:
+            op.add_column(
+                "research_sessions",
+                sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+            )
+    if "last_message_at" not in columns:
+        op.add_column(
+            "research_sessions",
+            sa.Column("last_message_at", sa.DateTime(), nullable=True),
+        )
+
+    if "research_session_messages" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "research_session_messages",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("role", sa.String(), nullable=True),
+        sa.Column("message", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["session_id"],
+            ["research_sessions.session_id"],
+            name="fk_research_session_messages_session_id",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_research_session_messages_session_seq",
+        "research_session_messages",
+        ["session_id", "id"],
+        unique=False,
+    )
+
+    # The legacy messages column is left in place for sessions written before
+    # this revision; new messages only go to the table
+    _backfill_messages(conn)
+
+
+def downgrade() -> None:
+    """Drop the message table and summary columns."""
+    try:
+        op.drop_index(
+            "ix_research_session_messages_session_seq",
+            table_name="research_session_messages",
+        )
+    except Exception:
+        pass
+    op.drop_table("research_session_messages")
+    for name in SUMMARY_COLUMNS + ("last_message_at",):
+        op.drop_column("research_sessions", name)
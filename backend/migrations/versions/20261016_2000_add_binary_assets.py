@@ -0,0 +1,221 @@
+"""Add binary_assets and move inline persona images out of analysis results
+
+Revision ID: add_binary_assets
+Revises: add_research_session_messages
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_binary_assets'
+down_revision = 'add_research_session_messages'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 200
+
+
+# Frozen copies of the helpers in backend.services.generative.asset_store.
+# Migrations must not import application code, whose later changes would
+# silently alter what this revision does.
+ASSET_URL_PREFIX = "/api/personas/assets/"
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URI_RE = re.compile(
+    r"^data:(?P<content_type>image/[\w.+-]+);base64,(?P<data>.*)$", re.DOTALL
+)
+
+
+def asset_url(digest):
+    return f"{ASSET_URL_PREFIX}{digest}"
+
+
+def digest_from_asset_url(value):
+    """Return the digest an asset URL points at, or None for any other value."""
+    if not isinstance(value, str) or not value.startswith(ASSET_URL_PREFIX):
+        return None
+    digest = value[len(ASSET_URL_PREFIX) :]
+    return digest if _DIGEST_RE.match(digest) else None
+
+
+def decode_image_data_uri(value):
+    """Split a base64 image data URI into (content_type, bytes)."""
+    if not isinstance(value, str) or not value.startswith("data:image/"):
+        return None
+    match = _DATA_URI_RE.match(value)
+    if not match:
+        return None
+    try:
+        data = base64.b64decode(match.group("data"), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return match.group("content_type"), data
+
+
+def encode_image_data_uri(content_type, data):
+    return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def map_persona_images(results, convert) -> int:
+    """
+    Apply ``convert`` to every persona image value in an analysis results dict.
+
+    Covers ``avatar_data_uri`` and the values of ``food_images``. Returns how many
+    values changed; ``results`` is updated in place.
+    """
+    changed = 0
+    personas = results.get("personas") if isinstance(results, dict) else None
+    if not isinstance(personas, list):
+        return changed
+
+    for persona in personas:
+        if not isinstance(persona, dict):
+            continue
+        avatar = persona.get("avatar_data_uri")
+        if isinstance(avatar, str):
+            converted = convert(avatar)
+            if converted != avatar:
+                persona["avatar_data_uri"] = converted
+                changed += 1
+        food_images = persona.get("food_images")
+        if isinstance(food_images, dict):
+            for key, image in food_images.items():
+                if not isinstance(image, str):
+                    continue
+                converted = convert(image)
+                if converted != image:
+                    food_images[key] = converted
+                    changed += 1
+    return changed
+
+
+def _load_json(value):
+    """JSON columns come back as text on some backends."""
+    if isinstance(value, (str, bytes)):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _rewrite_results(conn, marker: str, convert) -> int:
+    """Apply ``convert`` to persona images of every result whose JSON contains ``marker``."""
+    last_id = 0
+    rewritten = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT result_id, results FROM analysis_results "
+                "WHERE result_id > :last_id AND CAST(results AS TEXT) LIKE :marker "
+                "ORDER BY result_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "marker": f"%{marker}%", "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+
+        for result_id, results in rows:
+            last_id = result_id
+            results = _load_json(results)
+            if not isinstance(results, dict):
+                continue
+            try:
+                changed = map_persona_images(results, convert)
+            except Exception as e:
+                logger.warning(f"Skipping image rewrite for result {result_id}: {e}")
+                continue
+            if not changed:
+                continue
+            conn.execute(
+                sa.text(
+                    "UPDATE analysis_results SET results = :results "
+                    "WHERE result_id = :result_id"
+                ),
+                {"results": json.dumps(results), "result_id": result_id},
+            )
+            rewritten += 1
+    return rewritten
+
+
+def upgrade() -> None:
+    """Create binary_assets and replace inline data URIs with asset URLs."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "binary_assets" not in inspector.get_table_names():
+        op.create_table(
+            "binary_assets",
+            sa.Column("sha256", sa.String(64), primary_key=True, nullable=False),
+            sa.Column("content_type", sa.String(), nullable=False),
+            sa.Column("size", sa.Integer(), nullable=False),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+
+    stored = set()
+
+    def externalize(value):
+        decoded = decode_image_data_uri(value)
+        if decoded is None:
+            return value
+        content_type, data = decoded
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in stored:
+            exists = conn.execute(
+                sa.text("SELECT 1 FROM binary_assets WHERE sha256 = :sha256"),
+                {"sha256": digest},
+            ).first()
+            if not exists:
+                conn.execute(
+                    sa.text(
+                        "INSERT INTO binary_assets "
+                        "(sha256, content_type, size, data, created_at) "
+                        "VALUES (:sha256, :content_type, :size, :data, :created_at)"
+                    ),
+                    {
+                        "sha256": digest,
+                        "content_type": content_type,
+                        "size": len(data),
+                        "data": data,
+                        "created_at": datetime.utcnow(),
+                    },
+                )
+            stored.add(digest)
+        return asset_url(digest)
+
+    rewritten = _rewrite_results(conn, "data:image/", externalize)
+    logger.info(
+        f"Moved {len(stored)} inline persona images out of {rewritten} analysis results"
+    )
+
+
+def downgrade() -> None:
+    """Inline stored images back into analysis results, then drop binary_assets."""
+    conn = op.get_bind()
+
+    def inline(value):
+        digest = digest_from_asset_url(value)
+        if digest is None:
+            return value
+        row = conn.execute(
+            sa.text("SELECT content_type, data FROM binary_assets WHERE sha256 = :sha256"),
+            {"sha256": digest},
+        ).first()
+        if row is None:
+            return value
+        return encode_image_data_uri(row[0], bytes(row[1]))
+
+    _rewrite_results(conn, ASSET_URL_PREFIX, inline)
+    op.drop_table("binary_assets")
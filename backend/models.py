@@ -8,6 +8,9 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     Float,
+    Index,
+    LargeBinary,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, sessionmaker, foreign
@@ -73,7 +76,11 @@ class InterviewData(Base):
 
 class AnalysisResult(Base):
     __tablename__ = "analysis_results"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Keyset pagination for the analyses list view
+        Index("ix_analysis_results_date_id", "analysis_date", "result_id"),
+        {"extend_existing": True},
+    )
     __module__ = "backend.models"
 
     result_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -134,6 +141,9 @@ class AnalysisResult(Base):
     # NEW: Multi-stakeholder intelligence support
     stakeholder_intelligence = Column(JSONB, nullable=True)
 
+    # List-view projection (counts, top themes, sentiment), maintained on write
+    summary = Column(JSON, nullable=True)
+
     interview_data = relationship(
         "InterviewData",
         viewonly=True,
@@ -142,6 +152,28 @@ class AnalysisResult(Base):
     cached_prds = relationship("CachedPRD", viewonly=True)
 
 
+@event.listens_for(AnalysisResult, "before_insert")
+@event.listens_for(AnalysisResult, "before_update")
+def _refresh_analysis_summary(mapper, connection, target):
+    """Recompute the list-view summary whenever results or status are written."""
+    from sqlalchemy import inspect as sa_inspect
+    from backend.services.results.summary import build_analysis_summary
+
+    state = sa_inspect(target)
+    changed = state.committed_state
+    if (
+        state.pending
+        or target.summary is None
+        or "results" in changed
+        or "status" in changed
+    ):
+        try:
+            target.summary = build_analysis_summary(target.results, target.status)
+        except Exception:
+            # Never block a results write on the projection; reads fall back
+            target.summary = None
+
+
 class Persona(Base):
     __tablename__ = "personas"
     __table_args__ = {"extend_existing": True}
@@ -253,6 +285,39 @@ class SimulationData(Base):
         return None
 
 
+class SimulationInterview(Base):
+    """
+    Model for a single simulated interview, checkpointed as soon as it completes.
+
+    Rows let an interrupted simulation resume by re-running only the personas
+    that have no interview yet.
+    """
+
+    __tablename__ = "simulation_interviews"
+    __table_args__ = (
+        Index(
+            "uq_simulation_interviews_persona",
+            "simulation_id",
+            "persona_id",
+            unique=True,
+        ),
+        {"extend_existing": True},
+    )
+    __module__ = "backend.models"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    simulation_id = Column(
+        String,
+        ForeignKey("simulation_data.simulation_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    persona_id = Column(String, nullable=False)
+    stakeholder_type = Column(String, nullable=True)
+    interview = Column(JSON, nullable=False)  # SimulatedInterview.model_dump()
+    created_at = Column(DateTime, default=utc_now)
+
+
 class PipelineRun(Base):
     """
     Model for storing AxPersona pipeline execution history.
@@ -266,7 +331,17 @@ class PipelineRun(Base):
     """
 
     __tablename__ = "pipeline_runs"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Claim order for queued jobs
+        Index(
+            "ix_pipeline_runs_queue",
+            "job_type",
+            "status",
+            "priority",
+            "created_at",
+        ),
+        {"extend_existing": True},
+    )
     __module__ = "backend.models"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -297,6 +372,18 @@ class PipelineRun(Base):
     persona_count = Column(Integer, nullable=True)
     interview_count = Column(Integer, nullable=True)
 
+    # Background job queue (see backend.services.jobs). AxPersona pipeline runs
+    # keep the default job_type and are executed in-process, not by workers.
+    job_type = Column(String, nullable=False, default="axpersona_pipeline")
+    priority = Column(Integer, nullable=False, default=0)  # Higher runs first
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    available_at = Column(DateTime, nullable=True)  # Not claimable before (retry backoff)
+    lease_owner = Column(String, nullable=True)  # Worker currently holding the job
+    lease_expires_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    payload = Column(JSON, nullable=True)  # Job-type specific arguments
+
     user = relationship("User", viewonly=True)
 
     @property
@@ -312,3 +399,22 @@ class PipelineRun(Base):
         if self.completed_at and self.created_at:
             return int((self.completed_at - self.created_at).total_seconds() / 60)
         return None
+
+
+class BinaryAsset(Base):
+    """
+    Model for content-addressed binary assets such as generated persona images.
+
+    Rows are keyed by the SHA-256 of their bytes, so identical images are stored
+    once and JSON blobs reference them by digest instead of inlining base64.
+    """
+
+    __tablename__ = "binary_assets"
+    __table_args__ = {"extend_existing": True}
+    __module__ = "backend.models"
+
+    sha256 = Column(String(64), primary_key=True)
+    content_type = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=utc_now)
@@ -10,6 +10,7 @@ from .transcript import TranscriptSegment, TranscriptMetadata, StructuredTranscr
 from .pattern import Pattern, PatternResponse, PatternEvidence
 from .research_session import (
     ResearchSession,
+    ResearchSessionMessage,
     ResearchExport,
     ResearchSessionCreate,
     ResearchSessionUpdate,
@@ -69,7 +70,11 @@ def _get_sqlalchemy_models():
                 "Persona": getattr(backend_models, "Persona", None),
                 "CachedPRD": getattr(backend_models, "CachedPRD", None),
                 "SimulationData": getattr(backend_models, "SimulationData", None),
+                "SimulationInterview": getattr(
+                    backend_models, "SimulationInterview", None
+                ),
                 "PipelineRun": getattr(backend_models, "PipelineRun", None),
+                "BinaryAsset": getattr(backend_models, "BinaryAsset", None),
             }
         else:
             _models_cache = {
@@ -79,7 +84,9 @@ def _get_sqlalchemy_models():
                 "Persona": None,
                 "CachedPRD": None,
                 "SimulationData": None,
+                "SimulationInterview": None,
                 "PipelineRun": None,
+                "BinaryAsset": None,
             }
 
     except Exception as e:
@@ -95,7 +102,9 @@ def _get_sqlalchemy_models():
             "Persona": None,
             "CachedPRD": None,
             "SimulationData": None,
+            "SimulationInterview": None,
             "PipelineRun": None,
+            "BinaryAsset": None,
         }
 
     return _models_cache
@@ -109,7 +118,9 @@ AnalysisResult = _models["AnalysisResult"]
 Persona = _models["Persona"]
 CachedPRD = _models["CachedPRD"]
 SimulationData = _models["SimulationData"]
+SimulationInterview = _models["SimulationInterview"]
 PipelineRun = _models["PipelineRun"]
+BinaryAsset = _models["BinaryAsset"]
 
 
 __all__ = [
@@ -121,6 +132,7 @@ __all__ = [
     "PatternResponse",
     "PatternEvidence",
     "ResearchSession",
+    "ResearchSessionMessage",
     "ResearchExport",
     "ResearchSessionCreate",
     "ResearchSessionUpdate",
@@ -139,5 +151,7 @@ __all__ = [
     "Persona",
     "CachedPRD",
     "SimulationData",
+    "SimulationInterview",
     "PipelineRun",
+    "BinaryAsset",
 ]
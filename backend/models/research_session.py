@@ -11,6 +11,7 @@ from sqlalchemy import (
     JSON,
     Boolean,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -44,9 +45,15 @@ class ResearchSession(Base):
     status = Column(String, default="active")  # active, completed, abandoned
 
     # Conversation data
-    messages = Column(JSON)  # List of message objects
+    messages = Column(JSON)  # Legacy; messages live in research_session_messages
     conversation_context = Column(Text)
 
+    # Summary fields maintained on write so listings never read message bodies
+    message_count = Column(Integer, default=0, nullable=False)
+    last_message_at = Column(DateTime, nullable=True)
+    question_count = Column(Integer, default=0, nullable=False)
+    stakeholder_count = Column(Integer, default=0, nullable=False)
+
     # Generated questions
     questions_generated = Column(Boolean, default=False)
     research_questions = Column(JSON)  # ResearchQuestions object
@@ -59,6 +66,27 @@ class ResearchSession(Base):
     # Note: exports are now handled via Pydantic models, not SQLAlchemy relationships
 
 
+class ResearchSessionMessage(Base):
+    """Database model for one chat message, appended to a session's log."""
+
+    __tablename__ = "research_session_messages"
+    __table_args__ = (
+        # Keyset reads of one session's log in append order
+        Index("ix_research_session_messages_session_seq", "session_id", "id"),
+        {"extend_existing": True},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(
+        String,
+        ForeignKey("research_sessions.session_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    role = Column(String, nullable=True)
+    message = Column(JSON, nullable=False)  # The message object as sent
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 # Pydantic model for research exports
 class ResearchExport(BaseModel):
     """Pydantic model for research exports."""
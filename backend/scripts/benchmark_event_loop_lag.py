@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Event Loop Lag Load Test
+
+Runs concurrent simulated analyses against the repositories, each alternating
+UnitOfWork transactions with awaited "LLM calls", and measures how late a 10ms
+heartbeat task wakes up. Compares synchronous ``Session`` repositories (every
+query and commit blocks the loop) with the ``AsyncSession`` path.
+
+Usage:
+    python -m backend.scripts.benchmark_event_loop_lag [--analyses 50] [--steps 10] [--rows 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from backend.infrastructure.persistence.async_database import create_async_db_engine
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.models import AnalysisResult, InterviewData, User
+
+USER_ID = "load-test-user"
+HEARTBEAT_INTERVAL = 0.01
+
+
+# Postgres-only JSONB columns are rendered as plain JSON on the SQLite load-test database
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(element, compiler, **kw):
+    return "JSON"
+
+
+def seed_database(url: str, rows: int) -> List[int]:
+    """Create the schema and ``rows`` analysis results; return their IDs."""
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        session.add(User(user_id=USER_ID, email="load-test@example.com"))
+        interview = InterviewData(
+            user_id=USER_ID,
+            filename="load-test.txt",
+            input_type="free_text",
+            original_data="Interviewee: " + "we reconcile invoices by hand. " * 200,
+        )
+        session.add(interview)
+        session.flush()
+        results = [
+            AnalysisResult(
+                data_id=interview.id,
+                status="completed",
+                llm_provider="gemini",
+                llm_model="load-test",
+                results=json.dumps(
+                    {
+                        "progress": 1.0,
+                        "message": "done",
+                        "themes": [{"name": f"theme {i}", "statements": ["x" * 200] * 10}],
+                    }
+                ),
+            )
+            for i in range(rows)
+        ]
+        session.add_all(results)
+        session.commit()
+        return [r.result_id for r in results]
+    finally:
+        session.close()
+        engine.dispose()
+
+
+async def heartbeat(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how late each fixed-interval wakeup is."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(loop.time() - start - HEARTBEAT_INTERVAL)
+
+
+async def simulated_analysis(
+    session_factory: Callable, result_id: int, steps: int, llm_latency: float
+) -> None:
+    """Interleave repository work with awaited LLM calls, like a running analysis."""
+    for step in range(steps):
+        async with UnitOfWork(session_factory) as uow:
+            await uow.analyses.list_by_user(USER_ID, limit=100)
+            await uow.analyses.update_status(
+                result_id, USER_ID, "processing", progress=step / steps
+            )
+            await uow.commit()
+        await asyncio.sleep(llm_latency)
+
+
+async def run(
+    session_factory: Callable,
+    result_ids: List[int],
+    analyses: int,
+    steps: int,
+    llm_latency: float,
+) -> Dict[str, float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            simulated_analysis(session_factory, result_ids[i % len(result_ids)], steps, llm_latency)
+            for i in range(analyses)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(lags_ms),
+        "p99": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+        "max": lags_ms[-1],
+    }
+
+
+def report(label: str, stats: Dict[str, float]) -> None:
+    print(
+        f"{label:<13}: wall {stats['elapsed']:6.2f}s | loop lag "
+        f"p50 {stats['p50']:7.2f}ms  p99 {stats['p99']:7.2f}ms  max {stats['max']:7.2f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'load_test.db')}"
+        result_ids = seed_database(url, args.rows)
+        print(
+            f"{args.analyses} concurrent analyses x {args.steps} steps, "
+            f"{args.rows} seeded results, {args.llm_latency * 1000:.0f}ms simulated LLM latency"
+        )
+
+        sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+        sync_stats = await run(
+            sessionmaker(bind=sync_engine), result_ids, args.analyses, args.steps, args.llm_latency
+        )
+        sync_engine.dispose()
+        report("Sync Session", sync_stats)
+
+        async_engine = create_async_db_engine(url)
+        async_stats = await run(
+            async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False),
+            result_ids,
+            args.analyses,
+            args.steps,
+            args.llm_latency,
+        )
+        await async_engine.dispose()
+        report("AsyncSession", async_stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--analyses", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
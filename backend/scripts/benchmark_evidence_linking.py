@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Evidence Linking Benchmark
+
+Times EvidenceLinkingService.link_evidence_to_attributes_v2 on a synthetic
+transcript, comparing the SentenceIndex-backed candidate selection with the
+previous per-trait linear scan.
+
+Usage:
+    python -m backend.scripts.benchmark_evidence_linking [--words 100000] [--personas 8]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.services.processing.evidence_linking_service import (
+    EvidenceLinkingService,
+)
+from backend.services.processing.sentence_index import clear_sentence_index_cache
+
+VOCABULARY = (
+    "invoice reconcile manual spreadsheet export budget approval workflow customer "
+    "dashboard report deadline vendor payment audit finance team automation "
+    "integration onboarding tooling pipeline latency contract renewal forecast "
+    "compliance review meeting handoff escalation backlog priority roadmap"
+).split()
+FILLER = "really just like quite very also then maybe".split()
+
+
+def build_transcript(words: int, seed: int = 42) -> str:
+    """Build a synthetic interview transcript of roughly ``words`` words."""
+    rng = random.Random(seed)
+    lines: List[str] = []
+    count = 0
+    turn = 0
+    while count < words:
+        n = rng.randint(8, 24)
+        body = " ".join(
+            rng.choice(VOCABULARY) if rng.random() < 0.6 else rng.choice(FILLER)
+            for _ in range(n)
+        )
+        if turn % 4 == 0:
+            lines.append(f"Interviewer: how does the {body}?")
+        else:
+            lines.append(f"Interviewee: I think our {body}.")
+        count += n + 3
+        turn += 1
+    return "\n".join(lines)
+
+
+def build_personas(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+
+    def trait() -> Dict[str, Any]:
+        return {"value": " ".join(rng.sample(VOCABULARY, 6)), "evidence": []}
+
+    return [
+        {
+            "demographics": trait(),
+            "goals_and_motivations": trait(),
+            "challenges_and_frustrations": trait(),
+            "key_quotes": {"value": "", "evidence": []},
+        }
+        for _ in range(count)
+    ]
+
+
+class LinearScanLinkingService(EvidenceLinkingService):
+    """EvidenceLinkingService with the pre-index candidate selection."""
+
+    def _iter_sentences_with_spans(self, text: str) -> List[Tuple[int, int, str]]:
+        spans: List[Tuple[int, int, str]] = []
+        for m in re.finditer(r"[^.!?\n]+[.!?]", text or "", flags=re.MULTILINE):
+            s, e = m.span()
+            sent = text[s:e].strip()
+            if len(sent) >= 20:
+                spans.append((s, e, sent))
+        return spans or [(0, len(text or ""), (text or "").strip())]
+
+    def _select_candidate_spans(
+        self,
+        trait_value: str,
+        scoped_text: str,
+        used_spans: Any,
+        limit: int = 6,
+        metrics: Optional[Dict[str, int]] = None,
+        index: Any = None,
+    ) -> List[Tuple[int, int, str, float]]:
+        used = list(used_spans)
+        candidates = []
+        for s, e, sent in self._iter_sentences_with_spans(scoped_text):
+            ok, j = self._overlap_ok(trait_value or "", sent)
+            if not ok:
+                continue
+            if self._looks_like_metadata(sent) or self._looks_like_question(sent):
+                continue
+            if any(self._span_overlaps((s, e), u) for u in used):
+                continue
+            candidates.append((s, e, sent, j))
+        candidates.sort(key=lambda t: (t[3], len(t[2])), reverse=True)
+        return candidates[:limit]
+
+
+def run(service: EvidenceLinkingService, text: str, personas: List[Dict[str, Any]]):
+    meta = {"speaker": "Interviewee", "speaker_role": "Interviewee"}
+    start = time.perf_counter()
+    maps = []
+    for persona in personas:
+        _, ev_map = service.link_evidence_to_attributes_v2(
+            persona, scoped_text=text, scope_meta=meta
+        )
+        maps.append(ev_map)
+    return time.perf_counter() - start, maps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--personas", type=int, default=8)
+    args = parser.parse_args()
+
+    text = build_transcript(args.words)
+    personas = build_personas(args.personas)
+    print(f"Transcript: {len(text.split())} words, {len(text)} chars")
+
+    clear_sentence_index_cache()
+    indexed_time, indexed_maps = run(EvidenceLinkingService(None), text, personas)
+    legacy_time, legacy_maps = run(LinearScanLinkingService(None), text, personas)
+
+    print(f"Linear scan : {legacy_time:8.3f}s")
+    print(f"SentenceIndex: {indexed_time:8.3f}s (includes index build)")
+    print(f"Speedup     : {legacy_time / max(indexed_time, 1e-9):8.1f}x")
+    print(f"Same output : {indexed_maps == legacy_maps}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+JSON Repair Benchmark
+
+Times the single-pass tolerant parser against the previous implementation,
+``EnhancedJSONRepair.parse_json``, on theme, pattern and persona payloads. The
+previous implementation is loaded from git (``--baseline-rev``, by default the
+last revision before the tolerant parser replaced it), so the repo does not
+carry a second copy of it. Each payload is parsed as returned (valid JSON),
+inside a markdown fence, and with each of the defects seen in logged Gemini
+and OpenAI responses: trailing and missing commas, single-quoted or unquoted
+keys, Python literals, unescaped inner quotes and truncation.
+
+Timings are reported per shape. Most production responses are valid or only
+fenced, so compare those rows before reading the totals; the defect rows
+dominate the totals because the old chain retries many regex passes on them.
+
+Usage:
+    python -m backend.scripts.benchmark_json_repair [--items 40] [--repeat 5]
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import subprocess
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+# Last revision with the regex-based EnhancedJSONRepair chain
+BASELINE_REV = "cca3985"
+BASELINE_PATH = "backend/utils/json/enhanced_json_repair.py"
+BASELINE_MODULE = "json_repair_baseline"
+
+STATEMENTS = [
+    "I don't trust the numbers until I've reconciled them by hand",
+    "We export everything to a spreadsheet every Friday",
+    "It's the approval step that takes the longest",
+    "Honestly the dashboard is fine, it's the data that's wrong",
+    "Our vendor portal times out when we upload invoices",
+    "I'd pay for anything that removes the month-end crunch",
+]
+
+
+def build_payload(rng: random.Random, kind: str, items: int) -> Any:
+    """A clean theme, pattern or persona response like the LLMs return."""
+    if kind == "themes":
+        return {
+            "themes": [
+                {
+                    "name": f"Theme {i}",
+                    "definition": "Pain around manual finance workflows",
+                    "statements": rng.sample(STATEMENTS, 3),
+                    "frequency": round(rng.random(), 2),
+                    "sentiment": rng.choice([-0.5, 0.0, 0.4]),
+                    "keywords": ["invoice", "export", "approval"],
+                }
+                for i in range(items)
+            ]
+        }
+    if kind == "patterns":
+        return {
+            "patterns": [
+                {
+                    "name": f"Pattern {i}",
+                    "category": rng.choice(["Workflow", "Coping Strategy"]),
+                    "description": "Users rebuild reports by hand",
+                    "evidence": rng.sample(STATEMENTS, 2),
+                    "confidence": round(rng.random(), 2),
+                    "actionable": rng.choice([True, False]),
+                }
+                for i in range(items)
+            ]
+        }
+    return {
+        "personas": [
+            {
+                "name": f"Persona {i}",
+                "archetype": "Reluctant Reconciler",
+                "demographics": {
+                    "value": "Finance lead at a mid-size company",
+                    "confidence": 0.8,
+                    "evidence": rng.sample(STATEMENTS, 2),
+                },
+                "goals_and_motivations": {
+                    "value": "Close the books without weekend work",
+                    "confidence": 0.7,
+                    "evidence": rng.sample(STATEMENTS, 2),
+                },
+                "manager": None,
+            }
+            for i in range(max(1, items // 4))
+        ]
+    }
+
+
+QUOTED_PHRASES = [
+    ("the approval step", 'the "approval" step'),
+    ("Users rebuild", 'Users "rebuild"'),
+]
+
+
+def quote_phrases(text: str, escape: bool) -> str:
+    """Quote words inside string values, as LLMs do without escaping them."""
+    for phrase, quoted in QUOTED_PHRASES:
+        text = text.replace(phrase, json.dumps(quoted)[1:-1] if escape else quoted)
+    return text
+
+
+DEFECTS = {
+    "valid": lambda s: s,
+    "fenced": lambda s: f"Here is the analysis:\n```json\n{s}\n```",
+    "trailing_commas": lambda s: re.sub(r"(\S)(\n\s*[}\]])", r"\1,\2", s),
+    "missing_commas": lambda s: s.replace("},\n", "}\n").replace('",\n', '"\n', 3),
+    "single_quoted_keys": lambda s: re.sub(r'"(\w+)":', r"'\1':", s),
+    "unquoted_keys": lambda s: re.sub(r'"(\w+)":', r"\1:", s),
+    "python_literals": lambda s: s.replace("true", "True").replace("null", "None"),
+    "inner_quotes": lambda s: quote_phrases(s, escape=False),
+    "truncated": lambda s: s[: int(len(s) * 0.8)],
+}
+
+
+def build_corpus(items: int, seed: int = 7) -> List[Tuple[str, str, Any]]:
+    """(shape, text, expected) triples; expected is None where not recoverable."""
+    rng = random.Random(seed)
+    corpus = []
+    for kind in ("themes", "patterns", "personas"):
+        payload = build_payload(rng, kind, items)
+        clean = json.dumps(payload, indent=2)
+        for defect, apply in DEFECTS.items():
+            text = apply(clean)
+            expected = None if defect == "truncated" else payload
+            if defect == "inner_quotes":
+                expected = json.loads(quote_phrases(clean, escape=True))
+            corpus.append((defect, text, expected))
+    return corpus
+
+
+def load_baseline(rev: str = BASELINE_REV) -> types.ModuleType:
+    """Import the previous enhanced_json_repair module from git revision ``rev``."""
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{BASELINE_PATH}"],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType(BASELINE_MODULE)
+    exec(compile(source, f"{rev}:{BASELINE_PATH}", "exec"), module.__dict__)
+    return module
+
+
+def legacy_repair_for(baseline: types.ModuleType) -> Callable[[str], Optional[Any]]:
+    """The previous parse path: json.loads, then the full repair_json chain."""
+    return baseline.EnhancedJSONRepair.parse_json
+
+
+def tolerant_repair(json_str: str) -> Optional[Any]:
+    try:
+        return parse_tolerant(json_str).value
+    except TolerantJSONError:
+        return None
+
+
+def recovered(expected: Any, result: Any) -> bool:
+    """Exact recovery, or any non-empty object for truncated input."""
+    if expected is None:
+        return isinstance(result, dict) and bool(result)
+    return result == expected
+
+
+def timed(fn: Callable, texts: List[str], repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [fn(text) for text in texts]
+    return (time.perf_counter() - start) / repeat, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--baseline-rev",
+        default=BASELINE_REV,
+        help="Git revision to load the previous implementation from",
+    )
+    args = parser.parse_args()
+
+    legacy_repair = legacy_repair_for(load_baseline(args.baseline_rev))
+    # The old chain logs every failed repair attempt; keep the output readable
+    logging.getLogger(BASELINE_MODULE).setLevel(logging.CRITICAL)
+
+    corpus = build_corpus(args.items)
+    size = sum(len(text) for _, text, _ in corpus)
+    print(f"Corpus: {len(corpus)} responses, {size / 1024:.0f} KB")
+
+    print(
+        f"{'Shape':<20}{'Old ok':>8}{'New ok':>8}{'Old ms':>10}{'New ms':>10}{'Speedup':>9}"
+    )
+    totals = [0.0, 0.0]
+    for defect in DEFECTS:
+        rows = [(text, expected) for d, text, expected in corpus if d == defect]
+        texts = [text for text, _ in rows]
+        legacy_time, legacy = timed(legacy_repair, texts, args.repeat)
+        tolerant_time, tolerant = timed(tolerant_repair, texts, args.repeat)
+        totals[0] += legacy_time
+        totals[1] += tolerant_time
+        legacy_ok = sum(recovered(e, r) for (_, e), r in zip(rows, legacy))
+        tolerant_ok = sum(recovered(e, r) for (_, e), r in zip(rows, tolerant))
+        print(
+            f"{defect:<20}{legacy_ok:>6}/{len(rows)}{tolerant_ok:>6}/{len(rows)}"
+            f"{legacy_time * 1000:>10.2f}{tolerant_time * 1000:>10.2f}"
+            f"{legacy_time / max(tolerant_time, 1e-9):>8.1f}x"
+        )
+
+    print(f"Old parse_json    : {totals[0]:8.4f}s")
+    print(f"Tolerant parser   : {totals[1]:8.4f}s")
+    print(f"Speedup           : {totals[0] / max(totals[1], 1e-9):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
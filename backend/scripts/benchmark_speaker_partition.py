@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Speaker Partition Benchmark
+
+Times building per-speaker scoped text, doc_spans and document ids for
+persona formation on a synthetic panel transcript, comparing the single-pass
+partition_transcript with the previous scan of the transcript per speaker.
+
+Usage:
+    python -m backend.scripts.benchmark_speaker_partition [--segments 5000] [--speakers 40]
+"""
+
+import argparse
+import random
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from backend.services.processing.persona_formation.speakers.partition import (
+    build_scoped_text,
+    merge_buckets,
+    partition_transcript,
+    strip_block_prefix,
+)
+
+WORDS = (
+    "invoice reconcile manual spreadsheet export budget approval workflow customer "
+    "dashboard report deadline vendor payment audit finance team automation"
+).split()
+
+
+def build_transcript(segments: int, speakers: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build a synthetic multi-document panel transcript."""
+    rng = random.Random(seed)
+    transcript = []
+    for i in range(segments):
+        doc = f"interview_{i * 8 // segments + 1}"
+        if i % 5 == 0:
+            speaker, role = "Interviewer", "Interviewer"
+        else:
+            speaker, role = f"I{doc[-1]}|Speaker {rng.randrange(speakers)}", "Participant"
+        transcript.append(
+            {
+                "speaker_id": speaker,
+                "role": role,
+                "dialogue": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))),
+                "document_id": doc,
+            }
+        )
+    return transcript
+
+
+def speaker_keys(transcript: List[Dict[str, Any]]) -> Dict[str, set]:
+    """Per persona speaker, the (speaker_id, document_id) keys it claims."""
+    mapping: Dict[str, set] = {}
+    for seg in transcript:
+        if seg["role"].lower() == "interviewer":
+            continue
+        speaker = strip_block_prefix(seg["speaker_id"])
+        mapping.setdefault(speaker, set()).add((speaker, seg["document_id"]))
+    return mapping
+
+
+def per_speaker_scan(transcript, mapping) -> Dict[str, Tuple[str, List[Dict[str, Any]], str]]:
+    """The previous approach: rescan the whole transcript for every speaker."""
+
+    def _strip(spk):
+        if isinstance(spk, str) and re.match(r"^I\d+\|", spk):
+            return re.sub(r"^I\d+\|", "", spk)
+        return spk
+
+    def _matches(seg, keys):
+        return (
+            _strip(seg.get("speaker_id") or seg.get("speaker") or ""),
+            seg.get("document_id") or "original_text",
+        ) in keys
+
+    out = {}
+    for speaker, keys in mapping.items():
+        turns = [
+            (seg.get("document_id") or "original_text", seg.get("dialogue") or "")
+            for seg in transcript
+            if _matches(seg, keys)
+        ]
+        order, buckets = [], {}
+        for did, txt in turns:
+            if did not in buckets:
+                buckets[did] = []
+                order.append(did)
+            if txt:
+                buckets[did].append(str(txt))
+        pieces, spans, cursor = [], [], 0
+        for did in order:
+            block = "\n".join(buckets[did])
+            spans.append({"document_id": did, "start": cursor, "end": cursor + len(block)})
+            pieces.append(block)
+            cursor += len(block) + 2
+        doc_ids = Counter(
+            d
+            for d in ((seg.get("document_id") or "").strip() for seg in transcript if _matches(seg, keys))
+            if d
+        )
+        out[speaker] = ("\n\n".join(pieces), spans, doc_ids.most_common(1)[0][0])
+    return out
+
+
+def single_pass(transcript, mapping) -> Dict[str, Tuple[str, List[Dict[str, Any]], str]]:
+    buckets = partition_transcript(
+        transcript,
+        key=lambda seg: (
+            strip_block_prefix(seg.get("speaker_id") or seg.get("speaker") or ""),
+            seg.get("document_id") or "original_text",
+        ),
+    )
+    out = {}
+    for speaker, keys in mapping.items():
+        bucket = merge_buckets(buckets[k] for k in keys if k in buckets)
+        text, spans = build_scoped_text(bucket.turns)
+        out[speaker] = (text, spans, bucket.document_ids.most_common(1)[0][0])
+    return out
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--speakers", type=int, default=40)
+    args = parser.parse_args()
+
+    transcript = build_transcript(args.segments, args.speakers)
+    mapping = speaker_keys(transcript)
+    print(f"Transcript: {len(transcript)} segments, {len(mapping)} speakers")
+
+    legacy_time, legacy = timed(per_speaker_scan, transcript, mapping)
+    partition_time, partitioned = timed(single_pass, transcript, mapping)
+
+    print(f"Per-speaker scan: {legacy_time:8.3f}s")
+    print(f"Single pass     : {partition_time:8.3f}s")
+    print(f"Speedup         : {legacy_time / max(partition_time, 1e-9):8.1f}x")
+    print(f"Same output     : {legacy == partitioned}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Validation Token Overlap Benchmark
+
+Times the exact-match and windowed token-overlap layers of ValidationEngine for
+a batch of evidence items over a synthetic long transcript, comparing the
+prepared NumPy source with the previous per-window string and set rebuild.
+
+Usage:
+    python -m backend.scripts.benchmark_validation_overlap [--words 9000] [--evidence 200]
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from backend.services.evidence_intelligence.evidence_attribution import (
+    AttributedEvidence,
+    EvidenceType,
+)
+from backend.services.evidence_intelligence.speaker_intelligence import SpeakerRole
+from backend.services.evidence_intelligence.validation_engine import ValidationEngine
+
+WORDS = (
+    "invoice reconcile manual spreadsheet export budget approval workflow customer "
+    "dashboard report deadline vendor payment audit finance team automation we the "
+    "I it is was to and of a in that for our every month days hours"
+).split()
+
+
+def build_inputs(words: int, evidence: int, seed: int = 42) -> Tuple[str, List[str]]:
+    """A transcript of ``words`` words and evidence quotes, half taken verbatim."""
+    rng = random.Random(seed)
+    source_words = [rng.choice(WORDS) for _ in range(words)]
+    quotes = []
+    for i in range(evidence):
+        length = rng.randint(6, 30)
+        if i % 2 == 0:
+            start = rng.randrange(0, words - length)
+            quotes.append(" ".join(source_words[start : start + length]))
+        else:
+            quotes.append(" ".join(rng.choice(WORDS) for _ in range(length)))
+    return " ".join(source_words), quotes
+
+
+def legacy_checks(engine: ValidationEngine, text: str, source_text: str) -> Tuple[bool, float, str]:
+    """The previous implementation: renormalize and rebuild every window per item."""
+    exact = engine._normalize_for_matching(text) in engine._normalize_for_matching(source_text)
+
+    evidence_tokens = set(text.lower().split())
+    best_overlap, best_segment = 0.0, ""
+    words = source_text.split()
+    window_size = len(text.split()) * 2
+    for i in range(len(words) - window_size + 1):
+        segment = " ".join(words[i : i + window_size])
+        segment_tokens = set(segment.lower().split())
+        union = evidence_tokens.union(segment_tokens)
+        if union:
+            overlap = len(evidence_tokens.intersection(segment_tokens)) / len(union)
+            if overlap > best_overlap:
+                best_overlap, best_segment = overlap, segment
+    return exact, best_overlap, best_segment
+
+
+def prepared_checks(engine, evidence_items, source_text) -> List[Tuple[bool, float, str]]:
+    prepared = engine.prepare_source(source_text)
+    out = []
+    for evidence in evidence_items:
+        exact = engine._validate_exact_match(evidence, source_text, prepared)
+        overlap = engine._calculate_token_overlap(evidence, source_text, prepared)
+        out.append(
+            (
+                exact["exact_match"],
+                overlap["token_overlap_ratio"],
+                overlap["best_matching_segment"],
+            )
+        )
+    return out
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=9000)
+    parser.add_argument("--evidence", type=int, default=200)
+    args = parser.parse_args()
+
+    source_text, quotes = build_inputs(args.words, args.evidence)
+    evidence_items = [
+        AttributedEvidence(
+            text=q,
+            normalized_text=q,
+            speaker_id="participant",
+            speaker_role=SpeakerRole.PARTICIPANT,
+            evidence_type=EvidenceType.STATEMENT,
+        )
+        for q in quotes
+    ]
+    engine = ValidationEngine({})
+    print(f"Transcript: {args.words} words, {len(quotes)} evidence items")
+
+    legacy_time, legacy = timed(
+        lambda: [legacy_checks(engine, q, source_text) for q in quotes]
+    )
+    prepared_time, prepared = timed(prepared_checks, engine, evidence_items, source_text)
+
+    print(f"Per-window rebuild: {legacy_time:8.3f}s")
+    print(f"Prepared source   : {prepared_time:8.3f}s")
+    print(f"Speedup           : {legacy_time / max(prepared_time, 1e-9):8.1f}x")
+    print(f"Same output       : {legacy == prepared}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import logging
 import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, TYPE_CHECKING
+import httpx
 from pydantic import ValidationError, BaseModel
 
 # Import SQLAlchemy models directly from models.py to avoid dynamic import issues
@@ -13,12 +14,39 @@ from backend.services.llm import LLMServiceFactory
 from backend.services.nlp import get_nlp_processor
 from backend.core.processing_pipeline import process_data
 from backend.infrastructure.config.settings import settings
+from backend.infrastructure.events.analysis_stream import publish_analysis_event
+from backend.infrastructure.tracing import PipelineTrace, current_trace, trace_pipeline
 from backend.schemas import DetailedAnalysisResult, StakeholderIntelligence
 from backend.utils.timezone_utils import utc_now
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Queue priority of analysis jobs by subscription tier (higher is claimed first)
+QUEUE_PRIORITY_BY_TIER = {"free": 0, "starter": 1, "pro": 2, "enterprise": 3}
+
+# Provider/HTTP statuses that mean "try again later"
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """
+    Whether an analysis failure is transient (network error, timeout, rate
+    limit or provider outage), including errors wrapped by another exception.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (TimeoutError, ConnectionError, httpx.TransportError)):
+            return True
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        if status in RETRYABLE_STATUS_CODES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
 
 def make_json_serializable(obj: Any) -> Any:
     """
@@ -72,6 +100,7 @@ class AnalysisService:
         llm_model: Optional[str] = None,
         is_free_text: bool = False,
         industry: Optional[str] = None,
+        priority: Optional[int] = None,
     ) -> dict:
         """
         Start analysis of interview data.
@@ -82,6 +111,7 @@ class AnalysisService:
             llm_model: Optional specific model to use
             is_free_text: Whether the data is in free-text format
             industry: Optional industry context for analysis
+            priority: Queue priority; defaults to the user's subscription tier
             use_enhanced_theme_analysis: Whether to use enhanced theme analysis
             use_reliability_check: Whether to perform reliability checks
 
@@ -167,22 +197,45 @@ class AnalysisService:
                 logger.warning(f"Error tracking usage: {str(usage_error)}")
                 # This is non-critical, so we can continue
 
-            # Start background processing task
-            asyncio.create_task(
-                self._process_data_task(
-                    analysis_result.result_id,
-                    nlp_processor,
-                    llm_service,
-                    data,
+            config = {
+                "use_enhanced_theme_analysis": True,  # Always run enhanced analysis
+                "use_reliability_check": True,  # Always use reliability check
+                "llm_provider": llm_provider,
+                "llm_model": llm_model,
+                "industry": industry,  # Pass industry context to the processing pipeline
+            }
+
+            if settings.analysis_queue_enabled:
+                # Hand off to a worker process (backend.services.jobs.worker)
+                from backend.api.dependencies import get_container
+                from backend.services.jobs import ANALYSIS_JOB_TYPE
+
+                job_id = await get_container().get_job_queue().enqueue(
+                    ANALYSIS_JOB_TYPE,
                     {
-                        "use_enhanced_theme_analysis": True,  # Always run enhanced analysis
-                        "use_reliability_check": True,  # Always use reliability check
-                        "llm_provider": llm_provider,
-                        "llm_model": llm_model,
-                        "industry": industry,  # Pass industry context to the processing pipeline
+                        "result_id": analysis_result.result_id,
+                        "data_id": data_id,
+                        "is_free_text": is_free_text,
+                        "config": config,
                     },
+                    user_id=self.user.user_id,
+                    priority=self._queue_priority() if priority is None else priority,
+                    analysis_id=str(analysis_result.result_id),
+                )
+                logger.info(
+                    f"Queued analysis job {job_id} for result_id: {analysis_result.result_id}"
+                )
+            else:
+                # Start background processing task
+                asyncio.create_task(
+                    self._process_data_task(
+                        analysis_result.result_id,
+                        nlp_processor,
+                        llm_service,
+                        data,
+                        config,
+                    )
                 )
-            )
 
             # Return response
             return {
@@ -198,6 +251,15 @@ class AnalysisService:
             logger.error(f"Error initiating analysis: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
+    def _queue_priority(self) -> int:
+        """Queue priority for this user's analyses, from their subscription tier."""
+        usage_data = getattr(self.user, "usage_data", None)
+        subscription = usage_data.get("subscription") if isinstance(usage_data, dict) else None
+        tier = subscription.get("tier") if isinstance(subscription, dict) else None
+        if tier is None and getattr(self.user, "subscription_status", None) == "trialing":
+            tier = "pro"
+        return QUEUE_PRIORITY_BY_TIER.get(tier or "free", 0)
+
     def _parse_interview_data(self, interview_data: Any, is_free_text: bool) -> Any:
         """
         Parse interview data from database record.
@@ -424,6 +486,44 @@ class AnalysisService:
                 status_code=500, detail=f"Failed to create analysis record: {str(e)}"
             )
 
+    async def run_queued_analysis(
+        self,
+        result_id: int,
+        data_id: int,
+        is_free_text: bool,
+        config: Dict[str, Any],
+        final_attempt: bool = True,
+    ):
+        """
+        Run an analysis that was queued by start_analysis, inside a worker.
+
+        Args:
+            result_id: ID of the analysis result record created at enqueue time
+            data_id: ID of the interview data to analyze
+            is_free_text: Whether the data is in free-text format
+            config: Analysis configuration parameters
+            final_attempt: Whether the job has no retries left; otherwise
+                transient errors are raised so the queue retries the job
+        """
+        interview_data = (
+            self.db.query(models_module.InterviewData)
+            .filter(
+                models_module.InterviewData.id == data_id,
+                models_module.InterviewData.user_id == self.user.user_id,
+            )
+            .first()
+        )
+        if not interview_data:
+            raise ValueError(f"Interview data {data_id} not found for queued analysis")
+
+        data = self._parse_interview_data(interview_data, is_free_text)
+        llm_service = LLMServiceFactory.create(config["llm_provider"])
+        nlp_processor = get_nlp_processor()()
+
+        return await self._process_data_task(
+            result_id, nlp_processor, llm_service, data, config, final_attempt
+        )
+
     async def _process_data_task(
         self,
         result_id: int,
@@ -431,9 +531,31 @@ class AnalysisService:
         llm_service: Any,
         data: Any,
         config: Dict[str, Any],
+        final_attempt: bool = True,
+    ) -> PipelineTrace:
+        """
+        Background task to process interview data, traced per stage.
+
+        The stage/LLM timing summary is stored with the results under
+        "performance"; the trace is returned.
+        """
+        with trace_pipeline(result_id) as trace:
+            await self._run_data_task(
+                result_id, nlp_processor, llm_service, data, config, final_attempt
+            )
+        return trace
+
+    async def _run_data_task(
+        self,
+        result_id: int,
+        nlp_processor: Any,
+        llm_service: Any,
+        data: Any,
+        config: Dict[str, Any],
+        final_attempt: bool = True,
     ):
         """
-        Background task to process interview data.
+        Process interview data and persist results or the failure.
 
         Args:
             result_id: ID of the analysis result record
@@ -441,6 +563,8 @@ class AnalysisService:
             llm_service: Initialized LLM service
             data: Parsed interview data
             config: Analysis configuration parameters
+            final_attempt: When False, transient errors are re-raised without
+                failing the analysis so the job queue can retry it
         """
         from backend.database import get_db
 
@@ -554,6 +678,10 @@ class AnalysisService:
                         progress * 0.1
                     )  # Each stage can contribute up to 10%
                     overall_progress = min(0.95, base_progress + stage_contribution)
+                    # Stages run concurrently; never move the overall bar backwards
+                    overall_progress = max(
+                        overall_progress, current_results.get("progress") or 0.0
+                    )
 
                     current_results["progress"] = overall_progress
 
@@ -563,6 +691,16 @@ class AnalysisService:
                     # Save updated status
                     task_result.results = json.dumps(current_results)
                     async_db.commit()
+
+                    await publish_analysis_event(
+                        result_id,
+                        "progress",
+                        {
+                            "stage": stage,
+                            "progress": overall_progress,
+                            "message": message,
+                        },
+                    )
                 except Exception as update_error:
                     logger.error(
                         f"Error updating progress for result_id {result_id}: {str(update_error)}"
@@ -747,8 +885,27 @@ class AnalysisService:
                     f"[STAKEHOLDER_DEBUG] Available result keys: {list(current_results.keys())}"
                 )
 
+            trace = current_trace()
+            if trace is not None:
+                current_results["performance"] = trace.to_dict()
+
             # Save the merged results - ensure all Pydantic models are serialized
             serializable_results = make_json_serializable(current_results)
+
+            # Materialize persona evidence hydration/validation once so reads don't rescan transcripts
+            try:
+                from backend.services.results.hydration import (
+                    materialize_persona_hydration,
+                )
+
+                await asyncio.to_thread(
+                    materialize_persona_hydration, serializable_results
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Persona hydration failed for result_id {result_id}, will recompute on read: {e}"
+                )
+
             task_result.results = json.dumps(serializable_results)
             task_result.completed_at = datetime.now(timezone.utc)
 
@@ -762,8 +919,17 @@ class AnalysisService:
             logger.info(
                 f"Successfully set status to 'completed' for result_id: {task_result.result_id}"
             )
+            await publish_analysis_event(
+                result_id, "complete", {"result_id": result_id, "status": "completed"}
+            )
 
         except Exception as e:
+            if not final_attempt and _is_retryable_error(e):
+                logger.warning(
+                    f"Transient error during analysis task for result_id {result_id}, "
+                    f"leaving it to the job queue to retry: {str(e)}"
+                )
+                raise
             logger.error(
                 f"Error during analysis task for result_id {result_id}: {str(e)}",
                 exc_info=True,
@@ -816,6 +982,10 @@ class AnalysisService:
                     for key, value in error_info.items():
                         current_results[key] = value
 
+                    trace = current_trace()
+                    if trace is not None:
+                        current_results["performance"] = trace.to_dict()
+
                     # Update database record with error - ensure serializable
                     serializable_results = make_json_serializable(current_results)
                     task_result.results = json.dumps(serializable_results)
@@ -825,6 +995,16 @@ class AnalysisService:
                     logger.info(
                         f"Set status to 'failed' with detailed error info for result_id: {result_id}"
                     )
+                    await publish_analysis_event(
+                        result_id,
+                        "error",
+                        {
+                            "result_id": result_id,
+                            "status": "failed",
+                            "message": error_info["message"],
+                            "error_stage": current_stage,
+                        },
+                    )
                 else:
                     logger.error(
                         f"Could not update status to failed, AnalysisResult record not found for result_id: {result_id}"
@@ -839,3 +1019,51 @@ class AnalysisService:
             if async_db:
                 async_db.close()
                 logger.info(f"Closed database session for result_id: {result_id}")
+
+
+async def run_analysis_job(job: Any) -> None:
+    """
+    Job handler for queued analyses (see backend.services.jobs.worker).
+
+    Transient analysis errors (network, timeouts, rate limits) are raised so
+    the queue retries the job until ``max_attempts``; other analysis errors,
+    and transient ones on the last attempt, are recorded on the
+    AnalysisResult by _process_data_task. Exceptions raised here (missing
+    data, infrastructure failures) also make the queue retry the job.
+    """
+    from backend.database import SessionLocal
+
+    payload = job.payload
+    db = SessionLocal()
+    try:
+        user = (
+            db.query(models_module.User)
+            .filter(models_module.User.user_id == job.user_id)
+            .first()
+        )
+        if user is None:
+            raise ValueError(f"User {job.user_id} not found for job {job.job_id}")
+
+        trace = await AnalysisService(db, user).run_queued_analysis(
+            result_id=payload["result_id"],
+            data_id=payload["data_id"],
+            is_free_text=payload.get("is_free_text", False),
+            config=payload["config"],
+            final_attempt=job.attempts >= job.max_attempts,
+        )
+
+        # Keep the stage breakdown on the job's pipeline run as well
+        from backend.infrastructure.persistence.pipeline_run_repository import (
+            PipelineRunRepository,
+        )
+
+        try:
+            await PipelineRunRepository(db).record_job_trace(
+                job.job_id, trace.to_stage_traces()
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not store trace for job {job.job_id}: {e}")
+    finally:
+        db.close()
@@ -32,6 +32,8 @@ class ProcessingMetrics(BaseModel):
     evidence_validated: int = 0
     researcher_content_filtered: int = 0
     validation_success_rate: float = 0.0
+    llm_validation_calls: int = 0
+    llm_validation_calls_avoided: Dict[str, int] = Field(default_factory=dict)
     processing_time_seconds: float = 0.0
     errors_encountered: List[str] = Field(default_factory=list)
 
@@ -180,6 +182,9 @@ class EvidenceIntelligenceEngine:
             validation_results = await self.validation_engine.batch_validate(
                 attributed_evidence, transcript_text, parallel=True
             )
+            batch_stats = self.validation_engine.last_batch_stats
+            metrics.llm_validation_calls = batch_stats.get("llm_calls", 0)
+            metrics.llm_validation_calls_avoided = batch_stats.get("llm_calls_avoided", {})
 
             # Calculate validation metrics
             verified_count = sum(
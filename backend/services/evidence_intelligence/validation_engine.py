@@ -11,8 +11,16 @@ import logging
 import re
 from enum import Enum
 import asyncio
+from contextlib import nullcontext
 from difflib import SequenceMatcher
 
+import numpy as np
+
+from backend.services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+)
+
 from .evidence_attribution import AttributedEvidence, EvidenceType
 
 logger = logging.getLogger(__name__)
@@ -72,6 +80,103 @@ class ValidationResult(BaseModel):
     source_line_numbers: List[int] = Field(default_factory=list)
 
 
+class PreparedSource:
+    """
+    Source transcript prepared once for validating many evidence items.
+
+    Words are lowercased and mapped to integer ids, and each position records
+    where the same token occurs before and after it. Windowed Jaccard scores are
+    then computed for all windows at once from token occurrences instead of
+    building a joined string and token set per window.
+    """
+
+    def __init__(self, source_text: str, normalized_text: str):
+        self.source_text = source_text
+        self.normalized_text = normalized_text
+        self.words = source_text.split()
+
+        self.vocabulary: Dict[str, int] = {}
+        ids = [
+            self.vocabulary.setdefault(word.lower(), len(self.vocabulary))
+            for word in self.words
+        ]
+        self.token_ids = np.asarray(ids, dtype=np.int64)
+
+        # Nearest previous / next position of the same token (-1 / n when none)
+        n = len(self.token_ids)
+        order = np.argsort(self.token_ids, kind="stable")
+        same = self.token_ids[order[1:]] == self.token_ids[order[:-1]]
+        self.prev_same = np.full(n, -1, dtype=np.int64)
+        self.next_same = np.full(n, n, dtype=np.int64)
+        self.prev_same[order[1:][same]] = order[:-1][same]
+        self.next_same[order[:-1][same]] = order[1:][same]
+
+        self._distinct_counts: Dict[int, np.ndarray] = {}
+
+    def distinct_counts(self, window_size: int) -> np.ndarray:
+        """Number of distinct tokens in every window of ``window_size`` words."""
+        cached = self._distinct_counts.get(window_size)
+        if cached is not None:
+            return cached
+
+        n, w = len(self.token_ids), window_size
+        first = len(np.unique(self.token_ids[:w]))
+        # Sliding right by one adds the entering token if it does not already
+        # occur in the window and drops the leaving one if it does not reoccur
+        positions = np.arange(w, n)
+        entering = self.prev_same[w:] <= positions - w
+        leaving = self.next_same[: n - w] >= positions
+        deltas = entering.astype(np.int64) - leaving.astype(np.int64)
+        counts = np.concatenate(([first], first + np.cumsum(deltas)))
+
+        self._distinct_counts[window_size] = counts
+        return counts
+
+    def best_window_overlap(
+        self, evidence_tokens: Set[str], window_size: int
+    ) -> Tuple[float, str]:
+        """Highest Jaccard similarity between the evidence tokens and any window."""
+        n = len(self.token_ids)
+        if window_size <= 0 or window_size > n or not evidence_tokens:
+            return 0.0, ""
+
+        evidence_ids = np.asarray(
+            [self.vocabulary[t] for t in evidence_tokens if t in self.vocabulary],
+            dtype=np.int64,
+        )
+        windows = n - window_size + 1
+        if evidence_ids.size:
+            # Each window counts an evidence token once, at its leftmost
+            # occurrence in the window: the occurrence at p is leftmost for the
+            # windows starting after the token's previous occurrence and no
+            # later than p. Adding those start ranges into a difference array
+            # keeps the work linear in the source length.
+            positions = np.flatnonzero(np.isin(self.token_ids, evidence_ids))
+            starts = np.maximum(self.prev_same[positions] + 1, positions - window_size + 1)
+            ends = np.minimum(positions, windows - 1)
+            valid = starts <= ends
+            diff = np.bincount(starts[valid], minlength=windows + 1) - np.bincount(
+                ends[valid] + 1, minlength=windows + 1
+            )
+            intersection = np.cumsum(diff[:windows])
+        else:
+            intersection = np.zeros(windows, dtype=np.int64)
+
+        union = len(evidence_tokens) + self.distinct_counts(window_size) - intersection
+        overlaps = intersection / union
+        best = int(np.argmax(overlaps))
+        if overlaps[best] <= 0.0:
+            return 0.0, ""
+        return float(overlaps[best]), " ".join(self.words[best : best + window_size])
+
+    def coverage(self, evidence_tokens: Set[str]) -> float:
+        """Share of the evidence tokens found anywhere in the source."""
+        if not evidence_tokens:
+            return 0.0
+        found = sum(1 for token in evidence_tokens if token in self.vocabulary)
+        return found / len(evidence_tokens)
+
+
 class ValidationEngine:
     """
     Multi-layered validation engine using multiple LLMs and strict thresholds.
@@ -83,6 +188,11 @@ class ValidationEngine:
     MIN_SEMANTIC_SIMILARITY = 0.75  # 75% semantic similarity required
     MIN_CONSENSUS_SCORE = 0.66  # 2/3 LLMs must agree
 
+    # Deterministic checks settle items above this contamination level
+    CONTAMINATION_SHORT_CIRCUIT = 0.7
+    # Ambiguous evidence items sent to each LLM in one batch validation call
+    LLM_BATCH_SIZE = 10
+
     def __init__(self, llm_services: Dict[str, Any]):
         """
         Initialize with multiple LLM services for cross-verification.
@@ -139,6 +249,28 @@ class ValidationEngine:
         - Any issues or corrections needed
         """
 
+        self.batch_validation_prompt = """
+        Validate each numbered evidence item against the source transcript.
+
+        For every item decide whether its meaning is preserved in the source
+        (semantic_match), whether it is attributed to the participant rather than
+        the researcher, and whether it is a direct quote rather than an
+        interpretation. Require near-exact wording or a faithful paraphrase.
+
+        Evidence items:
+        {evidence_items}
+
+        Source transcript:
+        {source_text}
+
+        Respond with JSON:
+        {{"validations": [{{"index": <item number>, "semantic_match": true/false,
+        "attribution_correct": true/false, "notes": "<short reason>"}}]}}
+        """
+
+        # Outcome counts of the last batch_validate call
+        self.last_batch_stats: Dict[str, Any] = {}
+
         # Researcher contamination patterns
         self.contamination_patterns = [
             r"(?:interviewer|researcher|moderator)\s*:",
@@ -149,7 +281,11 @@ class ValidationEngine:
         ]
 
     async def validate_evidence(
-        self, evidence: AttributedEvidence, source_text: str, use_multi_llm: bool = True
+        self,
+        evidence: AttributedEvidence,
+        source_text: str,
+        use_multi_llm: bool = True,
+        prepared: Optional[PreparedSource] = None,
     ) -> ValidationResult:
         """
         Validate evidence with multi-layered checks.
@@ -158,19 +294,16 @@ class ValidationEngine:
             evidence: Evidence to validate
             source_text: Original source transcript
             use_multi_llm: Whether to use multiple LLMs for verification
+            prepared: Source prepared by prepare_source, reused across a batch
 
         Returns:
             Comprehensive validation result
         """
         try:
-            # Layer 1: Exact text matching
-            exact_result = self._validate_exact_match(evidence, source_text)
-
-            # Layer 2: Token overlap calculation (strict 70% threshold)
-            token_result = self._calculate_token_overlap(evidence, source_text)
-
-            # Layer 3: Researcher contamination check
-            contamination_result = self._check_contamination(evidence)
+            # Layers 1-3 are CPU-bound; keep them off the event loop
+            exact_result, token_result, contamination_result = await asyncio.to_thread(
+                self._run_text_checks, evidence, source_text, prepared
+            )
 
             # Layer 4: LLM semantic validation
             if use_multi_llm and len(self.llm_services) > 1:
@@ -196,8 +329,33 @@ class ValidationEngine:
             logger.error(f"Validation error: {e}")
             return self._create_error_result(str(e))
 
+    def prepare_source(self, source_text: str) -> PreparedSource:
+        """Normalize and tokenize a source transcript once for many validations."""
+        return PreparedSource(source_text, self._normalize_for_matching(source_text))
+
+    def _run_text_checks(
+        self,
+        evidence: AttributedEvidence,
+        source_text: str,
+        prepared: Optional[PreparedSource] = None,
+    ) -> Tuple[Dict, Dict, Dict]:
+        """Exact match, token overlap and contamination layers."""
+        if prepared is None:
+            prepared = self.prepare_source(source_text)
+        return (
+            # Layer 1: Exact text matching
+            self._validate_exact_match(evidence, source_text, prepared),
+            # Layer 2: Token overlap calculation (strict 70% threshold)
+            self._calculate_token_overlap(evidence, source_text, prepared),
+            # Layer 3: Researcher contamination check
+            self._check_contamination(evidence),
+        )
+
     def _validate_exact_match(
-        self, evidence: AttributedEvidence, source_text: str
+        self,
+        evidence: AttributedEvidence,
+        source_text: str,
+        prepared: Optional[PreparedSource] = None,
     ) -> Dict:
         """Check for exact text match in source"""
 
@@ -205,7 +363,11 @@ class ValidationEngine:
 
         # Normalize for comparison
         evidence_normalized = self._normalize_for_matching(evidence.text)
-        source_normalized = self._normalize_for_matching(source_text)
+        source_normalized = (
+            prepared.normalized_text
+            if prepared is not None
+            else self._normalize_for_matching(source_text)
+        )
 
         # Check for exact match
         if evidence_normalized in source_normalized:
@@ -230,44 +392,29 @@ class ValidationEngine:
         return result
 
     def _calculate_token_overlap(
-        self, evidence: AttributedEvidence, source_text: str
+        self,
+        evidence: AttributedEvidence,
+        source_text: str,
+        prepared: Optional[PreparedSource] = None,
     ) -> Dict:
         """
         Calculate token overlap with strict 70% threshold.
         This replaces the flawed 25% threshold.
         """
+        if prepared is None:
+            prepared = self.prepare_source(source_text)
 
-        # Tokenize evidence and source
+        # Tokenize evidence
         evidence_tokens = set(evidence.text.lower().split())
 
-        # Find best matching segment in source
-        best_overlap = 0.0
-        best_segment = ""
-
-        # Sliding window approach
-        words = source_text.split()
+        # Best matching window of the source (Jaccard similarity)
         window_size = len(evidence.text.split()) * 2  # Allow some flexibility
-
-        for i in range(len(words) - window_size + 1):
-            segment = " ".join(words[i : i + window_size])
-            segment_tokens = set(segment.lower().split())
-
-            # Calculate Jaccard similarity
-            intersection = evidence_tokens.intersection(segment_tokens)
-            union = evidence_tokens.union(segment_tokens)
-
-            if union:
-                overlap = len(intersection) / len(union)
-                if overlap > best_overlap:
-                    best_overlap = overlap
-                    best_segment = segment
+        best_overlap, best_segment = prepared.best_window_overlap(
+            evidence_tokens, window_size
+        )
 
         # Also calculate simple token overlap percentage
-        simple_overlap = 0.0
-        if evidence_tokens:
-            source_tokens = set(source_text.lower().split())
-            matching_tokens = evidence_tokens.intersection(source_tokens)
-            simple_overlap = len(matching_tokens) / len(evidence_tokens)
+        simple_overlap = prepared.coverage(evidence_tokens)
 
         return {
             "token_overlap_ratio": best_overlap,
@@ -431,7 +578,8 @@ class ValidationEngine:
     ) -> ValidationResult:
         """Combine all validation layers into final result"""
 
-        result = ValidationResult()
+        # Status is decided below once all layers are combined
+        result = ValidationResult(status=ValidationStatus.INSUFFICIENT)
 
         # Set basic results
         result.exact_match = exact_result.get("exact_match", False)
@@ -561,46 +709,112 @@ class ValidationEngine:
         evidence_list: List[AttributedEvidence],
         source_text: str,
         parallel: bool = True,
+        use_multi_llm: bool = True,
     ) -> Dict[str, ValidationResult]:
         """
-        Validate multiple evidence items.
+        Validate multiple evidence items in tiers.
+
+        Deterministic checks run for every item first. Items they settle
+        (verbatim quotes, or heavy researcher contamination) skip the LLMs; the remaining ambiguous items are validated LLM_BATCH_SIZE at a
+        time, highest token overlap first, under each provider's shared
+        concurrency limiter. Outcome counts are kept in ``last_batch_stats``.
 
         Args:
             evidence_list: List of evidence to validate
             source_text: Original source transcript
-            parallel: Whether to validate in parallel
+            parallel: Whether LLM batches may run concurrently
+            use_multi_llm: Whether to cross-check with every LLM service
 
         Returns:
             Dictionary mapping evidence text to validation results
         """
-        results = {}
+        results: Dict[str, ValidationResult] = {}
 
-        if parallel:
-            # Create validation tasks
-            tasks = []
+        # Tier 1: deterministic checks, with the transcript prepared once
+        def _deterministic() -> List[Any]:
+            prepared = self.prepare_source(source_text)
+            checks: List[Any] = []
             for evidence in evidence_list:
-                task = self.validate_evidence(evidence, source_text)
-                tasks.append(task)
-
-            # Execute in parallel
-            validation_results = await asyncio.gather(*tasks, return_exceptions=True)
+                try:
+                    checks.append(self._run_text_checks(evidence, source_text, prepared))
+                except Exception as e:
+                    checks.append(e)
+            return checks
+
+        checks = await asyncio.to_thread(_deterministic)
+
+        services = self._validation_services(use_multi_llm)
+        exact_early = contaminated_early = 0
+        ambiguous: List[Tuple[AttributedEvidence, Tuple[Dict, Dict, Dict]]] = []
+        for evidence, check in zip(evidence_list, checks):
+            if isinstance(check, Exception):
+                logger.error(f"Validation error: {check}")
+                results[evidence.text] = self._create_error_result(str(check))
+                continue
+
+            exact_result, token_result, contamination_result = check
+            settled = True
+            llm_results: Dict[str, Any] = {}
+            if contamination_result["contamination_score"] > self.CONTAMINATION_SHORT_CIRCUIT:
+                contaminated_early += 1
+            elif exact_result["exact_match"]:
+                # A verbatim quote is already a semantic match, so LLM verdicts
+                # cannot change its status; count it as agreed on
+                exact_early += 1
+                llm_results = {"consensus_score": 1.0}
+            elif services:
+                ambiguous.append((evidence, check))
+                continue
+            else:
+                settled = False
+
+            result = self._combine_validation_results(*check, llm_results)
+            if settled:
+                result.validation_notes.append("Settled by deterministic checks")
+            results[evidence.text] = result
+
+        # Tier 2: ambiguous items, most promising first, many per LLM call
+        ambiguous.sort(key=lambda item: item[1][1]["token_overlap_ratio"], reverse=True)
+        batches = [
+            ambiguous[i : i + self.LLM_BATCH_SIZE]
+            for i in range(0, len(ambiguous), self.LLM_BATCH_SIZE)
+        ]
 
-            for evidence, result in zip(evidence_list, validation_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Batch validation error: {result}")
-                    results[evidence.text] = self._create_error_result(str(result))
-                else:
-                    results[evidence.text] = result
-        else:
-            # Sequential validation
-            for evidence in evidence_list:
+        async def _validate_batch(batch) -> None:
+            evidence_batch = [evidence for evidence, _ in batch]
+            llm_results = await self._batch_llm_validation(
+                evidence_batch, source_text, services
+            )
+            for (evidence, check), item_llm_results in zip(batch, llm_results):
                 try:
-                    result = await self.validate_evidence(evidence, source_text)
-                    results[evidence.text] = result
+                    results[evidence.text] = self._combine_validation_results(
+                        *check, item_llm_results
+                    )
                 except Exception as e:
                     logger.error(f"Validation error: {e}")
                     results[evidence.text] = self._create_error_result(str(e))
 
+        if parallel:
+            await asyncio.gather(*(_validate_batch(batch) for batch in batches))
+        else:
+            for batch in batches:
+                await _validate_batch(batch)
+
+        service_count = len(services)
+        llm_calls = len(batches) * service_count
+        self.last_batch_stats = {
+            "evidence_items": len(evidence_list),
+            "exact_by_checks": exact_early,
+            "contaminated_by_checks": contaminated_early,
+            "escalated_to_llm": len(ambiguous),
+            "llm_calls": llm_calls,
+            # Against one call per item per service
+            "llm_calls_avoided": {
+                "deterministic": (exact_early + contaminated_early) * service_count,
+                "batching": len(ambiguous) * service_count - llm_calls,
+            },
+        }
+
         # Log summary
         verified_count = sum(
             1 for r in results.values() if r.status == ValidationStatus.VERIFIED
@@ -611,11 +825,116 @@ class ValidationEngine:
 
         logger.info(
             f"Batch validation complete: {verified_count}/{len(evidence_list)} verified, "
-            f"{contaminated_count} contaminated"
+            f"{contaminated_count} contaminated, {len(ambiguous)} escalated to "
+            f"{llm_calls} LLM calls (avoided {self.last_batch_stats['llm_calls_avoided']})"
         )
 
         return results
 
+    def _validation_services(self, use_multi_llm: bool) -> Dict[str, Any]:
+        """LLM services to cross-check with, mirroring validate_evidence."""
+        if use_multi_llm and len(self.llm_services) > 1:
+            return dict(self.llm_services)
+        if self.primary_llm:
+            return {"primary": self.primary_llm}
+        return {}
+
+    async def _batch_llm_validation(
+        self,
+        evidence_batch: List[AttributedEvidence],
+        source_text: str,
+        services: Dict[str, Any],
+    ) -> List[Dict]:
+        """
+        Validate a batch of evidence with one call per LLM service.
+
+        Returns per-item llm_results in the shape _combine_validation_results
+        expects, in the order of ``evidence_batch``.
+        """
+        evidence_items = "\n".join(
+            f"{i}. {evidence.text}" for i, evidence in enumerate(evidence_batch, 1)
+        )
+        prompt = self.batch_validation_prompt.format(
+            evidence_items=evidence_items,
+            source_text=source_text[:8000],  # Limit for context
+        )
+
+        async def _call(model_name: str, llm_service: Any) -> Any:
+            limiter = self._call_limiter(llm_service)
+            async with limiter.slot() if limiter else nullcontext():
+                return await llm_service.analyze(
+                    {
+                        "task": "evidence_validation",
+                        "prompt": prompt,
+                        "enforce_json": True,
+                        "temperature": 0.1,
+                    }
+                )
+
+        model_names = list(services)
+        responses = await asyncio.gather(
+            *(_call(name, services[name]) for name in model_names),
+            return_exceptions=True,
+        )
+
+        # Per-item agreement of each model; None when the model gave no verdict
+        agreements: List[Dict[str, Optional[bool]]] = [{} for _ in evidence_batch]
+        for model_name, response in zip(model_names, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Batch validation error for {model_name}: {response}")
+                verdicts = {}
+            else:
+                verdicts = self._parse_batch_verdicts(response)
+            for i, item_agreements in enumerate(agreements, 1):
+                item_agreements[model_name] = verdicts.get(i)
+
+        llm_results = []
+        for item_agreements in agreements:
+            valid = [v for v in item_agreements.values() if v is not None]
+            llm_results.append(
+                {
+                    "llm_agreements": item_agreements,
+                    "consensus_score": (
+                        sum(1 for v in valid if v) / len(valid) if valid else 0.0
+                    ),
+                }
+            )
+        return llm_results
+
+    @staticmethod
+    def _call_limiter(llm_service: Any) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        Provider limiter to hold around a call to ``llm_service``.
+
+        Services whose client limits its own requests (AsyncGenAIClient) get
+        None: holding a slot around a call that acquires another one from the
+        same limiter can deadlock once the limit is reached. Others share the
+        limiter of their provider, not one per ``llm_services`` key.
+        """
+        client = getattr(llm_service, "client", None)
+        if "limiter" in getattr(llm_service, "__dict__", {}) or (
+            client is not None and "limiter" in getattr(client, "__dict__", {})
+        ):
+            return None
+        provider = getattr(llm_service, "provider", None)
+        return get_concurrency_limiter(provider if isinstance(provider, str) else "gemini")
+
+    @staticmethod
+    def _parse_batch_verdicts(response: Any) -> Dict[int, bool]:
+        """Map item number to semantic_match from a batch validation response."""
+        items = response.get("validations") if isinstance(response, dict) else response
+        verdicts: Dict[int, bool] = {}
+        if not isinstance(items, list):
+            return verdicts
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                verdicts[int(item.get("index"))] = bool(item.get("semantic_match", False))
+            except (TypeError, ValueError):
+                continue
+        return verdicts
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate semantic similarity between two texts.
@@ -0,0 +1,373 @@
+"""
+Async Jira REST client used by the Jira exporter.
+
+All requests of an export share one pooled ``httpx.AsyncClient``, so they
+reuse keep-alive connections instead of opening one per issue. Concurrency is
+bounded by a semaphore, and rate-limited (429) or unavailable (503) responses
+are retried after the server's ``Retry-After`` delay. Transport errors are
+retried only when repeating the request cannot create a duplicate issue.
+"""
+
+import asyncio
+import base64
+import logging
+import random
+import re
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from backend.models.jira_export import JiraCredentials
+
+logger = logging.getLogger(__name__)
+
+# Jira accepts at most 50 issues per bulk-create request
+BULK_CREATE_LIMIT = 50
+# Summary clauses per JQL search, keeping each query well under Jira's limits
+JQL_CLAUSES_PER_SEARCH = 50
+RETRY_STATUSES = (429, 503)
+MAX_RETRY_DELAY = 60.0
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Raised before the request reached Jira, so retrying never repeats a write
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Lucene operators in text searches (summary ~ "..."), escaped with a backslash
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^~*?:\\/"])')
+
+
+class AsyncJiraClient:
+    """
+    Pooled, rate-limit aware client for the Jira Cloud REST API v3.
+
+    Use as an async context manager; the connection pool is closed on exit.
+    """
+
+    def __init__(
+        self,
+        credentials: JiraCredentials,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            credentials: Jira credentials
+            max_concurrency: Maximum number of requests in flight
+            max_retries: Retries for rate-limited, unavailable or failed requests
+            timeout: Per-request timeout in seconds
+            transport: Optional transport, e.g. a mock Jira server in tests
+            retry_delay: First backoff delay in seconds when Jira gives none
+        """
+        self.credentials = credentials
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        token = base64.b64encode(
+            f"{credentials.email}:{credentials.api_token}".encode("ascii")
+        ).decode("ascii")
+        self._client = httpx.AsyncClient(
+            base_url=credentials.jira_url.rstrip("/"),
+            headers={
+                "Authorization": f"Basic {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def request(
+        self, method: str, path: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying 429/503 responses and transport errors.
+
+        A non-idempotent request (POST by default) may already have been
+        processed when a read timeout or dropped connection hides the answer,
+        so it is only retried on errors raised before it was sent.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the Jira URL
+            idempotent: Whether repeating the request is harmless; defaults
+                to True for GET, PUT, DELETE, HEAD and OPTIONS
+
+        Returns the last response; callers check its status code.
+
+        Raises:
+            httpx.TransportError: If the request fails and cannot be retried
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        delay = self.retry_delay
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries or not (
+                    idempotent or isinstance(e, NOT_SENT_ERRORS)
+                ):
+                    raise
+                logger.warning(
+                    f"Jira {method} {path} failed (attempt {attempt + 1}): {e}. "
+                    f"Retrying in {delay:.1f}s"
+                )
+            else:
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                retry_after = _retry_after_seconds(response)
+                if retry_after is not None:
+                    delay = retry_after
+                logger.warning(
+                    f"Jira {method} {path} returned {response.status_code}; "
+                    f"retrying in {delay:.1f}s"
+                )
+            # Sleep outside the semaphore so other requests can proceed
+            await asyncio.sleep(delay + min(1.0, delay * 0.1) * random.random())
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+            attempt += 1
+
+    async def get_myself(self) -> httpx.Response:
+        return await self.request("GET", "/rest/api/3/myself")
+
+    async def get_project(self) -> httpx.Response:
+        return await self.request(
+            "GET", f"/rest/api/3/project/{self.credentials.project_key}"
+        )
+
+    async def search_issues(
+        self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Return every issue matching ``jql``, following pagination.
+
+        Raises:
+            httpx.HTTPStatusError: If a search request fails
+        """
+        issues: List[Dict[str, Any]] = []
+        start_at = 0
+        while True:
+            # Searching has no side effects, so read errors can be retried too
+            response = await self.request(
+                "POST",
+                "/rest/api/3/search",
+                idempotent=True,
+                json={
+                    "jql": jql,
+                    "startAt": start_at,
+                    "maxResults": page_size,
+                    "fields": fields or ["summary", "issuetype"],
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            page = data.get("issues") or []
+            issues.extend(page)
+            start_at += len(page)
+            if not page or start_at >= data.get("total", 0):
+                return issues
+
+    async def find_issues_by_summary(
+        self, summaries: List[str], issue_types: List[str]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Resolve existing issues for many summaries with batched JQL searches.
+
+        A batch Jira rejects (HTTP 400, e.g. a summary it cannot parse) is
+        retried one summary at a time, so one odd summary only loses its own
+        match.
+
+        Returns:
+            Map of (issue type, normalized summary) to the most recently
+            created issue with exactly that summary
+        """
+        wanted = list(dict.fromkeys(s for s in summaries if s))
+        if not wanted:
+            return {}
+        types = ", ".join(f'"{_escape_jql(t)}"' for t in issue_types)
+
+        def query(batch: List[str]) -> str:
+            clauses = " OR ".join(f'summary ~ "{_escape_text_search(s)}"' for s in batch)
+            return (
+                f"project = {self.credentials.project_key} AND issuetype in ({types}) "
+                f"AND ({clauses}) ORDER BY created DESC"
+            )
+
+        async def search(batch: List[str]) -> List[Dict[str, Any]]:
+            try:
+                return await self.search_issues(query(batch))
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 400:
+                    raise
+                if len(batch) == 1:
+                    logger.warning(f"Jira rejected the search for summary {batch[0]!r}")
+                    return []
+                logger.warning(
+                    f"Jira rejected a batched summary search; searching {len(batch)} summaries one by one"
+                )
+                results = await asyncio.gather(*(search([s]) for s in batch))
+                return [issue for issues in results for issue in issues]
+
+        pages = await asyncio.gather(
+            *(
+                search(wanted[i : i + JQL_CLAUSES_PER_SEARCH])
+                for i in range(0, len(wanted), JQL_CLAUSES_PER_SEARCH)
+            )
+        )
+
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for issues in pages:
+            for issue in issues:
+                fields = issue.get("fields") or {}
+                key = (
+                    (fields.get("issuetype") or {}).get("name", ""),
+                    normalize_summary(fields.get("summary")),
+                )
+                # Results are newest first; keep the first hit per summary
+                found.setdefault(key, issue)
+        return found
+
+    async def create_issue(self, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create one issue; returns Jira's {id, key, self} or None on failure."""
+        response = await self.request(
+            "POST", "/rest/api/3/issue", json={"fields": fields}
+        )
+        if response.status_code in (200, 201):
+            return response.json()
+        logger.error(
+            f"Failed to create {fields.get('issuetype', {}).get('name', 'issue')}: "
+            f"{response.status_code} - {response.text}"
+        )
+        return None
+
+    async def bulk_create(
+        self, issues: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create issues through the bulk endpoint, in chunks of 50.
+
+        Args:
+            issues: Field dictionaries, one per issue
+
+        Returns:
+            Jira's {id, key, self} for each input, in order, or None where
+            creation failed
+        """
+        chunks = [
+            issues[i : i + BULK_CREATE_LIMIT]
+            for i in range(0, len(issues), BULK_CREATE_LIMIT)
+        ]
+        results = await asyncio.gather(*(self._bulk_create_chunk(c) for c in chunks))
+        return [created for chunk in results for created in chunk]
+
+    async def _bulk_create_chunk(
+        self, issues: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        try:
+            response = await self.request(
+                "POST",
+                "/rest/api/3/issue/bulk",
+                json={"issueUpdates": [{"fields": fields} for fields in issues]},
+            )
+        except httpx.TransportError as e:
+            logger.error(f"Bulk issue creation failed: {e}")
+            return [None] * len(issues)
+
+        # Jira answers 400 with the created issues when only some elements failed
+        try:
+            data = response.json() if response.status_code in (200, 201, 400) else {}
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict) or "issues" not in data:
+            logger.error(
+                f"Bulk issue creation failed: {response.status_code} - {response.text}"
+            )
+            return [None] * len(issues)
+
+        failed = set()
+        for error in data.get("errors") or []:
+            index = error.get("failedElementNumber")
+            if isinstance(index, int):
+                failed.add(index)
+                logger.error(
+                    f"Failed to create issue {index} in bulk request: "
+                    f"{error.get('elementErrors')}"
+                )
+        created = iter(data.get("issues") or [])
+        return [
+            None if index in failed else next(created, None)
+            for index in range(len(issues))
+        ]
+
+    async def update_issue(self, issue_id: str, fields: Dict[str, Any]) -> bool:
+        """Update fields of an existing issue."""
+        response = await self.request(
+            "PUT", f"/rest/api/3/issue/{issue_id}", json={"fields": fields}
+        )
+        if response.status_code in (200, 204):
+            return True
+        logger.error(
+            f"Failed to update issue {issue_id}: {response.status_code} - {response.text}"
+        )
+        return False
+
+
+def normalize_summary(summary: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form used to match issue summaries."""
+    return " ".join((summary or "").split()).casefold()
+
+
+def _escape_jql(value: str) -> str:
+    """Escape a value for a quoted JQL string literal."""
+    return (value or "").replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _escape_text_search(value: str) -> str:
+    """Escape a value for a quoted ``~`` text search.
+
+    Lucene operators get a backslash first, then the whole value is escaped
+    for the JQL string, so ``[draft]`` becomes ``\\\\[draft\\\\]`` in the query.
+    """
+    return _escape_jql(_LUCENE_SPECIAL.sub(r"\\\1", value or ""))
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_DELAY)
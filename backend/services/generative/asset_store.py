@@ -0,0 +1,152 @@
+"""
+Content-addressed storage for generated binary assets (persona avatars, food images).
+
+Image bytes live once in the ``binary_assets`` table, keyed by their SHA-256.
+Analysis results only keep a short asset URL in place of the inline
+``data:image/...;base64,`` URI, so reading or listing results no longer drags
+image bytes through JSON parsing.
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models import BinaryAsset
+
+ASSET_URL_PREFIX = "/api/personas/assets/"
+STREAM_CHUNK_SIZE = 256 * 1024
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URI_RE = re.compile(
+    r"^data:(?P<content_type>image/[\w.+-]+);base64,(?P<data>.*)$", re.DOTALL
+)
+
+
+def asset_url(digest: str) -> str:
+    return f"{ASSET_URL_PREFIX}{digest}"
+
+
+def is_valid_digest(digest: str) -> bool:
+    return bool(_DIGEST_RE.match(digest or ""))
+
+
+def digest_from_asset_url(value: str) -> Optional[str]:
+    """Return the digest an asset URL points at, or None for any other value."""
+    if not isinstance(value, str) or not value.startswith(ASSET_URL_PREFIX):
+        return None
+    digest = value[len(ASSET_URL_PREFIX) :]
+    return digest if is_valid_digest(digest) else None
+
+
+def decode_image_data_uri(value: str) -> Optional[Tuple[str, bytes]]:
+    """Split a base64 image data URI into (content_type, bytes)."""
+    if not isinstance(value, str) or not value.startswith("data:image/"):
+        return None
+    match = _DATA_URI_RE.match(value)
+    if not match:
+        return None
+    try:
+        data = base64.b64decode(match.group("data"), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return match.group("content_type"), data
+
+
+def encode_image_data_uri(content_type: str, data: bytes) -> str:
+    return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def map_persona_images(results: Dict, convert: Callable[[str], str]) -> int:
+    """
+    Apply ``convert`` to every persona image value in an analysis results dict.
+
+    Covers ``avatar_data_uri`` and the values of ``food_images``. Returns how many
+    values changed; ``results`` is updated in place.
+    """
+    changed = 0
+    personas = results.get("personas") if isinstance(results, dict) else None
+    if not isinstance(personas, list):
+        return changed
+
+    for persona in personas:
+        if not isinstance(persona, dict):
+            continue
+        avatar = persona.get("avatar_data_uri")
+        if isinstance(avatar, str):
+            converted = convert(avatar)
+            if converted != avatar:
+                persona["avatar_data_uri"] = converted
+                changed += 1
+        food_images = persona.get("food_images")
+        if isinstance(food_images, dict):
+            for key, image in food_images.items():
+                if not isinstance(image, str):
+                    continue
+                converted = convert(image)
+                if converted != image:
+                    food_images[key] = converted
+                    changed += 1
+    return changed
+
+
+class AssetStore:
+    """Content-addressed asset store backed by the ``binary_assets`` table."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def put(self, data: bytes, content_type: str) -> str:
+        """
+        Store bytes once and return their digest.
+
+        The row is added to the session but not committed, so it lands in the
+        same transaction as the results that reference it.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self.db.get(BinaryAsset, digest) is None:
+            self.db.add(
+                BinaryAsset(
+                    sha256=digest,
+                    content_type=content_type,
+                    size=len(data),
+                    data=data,
+                )
+            )
+            self.db.flush()
+        return digest
+
+    def put_data_uri(self, value: str) -> str:
+        """Replace an image data URI with an asset URL; other values pass through."""
+        decoded = decode_image_data_uri(value)
+        if decoded is None:
+            return value
+        content_type, data = decoded
+        return asset_url(self.put(data, content_type))
+
+    def get_metadata(self, digest: str) -> Optional[Tuple[str, int]]:
+        """Return (content_type, size) without loading the bytes."""
+        row = (
+            self.db.query(BinaryAsset.content_type, BinaryAsset.size)
+            .filter(BinaryAsset.sha256 == digest)
+            .first()
+        )
+        return (row.content_type, row.size) if row else None
+
+    def iter_chunks(
+        self, digest: str, size: int, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Read an asset in fixed-size slices so it is never held whole in memory."""
+        for offset in range(0, size, chunk_size):
+            chunk = (
+                self.db.query(func.substr(BinaryAsset.data, offset + 1, chunk_size))
+                .filter(BinaryAsset.sha256 == digest)
+                .scalar()
+            )
+            if not chunk:
+                return
+            yield bytes(chunk)
@@ -0,0 +1,11 @@
+"""
+Durable background jobs.
+
+- queue.py: ``JobQueue`` for enqueueing and leasing jobs stored in pipeline_runs
+- worker.py: ``JobWorker`` and the ``python -m backend.services.jobs.worker`` entry point
+"""
+
+from backend.services.jobs.queue import ANALYSIS_JOB_TYPE, JobQueue, QueuedJob
+from backend.services.jobs.worker import JobWorker
+
+__all__ = ["ANALYSIS_JOB_TYPE", "JobQueue", "JobWorker", "QueuedJob"]
@@ -0,0 +1,181 @@
+"""
+Durable background job queue backed by the ``pipeline_runs`` table.
+
+API nodes enqueue jobs; worker processes (``backend.services.jobs.worker``)
+claim them under a time-limited lease, renew it with heartbeats, and complete
+or fail them. Jobs whose worker dies are released once the lease expires and
+retried until ``max_attempts`` is reached.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.persistence.pipeline_run_repository import (
+    PipelineRunRepository,
+)
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Job type for interview analyses started through AnalysisService
+ANALYSIS_JOB_TYPE = "analysis"
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """Snapshot of a leased job handed to a job handler."""
+
+    job_id: str
+    job_type: str
+    user_id: Optional[str]
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+class JobQueue:
+    """
+    Enqueue, lease and settle background jobs.
+
+    Every operation runs in its own short transaction so leases and status
+    changes are visible to other API and worker nodes immediately.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            session_factory: Session factory (sync or async); defaults to the
+                container's async session factory
+        """
+        if session_factory is None:
+            from backend.infrastructure.container import Container
+
+            session_factory = Container().get_async_session_factory()
+        self.session_factory = session_factory
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+        job_id: Optional[str] = None,
+        analysis_id: Optional[str] = None,
+    ) -> str:
+        """
+        Add a job to the queue.
+
+        Returns:
+            The job ID
+        """
+        job_id = job_id or f"{job_type}-{uuid.uuid4()}"
+        async with UnitOfWork(self.session_factory) as uow:
+            await uow.pipeline_runs.enqueue_job(
+                job_id=job_id,
+                job_type=job_type,
+                payload=payload,
+                user_id=user_id,
+                priority=priority,
+                max_attempts=max_attempts or settings.job_max_attempts,
+                analysis_id=analysis_id,
+            )
+            await uow.commit()
+        return job_id
+
+    async def claim(
+        self,
+        worker_id: str,
+        job_types: Sequence[str],
+        lease_seconds: Optional[int] = None,
+        global_limit: Optional[int] = None,
+        per_user_limit: Optional[int] = None,
+    ) -> Optional[QueuedJob]:
+        """Lease the next claimable job, respecting the concurrency caps."""
+        async with UnitOfWork(self.session_factory) as uow:
+            job = await uow.pipeline_runs.claim_next_job(
+                worker_id=worker_id,
+                job_types=job_types,
+                lease_seconds=lease_seconds or settings.job_lease_seconds,
+                global_limit=(
+                    settings.job_global_concurrency if global_limit is None else global_limit
+                ),
+                per_user_limit=(
+                    settings.job_per_user_concurrency
+                    if per_user_limit is None
+                    else per_user_limit
+                ),
+            )
+            snapshot = (
+                QueuedJob(
+                    job_id=job.job_id,
+                    job_type=job.job_type,
+                    user_id=job.user_id,
+                    payload=dict(job.payload or {}),
+                    attempts=job.attempts,
+                    max_attempts=job.max_attempts,
+                )
+                if job
+                else None
+            )
+            await uow.commit()
+        return snapshot
+
+    async def heartbeat(
+        self, job_id: str, worker_id: str, lease_seconds: Optional[int] = None
+    ) -> bool:
+        """Renew a lease; False means the lease was lost."""
+        async with UnitOfWork(self.session_factory) as uow:
+            ok = await uow.pipeline_runs.heartbeat_job(
+                job_id, worker_id, lease_seconds or settings.job_lease_seconds
+            )
+            await uow.commit()
+        return ok
+
+    async def complete(self, job_id: str, worker_id: str) -> bool:
+        """Mark a leased job completed."""
+        async with UnitOfWork(self.session_factory) as uow:
+            ok = await uow.pipeline_runs.complete_job(job_id, worker_id)
+            await uow.commit()
+        return ok
+
+    async def fail(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry_delay_seconds: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Record a failed attempt.
+
+        Returns:
+            The job's new status ("pending" when it will be retried), or None
+            if the lease was lost
+        """
+        async with UnitOfWork(self.session_factory) as uow:
+            job = await uow.pipeline_runs.fail_job(
+                job_id,
+                worker_id,
+                error,
+                retry_delay_seconds=(
+                    settings.job_retry_delay_seconds
+                    if retry_delay_seconds is None
+                    else retry_delay_seconds
+                ),
+            )
+            status = job.status if job else None
+            await uow.commit()
+        return status
+
+    async def requeue_expired(self, job_types: Sequence[str]) -> int:
+        """Release jobs whose worker stopped heartbeating."""
+        async with UnitOfWork(self.session_factory) as uow:
+            count = await uow.pipeline_runs.requeue_expired_leases(job_types)
+            await uow.commit()
+        return count
@@ -0,0 +1,195 @@
+"""
+Background job worker.
+
+Runs outside the API process and scales independently of it:
+
+    python -m backend.services.jobs.worker [--concurrency 2] [--job-types analysis]
+
+Each worker claims up to ``concurrency`` jobs at a time, renews their leases
+while handlers run, and settles them when the handler returns or raises. If
+the lease is lost (e.g. the worker stalled and another node took the job
+over) the handler is cancelled and its result discarded.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from backend.infrastructure.config.settings import settings
+from backend.services.jobs.queue import ANALYSIS_JOB_TYPE, JobQueue, QueuedJob
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[QueuedJob], Awaitable[None]]
+
+
+def default_handlers() -> Dict[str, JobHandler]:
+    """Handlers for the job types produced by the API."""
+    from backend.services.analysis_service import run_analysis_job
+
+    return {ANALYSIS_JOB_TYPE: run_analysis_job}
+
+
+class JobWorker:
+    """Claims and executes queued jobs with leases and heartbeats."""
+
+    def __init__(
+        self,
+        handlers: Dict[str, JobHandler],
+        queue: Optional[JobQueue] = None,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+        heartbeat_seconds: Optional[float] = None,
+    ):
+        self.handlers = handlers
+        self.queue = queue or JobQueue()
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self.concurrency = concurrency or settings.worker_concurrency
+        self.poll_interval = (
+            settings.worker_poll_seconds if poll_interval is None else poll_interval
+        )
+        self.lease_seconds = lease_seconds or settings.job_lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds or settings.job_heartbeat_seconds
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def job_types(self):
+        return list(self.handlers)
+
+    async def _claim(self) -> Optional[QueuedJob]:
+        return await self.queue.claim(
+            self.worker_id, self.job_types, lease_seconds=self.lease_seconds
+        )
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """Poll for jobs until ``stop_event`` is set, then drain running jobs."""
+        stop_event = stop_event or asyncio.Event()
+        loop = asyncio.get_running_loop()
+        last_reap = 0.0
+        logger.info(
+            f"Job worker {self.worker_id} started (types={self.job_types}, "
+            f"concurrency={self.concurrency})"
+        )
+
+        while not stop_event.is_set():
+            claimed = False
+            try:
+                if loop.time() - last_reap >= self.heartbeat_seconds:
+                    await self.queue.requeue_expired(self.job_types)
+                    last_reap = loop.time()
+                while len(self._tasks) < self.concurrency:
+                    job = await self._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(self.execute(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                    claimed = True
+            except Exception as e:
+                logger.error(f"Job worker {self.worker_id} poll failed: {e}")
+
+            if not claimed:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._tasks:
+            logger.info(f"Job worker {self.worker_id} draining {len(self._tasks)} jobs")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    async def run_once(self) -> bool:
+        """Claim and execute a single job; returns False if none was claimable."""
+        job = await self._claim()
+        if job is None:
+            return False
+        await self.execute(job)
+        return True
+
+    async def execute(self, job: QueuedJob) -> None:
+        """Run a leased job's handler and settle the job."""
+        handler = self.handlers[job.job_type]
+        work = asyncio.create_task(handler(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job, work))
+        try:
+            await work
+        except asyncio.CancelledError:
+            logger.warning(f"Abandoned job {job.job_id}: lease lost")
+            return
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            try:
+                await self.queue.fail(job.job_id, self.worker_id, f"{type(e).__name__}: {e}")
+            except Exception as settle_error:
+                logger.error(f"Could not record failure of job {job.job_id}: {settle_error}")
+            return
+        finally:
+            heartbeat.cancel()
+
+        try:
+            if not await self.queue.complete(job.job_id, self.worker_id):
+                logger.warning(f"Job {job.job_id} finished after its lease was lost")
+        except Exception as e:
+            logger.error(f"Could not mark job {job.job_id} completed: {e}")
+
+    async def _heartbeat(self, job: QueuedJob, work: asyncio.Task) -> None:
+        while not work.done():
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                held = await self.queue.heartbeat(
+                    job.job_id, self.worker_id, self.lease_seconds
+                )
+            except Exception as e:
+                # Transient DB error; the lease has headroom until it expires
+                logger.warning(f"Heartbeat for job {job.job_id} failed: {e}")
+                continue
+            if not held:
+                work.cancel()
+                return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a background job worker")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency)
+    parser.add_argument(
+        "--job-types",
+        nargs="+",
+        default=None,
+        help="Job types to execute (default: all known types)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    handlers = default_handlers()
+    if args.job_types:
+        handlers = {t: h for t, h in handlers.items() if t in args.job_types}
+
+    async def _run():
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass
+        await JobWorker(handlers, concurrency=args.concurrency).run(stop_event)
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
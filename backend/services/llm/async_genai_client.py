@@ -11,13 +11,28 @@ import asyncio
 import re
 import os
 import random
+from contextlib import nullcontext
 from typing import Dict, Any, List, Union, Optional, AsyncGenerator, Tuple
 
 import google.genai as genai
 from google.genai.types import GenerateContentConfig, Content
 
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.tracing import llm_span
 from backend.utils.json.json_repair import repair_json
+from backend.utils.json.incremental_parser import IncrementalJSONParser, select_items
+from backend.utils.json.tolerant_parser import TolerantJSONError
+from backend.services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+)
 from backend.services.llm.config.genai_config import GenAIConfigFactory, TaskType
+from backend.services.llm.response_cache import (
+    LLMResponseCache,
+    build_cache_key,
+    get_llm_response_cache,
+    is_cacheable_result,
+)
 from backend.services.llm.exceptions import (
     LLMAPIError,
     LLMResponseParseError,
@@ -36,16 +51,26 @@ class AsyncGenAIClient:
     asynchronously, with proper error handling, retry logic, and response parsing.
     """
 
-    def __init__(self, api_key: str, model: str = "gemini-3-flash-preview"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3-flash-preview",
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
         """
         Initialize the AsyncGenAIClient.
 
         Args:
             api_key: Google API key
             model: Model name to use (default: gemini-3-flash-preview)
+            limiter: Optional adaptive concurrency limiter for API calls; defaults
+                to the shared Gemini limiter when GENAI_ADAPTIVE_CONCURRENCY is set
         """
         self.api_key = api_key
         self.default_model = model
+        if limiter is None and settings.genai_adaptive_concurrency:
+            limiter = get_concurrency_limiter("gemini")
+        self.limiter = limiter
 
         try:
             # Initialize the client
@@ -100,22 +125,33 @@ class AsyncGenAIClient:
                 local_initial_delay = max(local_initial_delay, 2.0)
                 local_backoff = max(local_backoff, 2.5)
 
-            # Generate content with retry
-            response = await self._generate_with_retry(
-                model=self.default_model,
-                prompt=final_prompt,
-                config=config,
-                max_retries=local_max_retries,
-                initial_delay=local_initial_delay,
-                backoff_factor=local_backoff,
-                task=task,
-            )
+            async def _compute() -> Dict[str, Any]:
+                # Generate content with retry
+                response = await self._generate_with_retry(
+                    model=self.default_model,
+                    prompt=final_prompt,
+                    config=config,
+                    max_retries=local_max_retries,
+                    initial_delay=local_initial_delay,
+                    backoff_factor=local_backoff,
+                    task=task,
+                )
 
-            # Parse the response
-            parsed_response = await self._parse_response(response, task)
+                # Parse the response
+                parsed_response = await self._parse_response(response, task)
 
-            # Post-process the response based on task
-            return await self._post_process_response(parsed_response, task)
+                # Post-process the response based on task
+                return await self._post_process_response(parsed_response, task)
+
+            cache = get_llm_response_cache()
+            cache_key = self._build_cache_key(
+                cache, task_name, prompt, system_instruction, config
+            )
+            if cache_key is None:
+                return await _compute()
+            return await cache.get_or_compute(
+                cache_key, _compute, should_store=is_cacheable_result
+            )
 
         except (LLMAPIError, LLMResponseParseError, LLMProcessingError) as e:
             # Re-raise known LLM exceptions
@@ -129,6 +165,46 @@ class AsyncGenAIClient:
             )
             raise LLMServiceError(f"Unexpected error: {str(e)}") from e
 
+    def _build_cache_key(
+        self,
+        cache: LLMResponseCache,
+        task_name: str,
+        prompt: Union[str, List[Union[str, Content]]],
+        system_instruction: Optional[str],
+        config: GenerateContentConfig,
+    ) -> Optional[str]:
+        """
+        Build the response cache key for a request, or None if it must not be cached.
+
+        Args:
+            cache: Shared response cache
+            task_name: Task name
+            prompt: Prompt as passed by the caller (before system instruction merge)
+            system_instruction: Optional system instruction
+            config: Generation configuration
+
+        Returns:
+            Cache key, or None when caching is disabled or the request is not cacheable
+        """
+        temperature = getattr(config, "temperature", None)
+        if not cache.is_cacheable(temperature):
+            return None
+        try:
+            params = config.model_dump(exclude_none=True) if config else {}
+            params.pop("temperature", None)
+            return build_cache_key(
+                provider="genai",
+                model=self.default_model,
+                task=task_name,
+                content=prompt,
+                prompt_template=system_instruction,
+                temperature=temperature,
+                params=params,
+            )
+        except Exception as e:
+            logger.debug(f"Could not build LLM cache key for task {task_name}: {e}")
+            return None
+
     async def generate_content_stream(
         self,
         task: Union[str, TaskType],
@@ -202,6 +278,84 @@ class AsyncGenAIClient:
             )
             raise LLMServiceError(f"Unexpected error: {str(e)}") from e
 
+    async def generate_content_items(
+        self,
+        task: Union[str, TaskType],
+        prompt: Union[str, List[Union[str, Content]]],
+        item_key: Optional[str] = None,
+        custom_config: Optional[Dict[str, Any]] = None,
+        system_instruction: Optional[str] = None,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        backoff_factor: float = 2.0,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Stream a JSON response and yield its array elements as they complete.
+
+        The elements of the response's item array (see ``select_items``) are
+        parsed from the token stream, so each one is available as soon as its
+        closing brace arrives. Task post-processing is not applied to the
+        individual elements.
+
+        Args:
+            task: Task type (string or TaskType enum)
+            prompt: Prompt text or list of Content objects
+            item_key: Key of the item array in the top-level object
+            custom_config: Optional custom configuration parameters
+            system_instruction: Optional system instruction
+            max_retries: Maximum number of retries for API calls
+            initial_delay: Initial delay for retry backoff
+            backoff_factor: Backoff factor for retry delay
+
+        Yields:
+            Elements of the item array, in order
+        """
+        task_name = task.value if isinstance(task, TaskType) else str(task)
+        cache = get_llm_response_cache()
+        cache_key = self._build_cache_key(
+            cache,
+            f"{task_name}:stream",
+            prompt,
+            system_instruction,
+            GenAIConfigFactory.create_config(task, custom_config),
+        )
+        if cache_key is not None:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                for item in select_items(cached, item_key):
+                    yield item
+                return
+
+        parser = IncrementalJSONParser(item_key)
+        async for chunk in self.generate_content_stream(
+            task,
+            prompt,
+            custom_config=custom_config,
+            system_instruction=system_instruction,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            backoff_factor=backoff_factor,
+        ):
+            for item in parser.feed(chunk):
+                yield item
+
+        try:
+            result = parser.close()
+        except TolerantJSONError as e:
+            raise LLMResponseParseError(
+                f"No JSON in streamed response for task {task_name}: {str(e)}"
+            ) from e
+        if result.truncated:
+            logger.warning(
+                f"Streamed response for task {task_name} was truncated; "
+                f"recovered {len(select_items(result.value, item_key))} items"
+            )
+        elif cache_key is not None and is_cacheable_result(result.value):
+            await cache.set(cache_key, result.value)
+
+        for item in select_items(result.value, item_key)[parser.items_emitted :]:
+            yield item
+
     def _prepare_prompt(
         self,
         prompt: Union[str, List[Union[str, Content]]],
@@ -351,71 +505,78 @@ class AsyncGenAIClient:
         )
         use_fallback_next = False
 
-        for attempt in range(max_retries):
-            try:
-                # Choose model (fallback after certain errors)
-                effective_model = fallback_model if use_fallback_next else model
-
-                # Make the API call with dynamic timeout
-                response = await asyncio.wait_for(
-                    self.client.aio.models.generate_content(
-                        model=effective_model, contents=prompt, config=config
-                    ),
-                    timeout=timeout_seconds,
-                )
-                return response
-            except asyncio.TimeoutError as e:
-                last_exception = e
-                if attempt < max_retries - 1:
-                    # Log the timeout and retry
-                    logger.warning(
-                        f"API call timed out (attempt {attempt + 1}/{max_retries}): {str(e)}. "
-                        f"Retrying in {delay:.2f}s..."
-                    )
-                    await asyncio.sleep(delay)
-                    delay *= backoff_factor
-                else:
-                    # Last attempt failed, raise the exception
-                    logger.error(
-                        f"API call timed out after {max_retries} attempts: {str(e)}"
-                    )
-                    raise LLMAPIError(
-                        f"API call timed out after {max_retries} attempts: {str(e)}"
-                    ) from e
-            except Exception as e:
-                last_exception = e
-                if attempt < max_retries - 1:
-                    # Detect overload/unavailable and consider switching model
-                    message = str(e)
-                    overloaded = any(
-                        s in message for s in ["503", "UNAVAILABLE", "overloaded"]
-                    )
-                    if overloaded:
-                        use_fallback_next = True
-                        logger.warning(
-                            f"API call failed with service unavailable/overload (attempt {attempt + 1}/{max_retries})."
-                            f" Will retry using fallback model '{fallback_model}' in {delay:.2f}s. Error: {message}"
+        task_name = task.value if isinstance(task, TaskType) else str(task or "unknown")
+        with llm_span(task_name, model) as call:
+            for attempt in range(max_retries):
+                try:
+                    # Choose model (fallback after certain errors)
+                    effective_model = fallback_model if use_fallback_next else model
+
+                    # Make the API call with dynamic timeout; backoff sleeps
+                    # happen outside the limiter slot
+                    async with self.limiter.slot() if self.limiter else nullcontext():
+                        response = await asyncio.wait_for(
+                            self.client.aio.models.generate_content(
+                                model=effective_model, contents=prompt, config=config
+                            ),
+                            timeout=timeout_seconds,
                         )
-                    else:
+                    call.record_usage(response)
+                    return response
+                except asyncio.TimeoutError as e:
+                    last_exception = e
+                    if attempt < max_retries - 1:
+                        # Log the timeout and retry
                         logger.warning(
-                            f"API call failed (attempt {attempt + 1}/{max_retries}): {message}. "
+                            f"API call timed out (attempt {attempt + 1}/{max_retries}): {str(e)}. "
                             f"Retrying in {delay:.2f}s..."
                         )
-                    # Exponential backoff with small jitter to avoid thundering herd
-                    jitter = min(1.0, delay * 0.1) * random.random()
-                    await asyncio.sleep(delay + jitter)
-                    delay *= backoff_factor
-                else:
-                    # Last attempt failed, raise the exception
-                    logger.error(
-                        f"API call failed after {max_retries} attempts: {str(e)}"
-                    )
-                    raise LLMAPIError(
-                        f"API call failed after {max_retries} attempts: {str(e)}"
-                    ) from e
+                        call.retry()
+                        await asyncio.sleep(delay)
+                        delay *= backoff_factor
+                    else:
+                        # Last attempt failed, raise the exception
+                        logger.error(
+                            f"API call timed out after {max_retries} attempts: {str(e)}"
+                        )
+                        raise LLMAPIError(
+                            f"API call timed out after {max_retries} attempts: {str(e)}"
+                        ) from e
+                except Exception as e:
+                    last_exception = e
+                    if attempt < max_retries - 1:
+                        # Detect overload/unavailable and consider switching model
+                        message = str(e)
+                        overloaded = any(
+                            s in message for s in ["503", "UNAVAILABLE", "overloaded"]
+                        )
+                        if overloaded:
+                            use_fallback_next = True
+                            logger.warning(
+                                f"API call failed with service unavailable/overload (attempt {attempt + 1}/{max_retries})."
+                                f" Will retry using fallback model '{fallback_model}' in {delay:.2f}s. Error: {message}"
+                            )
+                        else:
+                            logger.warning(
+                                f"API call failed (attempt {attempt + 1}/{max_retries}): {message}. "
+                                f"Retrying in {delay:.2f}s..."
+                            )
+                        # Exponential backoff with small jitter to avoid thundering herd
+                        jitter = min(1.0, delay * 0.1) * random.random()
+                        call.retry()
+                        await asyncio.sleep(delay + jitter)
+                        delay *= backoff_factor
+                    else:
+                        # Last attempt failed, raise the exception
+                        logger.error(
+                            f"API call failed after {max_retries} attempts: {str(e)}"
+                        )
+                        raise LLMAPIError(
+                            f"API call failed after {max_retries} attempts: {str(e)}"
+                        ) from e
 
-        # This should never happen, but just in case
-        raise LLMAPIError(f"API call failed: {str(last_exception)}")
+            # This should never happen, but just in case
+            raise LLMAPIError(f"API call failed: {str(last_exception)}")
 
     async def _generate_stream_with_retry(
         self,
@@ -3,14 +3,14 @@ Base class for LLM services with common functionality.
 """
 
 import logging
-import json
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from backend.domain.interfaces.llm_unified import ILLMService, LLMError, RateLimitError, TokenLimitError, APIError
 from backend.services.llm.exceptions import LLMAPIError, LLMResponseParseError, LLMServiceError
-from backend.utils.json.json_repair import repair_json
+from backend.utils.json.incremental_parser import select_items
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
 
 logger = logging.getLogger(__name__)
 
@@ -72,27 +72,38 @@ class BaseLLMService(ABC):
             logger.error(f"Unexpected error in {task} analysis: {str(e)}", exc_info=True)
             return self._get_error_response(task, f"Unexpected error: {str(e)}")
 
+    async def analyze_stream(
+        self, request: Dict[str, Any], item_key: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Analyze content and yield the elements of the result's item array.
+
+        Services that can stream override this to yield each element as soon as
+        the model finishes it; this default waits for ``analyze``.
+
+        Args:
+            request: Dictionary containing task and text
+            item_key: Key of the item array in the result, e.g. "themes"
+
+        Yields:
+            Result elements (themes, patterns, personas, ...) in order
+        """
+        result = await self.analyze(request)
+        for item in select_items(result, item_key):
+            yield item
+
     def _parse_llm_json_response(self, response_text: str, context: str = "") -> Dict[str, Any]:
         try:
-            result = json.loads(response_text)
+            result = parse_tolerant(response_text)
+        except TolerantJSONError as e:
+            logger.error(f"[{context}] Failed to parse JSON even after repair: {e}")
+            return {}
+
+        if result.repaired:
+            logger.info(f"[{context}] Successfully parsed JSON after repair: {result.repairs}")
+        else:
             logger.debug(f"Successfully parsed JSON response for context: {context}")
-            return result
-        except json.JSONDecodeError as e1:
-            logger.warning(f"[{context}] Direct JSON parsing failed: {e1}. Trying JSON repair...")
-
-            try:
-                repaired_json = repair_json(response_text)
-                logger.debug(f"[{context}] Repaired JSON: {repaired_json[:200]}...")
-
-                result = json.loads(repaired_json)
-                logger.info(f"[{context}] Successfully parsed JSON after repair.")
-                return result
-            except json.JSONDecodeError as e2:
-                logger.error(f"[{context}] Failed to parse JSON even after repair: {e2}")
-                return {}
-            except Exception as e_generic:
-                logger.error(f"[{context}] Unexpected error during JSON repair: {e_generic}")
-                return {}
+        return result.value
 
     def _get_error_response(self, task: str, error_message: str) -> Dict[str, Any]:
         """
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 
 from .providers import BaseLLMProvider, get_provider
 from .retry import RetryConfig, with_retry, get_conservative_retry_config
+from .response_cache import build_cache_key, get_llm_response_cache, is_cacheable_result
 
 logger = logging.getLogger(__name__)
 
@@ -106,10 +107,28 @@ class UnifiedClient:
         Returns:
             Generated text response
         """
-        return await self.provider.generate_text(
-            prompt=prompt,
-            system_instruction=system_instruction,
-            **kwargs
+        async def _compute() -> str:
+            return await self.provider.generate_text(
+                prompt=prompt,
+                system_instruction=system_instruction,
+                **kwargs
+            )
+
+        cache = get_llm_response_cache()
+        temperature = kwargs.get("temperature", self.provider.config.temperature)
+        if not cache.is_cacheable(temperature):
+            return await _compute()
+        cache_key = build_cache_key(
+            provider=self.provider.__class__.__name__,
+            model=self.provider.model_name,
+            task="text_generation",
+            content=prompt,
+            prompt_template=system_instruction,
+            temperature=temperature,
+            params={k: v for k, v in kwargs.items() if k != "temperature"},
+        )
+        return await cache.get_or_compute(
+            cache_key, _compute, should_store=is_cacheable_result
         )
     
     async def generate_structured(
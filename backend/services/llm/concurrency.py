@@ -0,0 +1,215 @@
+"""
+Adaptive concurrency limiting for LLM providers.
+
+``AdaptiveConcurrencyLimiter`` caps in-flight requests with an AIMD policy:
+the limit grows by one per round of healthy completions and is halved when
+the provider signals overload (429 / 503 / resource exhausted). A completion
+is healthy when it succeeded and its latency stayed within a tolerance of the
+running average; other errors and slow completions hold the limit steady.
+
+Limiters are shared process-wide per provider through ``get_concurrency_limiter``
+so that concurrent simulations and analyses back off together. Waiters may live
+on different event loops.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from .retry import is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
+_OVERLOAD_MARKERS = ("503", "unavailable", "overloaded", "resource_exhausted", "resource exhausted")
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error is the provider asking callers to slow down."""
+    if is_rate_limit_error(error):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in _OVERLOAD_MARKERS)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent requests to one provider."""
+
+    def __init__(
+        self,
+        name: str = "default",
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.2,
+        cooldown_seconds: float = 5.0,
+        window: int = 20,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= max_limit")
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.cooldown_seconds = cooldown_seconds
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self._latency_avg: Optional[float] = None
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._last_backoff = float("-inf")
+        self._backoffs = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = _Waiter(asyncio.get_running_loop().create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                # The slot was handed over just before cancellation; pass it on
+                self._release_slot()
+            raise
+
+    def release(
+        self, latency: Optional[float] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """Free a slot and adjust the limit from the request's outcome."""
+        self._record(latency, error)
+        self._release_slot()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for one request, reporting its latency and error."""
+        await self.acquire()
+        start = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.release(time.perf_counter() - start, error)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "latency_avg": round(self._latency_avg, 3) if self._latency_avg else None,
+                "error_rate": round(self._error_rate(), 3),
+                "backoffs": self._backoffs,
+            }
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _record(self, latency: Optional[float], error: Optional[BaseException]) -> None:
+        if isinstance(error, asyncio.CancelledError):
+            return
+        with self._lock:
+            if error is not None and is_overload_error(error):
+                self._outcomes.append(False)
+                now = time.monotonic()
+                # One burst of overload responses halves the limit once
+                if now - self._last_backoff >= self.cooldown_seconds:
+                    self._last_backoff = now
+                    self._backoffs += 1
+                    previous = self.limit
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff_factor)
+                    logger.warning(
+                        f"[{self.name}] Provider overloaded; concurrency {previous} -> {self.limit}"
+                    )
+                return
+
+            self._outcomes.append(error is None)
+            if error is not None or latency is None:
+                return
+            slow = (
+                self._latency_avg is not None
+                and latency > self._latency_avg * self.latency_tolerance
+            )
+            self._latency_avg = (
+                latency
+                if self._latency_avg is None
+                else 0.8 * self._latency_avg + 0.2 * latency
+            )
+            if slow or self._error_rate() > self.max_error_rate:
+                return
+            if self._in_flight < self.limit:
+                # Not using the current limit; growing it would not be measured
+                return
+            # Additive increase: about +1 per `limit` healthy completions
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            while self._waiters and self._in_flight < self.limit:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                self._in_flight += 1
+                waiter.future.get_loop().call_soon_threadsafe(_wake, waiter.future)
+
+
+class _Waiter:
+    __slots__ = ("future", "granted")
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.granted = False
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(provider: str = "gemini") -> AdaptiveConcurrencyLimiter:
+    """Process-wide limiter for ``provider``, configured from settings."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            from backend.infrastructure.config.settings import settings
+
+            limiter = _limiters[provider] = AdaptiveConcurrencyLimiter(
+                name=provider,
+                initial_limit=settings.llm_concurrency_initial,
+                min_limit=settings.llm_concurrency_min,
+                max_limit=settings.llm_concurrency_max,
+            )
+        return limiter
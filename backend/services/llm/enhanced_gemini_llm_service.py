@@ -8,7 +8,7 @@ error management, and configuration.
 
 import logging
 import os
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from pydantic import BaseModel
 
 from backend.domain.interfaces.llm_unified import ILLMService
@@ -89,32 +89,11 @@ class EnhancedGeminiLLMService(BaseLLMService, ILLMService):
             API response
         """
         try:
-            # Extract custom configuration parameters if any
-            custom_config = {}
-            if "temperature" in request:
-                custom_config["temperature"] = request["temperature"]
-            if "max_tokens" in request:
-                custom_config["max_output_tokens"] = request["max_tokens"]
-            if "top_p" in request:
-                custom_config["top_p"] = request["top_p"]
-            if "top_k" in request:
-                custom_config["top_k"] = request["top_k"]
-
-            # If caller requests strict JSON, enforce via response_mime_type
-            try:
-                if request.get("enforce_json"):
-                    # application/json forces Gemini to emit JSON; keep temp at 0 for structure
-                    custom_config["response_mime_type"] = "application/json"
-                    # Prefer deterministic output for structured tasks
-                    custom_config.setdefault("temperature", 0.0)
-            except Exception:
-                pass
-
             # Call the AsyncGenAIClient
             return await self.client.generate_content(
                 task=task,
                 prompt=text,
-                custom_config=custom_config,
+                custom_config=self._custom_config(request),
                 system_instruction=system_message,
             )
         except (
@@ -134,6 +113,78 @@ class EnhancedGeminiLLMService(BaseLLMService, ILLMService):
             )
             raise LLMServiceError(f"Unexpected error: {str(e)}") from e
 
+    def _custom_config(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract custom generation parameters from a request.
+
+        Args:
+            request: Request data
+
+        Returns:
+            Custom configuration for AsyncGenAIClient
+        """
+        custom_config = {}
+        if "temperature" in request:
+            custom_config["temperature"] = request["temperature"]
+        if "max_tokens" in request:
+            custom_config["max_output_tokens"] = request["max_tokens"]
+        if "top_p" in request:
+            custom_config["top_p"] = request["top_p"]
+        if "top_k" in request:
+            custom_config["top_k"] = request["top_k"]
+
+        # If caller requests strict JSON, enforce via response_mime_type
+        try:
+            if request.get("enforce_json"):
+                # application/json forces Gemini to emit JSON; keep temp at 0 for structure
+                custom_config["response_mime_type"] = "application/json"
+                # Prefer deterministic output for structured tasks
+                custom_config.setdefault("temperature", 0.0)
+        except Exception:
+            pass
+        return custom_config
+
+    async def analyze_stream(
+        self, request: Dict[str, Any], item_key: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Analyze content, yielding result elements as the model streams them.
+
+        Falls back to the non-streaming ``analyze`` when the stream fails before
+        its first element; a failure after that is raised, since elements were
+        already handed to the caller.
+
+        Args:
+            request: Dictionary containing task and text
+            item_key: Key of the item array in the result, e.g. "themes"
+
+        Yields:
+            Result elements (themes, patterns, personas, ...) in order
+        """
+        task = request.get("task", "unknown_task")
+        emitted = 0
+        try:
+            async for item in self.client.generate_content_items(
+                task=task,
+                prompt=request.get("text", ""),
+                item_key=item_key,
+                custom_config=self._custom_config(request),
+                system_instruction=self._get_system_message(task, request),
+            ):
+                emitted += 1
+                yield item
+        except Exception as e:
+            if emitted:
+                raise
+            logger.warning(
+                f"Streaming {task} failed before the first item, retrying without streaming: {str(e)}"
+            )
+        else:
+            return
+
+        async for item in super().analyze_stream(request, item_key):
+            yield item
+
     def _parse_llm_response(self, response: Any, task: str) -> Dict[str, Any]:
         """
         Parse LLM response.
@@ -29,11 +29,18 @@ from backend.utils.json.pydantic_parser import (
     parse_json_with_pydantic,
     parse_llm_json_response_with_pydantic,
 )
+from backend.utils.json.tolerant_parser import parse_tolerant
 from backend.domain.interfaces.llm_unified import ILLMService
 from backend.services.llm.instructor_gemini_client import InstructorGeminiClient
+from backend.services.llm.response_cache import (
+    build_cache_key,
+    get_llm_response_cache,
+    is_cacheable_result,
+)
 
 from backend.schemas import Theme
 from backend.services.llm.prompts.gemini_prompts import GeminiPrompts
+from backend.infrastructure.tracing import llm_span
 from backend.services.llm.exceptions import (
     LLMAPIError,
     LLMResponseParseError,
@@ -638,59 +645,64 @@ class GeminiService:
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
         system_instruction_text: Optional[str] = None,
+        task: Optional[str] = None,
     ) -> genai.types.GenerateContentResponse:
         """Generates text using the Gemini API with retry logic."""
         delay = initial_delay
         last_exception = None
-        for attempt in range(max_retries):
-            try:
-                # Ensure prompt_parts are correctly formatted
-                current_prompt_parts = []
-                for part_item in prompt_parts:
-                    if isinstance(part_item, str):
-                        current_prompt_parts.append(part_item)
-                    elif isinstance(part_item, Content):
-                        current_prompt_parts.append(part_item)
-                    else:
-                        current_prompt_parts.append(str(part_item))
-
-                logger.debug(
-                    f"Attempt {attempt + 1}/{max_retries} - Calling _call_llm_api with model: {model_name}, "
-                    f"system_instruction: {bool(system_instruction_text)}"
-                )
-                # Directly await the async _call_llm_api method
-                response = await self._call_llm_api(
-                    model_name=model_name,
-                    contents=current_prompt_parts,
-                    generation_config=generation_config,
-                    system_instruction_text=system_instruction_text,
-                )
-                return response
-            except LLMAPIError as e:  # Catch specific API errors for retry
-                last_exception = e
-                logger.warning(
-                    f"LLM API call failed on attempt {attempt + 1}/{max_retries}: {e}. Retrying in {delay:.2f}s..."
-                )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
-            except Exception as e:  # Catch other unexpected errors
-                last_exception = e
-                logger.error(
-                    f"Unexpected error on attempt {attempt + 1}/{max_retries} while generating text: {e}",
-                    exc_info=True,
-                )
-                # Depending on policy, you might want to break or retry for some unexpected errors too
-                # For now, we'll retry on generic exceptions as well, but this could be refined.
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
+        with llm_span(task or "gemini", model_name) as call:
+            for attempt in range(max_retries):
+                try:
+                    # Ensure prompt_parts are correctly formatted
+                    current_prompt_parts = []
+                    for part_item in prompt_parts:
+                        if isinstance(part_item, str):
+                            current_prompt_parts.append(part_item)
+                        elif isinstance(part_item, Content):
+                            current_prompt_parts.append(part_item)
+                        else:
+                            current_prompt_parts.append(str(part_item))
 
-        logger.error(f"Failed to generate text after {max_retries} retries.")
-        if last_exception:
-            raise last_exception  # Re-raise the last caught exception
-        # Fallback if no specific exception was caught but retries exhausted (should not happen if loop completes)
-        raise LLMServiceError(
-            f"Failed to generate text after {max_retries} retries for model {model_name}."
-        )
+                    logger.debug(
+                        f"Attempt {attempt + 1}/{max_retries} - Calling _call_llm_api with model: {model_name}, "
+                        f"system_instruction: {bool(system_instruction_text)}"
+                    )
+                    # Directly await the async _call_llm_api method
+                    response = await self._call_llm_api(
+                        model_name=model_name,
+                        contents=current_prompt_parts,
+                        generation_config=generation_config,
+                        system_instruction_text=system_instruction_text,
+                    )
+                    call.record_usage(response)
+                    return response
+                except LLMAPIError as e:  # Catch specific API errors for retry
+                    last_exception = e
+                    logger.warning(
+                        f"LLM API call failed on attempt {attempt + 1}/{max_retries}: {e}. Retrying in {delay:.2f}s..."
+                    )
+                    call.retry()
+                    await asyncio.sleep(delay)
+                    delay *= backoff_factor
+                except Exception as e:  # Catch other unexpected errors
+                    last_exception = e
+                    logger.error(
+                        f"Unexpected error on attempt {attempt + 1}/{max_retries} while generating text: {e}",
+                        exc_info=True,
+                    )
+                    # Depending on policy, you might want to break or retry for some unexpected errors too
+                    # For now, we'll retry on generic exceptions as well, but this could be refined.
+                    call.retry()
+                    await asyncio.sleep(delay)
+                    delay *= backoff_factor
+
+            logger.error(f"Failed to generate text after {max_retries} retries.")
+            if last_exception:
+                raise last_exception  # Re-raise the last caught exception
+            # Fallback if no specific exception was caught but retries exhausted (should not happen if loop completes)
+            raise LLMServiceError(
+                f"Failed to generate text after {max_retries} retries for model {model_name}."
+            )
 
     @property
     def instructor_client(self) -> InstructorGeminiClient:
@@ -780,6 +792,43 @@ class GeminiService:
 
     async def analyze(
         self, text_or_payload: Union[str, Dict[str, Any]], task: Optional[str] = None, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Analyze text for a task, serving repeated requests from the shared LLM cache."""
+        if isinstance(text_or_payload, dict):
+            cache_text = text_or_payload.get("text", "")
+            cache_task = text_or_payload.get("task", task or "")
+            cache_params = dict(data or {})
+            cache_params.update(
+                {k: v for k, v in text_or_payload.items() if k not in ("text", "task")}
+            )
+        else:
+            cache_text, cache_task, cache_params = text_or_payload, task or "", dict(data or {})
+
+        cache = get_llm_response_cache()
+        temperature = cache_params.get("temperature", self.default_temperature)
+        if not cache.is_cacheable(temperature):
+            return await self._analyze_uncached(text_or_payload, task, data)
+        try:
+            cache_key = build_cache_key(
+                provider="gemini",
+                model=self.default_model_name,
+                task=cache_task,
+                content=cache_text,
+                prompt_template=self._get_system_message(cache_task, dict(cache_params)),
+                temperature=temperature,
+                params=cache_params,
+            )
+        except Exception as e:
+            logger.debug(f"Could not build LLM cache key for task {cache_task}: {e}")
+            return await self._analyze_uncached(text_or_payload, task, data)
+        return await cache.get_or_compute(
+            cache_key,
+            lambda: self._analyze_uncached(text_or_payload, task, data),
+            should_store=is_cacheable_result,
+        )
+
+    async def _analyze_uncached(
+        self, text_or_payload: Union[str, Dict[str, Any]], task: Optional[str] = None, data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         # Handle both call patterns:
         # 1. analyze({"task": ..., "text": ...}) - used by processor.py
@@ -1258,6 +1307,7 @@ Double-check your JSON for missing commas before responding.
                 prompt_parts=prompt_parts,
                 generation_config=current_generation_config,
                 system_instruction_text=system_message_content,
+                task=task,
             )
 
             # Try to extract text from the response
@@ -1691,17 +1741,17 @@ Double-check your JSON for missing commas before responding.
                                 logger.info(
                                     f"[{task}] Using specialized enhanced themes JSON repair function"
                                 )
-                                repaired = repair_enhanced_themes_json(text_response)
+                                result = json.loads(
+                                    repair_enhanced_themes_json(text_response)
+                                )
                             elif task == "persona_formation":
                                 logger.info(
                                     f"[{task}] Skipping JSON repair for persona formation - using raw response"
                                 )
                                 # For persona formation, don't apply any repair - use raw response
-                                repaired = text_response
+                                result = json.loads(text_response)
                             else:
-                                repaired = repair_json(text_response)
-
-                            result = json.loads(repaired)
+                                result = parse_tolerant(text_response).value
                             logger.info(
                                 f"[{task}] Successfully parsed JSON after repair."
                             )
@@ -1871,18 +1921,17 @@ Double-check your JSON for missing commas before responding.
                                     logger.info(
                                         f"[{task}] Using specialized enhanced themes JSON repair function in non-JSON path"
                                     )
-                                    repaired = repair_enhanced_themes_json(
-                                        text_response
+                                    result = json.loads(
+                                        repair_enhanced_themes_json(text_response)
                                     )
                                 elif task == "persona_formation":
                                     logger.info(
                                         f"[{task}] Skipping JSON repair for persona formation in non-JSON path - using raw response"
                                     )
                                     # For persona formation, don't apply any repair - use raw response
-                                    repaired = text_response
+                                    result = json.loads(text_response)
                                 else:
-                                    repaired = repair_json(text_response)
-                                result = json.loads(repaired)
+                                    result = parse_tolerant(text_response).value
                                 logger.info(
                                     f"[{task}] Successfully parsed JSON in non-JSON path after repair."
                                 )
@@ -14,10 +14,16 @@ import time
 from pydantic import ValidationError
 
 from backend.schemas import Theme, Pattern, Insight
+from backend.services.llm.response_cache import (
+    build_cache_key,
+    get_llm_response_cache,
+    is_cacheable_result,
+)
 from backend.utils.json.json_parser import (
     parse_llm_json_response,
     normalize_persona_response,
 )
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -65,6 +71,32 @@ class OpenAIService:
         logger.info(f"Initialized OpenAI service with model: {self.model}")
 
     async def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze data using OpenAI, serving repeated requests from the shared LLM cache."""
+        cache = get_llm_response_cache()
+        temperature = data.get("temperature", self.temperature)
+        if not cache.is_cacheable(temperature):
+            return await self._analyze_uncached(data)
+        try:
+            task = data.get("task", "")
+            cache_key = build_cache_key(
+                provider="openai",
+                model=self.model,
+                task=task,
+                content=data.get("text", ""),
+                prompt_template=self._get_system_message(task, data),
+                temperature=temperature,
+                params={k: v for k, v in data.items() if k not in ("text", "task")},
+            )
+        except Exception as e:
+            logger.debug(f"Could not build LLM cache key: {e}")
+            return await self._analyze_uncached(data)
+        return await cache.get_or_compute(
+            cache_key,
+            lambda: self._analyze_uncached(data),
+            should_store=is_cacheable_result,
+        )
+
+    async def _analyze_uncached(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze data using OpenAI."""
         task = data.get("task", "")
         text = data.get("text", "")
@@ -127,7 +159,7 @@ class OpenAIService:
             result_text = response.choices[0].message.content
             logger.debug(f"Raw response for task {task}:\n{result_text}")
 
-            result = json.loads(result_text)
+            result = parse_tolerant(result_text).value
 
             # Post-process results if needed
             if task == "theme_analysis":
@@ -1554,24 +1586,16 @@ class OpenAIService:
     def _parse_json_response(self, response_text):
         """Parse JSON from the response text, handling various formats"""
         try:
-            # Try to find JSON within the text (in case there's markdown or other text)
-            json_match = re.search(r"```json\s*([\s\S]*?)\s*```", response_text)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find JSON without the markdown markers
-                json_match = re.search(r"(\{[\s\S]*\}|\[[\s\S]*\])", response_text)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = response_text
-
-            return json.loads(json_str)
-        except Exception as e:
+            result = parse_tolerant(response_text)
+        except TolerantJSONError as e:
             self.logger.error(f"Failed to parse JSON: {str(e)}")
             self.logger.debug(f"Response text: {response_text}")
             raise Exception(f"Failed to parse response as JSON: {str(e)}")
 
+        if result.repaired:
+            self.logger.warning(f"Repaired malformed JSON response: {result.repairs}")
+        return result.value
+
     async def analyze_interviews(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze interview data using OpenAI.
@@ -0,0 +1,669 @@
+"""
+Shared, content-addressed cache for LLM responses.
+
+Responses are keyed by a SHA-256 digest of the model, task, prompt template
+(system instruction) digest, temperature, generation parameters and the
+normalized request content, so identical work is served from the cache no
+matter which worker or service instance issued it.
+
+Storage is pluggable through ``CacheBackend``:
+
+- ``MemoryLRUBackend``: in-process LRU bounded by entry count and bytes
+- ``DatabaseCacheBackend``: durable SQLAlchemy-backed tier (SQLite or
+  Postgres) shared by every worker pointing at the same URL
+
+``LLMResponseCache`` reads through the tiers in order, backfills faster tiers
+on a hit, and keeps hit/miss/byte counters.
+
+Configuration (environment):
+    LLM_CACHE_ENABLED: "true"/"false" (default: true)
+    LLM_CACHE_BACKEND: "memory" or "tiered" (default: tiered)
+    LLM_CACHE_DATABASE_URL: durable tier URL; without it the cache is
+        memory-only, so no database file appears in the working directory
+    LLM_CACHE_MAX_ENTRIES: in-process entry limit (default: 512)
+    LLM_CACHE_MAX_BYTES: in-process byte limit (default: 64 MiB)
+    LLM_CACHE_DB_MAX_BYTES: durable tier byte limit (default: 1 GiB)
+    LLM_CACHE_TTL_SECONDS: entry lifetime, 0 disables expiry (default: 7 days)
+    LLM_CACHE_MAX_TEMPERATURE: hotter requests bypass the cache (default: 0.7)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from backend.infrastructure.tracing import record_llm_cache_hit
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached response (e.g. after a parser change)
+CACHE_NAMESPACE = "llm-cache-v1"
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DB_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_TEMPERATURE = 0.7
+
+
+def normalize_content(content: Any) -> str:
+    """
+    Normalize request content for key building.
+
+    Line endings and trailing whitespace are not meaningful to the model, so
+    they are canonicalized; line structure is preserved because speaker turns
+    depend on it.
+    """
+    if content is None:
+        return ""
+    if not isinstance(content, str):
+        content = _canonical_json(content)
+    content = unicodedata.normalize("NFC", content)
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in content.split("\n")).strip()
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=_json_fallback)
+
+
+def _json_fallback(value: Any) -> Any:
+    """Serialize SDK/pydantic objects that show up in prompts and configs."""
+    if isinstance(value, type):  # Response schema classes
+        return f"{value.__module__}.{value.__qualname__}"
+    if hasattr(value, "model_dump"):
+        return value.model_dump(exclude_none=True)
+    if hasattr(value, "value"):  # Enums
+        return value.value
+    return str(value)
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_cache_key(
+    *,
+    model: Optional[str],
+    task: Optional[str],
+    content: Any,
+    prompt_template: Any = None,
+    temperature: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+    provider: Optional[str] = None,
+) -> str:
+    """
+    Build a content-addressed cache key.
+
+    Args:
+        model: Model name
+        task: Task identifier
+        content: User content (string or JSON-serializable structure)
+        prompt_template: System instruction or template text; its digest acts
+            as the prompt-template version
+        temperature: Sampling temperature
+        params: Remaining generation parameters that influence the output
+        provider: Provider or service name
+
+    Returns:
+        Hex SHA-256 key
+    """
+    template_version = _digest(normalize_content(prompt_template)) if prompt_template else ""
+    payload = {
+        "ns": CACHE_NAMESPACE,
+        "provider": provider or "",
+        "model": model or "",
+        "task": str(getattr(task, "value", task) or ""),
+        "template": template_version,
+        "temperature": None if temperature is None else round(float(temperature), 4),
+        "params": params or {},
+        "content": _digest(normalize_content(content)),
+    }
+    return _digest(_canonical_json(payload))
+
+
+class CacheBackend(ABC):
+    """Storage tier for serialized cache entries."""
+
+    name = "backend"
+    # Backends doing network or disk I/O are called from a worker thread
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored bytes for key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store bytes under key with an optional lifetime in seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name}
+
+
+class MemoryLRUBackend(CacheBackend):
+    """In-process LRU bounded by entry count and total value bytes."""
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at)
+            self._bytes += len(value)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+            }
+
+
+class DatabaseCacheBackend(CacheBackend):
+    """
+    Durable cache tier stored in a SQL table.
+
+    Works with SQLite (WAL mode, shared by workers on one host) and Postgres
+    (shared by every node). Least-recently-used rows are evicted once the
+    stored bytes exceed ``max_bytes``.
+    """
+
+    name = "database"
+    blocking = True
+
+    # Check the size budget every N writes instead of on every write
+    _EVICTION_CHECK_INTERVAL = 50
+
+    def __init__(self, url: str, max_bytes: int = DEFAULT_DB_MAX_BYTES):
+        from sqlalchemy import (
+            Column,
+            Float,
+            Integer,
+            LargeBinary,
+            MetaData,
+            String,
+            Table,
+            create_engine,
+            event,
+        )
+
+        self.url = url
+        self.max_bytes = max_bytes
+        self._writes = 0
+        self._evictions = 0
+
+        is_sqlite = url.startswith("sqlite")
+        connect_args = {"check_same_thread": False, "timeout": 30} if is_sqlite else {}
+        self._engine = create_engine(url, connect_args=connect_args, pool_pre_ping=True)
+
+        if is_sqlite:
+
+            @event.listens_for(self._engine, "connect")
+            def _enable_wal(dbapi_connection, _record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
+        metadata = MetaData()
+        self._table = Table(
+            "llm_response_cache",
+            metadata,
+            Column("cache_key", String(64), primary_key=True),
+            Column("value", LargeBinary, nullable=False),
+            Column("size", Integer, nullable=False),
+            Column("created_at", Float, nullable=False),
+            Column("expires_at", Float, nullable=True),
+            Column("last_access", Float, nullable=False, index=True),
+        )
+        metadata.create_all(self._engine, checkfirst=True)
+
+    def get(self, key: str) -> Optional[bytes]:
+        from sqlalchemy import delete, select, update
+
+        table = self._table
+        now = time.time()
+        with self._engine.begin() as conn:
+            row = conn.execute(
+                select(table.c.value, table.c.expires_at).where(table.c.cache_key == key)
+            ).first()
+            if row is None:
+                return None
+            if row.expires_at is not None and row.expires_at < now:
+                conn.execute(delete(table).where(table.c.cache_key == key))
+                return None
+            conn.execute(
+                update(table).where(table.c.cache_key == key).values(last_access=now)
+            )
+            return bytes(row.value)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        from sqlalchemy import delete, insert
+
+        table = self._table
+        now = time.time()
+        with self._engine.begin() as conn:
+            # Portable upsert: entries are immutable for a given key
+            conn.execute(delete(table).where(table.c.cache_key == key))
+            conn.execute(
+                insert(table).values(
+                    cache_key=key,
+                    value=value,
+                    size=len(value),
+                    created_at=now,
+                    expires_at=now + ttl if ttl else None,
+                    last_access=now,
+                )
+            )
+
+        self._writes += 1
+        if self._writes % self._EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired rows, then least-recently-used rows over the byte budget."""
+        from sqlalchemy import delete, func, select
+
+        table = self._table
+        removed = 0
+        with self._engine.begin() as conn:
+            result = conn.execute(
+                delete(table).where(
+                    table.c.expires_at.isnot(None), table.c.expires_at < time.time()
+                )
+            )
+            removed += result.rowcount or 0
+
+            total = conn.execute(select(func.coalesce(func.sum(table.c.size), 0))).scalar()
+            excess = int(total or 0) - self.max_bytes
+            if excess > 0:
+                victims = []
+                for cache_key, size in conn.execute(
+                    select(table.c.cache_key, table.c.size).order_by(table.c.last_access.asc())
+                ):
+                    victims.append(cache_key)
+                    excess -= size
+                    if excess <= 0:
+                        break
+                if victims:
+                    conn.execute(delete(table).where(table.c.cache_key.in_(victims)))
+                    removed += len(victims)
+
+        self._evictions += removed
+        return removed
+
+    def delete(self, key: str) -> None:
+        from sqlalchemy import delete
+
+        with self._engine.begin() as conn:
+            conn.execute(delete(self._table).where(self._table.c.cache_key == key))
+
+    def clear(self) -> None:
+        from sqlalchemy import delete
+
+        with self._engine.begin() as conn:
+            conn.execute(delete(self._table))
+
+    def stats(self) -> Dict[str, Any]:
+        from sqlalchemy import func, select
+
+        try:
+            with self._engine.connect() as conn:
+                entries, total = conn.execute(
+                    select(func.count(), func.coalesce(func.sum(self._table.c.size), 0))
+                ).one()
+        except Exception as e:
+            logger.warning(f"Could not read LLM cache table stats: {e}")
+            entries, total = None, None
+        return {
+            "name": self.name,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "evictions": self._evictions,
+        }
+
+
+class LLMResponseCache:
+    """
+    Read-through cache over one or more backends.
+
+    Values are stored as JSON. Concurrent requests for the same key within a
+    process share one computation.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[CacheBackend],
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_temperature: Optional[float] = DEFAULT_MAX_TEMPERATURE,
+        enabled: bool = True,
+    ):
+        self.backends: List[CacheBackend] = list(backends)
+        self.ttl = ttl or None
+        self.max_temperature = max_temperature
+        self.enabled = enabled and bool(self.backends)
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "errors": 0,
+            "bypassed": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+        }
+        self._tier_hits = [0] * len(self.backends)
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, temperature: Optional[float] = None) -> bool:
+        """Return False for disabled caches and for sampling hotter than the limit."""
+        if not self.enabled:
+            return False
+        if (
+            temperature is not None
+            and self.max_temperature is not None
+            and float(temperature) > self.max_temperature
+        ):
+            self._count("bypassed")
+            return False
+        return True
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        if not self.enabled:
+            return None
+        for index, backend in enumerate(self.backends):
+            try:
+                raw = await self._call(backend, backend.get, key)
+            except Exception as e:
+                self._count("errors")
+                logger.warning(f"LLM cache read failed on {backend.name} tier: {e}")
+                continue
+            if raw is None:
+                continue
+
+            try:
+                value = json.loads(raw.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                self._count("errors")
+                continue
+
+            logger.debug(f"LLM cache hit on {backend.name} tier: {key[:12]}")
+            with self._lock:
+                self._counters["hits"] += 1
+                self._counters["bytes_read"] += len(raw)
+                self._tier_hits[index] += 1
+            # Backfill faster tiers
+            for faster in self.backends[:index]:
+                try:
+                    await self._call(faster, faster.set, key, raw, self.ttl)
+                except Exception:
+                    self._count("errors")
+            return value
+
+        logger.debug(f"LLM cache miss: {key[:12]}")
+        self._count("misses")
+        return None
+
+    async def set(self, key: str, value: Any) -> bool:
+        """Store a JSON-serializable value under key in every tier."""
+        if not self.enabled:
+            return False
+        try:
+            raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping LLM cache store for non-JSON value: {e}")
+            return False
+
+        stored = False
+        for backend in self.backends:
+            try:
+                await self._call(backend, backend.set, key, raw, self.ttl)
+                stored = True
+            except Exception as e:
+                self._count("errors")
+                logger.warning(f"LLM cache write failed on {backend.name} tier: {e}")
+        if stored:
+            with self._lock:
+                self._counters["stores"] += 1
+                self._counters["bytes_written"] += len(raw)
+        return stored
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_store: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for key or compute, store and return it.
+
+        Args:
+            key: Cache key from ``build_cache_key``
+            compute: Coroutine factory producing the value on a miss
+            should_store: Optional predicate; results failing it are not cached
+        """
+        if not self.enabled:
+            return await compute()
+
+        cached = await self.get(key)
+        if cached is not None:
+            record_llm_cache_hit()
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pending = self._in_flight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            record_llm_cache_hit()
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise; mark retrieved so the loop does not warn
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+        future.set_result(value)
+        if value is not None and (should_store is None or should_store(value)):
+            await self.set(key, value)
+        return value
+
+    async def clear(self, include_durable: bool = False) -> None:
+        """Clear in-process tiers, and durable tiers when requested."""
+        for backend in self.backends:
+            if backend.blocking and not include_durable:
+                continue
+            await self._call(backend, backend.clear)
+
+    def clear_local(self) -> None:
+        """Synchronously clear in-process tiers."""
+        for backend in self.backends:
+            if not backend.blocking:
+                backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters plus per-tier statistics."""
+        with self._lock:
+            counters = dict(self._counters)
+            tier_hits = list(self._tier_hits)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        counters["enabled"] = self.enabled
+        counters["ttl"] = self.ttl
+        counters["tiers"] = [
+            dict(backend.stats(), hits=hits)
+            for backend, hits in zip(self.backends, tier_hits)
+        ]
+        return counters
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+            self._tier_hits = [0] * len(self.backends)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    @staticmethod
+    async def _call(backend: CacheBackend, fn: Callable, *args: Any) -> Any:
+        if backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """Default store predicate: skip empty results and error payloads."""
+    if result is None:
+        return False
+    if isinstance(result, dict):
+        return bool(result) and not result.get("error")
+    if isinstance(result, str):
+        return bool(result.strip())
+    return True
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+def create_llm_response_cache_from_env() -> LLMResponseCache:
+    """Build an ``LLMResponseCache`` from the LLM_CACHE_* environment variables."""
+    enabled = _env_bool("LLM_CACHE_ENABLED", True)
+    backend_name = os.getenv("LLM_CACHE_BACKEND", "tiered").lower()
+
+    backends: List[CacheBackend] = [
+        MemoryLRUBackend(
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        )
+    ]
+    url = os.getenv("LLM_CACHE_DATABASE_URL")
+    if enabled and backend_name == "tiered" and not url:
+        logger.info("LLM_CACHE_DATABASE_URL not set; LLM response cache is memory-only")
+    elif enabled and backend_name == "tiered":
+        try:
+            backends.append(
+                DatabaseCacheBackend(
+                    url,
+                    max_bytes=int(os.getenv("LLM_CACHE_DB_MAX_BYTES", DEFAULT_DB_MAX_BYTES)),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Durable LLM cache tier unavailable, using memory only: {e}")
+
+    max_temperature = os.getenv("LLM_CACHE_MAX_TEMPERATURE")
+    cache = LLMResponseCache(
+        backends,
+        ttl=float(os.getenv("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+        max_temperature=(
+            float(max_temperature) if max_temperature is not None else DEFAULT_MAX_TEMPERATURE
+        ),
+        enabled=enabled,
+    )
+    logger.info(
+        f"LLM response cache initialized: enabled={cache.enabled}, "
+        f"tiers={[b.name for b in cache.backends]}"
+    )
+    return cache
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache, creating it on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = create_llm_response_cache_from_env()
+    return _shared_cache
+
+
+def set_llm_response_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Replace the process-wide cache (None resets to env configuration)."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = cache
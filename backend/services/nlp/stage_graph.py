@@ -0,0 +1,152 @@
+"""
+Dependency-graph scheduler for analysis stages.
+
+Each ``Stage`` names the stages whose results it needs. ``StageGraph.run``
+starts every stage as soon as its dependencies have finished, so independent
+stages overlap and the wall time approaches the critical path instead of the
+sum of all stages. LLM-bound stages share a concurrency budget; ready stages
+acquire it in declaration order.
+
+A stage that raises or exceeds its timeout either fails the whole graph or,
+when it has an ``on_error`` policy, resolves to the policy's fallback value
+so that its dependents still run.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.infrastructure.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Stage outcomes recorded in StageGraph.outcomes
+COMPLETED = "completed"
+DEGRADED = "degraded"
+FAILED = "failed"
+
+
+@dataclass
+class Stage:
+    """One node of a StageGraph."""
+
+    name: str
+    # Receives the results of ``depends_on`` keyed by stage name
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    # Maps the stage's exception to a fallback result; None fails the graph
+    on_error: Optional[Callable[[BaseException], Any]] = None
+    uses_llm: bool = True
+
+
+class StageGraph:
+    """Runs stages concurrently in dependency order."""
+
+    def __init__(self, stages: Iterable[Stage], max_concurrency: int = 3):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        self.max_concurrency = max_concurrency
+        self.order = self._topological_order()
+        self.outcomes: Dict[str, str] = {}
+        # Wall seconds per executed stage, excluding time waiting for the budget
+        self.durations: Dict[str, float] = {}
+
+    def _topological_order(self) -> List[str]:
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+        order: List[str] = []
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [
+                name
+                for name, stage in remaining.items()
+                if all(dep not in remaining for dep in stage.depends_on)
+            ]
+            if not ready:
+                raise ValueError(f"Stage dependency cycle among: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+        return order
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run all stages and return their results keyed by stage name.
+
+        Raises:
+            The exception of the first stage without an ``on_error`` policy
+            that failed; all other stages are cancelled.
+        """
+        budget = asyncio.Semaphore(self.max_concurrency)
+        tasks: Dict[str, asyncio.Task] = {}
+        # Declaration order decides who gets the budget first among ready stages
+        for name in self.order:
+            tasks[name] = asyncio.create_task(
+                self._run_stage(self.stages[name], tasks, budget), name=f"stage:{name}"
+            )
+
+        try:
+            await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            for name in self.order:
+                task = tasks[name]
+                if task.done() and not task.cancelled() and task.exception():
+                    # Dependents re-raise the same exception; report the root stage
+                    raise task.exception()
+        finally:
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_stage(
+        self, stage: Stage, tasks: Dict[str, asyncio.Task], budget: asyncio.Semaphore
+    ) -> Any:
+        inputs = {dep: await tasks[dep] for dep in stage.depends_on}
+        if stage.uses_llm:
+            async with budget:
+                return await self._execute(stage, inputs)
+        return await self._execute(stage, inputs)
+
+    async def _execute(self, stage: Stage, inputs: Dict[str, Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            with span(stage.name):
+                try:
+                    if stage.timeout:
+                        result = await asyncio.wait_for(stage.run(inputs), stage.timeout)
+                    else:
+                        result = await stage.run(inputs)
+                finally:
+                    self.durations[stage.name] = time.perf_counter() - start
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            reason = (
+                f"timed out after {stage.timeout}s"
+                if isinstance(e, asyncio.TimeoutError)
+                else f"failed: {str(e)}"
+            )
+            if stage.on_error is None:
+                self.outcomes[stage.name] = FAILED
+                logger.error(f"Stage {stage.name} {reason}")
+                raise
+            self.outcomes[stage.name] = DEGRADED
+            logger.warning(f"Stage {stage.name} {reason}; continuing with fallback result")
+            return stage.on_error(e)
+
+        self.outcomes[stage.name] = COMPLETED
+        return result
@@ -44,10 +44,38 @@ except ImportError:
                 return ""
 
 
+from backend.services.processing.sentence_index import (
+    SentenceIndex,
+    SpanSet,
+    get_sentence_index,
+    tokenize,
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+QUOTE_GATE_RULES = (
+    "You are filtering evidence lines for persona formation.\n"
+    "Approve ONLY lines that are the participant's own statements (first-person voice, verbatim).\n"
+    "REJECT all interviewer/researcher/moderator content, prompts, instructions, section headers, metadata, or summaries.\n"
+    "Hard disallow: lines starting with timestamps + role labels (e.g., [12:34] Researcher: ...), any line containing 'Interviewer:' or 'Researcher:' anywhere,\n"
+    "lines that are clearly questions (end with ?), lines that begin with 'Q:' or 'Question:', and lines starting 'As a <role>...' when it reads like a prompt rather than self-description.\n"
+    "If uncertain, prefer REJECT. Return strict JSON ONLY."
+)
+
+
+def _clamp_indices(indices: List[Any], count: int) -> Set[int]:
+    """Integer indices within range(count); malformed entries are dropped."""
+    out: Set[int] = set()
+    for i in indices:
+        try:
+            out.add(int(i))
+        except Exception:
+            continue
+    return {i for i in out if 0 <= i < count}
+
+
 class EvidenceLinkingService:
     """
     Service for linking evidence to persona attributes.
@@ -582,9 +610,7 @@ class EvidenceLinkingService:
 
     # -------------------- V2: Scoped deterministic attribution with offsets --------------------
     def _tokenize(self, text: str) -> List[str]:
-        if not text:
-            return []
-        return [t for t in re.findall(r"\b[\w-]+\b", text.lower()) if len(t) > 3]
+        return tokenize(text)
 
     def _overlap_ok(self, a: str, b: str) -> Tuple[bool, float]:
         a_set = set(self._tokenize(a))
@@ -599,31 +625,7 @@ class EvidenceLinkingService:
     def _iter_sentences_with_spans(self, text: str) -> List[Tuple[int, int, str]]:
         if not text:
             return []
-        # Sentence segmentation by punctuation with spans
-        spans: List[Tuple[int, int, str]] = []
-        for m in re.finditer(r"[^.!?\n]+[.!?]", text, flags=re.MULTILINE):
-            s, e = m.span()
-            sent = text[s:e].strip()
-            if len(sent) >= 20:
-                spans.append((s, e, sent))
-        # Newline-aware fallback segmentation for sparse-punctuation texts
-        # Use only when we found no sentence spans via punctuation; avoids duplicating
-        # entire lines when proper sentence segmentation already worked.
-        if len(spans) == 0:
-            try:
-                start = 0
-                for line in text.splitlines(keepends=True):
-                    raw = (line or "").rstrip("\n")
-                    end = start + len(line)
-                    if raw and len(raw.strip()) >= 20:
-                        spans.append((start, end, raw.strip()))
-                    start = end
-            except Exception:
-                pass
-        # Final fallback: whole text
-        if not spans:
-            spans.append((0, len(text), (text or "").strip()))
-        return spans
+        return get_sentence_index(text).sentences
 
     def _span_overlaps(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
         return not (a[1] <= b[0] or b[1] <= a[0])
@@ -700,6 +702,15 @@ class EvidenceLinkingService:
             return True
         return False
 
+    def _has_demographic_hint(self, sent: str) -> bool:
+        """Heuristic: sentence mentions age, location or seniority."""
+        ls = (sent or "").lower()
+        return bool(
+            re.search(r"\b(\d{2})\s*(years old|y/o|yo)\b", ls)
+            or re.search(r"\b(based in|from|in)\s+[A-Z][A-Za-z\- ]+\b", sent or "")
+            or re.search(r"\b(junior|mid[- ]level|senior|lead|principal)\b", ls)
+        )
+
     def _select_candidate_spans(
         self,
         trait_value: str,
@@ -707,31 +718,49 @@ class EvidenceLinkingService:
         used_spans: List[Tuple[int, int]],
         limit: int = 6,
         metrics: Optional[Dict[str, int]] = None,
+        index: Optional[SentenceIndex] = None,
     ) -> List[Tuple[int, int, str, float]]:
         """
         Return up to `limit` candidate sentence spans (start, end, text, score) in scoped_text
         that adequately overlap with the trait_value tokens and do not collide with used_spans.
+
+        Candidates are retrieved through the shared SentenceIndex postings instead of
+        scanning and re-tokenizing every sentence.
         """
+        if not scoped_text:
+            return []
+        if index is None:
+            index = get_sentence_index(scoped_text)
+        if isinstance(used_spans, SpanSet):
+            collides = used_spans.overlaps
+        else:
+            collides = lambda span: any(  # noqa: E731
+                self._span_overlaps(span, u) for u in used_spans
+            )
+
+        matches = index.overlap_candidates(trait_value or "")
+        if metrics is not None:
+            metrics["checked_sentences"] = metrics.get("checked_sentences", 0) + len(
+                index
+            )
+            metrics["rejected_low_overlap"] = (
+                metrics.get("rejected_low_overlap", 0) + len(index) - len(matches)
+            )
+
         candidates: List[Tuple[int, int, str, float]] = []
-        for s, e, sent in self._iter_sentences_with_spans(scoped_text):
-            if metrics is not None:
-                metrics["checked_sentences"] = metrics.get("checked_sentences", 0) + 1
-            ok, j = self._overlap_ok(trait_value or "", sent)
-            if not ok:
-                if metrics is not None:
-                    metrics["rejected_low_overlap"] = (
-                        metrics.get("rejected_low_overlap", 0) + 1
-                    )
-                continue
+        for sid, j in matches:
+            s, e, sent = index.sentences[sid]
             # Additional hygiene filters: drop metadata-like lines and researcher-style questions
-            if self._looks_like_metadata(sent) or self._looks_like_question(sent):
+            if index.flag("metadata", sid, self._looks_like_metadata) or index.flag(
+                "question", sid, self._looks_like_question
+            ):
                 if metrics is not None:
                     metrics["rejected_metadata_or_question"] = (
                         metrics.get("rejected_metadata_or_question", 0) + 1
                     )
                 continue
             # Dedup against already used spans across traits
-            if any(self._span_overlaps((s, e), u) for u in used_spans):
+            if collides((s, e)):
                 if metrics is not None:
                     metrics["rejected_collision"] = (
                         metrics.get("rejected_collision", 0) + 1
@@ -877,14 +906,7 @@ class EvidenceLinkingService:
             numbered = "\n".join(
                 f"{i}. " + (q or "").strip() for i, q in enumerate(quotes)
             )
-            system_rules = (
-                "You are filtering evidence lines for persona formation.\n"
-                "Approve ONLY lines that are the participant's own statements (first-person voice, verbatim).\n"
-                "REJECT all interviewer/researcher/moderator content, prompts, instructions, section headers, metadata, or summaries.\n"
-                "Hard disallow: lines starting with timestamps + role labels (e.g., [12:34] Researcher: ...), any line containing 'Interviewer:' or 'Researcher:' anywhere,\n"
-                "lines that are clearly questions (end with ?), lines that begin with 'Q:' or 'Question:', and lines starting 'As a <role>...' when it reads like a prompt rather than self-description.\n"
-                "If uncertain, prefer REJECT. Return strict JSON ONLY."
-            )
+            system_rules = QUOTE_GATE_RULES
             prompt = (
                 f"Speaker context: {speaker}. Select lines spoken by the participant only.\n\n"
                 f"LINES:\n{numbered}\n\n"
@@ -908,20 +930,140 @@ class EvidenceLinkingService:
                 data = resp.get("parsed") or resp.get("response") or resp
             approved = data.get("approved_indices") if isinstance(data, dict) else None
             if isinstance(approved, list):
-                out: Set[int] = set()
-                for i in approved:
-                    try:
-                        out.add(int(i))
-                    except Exception:
-                        continue
-                # Clamp to valid range
-                return {i for i in out if 0 <= i < len(quotes)} or set()
+                return _clamp_indices(approved, len(quotes))
         except Exception as e:
             logger.warning(
                 "LLM evidence gate failed; falling back to approve-all. err=%s", e
             )
         return set(range(len(quotes)))
 
+    async def llm_filter_quotes_batch(
+        self,
+        quotes_by_field: Dict[str, List[str]],
+        scope_meta: Optional[Dict[str, Any]] = None,
+        max_batch_quotes: int = 150,
+    ) -> Dict[str, Set[int]]:
+        """
+        Batched version of llm_filter_quotes over several fields (or personas).
+        - One structured LLM call approves quotes for every field, returning
+          per-field indices; fields are grouped so no call exceeds max_batch_quotes.
+        - Fields missing from the response, and groups whose call fails, fall
+          back to concurrent per-field llm_filter_quotes calls.
+        - Fail-open like llm_filter_quotes.
+        """
+        results: Dict[str, Set[int]] = {
+            key: set(range(len(quotes))) for key, quotes in quotes_by_field.items()
+        }
+        pending = {key: quotes for key, quotes in quotes_by_field.items() if quotes}
+        if not pending or not getattr(self, "enable_llm_filter", False):
+            return results
+
+        groups: List[Dict[str, List[str]]] = [{}]
+        size = 0
+        for key, quotes in pending.items():
+            if groups[-1] and size + len(quotes) > max_batch_quotes:
+                groups.append({})
+                size = 0
+            groups[-1][key] = quotes
+            size += len(quotes)
+
+        batched = await asyncio.gather(
+            *(self._filter_quote_group(group, scope_meta) for group in groups)
+        )
+        missing: List[str] = []
+        for group, approved in zip(groups, batched):
+            for key in group:
+                if key in approved:
+                    results[key] = approved[key]
+                else:
+                    missing.append(key)
+
+        if missing:
+            logger.info(
+                "Batched evidence gate fell back to per-field calls for %d of %d fields",
+                len(missing),
+                len(pending),
+            )
+            fallback = await asyncio.gather(
+                *(self.llm_filter_quotes(pending[key], scope_meta) for key in missing)
+            )
+            results.update(zip(missing, fallback))
+        return results
+
+    async def _filter_quote_group(
+        self, group: Dict[str, List[str]], scope_meta: Optional[Dict[str, Any]]
+    ) -> Dict[str, Set[int]]:
+        """One gate call over several fields; returns only fields answered validly."""
+        speaker = (
+            (scope_meta or {}).get("speaker")
+            or (scope_meta or {}).get("speaker_role")
+            or "participant"
+        )
+        sections = []
+        for key, quotes in group.items():
+            numbered = "\n".join(
+                f"{i}. " + (q or "").strip() for i, q in enumerate(quotes)
+            )
+            sections.append(f"FIELD {key}:\n{numbered}")
+        prompt = (
+            f"Speaker context: {speaker}. For each field, select lines spoken by the participant only. "
+            "Line numbers restart at 0 in every field.\n\n"
+            + "\n\n".join(sections)
+            + "\n\n"
+            'Respond with JSON: {"fields": [{"field": "<field name>", "approved_indices": [<int>, ...]}, ...]} '
+            "with one entry per field, only."
+        )
+        try:
+            resp = await asyncio.wait_for(
+                self.llm_service.analyze(
+                    {
+                        "task": "classification",
+                        "prompt": QUOTE_GATE_RULES + "\n\n" + prompt,
+                        "enforce_json": True,
+                        "temperature": 0.0,
+                        "response_schema": {
+                            "type": "object",
+                            "properties": {
+                                "fields": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "field": {"type": "string"},
+                                            "approved_indices": {
+                                                "type": "array",
+                                                "items": {"type": "integer"},
+                                            },
+                                        },
+                                    },
+                                }
+                            },
+                        },
+                    }
+                ),
+                timeout=60.0,
+            )
+            data = {}
+            if isinstance(resp, dict):
+                data = resp.get("parsed") or resp.get("response") or resp
+            elif isinstance(resp, str):
+                data = json.loads(resp)
+            entries = data.get("fields") if isinstance(data, dict) else None
+            approved: Dict[str, Set[int]] = {}
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict):
+                    continue
+                key = entry.get("field")
+                indices = entry.get("approved_indices")
+                if key in group and isinstance(indices, list):
+                    approved[key] = _clamp_indices(indices, len(group[key]))
+            return approved
+        except Exception as e:
+            logger.warning(
+                "Batched LLM evidence gate failed for %d fields. err=%s", len(group), e
+            )
+            return {}
+
     async def llm_clean_scoped_text(
         self,
         scoped_text: str,
@@ -1032,7 +1174,9 @@ class EvidenceLinkingService:
         }
 
         enhanced = dict(attributes) if attributes else {}
-        used_spans: List[Tuple[int, int]] = []
+        used_spans = SpanSet()
+        # Segment/tokenize scoped_text once; shared across traits and personas
+        index = get_sentence_index(scoped_text) if scoped_text else None
         evidence_map: Dict[str, List[Dict[str, Any]]] = {}
 
         # Prioritize behavioral/usage fields before demographics to avoid consuming
@@ -1117,35 +1261,26 @@ class EvidenceLinkingService:
                 base_limit += 2
             limit = base_limit
             candidates = self._select_candidate_spans(
-                trait_value, scoped_text, used_spans, limit=limit, metrics=metrics
+                trait_value,
+                scoped_text,
+                used_spans,
+                limit=limit,
+                metrics=metrics,
+                index=index,
             )
 
             # Demographics pattern-based augmentation (age/location/experience) if still sparse
             if field == "demographics" and len(candidates) < limit:
                 try:
-                    import re as _re
-
                     seen = {(s, e) for (s, e, _t, _sc) in candidates}
-                    for s2, e2, sent2 in self._iter_sentences_with_spans(scoped_text):
-                        if any(self._span_overlaps((s2, e2), u) for u in used_spans):
+                    for sid, (s2, e2, sent2) in enumerate(index.sentences):
+                        if used_spans.overlaps((s2, e2)):
                             continue
                         if (s2, e2) in seen:
                             continue
-                        ls2 = (sent2 or "").lower()
-                        has_age = bool(
-                            _re.search(r"\b(\d{2})\s*(years old|y/o|yo)\b", ls2)
-                        )
-                        has_loc = bool(
-                            _re.search(
-                                r"\b(based in|from|in)\s+[A-Z][A-Za-z\- ]+\b", sent2
-                            )
-                        )
-                        has_exp = bool(
-                            _re.search(
-                                r"\b(junior|mid[- ]level|senior|lead|principal)\b", ls2
-                            )
-                        )
-                        if has_age or has_loc or has_exp:
+                        if index.flag(
+                            "demographic_hint", sid, self._has_demographic_hint
+                        ):
                             candidates.append((s2, e2, sent2, 0.51))
                             seen.add((s2, e2))
                             if len(candidates) >= limit:
@@ -1181,6 +1316,7 @@ class EvidenceLinkingService:
                                 used_spans,
                                 limit=limit,
                                 metrics=metrics,
+                                index=index,
                             )
                 except Exception:
                     pass
@@ -1253,7 +1389,12 @@ class EvidenceLinkingService:
                 if field == "demographics" and len(filtered_items) < desired_min:
                     # Re-run candidate selection ignoring cross-trait collisions to avoid starving this field
                     more_cands = self._select_candidate_spans(
-                        trait_value, scoped_text, [], limit=limit, metrics=None
+                        trait_value,
+                        scoped_text,
+                        [],
+                        limit=limit,
+                        metrics=None,
+                        index=index,
                     )
                     for s, e, sent, _ in more_cands:
                         span = (s, e)
@@ -0,0 +1,118 @@
+"""
+Single-pass partitioning of transcript segments by speaker.
+
+Persona formation needs, per speaker, the dialogue grouped by document, the
+character span of every document block in the joined scoped text, and role
+and document-id counts. ``partition_transcript`` collects all of them in one
+scan of the transcript instead of one scan per speaker.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from heapq import merge
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+import re
+
+DEFAULT_DOCUMENT_ID = "original_text"
+BLOCK_SEPARATOR = "\n\n"
+
+# "I{block_id}|" prefix added to speaker ids during transcript structuring
+_BLOCK_PREFIX = re.compile(r"^I\d+\|")
+
+
+def strip_block_prefix(speaker: Any) -> Any:
+    """Strip the "I{block_id}|" prefix from a speaker id (e.g. "I1|John" -> "John")."""
+    if isinstance(speaker, str) and speaker[:1] == "I":
+        return _BLOCK_PREFIX.sub("", speaker, count=1)
+    return speaker
+
+
+def segment_text(seg: Dict[str, Any]) -> str:
+    return seg.get("dialogue") or seg.get("text") or ""
+
+
+class Turn(NamedTuple):
+    position: int  # index of the segment in the transcript
+    document_id: str
+    text: str
+
+
+@dataclass
+class SpeakerBucket:
+    """Everything one speaker key contributed to a transcript."""
+
+    turns: List[Turn] = field(default_factory=list)
+    # Lower-cased roles, missing roles counted as "participant"
+    role_counts: Counter = field(default_factory=Counter)
+    # Non-empty document ids as they appear on the segments
+    document_ids: Counter = field(default_factory=Counter)
+
+    @property
+    def first_position(self) -> int:
+        return self.turns[0].position
+
+
+def partition_transcript(
+    transcript: Iterable[Any],
+    key: Callable[[Dict[str, Any]], Optional[Hashable]],
+    text: Callable[[Dict[str, Any]], str] = segment_text,
+) -> Dict[Hashable, SpeakerBucket]:
+    """
+    Bucket transcript segments by ``key`` in a single pass.
+
+    Non-dict entries and segments whose key is None are skipped. Buckets are
+    returned in first-appearance order and keep their turns in transcript order.
+    """
+    buckets: Dict[Hashable, SpeakerBucket] = {}
+    for position, seg in enumerate(transcript):
+        if not isinstance(seg, dict):
+            continue
+        k = key(seg)
+        if k is None:
+            continue
+        bucket = buckets.get(k)
+        if bucket is None:
+            bucket = buckets[k] = SpeakerBucket()
+        raw_doc_id = seg.get("document_id")
+        bucket.turns.append(Turn(position, raw_doc_id or DEFAULT_DOCUMENT_ID, text(seg)))
+        bucket.role_counts[(seg.get("role") or "").strip().lower() or "participant"] += 1
+        if isinstance(raw_doc_id, str) and raw_doc_id.strip():
+            bucket.document_ids[raw_doc_id.strip()] += 1
+    return buckets
+
+
+def merge_buckets(buckets: Iterable[SpeakerBucket]) -> SpeakerBucket:
+    """Combine buckets of several keys into one, keeping transcript order."""
+    # Ordering by first appearance keeps Counter tie-breaks in transcript order
+    buckets = sorted(buckets, key=lambda b: b.first_position)
+    if len(buckets) == 1:
+        return buckets[0]
+    merged = SpeakerBucket(turns=list(merge(*(b.turns for b in buckets))))
+    for bucket in buckets:
+        merged.role_counts.update(bucket.role_counts)
+        merged.document_ids.update(bucket.document_ids)
+    return merged
+
+
+def build_scoped_text(turns: Iterable[Turn]) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Join a speaker's turns into one text, grouped by document in first-seen order.
+
+    Returns the text and one ``{"document_id", "start", "end"}`` span per
+    document block; blocks are separated by BLOCK_SEPARATOR.
+    """
+    blocks: Dict[str, List[str]] = {}
+    for turn in turns:
+        lines = blocks.setdefault(turn.document_id, [])
+        if turn.text:
+            lines.append(str(turn.text))
+    pieces: List[str] = []
+    doc_spans: List[Dict[str, Any]] = []
+    cursor = 0
+    for document_id, lines in blocks.items():
+        block = "\n".join(lines)
+        doc_spans.append(
+            {"document_id": document_id, "start": cursor, "end": cursor + len(block)}
+        )
+        pieces.append(block)
+        cursor += len(block) + len(BLOCK_SEPARATOR)
+    return BLOCK_SEPARATOR.join(pieces), doc_spans
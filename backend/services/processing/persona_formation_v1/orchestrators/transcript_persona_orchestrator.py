@@ -12,6 +12,11 @@ import logging
 import os
 import time
 
+from backend.services.processing.persona_formation.speakers.partition import (
+    build_scoped_text,
+    partition_transcript,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,68 +56,26 @@ async def prepare_transcript_parallel_inputs(
         # Signal to caller with empty data; caller should return []
         return (start_time, {}, {}, [], asyncio.Semaphore(1))
 
-    # Consolidate text per speaker and extract roles
+    # Consolidate text per speaker, grouped by document_id, in a single pass
+    # (handles both old and new transcript formats)
+    buckets = partition_transcript(
+        transcript,
+        key=lambda turn: turn.get("speaker_id", turn.get("speaker", "Unknown Speaker")),
+        text=lambda turn: turn.get("dialogue", turn.get("text", "")),
+    )
     speaker_dialogues: Dict[str, List[str]] = {}
     speaker_roles_map: Dict[str, str] = {}
-
-    # Handle both old and new transcript formats
-    for turn in transcript:
-        # Extract speaker ID (handle both old and new formats)
-        speaker_id = turn.get("speaker_id", turn.get("speaker", "Unknown Speaker"))
-        # Extract dialogue/text (handle both old and new formats)
-        dialogue = turn.get("dialogue", turn.get("text", ""))
-        # Extract role (handle both old and new formats, with fallback to participants if provided)
-        role = turn.get("role", "Participant")
-
-        # Initialize speaker entry if not exists
-        if speaker_id not in speaker_dialogues:
-            speaker_dialogues[speaker_id] = []
-            speaker_roles_map[speaker_id] = role  # Store the first inferred role
-
-        # Add this dialogue to the speaker's collection
-        speaker_dialogues[speaker_id].append(dialogue)
-
-    # Build grouped text per speaker by document_id and compute doc_spans
     speaker_texts: Dict[str, str] = {}
     speaker_doc_spans_map: Dict[str, List[Dict[str, Any]]] = {}
-    try:
-        # Prepare buckets preserving per-speaker document order
-        buckets_by_speaker: Dict[str, Dict[str, List[str]]] = {}
-        order_by_speaker: Dict[str, List[str]] = {}
-        for turn in transcript:
-            spk = turn.get("speaker_id", turn.get("speaker", "Unknown Speaker"))
-            dlg = turn.get("dialogue", turn.get("text", "")) or ""
-            did = turn.get("document_id") or "original_text"
-            if spk not in buckets_by_speaker:
-                buckets_by_speaker[spk] = {}
-                order_by_speaker[spk] = []
-            if did not in buckets_by_speaker[spk]:
-                buckets_by_speaker[spk][did] = []
-                order_by_speaker[spk].append(did)
-            if dlg:
-                buckets_by_speaker[spk][did].append(str(dlg))
-        # Assemble texts and spans
-        for spk, buckets in buckets_by_speaker.items():
-            pieces: List[str] = []
-            spans: List[Dict[str, Any]] = []
-            cursor = 0
-            sep = "\n\n"
-            for did in order_by_speaker.get(spk, []):
-                block = "\n".join(buckets.get(did) or [])
-                start = cursor
-                end = start + len(block)
-                spans.append({"document_id": did, "start": start, "end": end})
-                pieces.append(block)
-                cursor = end + len(sep)
-            speaker_texts[spk] = sep.join(pieces)
-            speaker_doc_spans_map[spk] = spans
-    except Exception as _e:
-        # Fallback to simple join if anything goes wrong
-        speaker_texts = {
-            speaker: " ".join(dialogues)
-            for speaker, dialogues in speaker_dialogues.items()
-        }
-        speaker_doc_spans_map = {}
+    for spk, bucket in buckets.items():
+        speaker_dialogues[spk] = [turn.text for turn in bucket.turns]
+        # Store the first inferred role
+        speaker_roles_map[spk] = transcript[bucket.first_position].get("role", "Participant")
+        try:
+            speaker_texts[spk], speaker_doc_spans_map[spk] = build_scoped_text(bucket.turns)
+        except Exception:
+            # Fallback to simple join if anything goes wrong
+            speaker_texts[spk] = " ".join(str(t) for t in speaker_dialogues[spk] if t)
 
     # Expose doc_spans and scoped_text to downstream via context (mutates by ref)
     try:
@@ -6,7 +6,7 @@ This implementation intentionally reuses existing AttributeExtractor and
 PersonaBuilder to preserve output shape while enabling EVIDENCE_LINKING_V2.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 import os
 import time
 
@@ -39,6 +39,13 @@ from backend.services.processing.persona_formation_v2.fast_extraction import (
     fast_extract_personas,
     RAPIDFUZZ_AVAILABLE,
 )
+from backend.services.processing.persona_formation.speakers.partition import (
+    DEFAULT_DOCUMENT_ID,
+    build_scoped_text,
+    merge_buckets,
+    partition_transcript,
+    strip_block_prefix,
+)
 
 
 class PersonaFormationFacade:
@@ -112,6 +119,48 @@ class PersonaFormationFacade:
         persona = self.validator.ensure_golden_schema(persona)
         return persona
 
+    async def _gate_evidence_fields(
+        self,
+        quotes_by_field: Dict[str, List[str]],
+        scope_meta: Optional[Dict[str, Any]],
+        speaker: str,
+    ) -> Dict[str, Set[int]]:
+        """
+        Run the LLM quote gate over all evidence fields of one persona in a single call.
+
+        Returns approved indices per field; fields without an answer are left
+        out so callers keep their evidence unchanged (fail-open).
+        """
+        import asyncio
+        import logging
+        from backend.infrastructure.tracing import span
+
+        logger = logging.getLogger(__name__)
+        quotes_by_field = {k: q for k, q in quotes_by_field.items() if q}
+        if not quotes_by_field:
+            return {}
+        quote_count = sum(len(q) for q in quotes_by_field.values())
+        start = time.perf_counter()
+        try:
+            with span("quote_gating"):
+                approved = await asyncio.wait_for(
+                    self.evidence_linker.llm_filter_quotes_batch(
+                        quotes_by_field, scope_meta
+                    ),
+                    timeout=300.0,  # 5 minute timeout for quote filtering
+                )
+        except asyncio.TimeoutError:
+            logger.warning(f"👥 [PERSONA_V2] Quote gating TIMED OUT for {speaker} after 300s")
+            approved = {}
+        except Exception as e:
+            logger.warning(f"👥 [PERSONA_V2] Quote gating EXCEPTION for {speaker}: {e}")
+            approved = {}
+        logger.info(
+            f"👥 [PERSONA_V2] Quote gating for {speaker}: {len(quotes_by_field)} fields, "
+            f"{quote_count} quotes in {time.perf_counter() - start:.2f}s"
+        )
+        return approved
+
     async def _postprocess_personas(
         self,
         personas: List[Dict[str, Any]],
@@ -384,6 +433,16 @@ class PersonaFormationFacade:
             except Exception as e:
                 logger.warning(f"👥 [PERSONA_V2] Fast extraction failed, falling back to standard: {e}")
 
+        # Bucket every segment by (speaker_id without block prefix, document_id) in one pass;
+        # per-speaker scoped text, doc_spans and document ids are assembled from these buckets
+        segment_buckets = partition_transcript(
+            transcript,
+            key=lambda seg: (
+                strip_block_prefix(seg.get("speaker_id") or seg.get("speaker") or ""),
+                seg.get("document_id") or DEFAULT_DOCUMENT_ID,
+            ),
+        )
+
         # Group dialogues by speaker for non-interviewer roles to create per-participant personas
         by_speaker: Dict[str, List[str]] = {}
         role_counts: Dict[str, Dict[str, int]] = {}
@@ -419,13 +478,10 @@ class PersonaFormationFacade:
 
                 # Strip "I{block_id}|" prefix from speaker if present (e.g., "I1|John Smith" -> "John Smith")
                 # This prefix is added for uniqueness during transcript structuring but should not be in final name
-                import re
-                if isinstance(actual_speaker, str) and re.match(r"^I\d+\|", actual_speaker):
-                    actual_speaker = re.sub(r"^I\d+\|", "", actual_speaker)
+                actual_speaker = strip_block_prefix(actual_speaker)
 
                 doc_id = seg.get("document_id")
                 if doc_id and isinstance(doc_id, str):
-                    import re
                     # 1. Extract Name: Look for "Session (Name)" pattern
                     m_name = re.search(r"Session\s*\(([^)]+)\)", doc_id)
                     if m_name:
@@ -463,10 +519,8 @@ class PersonaFormationFacade:
                 # Track the original speaker_id (stripped of block prefix) AND document_id for this actual_speaker
                 # This is needed to match segments when building scoped_text later
                 # We need both because the same speaker_id (e.g., "Interviewee") may exist across multiple documents
-                stripped_speaker = speaker
-                if isinstance(stripped_speaker, str) and re.match(r"^I\d+\|", stripped_speaker):
-                    stripped_speaker = re.sub(r"^I\d+\|", "", stripped_speaker)
-                segment_doc_id = seg.get("document_id") or "original_text"
+                stripped_speaker = strip_block_prefix(speaker)
+                segment_doc_id = seg.get("document_id") or DEFAULT_DOCUMENT_ID
                 speaker_id_mapping.setdefault(actual_speaker, set()).add((stripped_speaker, segment_doc_id))
             except Exception as e:
                 logger.warning(f"👥 [PERSONA_V2] Error processing segment: {e}")
@@ -676,60 +730,52 @@ class PersonaFormationFacade:
                     # Filter evidence arrays in enhanced attributes
                     if self.enable_evidence_v2:
                         logger.info(f"👥 [PERSONA_V2] [DEBUG] Starting evidence filter loop for {speaker}...")
-                    import time as _time
                     _field_list = list(enhanced_attrs.items()) if isinstance(enhanced_attrs, dict) else []
                     logger.info(f"👥 [PERSONA_V2] [DEBUG] {speaker} has {len(_field_list)} fields to process: {[fk for fk, _ in _field_list]}")
-                    _field_idx = 0
                     if isinstance(enhanced_attrs, dict):
+                        # Helper to extract quote text from evidence item (supports both string and dict)
+                        def _get_quote_text(item):
+                            if isinstance(item, dict):
+                                return item.get("quote", "")
+                            elif isinstance(item, str):
+                                return item
+                            return ""
+
                         # SHORT-CIRCUIT: executed only if v2 is enabled
                         _iter_source = list(enhanced_attrs.items()) if self.enable_evidence_v2 else []
+                        # First apply local hygiene to every field
+                        hygienic: Dict[str, List[Any]] = {}
                         for fk, fv in _iter_source:
-                            _field_idx += 1
                             if isinstance(fv, dict) and isinstance(
                                 fv.get("evidence"), list
                             ):
-                                # Helper to extract quote text from evidence item (supports both string and dict)
-                                def _get_quote_text(item):
-                                    if isinstance(item, dict):
-                                        return item.get("quote", "")
-                                    elif isinstance(item, str):
-                                        return item
-                                    return ""
-                                
-                                pre = [
+                                hygienic[fk] = [
                                     it
                                     for it in fv["evidence"]
                                     if not _is_bad_evidence_line(_get_quote_text(it))
                                 ]
-                                # Optional LLM gate over quotes (fail-open)
-                                try:
-                                    quotes = [_get_quote_text(it) for it in pre]
-                                    if quotes:
-                                        logger.info(f"👥 [PERSONA_V2] [DEBUG] [{_field_idx}/{len(_field_list)}] Calling llm_filter_quotes for {speaker} field '{fk}' with {len(quotes)} quotes...")
-                                        _start = _time.perf_counter()
-                                    approved_idx = await asyncio.wait_for(
-                                        self.evidence_linker.llm_filter_quotes(
-                                            quotes, scope_meta_task
-                                        ),
-                                        timeout=300.0  # 5 minute timeout for quote filtering
-                                    )
-                                    if quotes:
-                                        _elapsed = _time.perf_counter() - _start
-                                        logger.info(f"👥 [PERSONA_V2] [DEBUG] [{_field_idx}/{len(_field_list)}] llm_filter_quotes completed for {speaker} field '{fk}' in {_elapsed:.2f}s")
-                                    if approved_idx and len(approved_idx) != len(pre):
-                                        pre = [
-                                            it for i, it in enumerate(pre) if i in approved_idx
-                                        ]
-                                except asyncio.TimeoutError:
-                                    logger.warning(f"👥 [PERSONA_V2] [DEBUG] [{_field_idx}/{len(_field_list)}] llm_filter_quotes TIMED OUT for {speaker} field '{fk}' after 30s")
-                                except Exception as e:
-                                    logger.warning(f"👥 [PERSONA_V2] [DEBUG] [{_field_idx}/{len(_field_list)}] llm_filter_quotes EXCEPTION for {speaker} field '{fk}': {e}")
-                                if len(pre) != len(fv["evidence"]):
-                                    nf = dict(fv)
-                                    nf["evidence"] = pre
-                                    enhanced_attrs[fk] = nf
                             else:
-                                logger.debug(f"👥 [PERSONA_V2] [DEBUG] [{_field_idx}/{len(_field_list)}] Skipping field '{fk}' (no evidence list)")
+                                logger.debug(f"👥 [PERSONA_V2] [DEBUG] Skipping field '{fk}' (no evidence list)")
+                        # Optional LLM gate over all fields' quotes in one call (fail-open)
+                        approved_by_field = await self._gate_evidence_fields(
+                            {
+                                fk: [_get_quote_text(it) for it in pre]
+                                for fk, pre in hygienic.items()
+                            },
+                            scope_meta_task,
+                            speaker,
+                        )
+                        for fk, pre in hygienic.items():
+                            approved_idx = approved_by_field.get(fk)
+                            if approved_idx and len(approved_idx) != len(pre):
+                                pre = [
+                                    it for i, it in enumerate(pre) if i in approved_idx
+                                ]
+                            fv = enhanced_attrs[fk]
+                            if len(pre) != len(fv["evidence"]):
+                                nf = dict(fv)
+                                nf["evidence"] = pre
+                                enhanced_attrs[fk] = nf
                     logger.info(f"👥 [PERSONA_V2] [DEBUG] Evidence filter loop completed for {speaker}")
 
                     # Write structured evidence back into attributes when V2 is enabled
@@ -952,76 +998,30 @@ class PersonaFormationFacade:
                             pass
                     return None
 
-        # Helper to strip "I{block_id}|" prefix from speaker_id for matching
-        def _strip_block_prefix(spk: str) -> str:
-            if isinstance(spk, str) and re.match(r"^I\d+\|", spk):
-                return re.sub(r"^I\d+\|", "", spk)
-            return spk
-
-        # Helper to check if a segment matches a speaker's identity
-        def _segment_matches_speaker(seg: Dict[str, Any], speaker_tuples: set) -> bool:
-            """Check if segment matches any of the (speaker_id, document_id) tuples for this speaker."""
-            seg_speaker = _strip_block_prefix(seg.get("speaker_id") or seg.get("speaker") or "")
-            seg_doc_id = seg.get("document_id") or "original_text"
-            return (seg_speaker, seg_doc_id) in speaker_tuples
-
         # Prepare tasks for all speakers
         for speaker, utterances in by_speaker.items():
             # Get the set of (original_speaker_id, document_id) tuples that map to this actual_speaker
             # This handles cases where speaker name was extracted from document_id
             # Using tuples prevents cross-contamination when same speaker_id exists across different documents
-            original_speaker_tuples = speaker_id_mapping.get(speaker, {(speaker, "original_text")})
+            original_speaker_tuples = speaker_id_mapping.get(speaker, {(speaker, DEFAULT_DOCUMENT_ID)})
+            bucket = merge_buckets(
+                segment_buckets[key]
+                for key in original_speaker_tuples
+                if key in segment_buckets
+            )
 
             # Build grouped scoped_text per document and corresponding doc_spans for this speaker
             try:
-                # Collect (doc_id, text) pairs for this speaker preserving order
-                # Match against (speaker_id, document_id) tuples to prevent cross-document contamination
-                speaker_turns = [
-                    (
-                        (seg.get("document_id") or "original_text"),
-                        (seg.get("dialogue") or seg.get("text") or ""),
-                    )
-                    for seg in transcript
-                    if _segment_matches_speaker(seg, original_speaker_tuples)
-                ]
-                order = []
-                buckets: Dict[str, List[str]] = {}
-                for did, txt in speaker_turns:
-                    if did not in buckets:
-                        buckets[did] = []
-                        order.append(did)
-                    if txt:
-                        buckets[did].append(str(txt))
-                pieces: List[str] = []
-                doc_spans: List[Dict[str, Any]] = []  # type: ignore[name-defined]
-                cursor = 0
-                sep = "\n\n"
-                for did in order:
-                    block = "\n".join(buckets.get(did) or [])
-                    start = cursor
-                    end = start + len(block)
-                    doc_spans.append({"document_id": did, "start": start, "end": end})
-                    pieces.append(block)
-                    cursor = end + len(sep)
-                scoped_text = sep.join(pieces)
+                scoped_text, doc_spans = build_scoped_text(bucket.turns)
             except Exception:
                 scoped_text = "\n".join(u for u in utterances if u)
                 doc_spans = []
 
             # Determine per-speaker document_id from transcript segments (mode)
-            doc_ids_for_speaker = [
-                (seg.get("document_id") or "").strip()
-                for seg in transcript
-                if _segment_matches_speaker(seg, original_speaker_tuples)
-            ]
             doc_id = None
-            if doc_ids_for_speaker:
+            if bucket.document_ids:
                 # Choose the most frequent non-empty document_id
-                from collections import Counter
-
-                counts = Counter([d for d in doc_ids_for_speaker if d])
-                if counts:
-                    doc_id = counts.most_common(1)[0][0]
+                doc_id = bucket.document_ids.most_common(1)[0][0]
             if not doc_id:
                 doc_id = (context or {}).get("document_id")
             
@@ -1147,56 +1147,55 @@ class PersonaFormationFacade:
                     except Exception:
                         return False
 
+                # First apply local hygiene to attribute evidence and the evidence map
+                attr_evidence: Dict[str, List[Any]] = {}
                 if isinstance(enhanced_attrs, dict):
                     for fk, fv in list(enhanced_attrs.items()):
                         if isinstance(fv, dict) and isinstance(
                             fv.get("evidence"), list
                         ):
-                            filtered = [
+                            attr_evidence[fk] = [
                                 q
                                 for q in fv["evidence"]
                                 if not _is_bad_evidence_line(q)
                             ]
-                            # Optional LLM gate (fail-open)
-                            try:
-                                approved_idx = (
-                                    await self.evidence_linker.llm_filter_quotes(
-                                        filtered, scope_meta
-                                    )
-                                )
-                                if approved_idx and len(approved_idx) != len(filtered):
-                                    filtered = [
-                                        q
-                                        for i, q in enumerate(filtered)
-                                        if i in approved_idx
-                                    ]
-                            except Exception:
-                                pass
-                            if len(filtered) != len(fv["evidence"]):
-                                nf = dict(fv)
-                                nf["evidence"] = filtered
-                                enhanced_attrs[fk] = nf
+                map_evidence: Dict[str, List[Any]] = {}
                 if isinstance(evidence_map, dict):
                     for field, items in list(evidence_map.items()):
-                        # First apply local hygiene
-                        pre = [
+                        map_evidence[field] = [
                             it
                             for it in items
                             if not _is_bad_evidence_line(it.get("quote", ""))
                         ]
-                        # Optional LLM gate over quotes (fail-open)
-                        try:
-                            quotes = [it.get("quote", "") for it in pre]
-                            approved_idx = await self.evidence_linker.llm_filter_quotes(
-                                quotes, scope_meta
-                            )
-                            if approved_idx and len(approved_idx) != len(pre):
-                                pre = [
-                                    it for i, it in enumerate(pre) if i in approved_idx
-                                ]
-                        except Exception:
-                            pass
-                        evidence_map[field] = pre
+                # Optional LLM gate over both in one call (fail-open)
+                quotes_by_field = {
+                    f"attr:{fk}": filtered for fk, filtered in attr_evidence.items()
+                }
+                quotes_by_field.update(
+                    {
+                        f"map:{field}": [it.get("quote", "") for it in pre]
+                        for field, pre in map_evidence.items()
+                    }
+                )
+                approved_by_field = await self._gate_evidence_fields(
+                    quotes_by_field, scope_meta, scope_meta["speaker"]
+                )
+                for fk, filtered in attr_evidence.items():
+                    approved_idx = approved_by_field.get(f"attr:{fk}")
+                    if approved_idx and len(approved_idx) != len(filtered):
+                        filtered = [
+                            q for i, q in enumerate(filtered) if i in approved_idx
+                        ]
+                    fv = enhanced_attrs[fk]
+                    if len(filtered) != len(fv["evidence"]):
+                        nf = dict(fv)
+                        nf["evidence"] = filtered
+                        enhanced_attrs[fk] = nf
+                for field, pre in map_evidence.items():
+                    approved_idx = approved_by_field.get(f"map:{field}")
+                    if approved_idx and len(approved_idx) != len(pre):
+                        pre = [it for i, it in enumerate(pre) if i in approved_idx]
+                    evidence_map[field] = pre
                 # Write structured evidence back into attributes when V2 is enabled (fallback path)
                 if (
                     self.enable_evidence_v2
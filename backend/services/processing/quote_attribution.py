@@ -0,0 +1,255 @@
+"""
+Multi-pattern quote-to-document attribution.
+
+The NLP processor used to attribute each theme statement by running a
+substring search over every interview's normalized text, which is
+O(statements x interviews x text length). ``QuoteAttributionIndex`` tokenizes
+all documents once and resolves a whole batch of quotes with a single scan
+through an Aho-Corasick automaton built over the quotes' token sequences.
+
+Quotes are resolved in three tiers:
+
+- ``exact``: the full token sequence occurs in a document
+- ``prefix``: the first ``PREFIX_TOKENS`` tokens occur (LLM quotes often drift
+  towards the end)
+- ``fuzzy``: most quote tokens align to the same region of a document,
+  found by voting over a token -> position postings map
+
+Matching is case-insensitive and ignores punctuation and whitespace, and
+matches report character offsets into the original document text.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Number of leading quote tokens used by the prefix tier
+PREFIX_TOKENS = 6
+
+# Minimum share of quote tokens that must align for a fuzzy match
+FUZZY_THRESHOLD = 0.6
+
+# Fuzzy matching needs at least this many quote tokens to be meaningful
+FUZZY_MIN_TOKENS = 3
+
+# Width (in tokens) of the alignment buckets used for fuzzy voting
+_ALIGN_BUCKET = 4
+
+
+def tokenize_with_spans(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Return lowercase word tokens of ``text`` and their character spans."""
+    tokens: List[str] = []
+    spans: List[Tuple[int, int]] = []
+    for m in _TOKEN_RE.finditer(text or ""):
+        tokens.append(m.group().lower())
+        spans.append(m.span())
+    return tokens, spans
+
+
+@dataclass(frozen=True)
+class QuoteMatch:
+    """Location of a quote in one of the indexed documents."""
+
+    document_id: str
+    start_char: int
+    end_char: int
+    match_type: str  # "exact" | "prefix" | "fuzzy"
+    score: float
+
+
+class _TokenAutomaton:
+    """Aho-Corasick automaton over token sequences."""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Optional[int]] = [None]
+        # Nearest state on the fail chain that ends a pattern
+        self.output_link: List[int] = [0]
+        self.lengths: List[int] = []
+
+    def add(self, tokens: Sequence[str]) -> int:
+        """Add a pattern, returning its id (identical patterns share an id)."""
+        state = 0
+        for tok in tokens:
+            nxt = self.goto[state].get(tok)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][tok] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.output_link.append(0)
+            state = nxt
+        if self.output[state] is None:
+            self.output[state] = len(self.lengths)
+            self.lengths.append(len(tokens))
+        return self.output[state]
+
+    def build(self) -> None:
+        """Compute failure and output links breadth-first."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and tok not in self.goto[f]:
+                    f = self.fail[f]
+                fl = self.fail[nxt] = self.goto[f].get(tok, 0)
+                self.output_link[nxt] = fl if self.output[fl] is not None else self.output_link[fl]
+
+    def scan(self, tokens: Sequence[str]) -> Iterable[Tuple[int, int]]:
+        """Yield (end_token_index, pattern_id) for every pattern occurrence."""
+        goto, fail, output, output_link = self.goto, self.fail, self.output, self.output_link
+        state = 0
+        for i, tok in enumerate(tokens):
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            s = state if output[state] is not None else output_link[state]
+            while s:
+                yield i + 1, output[s]
+                s = output_link[s]
+
+
+class QuoteAttributionIndex:
+    """
+    Token index over a set of documents for batch quote attribution.
+
+    Build once per upload (``documents`` is an iterable of
+    ``(document_id, text)``) and call ``resolve_all`` with every quote that
+    needs attributing. Earlier documents win ties, as with the linear scan.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[Tuple[str, str]],
+        fuzzy_threshold: float = FUZZY_THRESHOLD,
+    ):
+        self.document_ids: List[str] = []
+        self._tokens: List[List[str]] = []
+        self._spans: List[List[Tuple[int, int]]] = []
+        for document_id, text in documents:
+            tokens, spans = tokenize_with_spans(text)
+            self.document_ids.append(str(document_id))
+            self._tokens.append(tokens)
+            self._spans.append(spans)
+        self.fuzzy_threshold = fuzzy_threshold
+        self._postings: Optional[Dict[str, List[Tuple[int, int]]]] = None
+
+    def __len__(self) -> int:
+        return len(self.document_ids)
+
+    def _match(
+        self, doc: int, start: int, end: int, match_type: str, score: float
+    ) -> QuoteMatch:
+        spans = self._spans[doc]
+        return QuoteMatch(
+            document_id=self.document_ids[doc],
+            start_char=spans[start][0],
+            end_char=spans[end - 1][1],
+            match_type=match_type,
+            score=round(score, 3),
+        )
+
+    def resolve(self, quote: str, fuzzy: bool = True) -> Optional[QuoteMatch]:
+        """Resolve a single quote (prefer ``resolve_all`` for batches)."""
+        return self.resolve_all([quote], fuzzy=fuzzy)[0]
+
+    def resolve_all(
+        self, quotes: Sequence[str], fuzzy: bool = True
+    ) -> List[Optional[QuoteMatch]]:
+        """
+        Attribute every quote with one pass over the indexed documents.
+
+        Args:
+            quotes: Quote strings to locate
+            fuzzy: Whether to try the fuzzy tier for quotes without an
+                exact or prefix match
+
+        Returns:
+            One ``QuoteMatch`` (or None when unresolved) per input quote
+        """
+        automaton = _TokenAutomaton()
+        quote_tokens: List[List[str]] = []
+        patterns: List[Tuple[Optional[int], Optional[int]]] = []  # (exact, prefix)
+        for quote in quotes:
+            tokens = tokenize_with_spans(quote)[0] if isinstance(quote, str) else []
+            quote_tokens.append(tokens)
+            if not tokens:
+                patterns.append((None, None))
+                continue
+            exact = automaton.add(tokens)
+            prefix = automaton.add(tokens[:PREFIX_TOKENS]) if len(tokens) > PREFIX_TOKENS else None
+            patterns.append((exact, prefix))
+
+        # First occurrence of each pattern in document order: (doc, start, end)
+        hits: Dict[int, Tuple[int, int, int]] = {}
+        remaining = len(automaton.lengths)
+        if remaining:
+            automaton.build()
+            for doc, tokens in enumerate(self._tokens):
+                for end, pid in automaton.scan(tokens):
+                    if pid not in hits:
+                        hits[pid] = (doc, end - automaton.lengths[pid], end)
+                        remaining -= 1
+                if not remaining:
+                    break
+
+        results: List[Optional[QuoteMatch]] = []
+        for tokens, (exact, prefix) in zip(quote_tokens, patterns):
+            match = None
+            if exact is not None and exact in hits:
+                match = self._match(*hits[exact], "exact", 1.0)
+            elif prefix is not None and prefix in hits:
+                match = self._match(*hits[prefix], "prefix", PREFIX_TOKENS / len(tokens))
+            elif fuzzy and len(tokens) >= FUZZY_MIN_TOKENS:
+                match = self._fuzzy_match(tokens)
+            results.append(match)
+        return results
+
+    def _get_postings(self) -> Dict[str, List[Tuple[int, int]]]:
+        if self._postings is None:
+            postings: Dict[str, List[Tuple[int, int]]] = {}
+            for doc, tokens in enumerate(self._tokens):
+                for pos, tok in enumerate(tokens):
+                    postings.setdefault(tok, []).append((doc, pos))
+            self._postings = postings
+        return self._postings
+
+    def _fuzzy_match(self, tokens: List[str]) -> Optional[QuoteMatch]:
+        """
+        Find the document region where most quote tokens align.
+
+        Each occurrence of a quote token votes for the quote start it implies;
+        votes are bucketed so small insertions or deletions still agree.
+        """
+        postings = self._get_postings()
+        votes: Dict[Tuple[int, int], Dict[int, int]] = {}
+        for qpos, tok in enumerate(tokens):
+            for doc, pos in postings.get(tok, ()):
+                bucket = votes.setdefault((doc, (pos - qpos) // _ALIGN_BUCKET), {})
+                bucket.setdefault(qpos, pos)
+
+        best: Optional[Tuple[float, int, int, int]] = None  # (score, doc, start, end)
+        for (doc, b), aligned in votes.items():
+            merged = dict(votes.get((doc, b + 1), {}))
+            merged.update(aligned)
+            score = len(merged) / len(tokens)
+            if score < self.fuzzy_threshold:
+                continue
+            positions = merged.values()
+            candidate = (score, doc, min(positions), max(positions) + 1)
+            if best is None or (score, -doc, -candidate[2]) > (best[0], -best[1], -best[2]):
+                best = candidate
+        if best is None:
+            return None
+        score, doc, start, end = best
+        return self._match(doc, start, end, "fuzzy", score)
@@ -0,0 +1,189 @@
+"""
+Sentence index for deterministic evidence linking.
+
+EvidenceLinkingService V2 used to re-segment the scoped text and re-tokenize
+every sentence for every trait of every persona, and checked each candidate
+against every used span. ``SentenceIndex`` does the segmentation and
+tokenization once per text and keeps an inverted token -> sentence postings
+map, so candidate retrieval only touches sentences that share a token with the
+trait value. ``SpanSet`` replaces the linear collision scan with a sorted
+interval lookup.
+"""
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+import logging
+import re
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\b[\w-]+\b")
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]", flags=re.MULTILINE)
+
+# Number of recently used indexes kept (one per scoped text)
+INDEX_CACHE_SIZE = 16
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens longer than three characters."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 3]
+
+
+def split_sentences(text: str) -> List[Tuple[int, int, str]]:
+    """
+    Segment text into (start, end, sentence) spans.
+
+    Sentences are split on terminal punctuation; texts without any qualifying
+    sentence fall back to line segmentation and finally to the whole text.
+    """
+    if not text:
+        return []
+    spans: List[Tuple[int, int, str]] = []
+    for m in _SENTENCE_RE.finditer(text):
+        s, e = m.span()
+        sent = text[s:e].strip()
+        if len(sent) >= 20:
+            spans.append((s, e, sent))
+    # Newline-aware fallback segmentation for sparse-punctuation texts
+    if not spans:
+        start = 0
+        for line in text.splitlines(keepends=True):
+            raw = (line or "").rstrip("\n")
+            end = start + len(line)
+            if raw and len(raw.strip()) >= 20:
+                spans.append((start, end, raw.strip()))
+            start = end
+    # Final fallback: whole text
+    if not spans:
+        spans.append((0, len(text), (text or "").strip()))
+    return spans
+
+
+class SpanSet:
+    """
+    Set of (start, end) character spans with sorted overlap lookup.
+
+    Supports ``append`` and iteration so it can stand in for the plain
+    ``used_spans`` list the linker used before.
+    """
+
+    def __init__(self, spans: Optional[Iterable[Tuple[int, int]]] = None):
+        self._spans: List[Tuple[int, int]] = []
+        # While spans are pairwise disjoint, ends are sorted along with starts
+        # and only the nearest preceding span can overlap a query.
+        self._disjoint = True
+        for span in spans or ():
+            self.append(span)
+
+    def append(self, span: Tuple[int, int]) -> None:
+        span = (span[0], span[1])
+        if self._disjoint and self.overlaps(span):
+            self._disjoint = False
+        insort(self._spans, span)
+
+    add = append
+
+    def overlaps(self, span: Tuple[int, int]) -> bool:
+        """Return True if ``span`` overlaps any stored span."""
+        s, e = span
+        idx = bisect_left(self._spans, (e,))
+        if self._disjoint:
+            return idx > 0 and self._spans[idx - 1][1] > s
+        return any(u[1] > s for u in self._spans[:idx])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+class SentenceIndex:
+    """
+    Sentences of one text with precomputed token sets and postings.
+
+    Build once per scoped text (see ``get_sentence_index``) and share it
+    across all personas and traits linked against that text.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.sentences: List[Tuple[int, int, str]] = split_sentences(text)
+        self.token_sets: List[FrozenSet[str]] = []
+        self.postings: Dict[str, List[int]] = {}
+        for sid, (_s, _e, sent) in enumerate(self.sentences):
+            tokens = frozenset(tokenize(sent))
+            self.token_sets.append(tokens)
+            for tok in tokens:
+                self.postings.setdefault(tok, []).append(sid)
+        self._flags: Dict[str, List[Optional[bool]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def overlap_candidates(self, query: str) -> List[Tuple[int, float]]:
+        """
+        Return (sentence_id, jaccard) for sentences with adequate token overlap.
+
+        Uses the same acceptance rule as ``EvidenceLinkingService._overlap_ok``
+        (at least two shared tokens or Jaccard >= 0.25). Results are in
+        sentence order.
+        """
+        q_tokens = set(tokenize(query))
+        if not q_tokens:
+            return []
+        shared: Dict[int, int] = {}
+        for tok in q_tokens:
+            for sid in self.postings.get(tok, ()):
+                shared[sid] = shared.get(sid, 0) + 1
+
+        q_len = len(q_tokens)
+        out: List[Tuple[int, float]] = []
+        for sid in sorted(shared):
+            inter = shared[sid]
+            jacc = inter / max(1, q_len + len(self.token_sets[sid]) - inter)
+            if inter >= 2 or jacc >= 0.25:
+                out.append((sid, jacc))
+        return out
+
+    def flag(self, name: str, sid: int, predicate: Callable[[str], bool]) -> bool:
+        """Evaluate ``predicate`` on a sentence once and cache it under ``name``."""
+        cached = self._flags.get(name)
+        if cached is None:
+            cached = self._flags[name] = [None] * len(self.sentences)
+        value = cached[sid]
+        if value is None:
+            value = cached[sid] = bool(predicate(self.sentences[sid][2]))
+        return value
+
+
+_index_cache: "OrderedDict[int, SentenceIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_sentence_index(text: str) -> SentenceIndex:
+    """Return a shared ``SentenceIndex`` for ``text``, building it on first use."""
+    key = hash(text)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None and (index.text is text or index.text == text):
+            _index_cache.move_to_end(key)
+            return index
+
+    index = SentenceIndex(text)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def clear_sentence_index_cache() -> None:
+    """Drop all cached indexes."""
+    with _index_cache_lock:
+        _index_cache.clear()
@@ -3,12 +3,18 @@ Transcript structuring service for processing raw interview transcripts.
 
 This service uses an LLM to convert raw interview transcripts into a structured
 JSON format with speaker identification and role inference.
+
+Clean "Speaker: text" transcripts are parsed by rules without an LLM call.
+Other transcripts are split at interview markers and turn boundaries, and
+the chunks are structured in parallel and stitched back together in order.
 """
 
+import asyncio
 import json
 import logging
 import re
-from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from pydantic import ValidationError
 
@@ -27,20 +33,71 @@ from backend.services.llm.prompts.tasks.transcript_structuring import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Largest piece of an interview sent to the LLM in one structuring call
+MAX_CHUNK_CHARS = 12000
+MAX_PARALLEL_CHUNKS = 4
+# Non-dialogue lines tolerated before the first speaker turn of an interview
+MAX_PREAMBLE_LINES = 8
+MAX_SPEAKERS_PER_INTERVIEW = 6
+
+# "Name: text", optionally prefixed with a timestamp
+SPEAKER_LINE_PATTERN = re.compile(
+    r"^(?:\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*)?([A-Za-z][\w .'()&/-]{0,50}?)\s*[:：](?:\s+(.*))?$"
+)
+TIMESTAMP_LINE_PATTERN = re.compile(r"^\[?\d{1,2}:\d{2}(?::\d{2})?\]?$")
+SEPARATOR_LINE_PATTERN = re.compile(r"^[=\-_*#~]{3,}$")
+# Labels that introduce header fields rather than speaker turns
+METADATA_LABELS = {
+    "date",
+    "time",
+    "attendees",
+    "participants",
+    "location",
+    "duration",
+    "subject",
+    "title",
+    "topic",
+    "notes",
+    "stakeholder category",
+    "company",
+    "source",
+    "recording",
+}
+
+
+@dataclass
+class TranscriptChunk:
+    """A piece of a transcript structured by one LLM call."""
+
+    text: str
+    document_id: Optional[str] = None
+    # Speaker labels seen across the whole interview, for consistent IDs
+    speakers: List[str] = field(default_factory=list)
+    partial: bool = False
+
 
 class TranscriptStructuringService:
     """
     Service for structuring raw interview transcripts using LLM.
     """
 
-    def __init__(self, llm_service: ILLMService):
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        max_chunk_chars: int = MAX_CHUNK_CHARS,
+        max_parallel_chunks: int = MAX_PARALLEL_CHUNKS,
+    ):
         """
         Initialize the transcript structuring service.
 
         Args:
             llm_service: LLM service for transcript structuring
+            max_chunk_chars: Largest interview piece sent in one LLM call
+            max_parallel_chunks: Concurrent LLM calls per transcript
         """
         self.llm_service = llm_service
+        self.max_chunk_chars = max_chunk_chars
+        self.max_parallel_chunks = max_parallel_chunks
         logger.info("Initialized TranscriptStructuringService")
 
     def _detect_content_type(self, raw_text: str) -> Dict[str, Any]:
@@ -165,99 +222,32 @@ class TranscriptStructuringService:
             return []
 
         try:
-            # Get the prompt for transcript structuring
-            prompt = TranscriptStructuringPrompts.get_prompt()
-
-            # Log the length of the raw text
             logger.info(f"Structuring transcript with {len(raw_text)} characters")
 
-            # Detect content type based on the actual content
-            content_info = self._detect_content_type(raw_text)
-
-            # Add special instructions based on content type
-            if content_info["is_problem_focused"]:
+            # Clean "Speaker: text" transcripts are parsed without an LLM call
+            deterministic = self._structure_deterministically(raw_text)
+            if deterministic:
                 logger.info(
-                    "Detected problem-focused interview content. Using special handling."
-                )
-                prompt = (
-                    prompt
-                    + "\n\nIMPORTANT: This appears to be a problem-focused interview. Focus on accurately structuring the dialogue without interpreting the content. Ensure the output is a valid JSON array with proper speaker_id, role, and dialogue fields."
+                    f"Structured transcript deterministically into {len(deterministic)} segments"
                 )
+                return self._post_process_segments(deterministic, raw_text)
 
-            if content_info["has_timestamps"]:
+            chunks = self._split_into_chunks(raw_text)
+            if len(chunks) > 1:
                 logger.info(
-                    "Detected timestamps in content. Adding special handling instructions."
+                    f"Structuring transcript in {len(chunks)} chunks "
+                    f"(up to {self.max_parallel_chunks} in parallel)"
                 )
-                prompt = (
-                    prompt
-                    + "\n\nNOTE: This transcript contains timestamps. Remember to exclude timestamps from the speaker_id and dialogue fields."
+            semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+            chunk_results = await asyncio.gather(
+                *(
+                    self._structure_chunk(chunk, semaphore, stitched=len(chunks) > 1)
+                    for chunk in chunks
                 )
-
-            if content_info["content_complexity"] == "high":
-                logger.info(
-                    "Detected high complexity content. Adding special handling instructions."
-                )
-                prompt = (
-                    prompt
-                    + "\n\nNOTE: This is a complex transcript. Pay special attention to maintaining the correct sequence of dialogue and ensuring all speakers are consistently identified."
-                )
-
-            if content_info["is_multi_interview"]:
-                logger.info(
-                    f"Detected multi-interview file with {content_info['interview_count']} interviews. Adding special handling instructions."
-                )
-                prompt = (
-                    prompt
-                    + f"\n\nCRITICAL: This file contains {content_info['interview_count']} SEPARATE INTERVIEWS. "
-                    + "Each interview section starts with a '--- START OF FILE ... ---' marker that contains the interviewee's name in parentheses. "
-                    + "For example: '--- START OF FILE Research Session (John) - 2025_01_15 ---' means the interviewee is 'John'. "
-                    + "You MUST extract the actual name from these markers and use it as the speaker_id for all dialogue in that section. "
-                    + "The interviewer/researcher should be labeled as 'Researcher' or their actual name from the transcript. "
-                    + "DO NOT use generic labels like 'Interviewee' or archetype names like 'Operational_Account_Managers'. "
-                    + "Each individual person should have their ACTUAL NAME as the speaker_id."
-                )
-
-            # Create a response schema using the TranscriptSegment model
-            # This helps Gemini understand the expected output structure
-            response_schema = {
-                "type": "array",
-                "items": TranscriptSegment.model_json_schema(),
-            }
-
-            logger.info(
-                f"Using response schema for transcript structuring: {response_schema}"
-            )
-
-            # Call LLM to structure the transcript with enhanced JSON configuration
-            llm_response = await self.llm_service.analyze(
-                {
-                    "task": "transcript_structuring",
-                    "text": raw_text,
-                    "prompt": prompt,
-                    "enforce_json": True,  # Crucial for Gemini to output JSON
-                    "temperature": 0.0,  # For deterministic structuring
-                    "response_mime_type": "application/json",  # Explicitly enforce JSON output
-                    "response_schema": response_schema,  # Provide the schema for structured output
-                    "content_info": content_info,  # Pass content info instead of relying on filename
-                }
             )
-
-            # Parse the LLM response
-            structured_transcript = self._parse_llm_response(llm_response)
-
-            # Check if the response indicates a timeout or API error
-            if self._is_timeout_or_api_error(llm_response):
-                logger.warning(
-                    "LLM API timeout or error detected. Using manual extraction fallback."
-                )
-                structured_transcript = self._extract_transcript_manually(raw_text)
-
-            # If problem-focused content and still no valid structure, try fallback method
-            elif content_info["is_problem_focused"] and not structured_transcript:
-                logger.warning(
-                    "Problem-focused content failed to structure. Trying fallback method."
-                )
-                structured_transcript = self._extract_transcript_manually(raw_text)
+            structured_transcript = [
+                segment for segments in chunk_results for segment in segments
+            ]
 
             # Validate the structured transcript using Pydantic
             validated_segments = []
@@ -284,23 +274,9 @@ class TranscriptStructuringService:
                                 f"Could not fix segment even after role correction"
                             )
 
-            structured_transcript = validated_segments
-            # Normalize roles consistently across the transcript (infer interviewer vs interviewee)
-            try:
-                structured_transcript = self._normalize_roles(structured_transcript)
-            except Exception:
-                logger.warning(
-                    "Role normalization failed; continuing with original roles"
-                )
-
-            # Post-process: Assign document_ids based on "--- START OF FILE ---" markers in raw_text
-            # This ensures per-interview scoping even when LLM structuring doesn't preserve it
-            try:
-                structured_transcript = self._assign_document_ids_from_markers(
-                    structured_transcript, raw_text
-                )
-            except Exception as e:
-                logger.warning(f"Document ID assignment failed: {e}")
+            structured_transcript = self._post_process_segments(
+                validated_segments, raw_text
+            )
 
             if structured_transcript:
                 logger.info(
@@ -369,6 +345,360 @@ class TranscriptStructuringService:
             logger.error(f"Error structuring transcript: {str(e)}", exc_info=True)
             return []
 
+    def _post_process_segments(
+        self, segments: List[Dict[str, Any]], raw_text: str
+    ) -> List[Dict[str, Any]]:
+        """Normalize roles and assign document IDs, whichever path structured the text."""
+        # Normalize roles consistently across the transcript (infer interviewer vs interviewee)
+        try:
+            segments = self._normalize_roles(segments)
+        except Exception:
+            logger.warning("Role normalization failed; continuing with original roles")
+
+        # Assign document_ids based on "--- START OF FILE ---" markers in raw_text
+        # This ensures per-interview scoping even when structuring doesn't preserve it
+        try:
+            segments = self._assign_document_ids_from_markers(segments, raw_text)
+        except Exception as e:
+            logger.warning(f"Document ID assignment failed: {e}")
+        return segments
+
+    def _build_prompt(self, content_info: Dict[str, Any], chunk: TranscriptChunk) -> str:
+        """Transcript structuring prompt with content-specific instructions."""
+        prompt = TranscriptStructuringPrompts.get_prompt()
+
+        if content_info["is_problem_focused"]:
+            logger.info(
+                "Detected problem-focused interview content. Using special handling."
+            )
+            prompt = (
+                prompt
+                + "\n\nIMPORTANT: This appears to be a problem-focused interview. Focus on accurately structuring the dialogue without interpreting the content. Ensure the output is a valid JSON array with proper speaker_id, role, and dialogue fields."
+            )
+
+        if content_info["has_timestamps"]:
+            logger.info(
+                "Detected timestamps in content. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + "\n\nNOTE: This transcript contains timestamps. Remember to exclude timestamps from the speaker_id and dialogue fields."
+            )
+
+        if content_info["content_complexity"] == "high":
+            logger.info(
+                "Detected high complexity content. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + "\n\nNOTE: This is a complex transcript. Pay special attention to maintaining the correct sequence of dialogue and ensuring all speakers are consistently identified."
+            )
+
+        if content_info["is_multi_interview"] and content_info["interview_count"] > 1:
+            logger.info(
+                f"Detected multi-interview file with {content_info['interview_count']} interviews. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + f"\n\nCRITICAL: This file contains {content_info['interview_count']} SEPARATE INTERVIEWS. "
+                + "Each interview section starts with a '--- START OF FILE ... ---' marker that contains the interviewee's name in parentheses. "
+                + "For example: '--- START OF FILE Research Session (John) - 2025_01_15 ---' means the interviewee is 'John'. "
+                + "You MUST extract the actual name from these markers and use it as the speaker_id for all dialogue in that section. "
+                + "The interviewer/researcher should be labeled as 'Researcher' or their actual name from the transcript. "
+                + "DO NOT use generic labels like 'Interviewee' or archetype names like 'Operational_Account_Managers'. "
+                + "Each individual person should have their ACTUAL NAME as the speaker_id."
+            )
+        elif content_info["is_multi_interview"]:
+            prompt = (
+                prompt
+                + "\n\nCRITICAL: This is one interview from a multi-interview file. "
+                + "It starts with a marker such as '--- START OF FILE Research Session (John) - 2025_01_15 ---' that contains the interviewee's name in parentheses. "
+                + "Use that ACTUAL NAME as the interviewee's speaker_id. "
+                + "The interviewer/researcher should be labeled as 'Researcher' or their actual name from the transcript."
+            )
+
+        if chunk.partial and chunk.speakers:
+            prompt = (
+                prompt
+                + "\n\nNOTE: This text is one part of a longer interview. "
+                + f"Use exactly these speaker_id values where they apply: {', '.join(chunk.speakers)}."
+            )
+
+        return prompt
+
+    async def _structure_chunk(
+        self, chunk: TranscriptChunk, semaphore: asyncio.Semaphore, stitched: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Structure one chunk with the LLM, falling back to rule-based extraction.
+
+        Args:
+            chunk: Transcript chunk
+            semaphore: Limits concurrent LLM calls
+            stitched: Whether the chunk is combined with others afterwards
+
+        Returns:
+            Unvalidated transcript segments of the chunk
+        """
+        content_info = self._detect_content_type(chunk.text)
+        prompt = self._build_prompt(content_info, chunk)
+
+        # Create a response schema using the TranscriptSegment model
+        # This helps Gemini understand the expected output structure
+        response_schema = {
+            "type": "array",
+            "items": TranscriptSegment.model_json_schema(),
+        }
+
+        try:
+            async with semaphore:
+                # Call LLM to structure the transcript with enhanced JSON configuration
+                llm_response = await self.llm_service.analyze(
+                    {
+                        "task": "transcript_structuring",
+                        "text": chunk.text,
+                        "prompt": prompt,
+                        "enforce_json": True,  # Crucial for Gemini to output JSON
+                        "temperature": 0.0,  # For deterministic structuring
+                        "response_mime_type": "application/json",  # Explicitly enforce JSON output
+                        "response_schema": response_schema,  # Provide the schema for structured output
+                        "content_info": content_info,  # Pass content info instead of relying on filename
+                    }
+                )
+        except Exception as e:
+            logger.error(f"LLM structuring of transcript chunk failed: {str(e)}")
+            segments = self._extract_transcript_manually(chunk.text)
+        else:
+            # Parse the LLM response
+            segments = self._parse_llm_response(llm_response)
+
+            # Check if the response indicates a timeout or API error
+            if self._is_timeout_or_api_error(llm_response):
+                logger.warning(
+                    "LLM API timeout or error detected. Using manual extraction fallback."
+                )
+                segments = self._extract_transcript_manually(chunk.text)
+
+            # If problem-focused content and still no valid structure, try fallback method
+            elif content_info["is_problem_focused"] and not segments:
+                logger.warning(
+                    "Problem-focused content failed to structure. Trying fallback method."
+                )
+                segments = self._extract_transcript_manually(chunk.text)
+
+        if not stitched:
+            return segments
+
+        # Stitch: the chunk's interview decides the document, and speaker IDs
+        # are mapped onto the labels used across the whole interview
+        canonical = {self._speaker_key(name): name for name in chunk.speakers}
+        for segment in segments:
+            if not isinstance(segment, dict):
+                continue
+            speaker_id = re.sub(r"^I\d+\|", "", str(segment.get("speaker_id") or ""))
+            segment["speaker_id"] = canonical.get(self._speaker_key(speaker_id), speaker_id)
+            if chunk.document_id:
+                segment["document_id"] = chunk.document_id
+        return segments
+
+    @staticmethod
+    def _speaker_key(name: str) -> str:
+        return " ".join(name.split()).casefold()
+
+    def _find_interview_markers(self, raw_text: str) -> List[Dict[str, Any]]:
+        """
+        Locate interview markers in a multi-interview file.
+
+        Returns:
+            Markers sorted by position with ``session_name``, ``marker_start``
+            and ``start_pos`` (where the interview content begins)
+        """
+        # Try multiple patterns for different file formats
+        marker_patterns = [
+            # Pattern 1: "--- START OF FILE {session_name} ---"
+            (re.compile(r"---\s*START\s+OF\s+FILE\s+(.*?)\s*---", re.IGNORECASE), 1),
+            # Pattern 2: "INTERVIEW N OF M" with metadata block
+            (re.compile(r"INTERVIEW\s+(\d+)\s+OF\s+\d+\s*\n=+", re.IGNORECASE), 1),
+        ]
+
+        markers = []
+        for pattern, group_idx in marker_patterns:
+            for m in pattern.finditer(raw_text):
+                session_name = m.group(group_idx).strip()
+                # For "INTERVIEW N OF M", create a more descriptive name
+                if "INTERVIEW" in pattern.pattern.upper():
+                    # Try to extract stakeholder category from metadata
+                    metadata_section = raw_text[m.end():m.end()+1000]
+                    cat_match = re.search(r"Stakeholder Category:\s*(.+?)(?:\n|$)", metadata_section)
+                    if cat_match:
+                        session_name = f"Interview {session_name} - {cat_match.group(1).strip()}"
+                    else:
+                        session_name = f"Interview {session_name}"
+                markers.append({
+                    "session_name": session_name,
+                    "marker_start": m.start(),
+                    "start_pos": m.end(),  # Content starts after marker
+                })
+            if markers:
+                break  # Use first pattern that matches
+
+        markers.sort(key=lambda x: x["start_pos"])
+        return markers
+
+    def _split_interviews(self, raw_text: str) -> List[Tuple[Optional[str], str, str]]:
+        """
+        Split a transcript at interview markers.
+
+        Returns:
+            ``(document_id, marker_text, body)`` per interview. Text before the
+            first marker is returned with ``document_id`` None when it contains
+            speaker turns.
+        """
+        markers = self._find_interview_markers(raw_text)
+        if not markers:
+            return [(None, "", raw_text)]
+
+        interviews: List[Tuple[Optional[str], str, str]] = []
+        preamble = raw_text[: markers[0]["marker_start"]]
+        if any(
+            self._speaker_turn(line.strip()) for line in preamble.split("\n")
+        ):
+            interviews.append((None, "", preamble))
+        for i, marker in enumerate(markers):
+            end = markers[i + 1]["marker_start"] if i + 1 < len(markers) else len(raw_text)
+            interviews.append(
+                (
+                    marker["session_name"],
+                    raw_text[marker["marker_start"] : marker["start_pos"]],
+                    raw_text[marker["start_pos"] : end],
+                )
+            )
+        return interviews
+
+    def _speaker_turn(self, line: str) -> Optional[Tuple[str, str]]:
+        """``(speaker, text)`` when the line opens a speaker turn."""
+        match = SPEAKER_LINE_PATTERN.match(line)
+        if not match:
+            return None
+        speaker = match.group(1).strip()
+        if speaker.lower() in METADATA_LABELS or len(speaker.split()) > 4:
+            return None
+        return speaker, (match.group(2) or "").strip()
+
+    def _parse_speaker_turns(self, body: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Parse an interview made only of ``Speaker: text`` turns.
+
+        Lines without a label continue the previous turn. Returns None when
+        the text does not look like a clean speaker-labelled transcript.
+        """
+        turns: List[List[str]] = []
+        preamble = 0
+        for line in body.split("\n"):
+            stripped = line.strip()
+            if (
+                not stripped
+                or SEPARATOR_LINE_PATTERN.match(stripped)
+                or TIMESTAMP_LINE_PATTERN.match(stripped)
+            ):
+                continue
+            turn = self._speaker_turn(stripped)
+            if turn:
+                turns.append([turn[0], turn[1]])
+            elif not turns:
+                # Header fields and titles before the conversation starts
+                preamble += 1
+                if preamble > MAX_PREAMBLE_LINES:
+                    return None
+            elif SPEAKER_LINE_PATTERN.match(stripped):
+                # A header field in the middle of the dialogue
+                return None
+            else:
+                turns[-1][1] = f"{turns[-1][1]}\n{stripped}".strip()
+
+        if len(turns) < 2:
+            return None
+        counts: Dict[str, int] = {}
+        for speaker, _ in turns:
+            counts[speaker] = counts.get(speaker, 0) + 1
+        if len(counts) > MAX_SPEAKERS_PER_INTERVIEW:
+            return None
+        # With more than two labels, one-off labels are usually not speakers
+        if len(counts) > 2 and min(counts.values()) < 2:
+            return None
+        return [(speaker, text) for speaker, text in turns]
+
+    def _structure_deterministically(self, raw_text: str) -> List[Dict[str, Any]]:
+        """
+        Structure a clean speaker-labelled transcript without the LLM.
+
+        Returns:
+            Segments in the same shape as the manual extraction, or an empty
+            list when any interview is not cleanly speaker-labelled
+        """
+        if raw_text.strip()[:1] in ("{", "["):
+            return []
+
+        segments: List[Dict[str, Any]] = []
+        for block_id, (document_id, _marker, body) in enumerate(
+            self._split_interviews(raw_text), start=1
+        ):
+            turns = self._parse_speaker_turns(body)
+            if turns is None:
+                return []
+            segments.extend(self._segments_from_turns(block_id, turns, document_id or ""))
+        return segments
+
+    def _split_turn_safe(self, text: str, max_chars: int) -> List[str]:
+        """Split text into pieces of about ``max_chars`` at turn or paragraph boundaries."""
+        if len(text) <= max_chars:
+            return [text]
+
+        pieces: List[str] = []
+        current: List[str] = []
+        size = 0
+        previous_blank = False
+        for line in text.split("\n"):
+            boundary = previous_blank or self._speaker_turn(line.strip()) is not None
+            # Cut at a boundary once full; cut anywhere if no boundary shows up
+            if current and (
+                (boundary and size + len(line) > max_chars) or size > 2 * max_chars
+            ):
+                pieces.append("\n".join(current))
+                current, size = [], 0
+            current.append(line)
+            size += len(line) + 1
+            previous_blank = not line.strip()
+        if current:
+            pieces.append("\n".join(current))
+        return [piece for piece in pieces if piece.strip()]
+
+    def _split_into_chunks(self, raw_text: str) -> List[TranscriptChunk]:
+        """Split a transcript into interview- and turn-aligned chunks."""
+        interviews = self._split_interviews(raw_text)
+        if len(interviews) == 1 and len(raw_text) <= self.max_chunk_chars:
+            return [TranscriptChunk(text=raw_text, document_id=interviews[0][0])]
+
+        chunks: List[TranscriptChunk] = []
+        for document_id, marker, body in interviews:
+            speakers: List[str] = []
+            for line in body.split("\n"):
+                turn = self._speaker_turn(line.strip())
+                if turn and turn[0] not in speakers:
+                    speakers.append(turn[0])
+            pieces = self._split_turn_safe(body, self.max_chunk_chars)
+            for piece in pieces:
+                chunks.append(
+                    TranscriptChunk(
+                        # Keep the marker on every piece so the interviewee's name is known
+                        text=f"{marker}\n{piece}" if marker else piece,
+                        document_id=document_id,
+                        speakers=speakers[:MAX_SPEAKERS_PER_INTERVIEW],
+                        partial=len(pieces) > 1,
+                    )
+                )
+        return chunks
+
     def _is_timeout_or_api_error(
         self, llm_response: Union[str, Dict[str, Any], List[Dict[str, Any]]]
     ) -> bool:
@@ -438,34 +768,7 @@ class TranscriptStructuringService:
         if not segments or not raw_text:
             return segments
 
-        # Try multiple patterns for different file formats
-        marker_patterns = [
-            # Pattern 1: "--- START OF FILE {session_name} ---"
-            (re.compile(r"---\s*START\s+OF\s+FILE\s+(.*?)\s*---", re.IGNORECASE), 1),
-            # Pattern 2: "INTERVIEW N OF M" with metadata block
-            (re.compile(r"INTERVIEW\s+(\d+)\s+OF\s+\d+\s*\n=+", re.IGNORECASE), 1),
-        ]
-
-        # Find all markers and their positions
-        markers = []
-        for pattern, group_idx in marker_patterns:
-            for m in pattern.finditer(raw_text):
-                session_name = m.group(group_idx).strip()
-                # For "INTERVIEW N OF M", create a more descriptive name
-                if "INTERVIEW" in pattern.pattern.upper():
-                    # Try to extract stakeholder category from metadata
-                    metadata_section = raw_text[m.end():m.end()+1000]
-                    cat_match = re.search(r"Stakeholder Category:\s*(.+?)(?:\n|$)", metadata_section)
-                    if cat_match:
-                        session_name = f"Interview {session_name} - {cat_match.group(1).strip()}"
-                    else:
-                        session_name = f"Interview {session_name}"
-                markers.append({
-                    "session_name": session_name,
-                    "start_pos": m.end(),  # Content starts after marker
-                })
-            if markers:
-                break  # Use first pattern that matches
+        markers = self._find_interview_markers(raw_text)
 
         if not markers:
             logger.debug("No interview markers found in raw text")
@@ -473,9 +776,6 @@ class TranscriptStructuringService:
 
         logger.info(f"Found {len(markers)} interview session markers")
 
-        # Sort markers by position
-        markers.sort(key=lambda x: x["start_pos"])
-
         # Calculate end positions (start of next marker or end of text)
         for i, marker in enumerate(markers):
             if i + 1 < len(markers):
@@ -1174,121 +1474,11 @@ class TranscriptStructuringService:
 
                 total_turns += len(matches)
 
-                # Analyze speakers for this block to determine interviewer
-                speakers: dict[str, dict[str, float]] = {}
-                for speaker, dialogue in matches:
-                    speaker_clean = speaker.strip()
-                    speaker_clean = re.sub(
-                        r"\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*", "", speaker_clean
+                structured_data.extend(
+                    self._segments_from_turns(
+                        block_id, matches, session_name, min_dialogue_chars=10
                     )
-                    if speaker_clean not in speakers:
-                        speakers[speaker_clean] = {
-                            "count": 0,
-                            "avg_length": 0.0,
-                            "question_marks": 0,
-                        }
-                    speakers[speaker_clean]["count"] += 1
-                    speakers[speaker_clean]["avg_length"] += len(dialogue)
-                    speakers[speaker_clean]["question_marks"] += dialogue.count("?")
-
-                for spk in speakers:
-                    if speakers[spk]["count"]:
-                        speakers[spk]["avg_length"] /= speakers[spk]["count"]
-
-                # Prefer explicit researcher/interviewer labels in this block
-                explicit = [
-                    spk
-                    for spk in speakers.keys()
-                    if re.search(r"(?i)^(researcher|interviewer)$", spk.strip())
-                ]
-                interviewer = explicit[0] if explicit else None
-
-                # CRITICAL FIX: If there's only ONE unique speaker in this block, do NOT
-                # mark them as interviewer. This handles "merged dialogue" transcripts where
-                # the transcription tool (e.g., "Notes by Gemini") combined both interviewer
-                # questions and interviewee answers under a single speaker label.
-                # In such cases, the single speaker is clearly the interviewee (subject of the
-                # interview session), not the interviewer.
-                if len(speakers) == 1 and not interviewer:
-                    # Single speaker block with no explicit interviewer label
-                    # Treat them as the interviewee, not the interviewer
-                    logger.info(
-                        f"Block {block_id}: Single speaker '{list(speakers.keys())[0]}' detected - "
-                        f"treating as Interviewee (merged dialogue format)"
-                    )
-                    interviewer = None  # No interviewer in this block
-                else:
-                    # Multiple speakers - use heuristics to identify interviewer
-                    # Else by question ratio
-                    if not interviewer:
-                        best_spk, best_ratio = None, -1.0
-                        for spk, d in speakers.items():
-                            ratio = (
-                                (d["question_marks"] / d["count"]) if d["count"] else 0.0
-                            )
-                            if ratio > best_ratio:
-                                best_ratio = ratio
-                                best_spk = spk
-                        interviewer = best_spk
-
-                    # Else shortest average length
-                    if not interviewer and speakers:
-                        interviewer = min(
-                            speakers.items(), key=lambda kv: kv[1]["avg_length"]
-                        )[0]
-
-                    logger.info(
-                        f"Block {block_id}: identified '{interviewer}' as likely interviewer"
-                    )
-
-                for speaker, dialogue in matches:
-                    speaker_id = speaker.strip()
-                    speaker_id = re.sub(
-                        r"\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*", "", speaker_id
-                    )
-                    dialogue_text = dialogue.strip()
-
-                    # Normalize explicit labels and infer role
-                    spk_norm = speaker_id.strip()
-                    if re.search(r"(?i)^(researcher|interviewer)$", spk_norm):
-                        role = "Interviewer"
-                    elif interviewer and spk_norm == interviewer:
-                        role = "Interviewer"
-                    else:
-                        role = "Interviewee"
-
-                    # Ensure uniqueness across blocks
-                    unique_speaker_id = f"I{block_id}|{spk_norm}"
-
-                    # Use session_name as document_id if available (e.g., "Research Session (John)")
-                    # This preserves the interviewee name for downstream persona name extraction
-                    doc_id = session_name if session_name else f"interview_{block_id}"
-
-                    # Skip timestamp-only segments (e.g., "00" with dialogue "00:00")
-                    # These are artifacts of parsing timestamp lines like "00:00:00"
-                    if re.match(r'^\d+$', spk_norm):
-                        # Speaker is just digits (e.g., "00" from "00:00:00")
-                        continue
-                    if re.match(r'^\d{2}:\d{2}(:\d{2})?$', dialogue_text.strip()):
-                        # Dialogue is just a timestamp fragment
-                        continue
-
-                    # Skip very short dialogues that are likely parsing artifacts
-                    if len(dialogue_text.strip()) < 10:
-                        continue
-
-                    segment_data = {
-                        "speaker_id": unique_speaker_id,
-                        "role": role,
-                        "dialogue": dialogue_text,
-                        # Assign per-interview document id - preserves session name for name extraction
-                        "document_id": doc_id,
-                    }
-                    try:
-                        validated_segment = TranscriptSegment(**segment_data)
-                        structured_data.append(validated_segment.model_dump())
-                    except ValidationError:
-                        structured_data.append(segment_data)
+                )
 
             if total_turns:
                 logger.info(
@@ -1316,6 +1506,140 @@ class TranscriptStructuringService:
 
         return structured_data
 
+    def _segments_from_turns(
+        self,
+        block_id: int,
+        matches: List[Tuple[str, str]],
+        session_name: str = "",
+        min_dialogue_chars: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build validated segments from the ``(speaker, dialogue)`` turns of one interview.
+
+        Infers the interviewer of the block and prefixes speaker IDs with the
+        block number so they stay unique across interviews. Turns shorter than
+        ``min_dialogue_chars`` are dropped; the regex-based manual extraction
+        uses this to discard parsing artifacts, while cleanly parsed turns keep
+        short answers such as "Yes.".
+        """
+        segments: List[Dict[str, Any]] = []
+        # Analyze speakers for this block to determine interviewer
+        speakers: dict[str, dict[str, float]] = {}
+        for speaker, dialogue in matches:
+            speaker_clean = speaker.strip()
+            speaker_clean = re.sub(
+                r"\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*", "", speaker_clean
+            )
+            if speaker_clean not in speakers:
+                speakers[speaker_clean] = {
+                    "count": 0,
+                    "avg_length": 0.0,
+                    "question_marks": 0,
+                }
+            speakers[speaker_clean]["count"] += 1
+            speakers[speaker_clean]["avg_length"] += len(dialogue)
+            speakers[speaker_clean]["question_marks"] += dialogue.count("?")
+
+        for spk in speakers:
+            if speakers[spk]["count"]:
+                speakers[spk]["avg_length"] /= speakers[spk]["count"]
+
+        # Prefer explicit researcher/interviewer labels in this block
+        explicit = [
+            spk
+            for spk in speakers.keys()
+            if re.search(r"(?i)^(researcher|interviewer)$", spk.strip())
+        ]
+        interviewer = explicit[0] if explicit else None
+
+        # CRITICAL FIX: If there's only ONE unique speaker in this block, do NOT
+        # mark them as interviewer. This handles "merged dialogue" transcripts where
+        # the transcription tool (e.g., "Notes by Gemini") combined both interviewer
+        # questions and interviewee answers under a single speaker label.
+        # In such cases, the single speaker is clearly the interviewee (subject of the
+        # interview session), not the interviewer.
+        if len(speakers) == 1 and not interviewer:
+            # Single speaker block with no explicit interviewer label
+            # Treat them as the interviewee, not the interviewer
+            logger.info(
+                f"Block {block_id}: Single speaker '{list(speakers.keys())[0]}' detected - "
+                f"treating as Interviewee (merged dialogue format)"
+            )
+            interviewer = None  # No interviewer in this block
+        else:
+            # Multiple speakers - use heuristics to identify interviewer
+            # Else by question ratio
+            if not interviewer:
+                best_spk, best_ratio = None, -1.0
+                for spk, d in speakers.items():
+                    ratio = (
+                        (d["question_marks"] / d["count"]) if d["count"] else 0.0
+                    )
+                    if ratio > best_ratio:
+                        best_ratio = ratio
+                        best_spk = spk
+                interviewer = best_spk
+
+            # Else shortest average length
+            if not interviewer and speakers:
+                interviewer = min(
+                    speakers.items(), key=lambda kv: kv[1]["avg_length"]
+                )[0]
+
+            logger.info(
+                f"Block {block_id}: identified '{interviewer}' as likely interviewer"
+            )
+
+        for speaker, dialogue in matches:
+            speaker_id = speaker.strip()
+            speaker_id = re.sub(
+                r"\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*", "", speaker_id
+            )
+            dialogue_text = dialogue.strip()
+
+            # Normalize explicit labels and infer role
+            spk_norm = speaker_id.strip()
+            if re.search(r"(?i)^(researcher|interviewer)$", spk_norm):
+                role = "Interviewer"
+            elif interviewer and spk_norm == interviewer:
+                role = "Interviewer"
+            else:
+                role = "Interviewee"
+
+            # Ensure uniqueness across blocks
+            unique_speaker_id = f"I{block_id}|{spk_norm}"
+
+            # Use session_name as document_id if available (e.g., "Research Session (John)")
+            # This preserves the interviewee name for downstream persona name extraction
+            doc_id = session_name if session_name else f"interview_{block_id}"
+
+            # Skip timestamp-only segments (e.g., "00" with dialogue "00:00")
+            # These are artifacts of parsing timestamp lines like "00:00:00"
+            if re.match(r'^\d+$', spk_norm):
+                # Speaker is just digits (e.g., "00" from "00:00:00")
+                continue
+            if re.match(r'^\d{2}:\d{2}(:\d{2})?$', dialogue_text.strip()):
+                # Dialogue is just a timestamp fragment
+                continue
+
+            # Skip empty turns and, for regex matches, very short parsing artifacts
+            if not dialogue_text or len(dialogue_text) < min_dialogue_chars:
+                continue
+
+            segment_data = {
+                "speaker_id": unique_speaker_id,
+                "role": role,
+                "dialogue": dialogue_text,
+                # Assign per-interview document id - preserves session name for name extraction
+                "document_id": doc_id,
+            }
+            try:
+                validated_segment = TranscriptSegment(**segment_data)
+                segments.append(validated_segment.model_dump())
+            except ValidationError:
+                segments.append(segment_data)
+        return segments
+
     def _normalize_roles(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Infer a consistent interviewer vs interviewee role per speaker and normalize.
         - If any segments explicitly marked as Interviewer, prefer that speaker.
@@ -2,15 +2,19 @@
 Research Session Service for managing customer research sessions
 """
 
+import base64
+import json
 import uuid
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple
+from fastapi import HTTPException
+from sqlalchemy.orm import Session, defer
 from sqlalchemy import desc
 
 from backend.models.research_session import (
     ResearchSession,
+    ResearchSessionMessage,
     ResearchExport,
     ResearchSessionCreate,
     ResearchSessionUpdate,
@@ -21,6 +25,55 @@ from backend.database import get_db
 
 logger = logging.getLogger(__name__)
 
+STAKEHOLDER_GROUPS = ("primaryStakeholders", "secondaryStakeholders")
+QUESTION_CATEGORIES = ("problemDiscovery", "solutionValidation", "followUp")
+
+
+def count_research_questions(research_questions: Any) -> Tuple[int, int]:
+    """Count (questions, stakeholders) in a generated questionnaire."""
+    question_count = 0
+    stakeholder_count = 0
+    if not isinstance(research_questions, dict):
+        return question_count, stakeholder_count
+
+    for group in STAKEHOLDER_GROUPS:
+        stakeholders = research_questions.get(group)
+        if not isinstance(stakeholders, list):
+            continue
+        stakeholder_count += len(stakeholders)
+        for stakeholder in stakeholders:
+            questions = stakeholder.get("questions") if isinstance(stakeholder, dict) else None
+            if not isinstance(questions, dict):
+                continue
+            for category in QUESTION_CATEGORIES:
+                if isinstance(questions.get(category), list):
+                    question_count += len(questions[category])
+    return question_count, stakeholder_count
+
+
+def parse_message_timestamp(message: Dict[str, Any]) -> Optional[datetime]:
+    """Parse a message's ISO timestamp as naive UTC, if it has one."""
+    value = message.get("timestamp") if isinstance(message, dict) else None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _same_message(a: Any, b: Any) -> bool:
+    """Whether two message dicts are the same turn, by ID when both have one."""
+    if isinstance(a, dict) and isinstance(b, dict) and a.get("id") and b.get("id"):
+        return a["id"] == b["id"]
+    return a == b
+
 
 class ResearchSessionService:
     """Service for managing research sessions."""
@@ -73,7 +126,6 @@ class ResearchSessionService:
                     business_idea=session_data.business_idea,
                     target_customer=session_data.target_customer,
                     problem=session_data.problem,
-                    messages=session_data.messages or [],
                     conversation_context=session_data.conversation_context or "",
                     industry=session_data.industry or "general",
                     stage=session_data.stage or "initial",
@@ -82,6 +134,8 @@ class ResearchSessionService:
                 )
 
                 self.db.add(session)
+                self.db.flush()
+                self._append_messages(session, session_data.messages or [])
                 self.db.commit()
                 self.db.refresh(session)
 
@@ -122,8 +176,17 @@ class ResearchSessionService:
             return None
 
         # Update fields that are provided
-        for field, value in update_data.dict(exclude_unset=True).items():
+        fields = update_data.dict(exclude_unset=True)
+        messages = fields.pop("messages", None)
+        for field, value in fields.items():
             setattr(session, field, value)
+        if "research_questions" in fields:
+            self._update_question_counts(session)
+
+        # ``messages`` is the client's history; only entries not yet in the
+        # log are appended
+        if messages:
+            self._append_messages(session, self._new_messages(session, messages))
 
         session.updated_at = datetime.utcnow()
 
@@ -135,18 +198,19 @@ class ResearchSessionService:
     def add_message(
         self, session_id: str, message: Dict[str, Any]
     ) -> Optional[ResearchSession]:
-        """Add a message to the session."""
+        """Append a message to the session's log."""
+        return self.add_messages(session_id, [message])
+
+    def add_messages(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> Optional[ResearchSession]:
+        """Append messages to the session's log, updating its summary fields."""
 
         session = self.get_session(session_id)
         if not session:
             return None
 
-        # Initialize messages if None
-        if session.messages is None:
-            session.messages = []
-
-        # Add the new message
-        session.messages.append(message)
+        self._append_messages(session, messages)
         session.updated_at = datetime.utcnow()
 
         self.db.commit()
@@ -154,6 +218,130 @@ class ResearchSessionService:
 
         return session
 
+    def get_messages(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Read a session's messages in append order.
+
+        Returns:
+            Tuple of (messages, cursor for the next page or None)
+        """
+        query = self.db.query(
+            ResearchSessionMessage.id, ResearchSessionMessage.message
+        ).filter(ResearchSessionMessage.session_id == session_id)
+        if cursor:
+            query = query.filter(
+                ResearchSessionMessage.id > self._decode_message_cursor(cursor)
+            )
+        query = query.order_by(ResearchSessionMessage.id)
+        if limit:
+            # Fetch one extra row to know whether another page exists
+            query = query.limit(limit + 1)
+
+        rows = query.all()
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_message_cursor(rows[-1].id)
+
+        return [row.message for row in rows], next_cursor
+
+    def _append_messages(
+        self, session: ResearchSession, messages: List[Dict[str, Any]]
+    ) -> None:
+        """Insert message rows and advance the session's summary fields."""
+        if not messages:
+            return
+
+        now = datetime.utcnow()
+        self.db.add_all(
+            ResearchSessionMessage(
+                session_id=session.session_id,
+                role=message.get("role") if isinstance(message, dict) else None,
+                message=message,
+                created_at=now,
+            )
+            for message in messages
+        )
+        session.message_count = (session.message_count or 0) + len(messages)
+        session.last_message_at = parse_message_timestamp(messages[-1]) or now
+
+    def _new_messages(
+        self, session: ResearchSession, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Messages of a client history that are not in the session's log yet.
+
+        The usual client sends its full history, so everything past the
+        stored count is new once the message at the boundary matches the last
+        stored one. A history that is trimmed, edited or reordered is matched
+        by message ID instead; messages without an ID are then skipped rather
+        than risk duplicating or dropping turns.
+        """
+        stored = session.message_count or 0
+        if not stored:
+            return list(messages)
+
+        last_row = (
+            self.db.query(ResearchSessionMessage.message)
+            .filter(ResearchSessionMessage.session_id == session.session_id)
+            .order_by(desc(ResearchSessionMessage.id))
+            .first()
+        )
+        last = last_row.message if last_row else None
+        if _same_message(messages[-1], last):
+            return []
+        if len(messages) > stored and _same_message(messages[stored - 1], last):
+            return messages[stored:]
+
+        known = {
+            message.get("id")
+            for message in self.get_messages(session.session_id)[0]
+            if isinstance(message, dict)
+        }
+        new = [
+            message
+            for message in messages
+            if isinstance(message, dict)
+            and message.get("id")
+            and message["id"] not in known
+        ]
+        skipped = sum(
+            1 for message in messages if not isinstance(message, dict) or not message.get("id")
+        )
+        logger.warning(
+            f"Message history for session {session.session_id} does not extend the "
+            f"stored log; appending {len(new)} messages by ID"
+            + (f", skipping {skipped} without an ID" if skipped else "")
+        )
+        return new
+
+    def _update_question_counts(self, session: ResearchSession) -> None:
+        session.question_count, session.stakeholder_count = count_research_questions(
+            session.research_questions
+        )
+
+    @staticmethod
+    def _encode_message_cursor(message_id: int) -> str:
+        """Encode the last message's id into an opaque keyset cursor."""
+        return base64.urlsafe_b64encode(json.dumps([message_id]).encode("utf-8")).decode(
+            "ascii"
+        )
+
+    @staticmethod
+    def _decode_message_cursor(cursor: str) -> int:
+        """Decode a keyset cursor, raising 400 for malformed values."""
+        try:
+            (message_id,) = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return int(message_id)
+        except (ValueError, TypeError, json.JSONDecodeError, UnicodeError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
     def complete_session(
         self, session_id: str, research_questions: Dict[str, Any]
     ) -> Optional[ResearchSession]:
@@ -166,6 +354,7 @@ class ResearchSessionService:
         session.status = "completed"
         session.questions_generated = True
         session.research_questions = research_questions
+        self._update_question_counts(session)
         session.completed_at = datetime.utcnow()
         session.updated_at = datetime.utcnow()
 
@@ -179,6 +368,7 @@ class ResearchSessionService:
         try:
             return (
                 self.db.query(ResearchSession)
+                .options(defer(ResearchSession.messages))
                 .filter(ResearchSession.user_id == user_id)
                 .order_by(desc(ResearchSession.updated_at))
                 .limit(limit)
@@ -194,6 +384,7 @@ class ResearchSessionService:
         """Get all sessions (for development/testing purposes)."""
         return (
             self.db.query(ResearchSession)
+            .options(defer(ResearchSession.messages))
             .order_by(desc(ResearchSession.updated_at))
             .limit(limit)
             .all()
@@ -203,6 +394,7 @@ class ResearchSessionService:
         """Get recent sessions (for admin/analytics)."""
         return (
             self.db.query(ResearchSession)
+            .options(defer(ResearchSession.messages))
             .order_by(desc(ResearchSession.updated_at))
             .limit(limit)
             .all()
@@ -215,7 +407,7 @@ class ResearchSessionService:
         if not session:
             return None
 
-        message_count = len(session.messages) if session.messages else 0
+        message_count = session.message_count or 0
 
         return ResearchSessionSummary(
             id=session.id,
@@ -269,34 +461,16 @@ class ResearchSessionService:
         # Note: ResearchExport is a Pydantic model, not stored in database
         # No need to delete exports as they're not persisted in the database
 
-        # Delete session
+        # Delete session and its message log
+        self.db.query(ResearchSessionMessage).filter(
+            ResearchSessionMessage.session_id == session_id
+        ).delete(synchronize_session=False)
         self.db.delete(session)
         self.db.commit()
 
         logger.info(f"✅ Successfully deleted session: {session_id}")
         return True
 
-    def add_message(
-        self, session_id: str, message_data: dict
-    ) -> Optional[ResearchSession]:
-        """Add a message to a research session."""
-        session = self.get_session(session_id)
-        if not session:
-            return None
-
-        # Initialize messages list if it doesn't exist
-        if not session.messages:
-            session.messages = []
-
-        # Add the new message
-        session.messages.append(message_data)
-        session.updated_at = datetime.now()
-
-        self.db.commit()
-        self.db.refresh(session)
-
-        return session
-
 
 def get_research_session_service(db: Session = None) -> ResearchSessionService:
     """Get research session service instance."""
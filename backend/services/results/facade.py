@@ -7,7 +7,7 @@ logic into repositories/services/presenters in this package.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 import os
@@ -52,9 +52,44 @@ class ResultsServiceFacade:
         sort_by: Optional[str] = None,
         sort_direction: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        view: str = "full",
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         return LegacyResultsService(self.db, self.user).get_all_analyses(
-            sort_by=sort_by, sort_direction=sort_direction, status=status
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            status=status,
+            view=view,
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+
+    def get_analyses_page(
+        self,
+        *,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        view: str = "full",
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return LegacyResultsService(self.db, self.user).get_analyses_page(
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            status=status,
+            view=view,
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
         )
 
     def get_design_thinking_personas(self, result_id: int):
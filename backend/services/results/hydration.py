@@ -0,0 +1,439 @@
+"""Materialized persona evidence hydration for analysis results.
+
+Linking persona trait evidence to transcript offsets and validating it against
+the source both rescan the full transcript. Doing that on every results read
+made result-page latency scale with transcript size, so the work is done once
+when an analysis completes and stored in the results blob under
+``persona_hydration`` together with a version stamp. Reads use the stored
+output and only schedule a background recompute when the stamp is stale.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when hydration/validation output changes so stored results are recomputed
+HYDRATION_VERSION = 1
+
+# Key under which the stamp is stored in AnalysisResult.results
+HYDRATION_KEY = "persona_hydration"
+
+VALIDATION_METHOD = "persona_evidence_validator_v1"
+
+HYDRATED_TRAITS = (
+    "demographics",
+    "goals_and_motivations",
+    "challenges_and_frustrations",
+    "key_quotes",
+)
+
+# Result ids with a background recompute in flight
+_inflight: set = set()
+_inflight_lock = threading.Lock()
+
+
+def should_hydrate_personas() -> bool:
+    """Check if persona hydration is enabled via environment variable."""
+    return str(
+        os.getenv("ENABLE_FULL_RESULTS_PERSONAS_HYDRATION", "true")
+    ).lower() in {"1", "true", "yes"}
+
+
+def should_revalidate_personas() -> bool:
+    """Check if persona revalidation is enabled via environment variable."""
+    return str(
+        os.getenv("ENABLE_ON_READ_PERSONAS_REVALIDATION", "true")
+    ).lower() in {"1", "true", "yes"}
+
+
+def build_concat_and_spans(
+    transcript: Optional[List[Dict[str, Any]]],
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Build concatenated text and document spans from transcript segments.
+
+    Args:
+        transcript: List of transcript segment dictionaries
+
+    Returns:
+        Tuple of (concatenated_text, document_spans)
+    """
+    try:
+        order = []
+        buckets: Dict[str, List[str]] = {}
+        for seg in transcript or []:
+            if not isinstance(seg, dict):
+                continue
+            did = seg.get("document_id") or "original_text"
+            if did not in buckets:
+                buckets[did] = []
+                order.append(did)
+            dlg = seg.get("dialogue") or seg.get("text") or ""
+            if dlg:
+                buckets[did].append(str(dlg))
+
+        pieces, spans, cursor = [], [], 0
+        sep = "\n\n"
+        for did in order:
+            block = "\n".join(buckets.get(did) or [])
+            start, end = cursor, cursor + len(block)
+            spans.append({"document_id": did, "start": start, "end": end})
+            pieces.append(block)
+            cursor = end + len(sep)
+        return sep.join(pieces), spans
+    except (TypeError, KeyError, AttributeError):
+        return "", []
+
+
+def hydrate_persona_evidence(
+    personas: List[Dict[str, Any]],
+    scoped_text: str,
+    doc_spans: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """
+    Hydrate persona evidence with document IDs and offsets.
+
+    Modifies personas in place. Personas without an EV2 evidence map also get
+    ``_evidence_linking_v2`` so the presenter does not need to link on read.
+
+    Args:
+        personas: List of persona dictionaries
+        scoped_text: The source text to search for evidence
+        doc_spans: Optional document span information
+    """
+    if not scoped_text or not scoped_text.strip():
+        return
+
+    try:
+        from backend.services.processing.evidence_linking_service import (
+            EvidenceLinkingService,
+        )
+
+        svc = EvidenceLinkingService(None)
+        svc.enable_v2 = True
+        scope_meta = {
+            "speaker": "Interviewee",
+            "speaker_role": "Interviewee",
+            "document_id": "original_text",
+        }
+        if doc_spans:
+            scope_meta["doc_spans"] = doc_spans
+
+        for p in personas:
+            try:
+                attributes = {
+                    tn: {"value": (p.get(tn, {}) or {}).get("value", "")}
+                    for tn in HYDRATED_TRAITS
+                }
+                _, ev_map = svc.link_evidence_to_attributes_v2(
+                    attributes,
+                    scoped_text=scoped_text,
+                    scope_meta=scope_meta,
+                    protect_key_quotes=True,
+                )
+                for tn in HYDRATED_TRAITS:
+                    trait = p.get(tn) or {}
+                    items = ev_map.get(tn) or []
+                    if items:
+                        safe_items = _ensure_document_ids(items)
+                        trait["evidence"] = safe_items
+                        p[tn] = trait
+                        _hydrate_populated_traits(p, tn, safe_items)
+                if not p.get("_evidence_linking_v2") and isinstance(ev_map, dict):
+                    p["_evidence_linking_v2"] = {
+                        "evidence_map": {
+                            tn: _ensure_document_ids(items or [])
+                            for tn, items in ev_map.items()
+                        }
+                    }
+            except (KeyError, TypeError, AttributeError):
+                continue
+    except ImportError:
+        logger.warning("[HYDRATION] EvidenceLinkingService not available")
+
+
+def _ensure_document_ids(items: List[Any]) -> List[Any]:
+    """Ensure all items have non-empty document_id."""
+    safe_items = []
+    for it in items:
+        if isinstance(it, dict):
+            it2 = dict(it)
+            if not (it2.get("document_id") or "").strip():
+                it2["document_id"] = "original_text"
+            safe_items.append(it2)
+        else:
+            safe_items.append(it)
+    return safe_items
+
+
+def _hydrate_populated_traits(
+    persona: Dict[str, Any], trait_name: str, items: List[Any]
+) -> None:
+    """Hydrate populated_traits section if present."""
+    try:
+        if isinstance(persona.get("populated_traits"), dict):
+            pt = dict(persona.get("populated_traits") or {})
+            if isinstance(pt.get(trait_name), dict):
+                pt[trait_name] = dict(pt[trait_name])
+                pt[trait_name]["evidence"] = items
+                persona["populated_traits"] = pt
+    except (KeyError, TypeError, AttributeError):
+        pass
+
+
+def _source_for(results: Dict[str, Any]) -> Tuple[Optional[list], Optional[str]]:
+    """Return (transcript, original_text) the way the results source payload does."""
+    from backend.services.results.formatting.flattening import build_source_payload
+
+    source_payload = build_source_payload(results, None)
+    transcript = source_payload.get("transcript")
+    if not (isinstance(transcript, list) and transcript):
+        transcript = None
+    return transcript, source_payload.get("original_text")
+
+
+def compute_persona_validation(
+    personas: List[Dict[str, Any]],
+    transcript: Optional[List[Dict[str, Any]]],
+    source_text: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Validate persona evidence against the source.
+
+    Returns:
+        Dict with ``validation_summary``, ``validation_status`` and
+        ``confidence_components`` in the shape served by the results endpoint
+    """
+    from backend.services.validation.persona_evidence_validator import (
+        PersonaEvidenceValidator,
+    )
+
+    validator = PersonaEvidenceValidator()
+    index = validator.build_index(transcript=transcript, source_text=source_text)
+    all_matches = []
+    any_cross_trait = False
+    speaker_mismatch_count = 0
+
+    for p in personas:
+        if not isinstance(p, dict):
+            continue
+        try:
+            matches = validator.match_evidence(
+                persona_ssot=p,
+                source_text=source_text,
+                transcript=transcript,
+                index=index,
+            )
+            all_matches.extend(matches)
+
+            dup = PersonaEvidenceValidator.detect_duplication(p)
+            ctr = dup.get("cross_trait_reuse")
+            if isinstance(ctr, list):
+                any_cross_trait = any_cross_trait or bool(ctr)
+            elif ctr:
+                any_cross_trait = True
+
+            sc = PersonaEvidenceValidator.check_speaker_consistency(
+                p, transcript, index=index
+            )
+            sm = sc.get("speaker_mismatches")
+            if isinstance(sm, list):
+                speaker_mismatch_count += len(sm)
+            elif isinstance(sm, int):
+                speaker_mismatch_count += sm
+        except (TypeError, KeyError, AttributeError):
+            continue
+
+    contamination = PersonaEvidenceValidator.detect_contamination(
+        personas, index=index
+    )
+    summary = PersonaEvidenceValidator.summarize(
+        all_matches,
+        {"cross_trait_reuse": any_cross_trait},
+        {"speaker_mismatches": speaker_mismatch_count},
+        contamination,
+    )
+    confidence = PersonaEvidenceValidator.compute_confidence_components(summary)
+    status = PersonaEvidenceValidator.compute_status(summary)
+
+    return {
+        "validation_summary": {
+            "counts": summary.get("counts", {}),
+            "method": VALIDATION_METHOD,
+            "speaker_mismatches": speaker_mismatch_count,
+            "contamination": contamination,
+            "confidence_components": confidence,
+        },
+        "validation_status": "pass" if status == "PASS" else "warning",
+        "confidence_components": confidence,
+    }
+
+
+def materialize_persona_hydration(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Hydrate and validate persona evidence once and stamp the results blob.
+
+    Personas in ``results`` are modified in place and the stamp is stored under
+    ``results[HYDRATION_KEY]``.
+
+    Args:
+        results: Parsed ``AnalysisResult.results`` dict
+
+    Returns:
+        The stored stamp
+    """
+    stamp = _new_stamp()
+
+    personas = results.get("personas")
+    if isinstance(personas, list) and personas:
+        transcript, original_text = _source_for(results)
+
+        if should_hydrate_personas():
+            try:
+                scoped_text, doc_spans = None, None
+                if transcript:
+                    txt, spans = build_concat_and_spans(transcript)
+                    if txt and spans:
+                        scoped_text, doc_spans = txt, spans
+                if not scoped_text:
+                    scoped_text = original_text or ""
+                if scoped_text:
+                    hydrate_persona_evidence(personas, scoped_text, doc_spans)
+            except Exception as err:
+                logger.warning(f"[PERSONA_HYDRATION] Hydration skipped: {err}")
+
+        if should_revalidate_personas():
+            try:
+                stamp.update(
+                    compute_persona_validation(personas, transcript, original_text)
+                )
+            except Exception as err:
+                logger.warning(f"[PERSONA_HYDRATION] Validation skipped: {err}")
+
+    results[HYDRATION_KEY] = stamp
+    return stamp
+
+
+def _new_stamp() -> Dict[str, Any]:
+    return {
+        "version": HYDRATION_VERSION,
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _parse_results(value: Any) -> Optional[Dict[str, Any]]:
+    """Parse a stored results blob; None if it is empty or not a dict."""
+    if not value:
+        return None
+    try:
+        results = json.loads(value) if isinstance(value, str) else dict(value)
+    except (TypeError, ValueError):
+        return None
+    return results if isinstance(results, dict) else None
+
+
+def is_hydration_current(stamp: Any) -> bool:
+    """Return True if a stored stamp matches the current hydration version."""
+    return isinstance(stamp, dict) and stamp.get("version") == HYDRATION_VERSION
+
+
+def get_current_hydration(results: Any) -> Optional[Dict[str, Any]]:
+    """Return the stored stamp of a parsed results dict if it is current."""
+    if not isinstance(results, dict):
+        return None
+    stamp = results.get(HYDRATION_KEY)
+    return stamp if is_hydration_current(stamp) else None
+
+
+def refresh_persona_hydration(
+    result_id: int, session_factory: Optional[Callable[[], Any]] = None
+) -> bool:
+    """
+    Recompute and persist the hydration for one analysis result.
+
+    Meant to run as a background job after a read found a stale stamp.
+    Concurrent refreshes of the same result are collapsed into one.
+
+    The recompute runs outside any transaction; only the personas and the
+    stamp are then written back, under a row lock, into the latest stored
+    results, so other fields written meanwhile are kept. If the personas
+    themselves changed meanwhile, nothing is written. Failed analyses
+    (results with an ``error`` key) get a stamp without hydration so reads
+    stop scheduling refreshes for them.
+
+    Args:
+        result_id: AnalysisResult id
+        session_factory: Session factory, defaults to ``SessionLocal``
+
+    Returns:
+        True if a new stamp was stored
+    """
+    with _inflight_lock:
+        if result_id in _inflight:
+            return False
+        _inflight.add(result_id)
+
+    try:
+        from sqlalchemy import select
+
+        from backend.models import AnalysisResult
+
+        if session_factory is None:
+            from backend.database import SessionLocal as session_factory
+
+        db = session_factory()
+        try:
+            row = db.get(AnalysisResult, result_id)
+            results = _parse_results(row.results) if row is not None else None
+            # End the read transaction; the recompute can take a while
+            db.rollback()
+            if results is None or is_hydration_current(results.get(HYDRATION_KEY)):
+                return False
+
+            read_personas = copy.deepcopy(results.get("personas"))
+            if "error" in results:
+                results[HYDRATION_KEY] = _new_stamp()
+            else:
+                materialize_persona_hydration(results)
+
+            row = db.execute(
+                select(AnalysisResult)
+                .where(AnalysisResult.result_id == result_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            ).scalar_one_or_none()
+            latest = _parse_results(row.results) if row is not None else None
+            if (
+                latest is None
+                or is_hydration_current(latest.get(HYDRATION_KEY))
+                or latest.get("personas") != read_personas
+            ):
+                db.rollback()
+                return False
+
+            if "personas" in results:
+                latest["personas"] = results["personas"]
+            latest[HYDRATION_KEY] = results[HYDRATION_KEY]
+            row.results = json.dumps(latest)
+            db.commit()
+            logger.info(f"[PERSONA_HYDRATION] Refreshed result_id={result_id}")
+            return True
+        except Exception as err:
+            db.rollback()
+            logger.warning(
+                f"[PERSONA_HYDRATION] Refresh failed for result_id={result_id}: {err}"
+            )
+            return False
+        finally:
+            db.close()
+    finally:
+        with _inflight_lock:
+            _inflight.discard(result_id)
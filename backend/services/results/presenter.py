@@ -18,6 +18,7 @@ from backend.services.results.formatters import (
     inject_age_ranges_from_source,
     adjust_theme_frequencies_for_prevalence,
 )
+from backend.services.results.hydration import HYDRATION_KEY, get_current_hydration
 
 
 def _parse_results(results_field: Any) -> Dict[str, Any]:
@@ -80,117 +81,9 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
         },
     )
 
-    # EV2 on-read hydration fallback for legacy results lacking instrumentation
-    try:
-        hydrate_ev2 = os.getenv("RESULTS_SERVICE_V2_PRESENTER", "false").lower() in (
-            "1",
-            "true",
-            "yes",
-            "on",
-        )
-        if hydrate_ev2 and isinstance(flattened.get("personas"), list):
-            # Helper: build concatenated text and doc_spans from transcript
-            def _build_concat_and_spans(tx):
-                try:
-                    # Group by document_id preserving first-seen order
-                    order = []
-                    buckets = {}
-                    for seg in tx or []:
-                        if not isinstance(seg, dict):
-                            continue
-                        did = seg.get("document_id") or "original_text"
-                        if did not in buckets:
-                            buckets[did] = []
-                            order.append(did)
-                        # prefer 'dialogue' then 'text'
-                        dlg = seg.get("dialogue") or seg.get("text") or ""
-                        if dlg:
-                            buckets[did].append(str(dlg))
-                    # Assemble blocks and spans
-                    pieces = []
-                    spans = []
-                    cursor = 0
-                    sep = "\n\n"
-                    for did in order:
-                        block = "\n".join(buckets.get(did) or [])
-                        start = cursor
-                        end = start + len(block)
-                        spans.append({"document_id": did, "start": start, "end": end})
-                        pieces.append(block)
-                        cursor = end + len(sep)
-                    return sep.join(pieces), spans
-                except Exception:
-                    return "", []
-
-            transcript = (
-                source_payload.get("transcript")
-                if isinstance(source_payload, dict)
-                else None
-            )
-            scoped_text = None
-            doc_spans = None
-            if isinstance(transcript, list) and transcript:
-                txt, spans = _build_concat_and_spans(transcript)
-                if txt and spans:
-                    scoped_text = txt
-                    doc_spans = spans
-            if not scoped_text:
-                scoped_text = original_text
-
-            # Choose scoped_text from transcript (with doc_spans) or fall back to original_text
-            if isinstance(scoped_text, str) and scoped_text.strip():
-                # Minimal no-op LLM for constructor compatibility
-                class _NoOpLLM:
-                    async def analyze(self, *_args, **_kwargs):
-                        return {}
-
-                try:
-                    from backend.services.processing.evidence_linking_service import (
-                        EvidenceLinkingService,
-                    )
-
-                    ev = EvidenceLinkingService(_NoOpLLM())
-                    scope_meta = {
-                        "speaker": "Interviewee",
-                        "speaker_role": "Interviewee",
-                        "document_id": source_payload.get("document_id")
-                        or "original_text",
-                    }
-                    if doc_spans:
-                        scope_meta["doc_spans"] = doc_spans
-                    hydrated = []
-                    for p in flattened.get("personas", []):
-                        if not isinstance(p, dict):
-                            hydrated.append(p)
-                            continue
-                        if not p.get("_evidence_linking_v2"):
-                            try:
-                                enhanced, evmap = ev.link_evidence_to_attributes_v2(
-                                    p,
-                                    scoped_text=scoped_text,
-                                    scope_meta=scope_meta,
-                                    protect_key_quotes=True,
-                                )
-                                p = enhanced if isinstance(enhanced, dict) else p
-                                p["_evidence_linking_v2"] = {"evidence_map": evmap}
-                            except Exception:
-                                pass
-                        # Backfill missing document_id on items if needed
-                        try:
-                            ev2 = p.get("_evidence_linking_v2") or {}
-                            evidence_map = ev2.get("evidence_map") or {}
-                            for items in evidence_map.values():
-                                for it in items or []:
-                                    if not it.get("document_id"):
-                                        it["document_id"] = scope_meta["document_id"]
-                        except Exception:
-                            pass
-                        hydrated.append(p)
-                    flattened["personas"] = hydrated
-                except Exception:
-                    pass
-    except Exception:
-        pass
+    # EV2 evidence maps are materialized at write time (see results.hydration);
+    # stale results are recomputed in the background rather than on read.
+    hydration = get_current_hydration(results_dict)
 
     # Fix mis-scaled theme frequencies that look like normalized weights (sum≈1)
     try:
@@ -422,7 +315,11 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
     validation_status = None
     confidence_components = None
     try:
-        if personas_ssot:
+        if hydration and "validation_summary" in hydration:
+            validation_summary = hydration.get("validation_summary")
+            validation_status = hydration.get("validation_status")
+            confidence_components = hydration.get("confidence_components")
+        elif personas_ssot:
             from backend.services.validation.persona_evidence_validator import (
                 PersonaEvidenceValidator,
             )
@@ -432,6 +329,10 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
             all_dup = {"duplicates": [], "cross_trait_reuse": []}
             transcript = source_payload.get("transcript")
             original_text = source_payload.get("original_text") or ""
+            index = validator.build_index(
+                transcript=transcript if isinstance(transcript, list) else None,
+                source_text=original_text,
+            )
 
             for p in personas_ssot:
                 if not isinstance(p, dict):
@@ -440,6 +341,7 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
                     persona_ssot=p,
                     source_text=original_text,
                     transcript=(transcript if isinstance(transcript, list) else None),
+                    index=index,
                 )
                 all_matches.extend(matches)
                 dup = validator.detect_duplication(p)
@@ -448,12 +350,16 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
 
             speaker_check = (
                 validator.check_speaker_consistency(
-                    p, transcript if isinstance(transcript, list) else None
+                    p,
+                    transcript if isinstance(transcript, list) else None,
+                    index=index,
                 )
                 if personas_ssot
                 else {"speaker_mismatches": []}
             )
-            contamination = validator.detect_contamination(personas_ssot)
+            contamination = validator.detect_contamination(
+                personas_ssot, index=index
+            )
             summary = validator.summarize(
                 all_matches,
                 duplication=all_dup,
@@ -487,6 +393,7 @@ def present_formatted_results(db: Session, row: AnalysisResultRow) -> Dict[str,
         "llmModel": row.llm_model,
         **flattened,
         "source": source_payload,
+        HYDRATION_KEY: results_dict.get(HYDRATION_KEY),
     }
     if si is not None and (
         os.getenv("ENABLE_MULTI_STAKEHOLDER", "false").lower() == "true"
@@ -0,0 +1,112 @@
+"""Summary projection for analysis results.
+
+The analyses list endpoint only needs counts, a handful of theme names and the
+sentiment overview for each row. Deserializing the full ``AnalysisResult.results``
+blob for that is wasteful, so a compact projection is computed whenever the
+results are written and stored in ``AnalysisResult.summary``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the projection shape changes so stale rows can be recomputed
+SUMMARY_VERSION = 1
+
+# Number of theme names kept in the projection
+TOP_THEME_LIMIT = 5
+
+DEFAULT_SENTIMENT_OVERVIEW = {"positive": 0.33, "neutral": 0.34, "negative": 0.33}
+
+
+def _load_results(results: Any) -> Optional[Dict[str, Any]]:
+    """Return the results blob as a dict, decoding JSON strings if needed."""
+    if results is None:
+        return None
+    if isinstance(results, (str, bytes)):
+        try:
+            results = json.loads(results)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return None
+    return results if isinstance(results, dict) else None
+
+
+def _list_len(data: Dict[str, Any], key: str) -> int:
+    value = data.get(key)
+    return len(value) if isinstance(value, list) else 0
+
+
+def _top_theme_names(data: Dict[str, Any], limit: int) -> List[str]:
+    """Pick theme names, preferring enhanced themes, ordered by frequency."""
+    themes = data.get("enhanced_themes")
+    if not isinstance(themes, list) or not themes:
+        themes = data.get("themes")
+    if not isinstance(themes, list):
+        return []
+
+    ranked = []
+    for index, theme in enumerate(themes):
+        if isinstance(theme, dict):
+            name = theme.get("name") or theme.get("title")
+            try:
+                frequency = float(theme.get("frequency") or 0.0)
+            except (TypeError, ValueError):
+                frequency = 0.0
+        elif isinstance(theme, str):
+            name, frequency = theme, 0.0
+        else:
+            continue
+        if name:
+            ranked.append((-frequency, index, str(name)))
+
+    ranked.sort()
+    return [name for _, _, name in ranked[:limit]]
+
+
+def build_analysis_summary(
+    results: Any,
+    status: Optional[str] = None,
+    top_n: int = TOP_THEME_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Build the list-view projection for an analysis results blob.
+
+    Args:
+        results: ``AnalysisResult.results`` as stored (dict or JSON string)
+        status: Row status, used to decide whether an error is surfaced
+        top_n: Number of theme names to keep
+
+    Returns:
+        JSON-serializable summary dict
+    """
+    data = _load_results(results) or {}
+
+    sentiment_overview = data.get("sentimentOverview")
+    if not isinstance(sentiment_overview, dict):
+        sentiment_overview = DEFAULT_SENTIMENT_OVERVIEW
+
+    summary: Dict[str, Any] = {
+        "version": SUMMARY_VERSION,
+        "themeCount": _list_len(data, "themes"),
+        "enhancedThemeCount": _list_len(data, "enhanced_themes"),
+        "patternCount": _list_len(data, "patterns"),
+        "personaCount": _list_len(data, "personas"),
+        "insightCount": _list_len(data, "insights"),
+        "topThemes": _top_theme_names(data, top_n),
+        "sentimentOverview": sentiment_overview,
+    }
+
+    error = data.get("error")
+    if status in ("failed", "error") and error:
+        summary["error"] = str(error)
+
+    return summary
+
+
+def is_summary_current(summary: Any) -> bool:
+    """Return True if a stored summary matches the current projection version."""
+    return isinstance(summary, dict) and summary.get("version") == SUMMARY_VERSION
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 from fastapi import HTTPException
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
+import base64
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal, Tuple
 
 
 import re
 
 from backend.models import User, InterviewData, AnalysisResult
 from backend.utils.timezone_utils import format_iso_utc
+from backend.services.results.summary import (
+    DEFAULT_SENTIMENT_OVERVIEW,
+    build_analysis_summary,
+    is_summary_current,
+)
 from backend.services.results.persona_transformers import (
     convert_enhanced_persona_to_frontend_format,
     map_json_to_persona_schema,
@@ -22,9 +29,6 @@ from backend.services.results.persona_transformers import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Default sentiment values when none are available
-DEFAULT_SENTIMENT_OVERVIEW = {"positive": 0.33, "neutral": 0.34, "negative": 0.33}
-
 
 class ResultsService:
     """
@@ -352,70 +356,19 @@ class ResultsService:
                         f"Failed to apply evidence attribution filtering: {e}"
                     )
 
-                # Compute validation using PersonaEvidenceValidator with transcript-aware matching
+                # Validation is materialized at write time. A stale or missing stamp
+                # serves the last stored validation (or none); the results route
+                # schedules refresh_persona_hydration instead of rescanning here.
                 validation_summary = None
                 validation_status = None
                 confidence_components = None
-                try:
-                    if personas_ssot:
-                        from backend.services.validation.persona_evidence_validator import (
-                            PersonaEvidenceValidator,
-                        )
-
-                        validator = PersonaEvidenceValidator()
-                        all_matches = []
-                        all_dup = {"duplicates": [], "cross_trait_reuse": []}
-                        transcript = source_payload.get("transcript")
-                        original_text = source_payload.get("original_text") or ""
+                from backend.services.results.hydration import HYDRATION_KEY
 
-                        for p in personas_ssot:
-                            if not isinstance(p, dict):
-                                continue
-                            matches = validator.match_evidence(
-                                persona_ssot=p,
-                                source_text=original_text,
-                                transcript=(
-                                    transcript if isinstance(transcript, list) else None
-                                ),
-                            )
-                            all_matches.extend(matches)
-                            dup = validator.detect_duplication(p)
-                            # Merge duplication info
-                            all_dup["duplicates"].extend(dup.get("duplicates", []))
-                            all_dup["cross_trait_reuse"].extend(
-                                dup.get("cross_trait_reuse", [])
-                            )
-                        speaker_check = (
-                            validator.check_speaker_consistency(
-                                p, transcript if isinstance(transcript, list) else None
-                            )
-                            if personas_ssot
-                            else {"speaker_mismatches": []}
-                        )
-                        contamination = validator.detect_contamination(personas_ssot)
-                        summary = validator.summarize(
-                            all_matches,
-                            duplication=all_dup,
-                            speaker_check=speaker_check,
-                            contamination=contamination,
-                        )
-                        validation_summary = {
-                            "counts": summary.get("counts", {}),
-                            "method": "persona_evidence_validator_v1",
-                            "speaker_mismatches": len(
-                                summary.get("speaker_check", {}).get(
-                                    "speaker_mismatches", []
-                                )
-                            ),
-                            "contamination": summary.get("contamination", {}),
-                        }
-                        status = validator.compute_status(summary)
-                        validation_status = "pass" if status == "PASS" else "warning"
-                        confidence_components = validator.compute_confidence_components(
-                            summary
-                        )
-                except Exception as e:
-                    logger.warning(f"Validation summary computation failed: {e}")
+                stamp = results_dict.get(HYDRATION_KEY)
+                if isinstance(stamp, dict) and "validation_summary" in stamp:
+                    validation_summary = stamp.get("validation_summary")
+                    validation_status = stamp.get("validation_status")
+                    confidence_components = stamp.get("confidence_components")
 
                 # Feature flag for future enforcement (Phase 1)
                 try:
@@ -534,6 +487,7 @@ class ResultsService:
                     formatted_results["validation_status"] = validation_status
                     formatted_results["confidence_components"] = confidence_components
                     formatted_results["validation_enforcement"] = validation_enforcement
+                    formatted_results[HYDRATION_KEY] = results_dict.get(HYDRATION_KEY)
                 except Exception as e:
                     logger.warning(f"Failed to attach SSoT/validation fields: {e}")
 
@@ -623,6 +577,11 @@ class ResultsService:
         sort_by: Optional[str] = None,
         sort_direction: Optional[Literal["asc", "desc"]] = "desc",
         status: Optional[Literal["pending", "completed", "failed"]] = None,
+        view: Literal["full", "summary"] = "full",
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve all analyses for the current user.
@@ -631,62 +590,161 @@ class ResultsService:
             sort_by: Field to sort by (createdAt, fileName)
             sort_direction: Sort direction (asc, desc)
             status: Filter by status
+            view: "full" ships the results payload, "summary" only the projection
+            fields: Optional list of item keys to keep ("id" is always kept)
+            limit: Maximum number of items to return
+            cursor: Keyset cursor returned by a previous page
+            offset: Legacy offset pagination, ignored when a cursor is given
 
         Returns:
             List of formatted analysis results
         """
+        items, _ = self.get_analyses_page(
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            status=status,
+            view=view,
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+        return items
+
+    def get_analyses_page(
+        self,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[Literal["asc", "desc"]] = "desc",
+        status: Optional[Literal["pending", "completed", "failed"]] = None,
+        view: Literal["full", "summary"] = "full",
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of analyses for the current user.
+
+        Filenames come from the same joined query, and the summary view never
+        selects the ``results`` column.
+
+        Returns:
+            Tuple of (formatted items, cursor for the next page or None)
+        """
         try:
-            # Log retrieval request
             logger.info(f"list_analyses called - user_id: {self.user.user_id}")
             logger.info(
-                f"Request parameters - sortBy: {sort_by}, sortDirection: {sort_direction}, status: {status}"
+                f"Request parameters - sortBy: {sort_by}, sortDirection: {sort_direction}, "
+                f"status: {status}, view: {view}, limit: {limit}"
             )
 
+            summary_view = view == "summary"
+            if summary_view:
+                query = self.db.query(
+                    AnalysisResult.result_id,
+                    AnalysisResult.status,
+                    AnalysisResult.analysis_date,
+                    AnalysisResult.completed_at,
+                    AnalysisResult.llm_provider,
+                    AnalysisResult.llm_model,
+                    AnalysisResult.summary,
+                    InterviewData.filename,
+                )
+            else:
+                query = self.db.query(AnalysisResult, InterviewData.filename)
+
             # Build the query with user authorization check
-            query = (
-                self.db.query(AnalysisResult)
-                .join(InterviewData)
-                .filter(InterviewData.user_id == self.user.user_id)
-            )
+            query = query.join(
+                InterviewData, AnalysisResult.data_id == InterviewData.id
+            ).filter(InterviewData.user_id == self.user.user_id)
 
             # Apply status filter if provided
             if status:
                 query = query.filter(AnalysisResult.status == status)
 
-            # Apply sorting
-            if sort_by == "createdAt" or sort_by is None:
-                # Default sorting by creation date
-                if sort_direction == "asc":
-                    query = query.order_by(AnalysisResult.analysis_date.asc())
-                else:
-                    query = query.order_by(AnalysisResult.analysis_date.desc())
-            elif sort_by == "fileName":
-                # Sorting by filename requires joining with InterviewData
-                if sort_direction == "asc":
-                    query = query.order_by(InterviewData.filename.asc())
+            # Sort key plus result_id as a unique tie-breaker for keyset paging
+            if sort_by == "fileName":
+                sort_column = func.coalesce(InterviewData.filename, "")
+            else:
+                sort_column = AnalysisResult.analysis_date
+            descending = sort_direction != "asc"
+
+            if cursor:
+                sort_value, last_id = self._decode_list_cursor(cursor, sort_by)
+                if descending:
+                    query = query.filter(
+                        or_(
+                            sort_column < sort_value,
+                            and_(
+                                sort_column == sort_value,
+                                AnalysisResult.result_id < last_id,
+                            ),
+                        )
+                    )
                 else:
-                    query = query.order_by(InterviewData.filename.desc())
-
-            # Execute query
-            analysis_results = query.all()
+                    query = query.filter(
+                        or_(
+                            sort_column > sort_value,
+                            and_(
+                                sort_column == sort_value,
+                                AnalysisResult.result_id > last_id,
+                            ),
+                        )
+                    )
 
-            # Format the results
-            formatted_results = []
-            for result in analysis_results:
-                # Skip results with no data
-                if not result:
-                    continue
+            if descending:
+                query = query.order_by(
+                    sort_column.desc(), AnalysisResult.result_id.desc()
+                )
+            else:
+                query = query.order_by(sort_column.asc(), AnalysisResult.result_id.asc())
+
+            if offset and not cursor:
+                query = query.offset(offset)
+            if limit:
+                # Fetch one extra row to know whether another page exists
+                query = query.limit(limit + 1)
+
+            rows = query.all()
+
+            next_cursor = None
+            if limit and len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                last_result_id = last.result_id if summary_view else last[0].result_id
+                last_sort_value = (
+                    last.filename or ""
+                    if sort_by == "fileName"
+                    else (last.analysis_date if summary_view else last[0].analysis_date)
+                )
+                next_cursor = self._encode_list_cursor(last_sort_value, last_result_id)
+
+            if summary_view:
+                formatted_results = self._format_analysis_summary_items(rows)
+            else:
+                formatted_results = [
+                    self._format_analysis_list_item(
+                        result, filename=filename or "Unknown"
+                    )
+                    for result, filename in rows
+                    if result
+                ]
 
-                # Format data to match frontend schema
-                formatted_result = self._format_analysis_list_item(result)
-                formatted_results.append(formatted_result)
+            if fields:
+                keep = set(fields) | {"id"}
+                formatted_results = [
+                    {k: v for k, v in item.items() if k in keep}
+                    for item in formatted_results
+                ]
 
             logger.info(
                 f"Returning {len(formatted_results)} analyses for user {self.user.user_id}"
             )
 
-            return formatted_results
+            return formatted_results, next_cursor
 
+        except HTTPException:
+            raise
         except Exception as e:
             # Rollback the transaction to clean up failed state
             self.db.rollback()
@@ -695,6 +753,98 @@ class ResultsService:
                 status_code=500, detail=f"Internal server error: {str(e)}"
             )
 
+    @staticmethod
+    def _encode_list_cursor(sort_value: Any, result_id: int) -> str:
+        """Encode the last row's sort key into an opaque keyset cursor."""
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        raw = json.dumps([sort_value, result_id]).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_list_cursor(cursor: str, sort_by: Optional[str]) -> Tuple[Any, int]:
+        """Decode a keyset cursor, raising 400 for malformed values."""
+        try:
+            sort_value, result_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+            if sort_by != "fileName":
+                sort_value = datetime.fromisoformat(sort_value)
+            return sort_value, int(result_id)
+        except (ValueError, TypeError, json.JSONDecodeError, UnicodeError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    def _format_analysis_summary_items(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Format summary-view rows, backfilling projections for legacy rows.
+
+        Rows written before the summary column existed (or with an older
+        projection version) are recomputed once from their results blob and
+        persisted so later list calls stay on the fast path.
+        """
+        summaries = {
+            row.result_id: row.summary
+            for row in rows
+            if is_summary_current(row.summary)
+        }
+
+        stale_ids = [row.result_id for row in rows if row.result_id not in summaries]
+        if stale_ids:
+            try:
+                stale_results = (
+                    self.db.query(AnalysisResult)
+                    .filter(AnalysisResult.result_id.in_(stale_ids))
+                    .all()
+                )
+                for result in stale_results:
+                    result.summary = build_analysis_summary(
+                        result.results, result.status
+                    )
+                    summaries[result.result_id] = result.summary
+                self.db.commit()
+                logger.info(f"Backfilled summary projection for {len(stale_ids)} analyses")
+            except Exception as e:
+                self.db.rollback()
+                logger.warning(f"Could not persist summary backfill: {e}")
+
+        formatted = []
+        for row in rows:
+            summary = summaries.get(row.result_id) or build_analysis_summary(
+                None, row.status
+            )
+            item = {
+                "id": str(row.result_id),
+                "status": self._map_list_status(row.status),
+                "createdAt": format_iso_utc(row.analysis_date),
+                "completedAt": format_iso_utc(row.completed_at),
+                "fileName": row.filename or "Unknown",
+                "fileSize": None,  # We don't store this currently
+                "llmProvider": row.llm_provider,
+                "llmModel": row.llm_model,
+                "themeCount": summary.get("themeCount", 0),
+                "enhancedThemeCount": summary.get("enhancedThemeCount", 0),
+                "patternCount": summary.get("patternCount", 0),
+                "personaCount": summary.get("personaCount", 0),
+                "insightCount": summary.get("insightCount", 0),
+                "topThemes": summary.get("topThemes", []),
+                "sentimentOverview": summary.get(
+                    "sentimentOverview", DEFAULT_SENTIMENT_OVERVIEW
+                ),
+            }
+            if summary.get("error"):
+                item["error"] = summary["error"]
+            formatted.append(item)
+        return formatted
+
+    @staticmethod
+    def _map_list_status(status: Optional[str]) -> Optional[str]:
+        """Map stored status values to the list schema values."""
+        if status == "processing":
+            return "pending"
+        if status == "error":
+            return "failed"
+        return status
+
     def _ensure_personas_present(
         self, results_dict: Dict[str, Any], result_id: int
     ) -> None:
@@ -742,12 +892,15 @@ class ResultsService:
                 return interview_data.filename or "Unknown"
         return "Unknown"
 
-    def _format_analysis_list_item(self, result: "AnalysisResult") -> Dict[str, Any]:
+    def _format_analysis_list_item(
+        self, result: "AnalysisResult", filename: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Format a single analysis result for the list view.
 
         Args:
             result: AnalysisResult database record
+            filename: Filename already loaded by the list query, if any
 
         Returns:
             Formatted result for API response
@@ -755,11 +908,14 @@ class ResultsService:
         # Format data to match frontend schema
         from backend.services.results.formatters import get_filename_for_data_id
 
+        if filename is None:
+            filename = get_filename_for_data_id(self.db, result.data_id)
+
         formatted_result = {
             "id": str(result.result_id),
             "status": result.status,
             "createdAt": format_iso_utc(result.analysis_date),
-            "fileName": get_filename_for_data_id(self.db, result.data_id),
+            "fileName": filename,
             "fileSize": None,  # We don't store this currently
             "themes": [],
             "enhanced_themes": [],  # Initialize empty enhanced themes list
@@ -821,10 +977,7 @@ class ResultsService:
                 logger.error(f"Error parsing results data: {str(e)}")
 
         # Map API status to schema status values
-        if result.status == "processing":
-            formatted_result["status"] = "pending"  # Match schema requirements
-        elif result.status == "error":
-            formatted_result["status"] = "failed"  # Match schema requirements
+        formatted_result["status"] = self._map_list_status(result.status)
 
         return formatted_result
 
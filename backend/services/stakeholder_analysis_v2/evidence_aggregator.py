@@ -5,6 +5,7 @@ Handles evidence aggregation and linking for stakeholder analysis.
 Reuses EVIDENCE_LINKING_V2 for consistent evidence attribution.
 """
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
 
 from backend.domain.interfaces.llm_unified import ILLMService
@@ -12,6 +13,9 @@ from backend.schemas import DetectedStakeholder
 
 logger = logging.getLogger(__name__)
 
+# Stakeholders whose evidence is linked at the same time
+MAX_CONCURRENT_STAKEHOLDERS = 4
+
 
 class EvidenceAggregator:
     """
@@ -19,9 +23,14 @@ class EvidenceAggregator:
     for stakeholder analysis components.
     """
 
-    def __init__(self, llm_service: ILLMService):
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        max_concurrency: int = MAX_CONCURRENT_STAKEHOLDERS,
+    ):
         self.llm_service = llm_service
         self.evidence_linking_service = None
+        self.max_concurrency = max(1, max_concurrency)
         
         # Initialize evidence linking service
         self._initialize_evidence_linking()
@@ -56,13 +65,22 @@ class EvidenceAggregator:
             # Extract content from files
             content = self._extract_content_from_files(files)
             
-            # Aggregate evidence per stakeholder
-            stakeholder_evidence = {}
-            for stakeholder in detected_stakeholders:
-                evidence = await self._aggregate_stakeholder_evidence(
-                    stakeholder, content, files
-                )
-                stakeholder_evidence[stakeholder.stakeholder_id] = evidence
+            # Aggregate evidence per stakeholder, a bounded number at a time
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def _bounded(stakeholder: DetectedStakeholder) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._aggregate_stakeholder_evidence(
+                        stakeholder, content, files
+                    )
+
+            results = await asyncio.gather(
+                *(_bounded(stakeholder) for stakeholder in detected_stakeholders)
+            )
+            stakeholder_evidence = {
+                stakeholder.stakeholder_id: evidence
+                for stakeholder, evidence in zip(detected_stakeholders, results)
+            }
             
             # Create cross-stakeholder evidence summary
             cross_evidence = self._create_cross_evidence_summary(
@@ -147,8 +165,13 @@ class EvidenceAggregator:
                 "stakeholder_type": stakeholder.stakeholder_type,
             }
             
-            linked_attributes, evidence_map = self.evidence_linking_service.link_evidence_to_attributes_v2(
-                attributes, content, scope_meta, protect_key_quotes=True
+            # Synchronous and CPU-bound; run off the event loop so stakeholders overlap
+            linked_attributes, evidence_map = await asyncio.to_thread(
+                self.evidence_linking_service.link_evidence_to_attributes_v2,
+                attributes,
+                content,
+                scope_meta,
+                protect_key_quotes=True,
             )
             
             # Convert to evidence items
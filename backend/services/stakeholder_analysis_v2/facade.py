@@ -8,8 +8,11 @@ backward compatibility with the existing StakeholderAnalysisService API.
 from typing import List, Dict, Any, Optional
 import os
 import logging
+import time
 
 from backend.domain.interfaces.llm_unified import ILLMService
+from backend.infrastructure.config.settings import settings
+from backend.services.nlp.stage_graph import Stage, StageGraph
 from backend.schemas import (
     StakeholderIntelligence,
     DetectedStakeholder,
@@ -65,41 +68,81 @@ class StakeholderAnalysisFacade:
         logger.info("Starting V2 modular stakeholder analysis")
 
         try:
-            # Phase 1: Stakeholder Detection
-            detected_stakeholders = await self.detector.detect_stakeholders(
-                files, base_analysis, personas
-            )
+            # Phase 1 (detection) gates everything; later phases only need its
+            # stakeholders, so they run concurrently as their inputs become ready
+            async def detect(_deps):
+                return await self.detector.detect_stakeholders(
+                    files, base_analysis, personas
+                )
 
             # Phase 2: Cross-stakeholder Pattern Analysis
-            cross_patterns = await self.influence_calculator.analyze_patterns(
-                detected_stakeholders, files
-            )
+            async def analyze_patterns(deps):
+                return await self.influence_calculator.analyze_patterns(
+                    deps["detection"], files
+                )
 
             # Phase 3: Multi-stakeholder Summary
-            multi_summary = await self.report_assembler.generate_summary(
-                detected_stakeholders, cross_patterns, files
-            )
+            async def summarize(deps):
+                return await self.report_assembler.generate_summary(
+                    deps["detection"], deps["cross_patterns"], files
+                )
 
             # Phase 4: Theme Attribution Enhancement
-            enhanced_themes = await self.theme_analyzer.enhance_themes_with_attribution(
-                base_analysis.themes, detected_stakeholders, files
-            )
+            async def attribute_themes(deps):
+                return await self.theme_analyzer.enhance_themes_with_attribution(
+                    base_analysis.themes, deps["detection"], files
+                )
 
             # Phase 5: Evidence Aggregation
-            aggregated_evidence = await self.evidence_aggregator.aggregate_evidence(
-                detected_stakeholders, files
+            async def aggregate_evidence(deps):
+                return await self.evidence_aggregator.aggregate_evidence(
+                    deps["detection"], files
+                )
+
+            graph = StageGraph(
+                [
+                    Stage("detection", detect),
+                    Stage("cross_patterns", analyze_patterns, depends_on=("detection",)),
+                    Stage(
+                        "summary",
+                        summarize,
+                        depends_on=("detection", "cross_patterns"),
+                    ),
+                    Stage(
+                        "theme_attribution",
+                        attribute_themes,
+                        depends_on=("detection",),
+                    ),
+                    Stage(
+                        "evidence_aggregation",
+                        aggregate_evidence,
+                        depends_on=("detection",),
+                        uses_llm=False,
+                    ),
+                ],
+                max_concurrency=settings.analysis_stage_concurrency,
             )
+            phase_start = time.perf_counter()
+            phases = await graph.run()
+            phase_timings = {
+                name: round(seconds, 3) for name, seconds in graph.durations.items()
+            }
+            phase_timings["total"] = round(time.perf_counter() - phase_start, 3)
+            logger.info(f"V2 stakeholder phase timings: {phase_timings}")
+
+            detected_stakeholders = phases["detection"]
 
             # Assemble final result
             enhanced_analysis = self.report_assembler.assemble_final_result(
                 base_analysis=base_analysis,
                 stakeholder_intelligence=StakeholderIntelligence(
                     detected_stakeholders=detected_stakeholders,
-                    cross_stakeholder_patterns=cross_patterns,
-                    multi_stakeholder_summary=multi_summary,
+                    cross_stakeholder_patterns=phases["cross_patterns"],
+                    multi_stakeholder_summary=phases["summary"],
+                    processing_metadata={"phase_timings": phase_timings},
                 ),
-                enhanced_themes=enhanced_themes,
-                evidence=aggregated_evidence,
+                enhanced_themes=phases["theme_attribution"],
+                evidence=phases["evidence_aggregation"],
             )
 
             # Validate result
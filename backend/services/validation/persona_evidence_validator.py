@@ -13,12 +13,130 @@ This version does NOT gate saving; it only computes metrics.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 import re
 
 # Types
 StructuredTranscript = List[Dict[str, str]]  # [{speaker, dialogue}]
 
+_SPEAKER_LABELS = [
+    "researcher",
+    "interviewer",
+    "moderator",
+    "interviewee",
+    "participant",
+    "speaker",
+    "user",
+    "customer",
+    "stakeholder",
+]
+
+# Single-character replacements applied during normalization
+_CHAR_REPLACEMENTS = {
+    # Smart quotes/apostrophes
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2019": "'",
+    # Dashes and ellipsis
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2026": "...",
+    # Zero-width and non-breaking spaces
+    "\u200b": "",
+    "\u00a0": " ",
+}
+_WHITESPACE_RE = re.compile(r"[\s\n\r\t]+")
+_EDGE_PUNCTUATION = "\"'“”‘’[]()"
+
+
+def _strip_leading_timestamp(s: str) -> str:
+    """Remove leading bracketed timestamps like "[12:40]" (simple, non-regex)."""
+    # Do it repeatedly in case of stacked prefixes
+    s = s.lstrip()
+    while s.startswith("["):
+        close = s.find("]")
+        if 0 < close <= 8:
+            inside = s[1:close]
+            parts = inside.split(":")
+            if (
+                len(parts) == 2
+                and all(p.isdigit() for p in parts)
+                and len(parts[1]) in (2,)
+            ):
+                s = s[close + 1 :].lstrip()
+                continue
+        break
+    return s
+
+
+def _strip_leading_label(s: str) -> str:
+    """Strip common speaker labels at the start (no heavy regex)."""
+    s0 = s.lstrip()
+    for lbl in _SPEAKER_LABELS:
+        if s0.startswith(lbl + ":"):
+            return s0[len(lbl) + 1 :].lstrip()
+        if s0.startswith(lbl + " -"):
+            return s0[len(lbl) + 2 :].lstrip()
+    return s0
+
+
+def _normalize_with_offsets(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    Normalize like ``PersonaEvidenceValidator._normalize`` and map every
+    normalized character back to its index in ``text``.
+
+    Returns ``(normalized, None)`` if the character-wise mapping cannot
+    reproduce the normalized string (e.g. context-sensitive lowercasing).
+    """
+    text = text or ""
+    chars: List[str] = []
+    offs: List[int] = []
+    for i, ch in enumerate(text):
+        for lc in ch.lower():
+            chars.append(lc)
+            offs.append(i)
+    t = "".join(chars)
+
+    def keep(t: str, new: str, from_front: bool) -> Tuple[str, List[int]]:
+        # ``new`` is a prefix or suffix of ``t``; trim offsets to match
+        cut = len(t) - len(new)
+        return new, (offs[cut:] if from_front else offs[: len(offs) - cut])
+
+    t, offs = keep(t, t.lstrip(), True)
+    t, offs = keep(t, t.rstrip(), False)
+    t, offs = keep(t, _strip_leading_timestamp(t), True)
+    t, offs = keep(t, _strip_leading_label(t), True)
+
+    chars, mapped = [], []
+    for ch, o in zip(t, offs):
+        rep = _CHAR_REPLACEMENTS.get(ch, ch)
+        for rc in rep:
+            chars.append(rc)
+            mapped.append(o)
+    t, offs = "".join(chars), mapped
+
+    chars, mapped = [], []
+    pos = 0
+    for m in _WHITESPACE_RE.finditer(t):
+        chars.append(t[pos : m.start()])
+        mapped.extend(offs[pos : m.start()])
+        chars.append(" ")
+        mapped.append(offs[m.start()])
+        pos = m.end()
+    chars.append(t[pos:])
+    mapped.extend(offs[pos:])
+    t, offs = "".join(chars), mapped
+
+    t, offs = keep(t, t.lstrip(), True)
+    t, offs = keep(t, t.rstrip(), False)
+    t, offs = keep(t, t.lstrip(_EDGE_PUNCTUATION), True)
+    t, offs = keep(t, t.rstrip(_EDGE_PUNCTUATION), False)
+
+    expected = PersonaEvidenceValidator._normalize(text)
+    if t != expected:
+        return expected, None
+    return t, offs
+
 
 @dataclass
 class EvidenceMatch:
@@ -29,6 +147,144 @@ class EvidenceMatch:
     speaker: Optional[str]
 
 
+class TranscriptIndex:
+    """
+    Prepared transcript (or plain source text) for evidence matching.
+
+    Normalizes each segment once, keeps a normalized->original offset map so
+    normalized matches report real offsets, and holds token postings so the
+    fuzzy fallback only considers segments sharing a token with the quote.
+    Build one per result with ``PersonaEvidenceValidator.build_index`` and pass
+    it to ``match_evidence``, ``check_speaker_consistency`` and
+    ``detect_contamination``.
+    """
+
+    def __init__(
+        self,
+        segments: Sequence[Tuple[Optional[str], str]],
+        normalization: bool = True,
+        structured: bool = True,
+    ):
+        self.normalization = normalization
+        self.structured = structured
+        self.segment_speakers: List[Optional[str]] = []
+        self.dialogues: List[str] = []
+        self.global_offsets: List[int] = []
+        self.normalized: List[str] = []
+        self.offset_maps: List[Optional[List[int]]] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        global_offset = 0
+        for sid, (speaker, dialogue) in enumerate(segments):
+            dialogue = dialogue or ""
+            self.segment_speakers.append(speaker)
+            self.dialogues.append(dialogue)
+            self.global_offsets.append(global_offset)
+            global_offset += len(dialogue) + 1  # +1 for separator
+            if not normalization or not dialogue:
+                self.normalized.append("")
+                self.offset_maps.append(None)
+                continue
+            norm, offsets = _normalize_with_offsets(dialogue)
+            self.normalized.append(norm)
+            self.offset_maps.append(offsets)
+            for tok in set(norm.split()):
+                self.postings.setdefault(tok, []).append(sid)
+
+        self.speakers = {sp for sp in self.segment_speakers if sp}
+        self._found: Dict[str, Tuple[str, Optional[int], Optional[int], Optional[str]]] = {}
+        self._flags: Dict[Tuple[str, str], bool] = {}
+
+    @classmethod
+    def from_transcript(
+        cls, transcript: StructuredTranscript, normalization: bool = True
+    ) -> "TranscriptIndex":
+        return cls(
+            [(seg.get("speaker"), seg.get("dialogue", "")) for seg in transcript],
+            normalization=normalization,
+            structured=True,
+        )
+
+    @classmethod
+    def from_text(cls, text: str, normalization: bool = True) -> "TranscriptIndex":
+        return cls([(None, text or "")], normalization=normalization, structured=False)
+
+    def _fuzzy_first(self, norm_quote: str) -> Optional[int]:
+        """First segment sharing >= 25% of the quote's (2+) distinct tokens."""
+        q_tokens = set(norm_quote.split())
+        if len(q_tokens) < 2:
+            return None
+        shared: Dict[int, int] = {}
+        for tok in q_tokens:
+            for sid in self.postings.get(tok, ()):
+                shared[sid] = shared.get(sid, 0) + 1
+        hits = [sid for sid, n in shared.items() if n / len(q_tokens) >= 0.25]
+        return min(hits) if hits else None
+
+    def find(
+        self, quote: str
+    ) -> Tuple[str, Optional[int], Optional[int], Optional[str]]:
+        """
+        Locate a quote; returns (match_type, start, end, speaker).
+
+        The first segment with a verbatim, normalized or fuzzy match wins, as
+        with the per-segment scan. Offsets are transcript-level.
+        """
+        cached = self._found.get(quote)
+        if cached is not None:
+            return cached
+        result: Tuple[str, Optional[int], Optional[int], Optional[str]] = (
+            "no_match",
+            None,
+            None,
+            None,
+        )
+        if quote:
+            norm_quote = ""
+            last = len(self.dialogues) - 1
+            fuzzy_first = None
+            if self.normalization:
+                norm_quote = PersonaEvidenceValidator._normalize(quote)
+                fuzzy_first = self._fuzzy_first(norm_quote)
+                if fuzzy_first is not None:
+                    last = fuzzy_first
+            for sid in range(last + 1):
+                dialogue = self.dialogues[sid]
+                if not dialogue:
+                    continue
+                speaker = self.segment_speakers[sid]
+                base = self.global_offsets[sid]
+                idx = dialogue.find(quote)
+                if idx != -1:
+                    result = ("verbatim", base + idx, base + idx + len(quote), speaker)
+                    break
+                if not self.normalization:
+                    continue
+                j = self.normalized[sid].find(norm_quote)
+                if j != -1:
+                    offsets = self.offset_maps[sid]
+                    if offsets is not None and norm_quote:
+                        start = offsets[j]
+                        end = offsets[j + len(norm_quote) - 1] + 1
+                        result = ("normalized", base + start, base + end, speaker)
+                    else:
+                        result = ("normalized", None, None, speaker)
+                    break
+                if sid == fuzzy_first:
+                    result = ("normalized", None, None, speaker)
+                    break
+        self._found[quote] = result
+        return result
+
+    def flag(self, name: str, quote: str, predicate: Callable[[str], bool]) -> bool:
+        """Evaluate ``predicate`` on a quote once and cache it under ``name``."""
+        key = (name, quote)
+        value = self._flags.get(key)
+        if value is None:
+            value = self._flags[key] = bool(predicate(quote))
+        return value
+
+
 class PersonaEvidenceValidator:
     """Validator for persona evidence items against source text/transcript."""
 
@@ -66,7 +322,15 @@ class PersonaEvidenceValidator:
         return s.endswith("?")
 
     @staticmethod
-    def detect_contamination(personas_ssot: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _is_contaminated(quote: str) -> bool:
+        return PersonaEvidenceValidator._looks_like_metadata_line(
+            quote
+        ) or PersonaEvidenceValidator._looks_like_researcher_question(quote)
+
+    @staticmethod
+    def detect_contamination(
+        personas_ssot: List[Dict[str, Any]], index: Optional[TranscriptIndex] = None
+    ) -> Dict[str, Any]:
         cnt = 0
         examples: List[str] = []
         for p in personas_ssot or []:
@@ -88,11 +352,15 @@ class PersonaEvidenceValidator:
                     )
                     if not quote:
                         continue
-                    if PersonaEvidenceValidator._looks_like_metadata_line(
-                        quote
-                    ) or PersonaEvidenceValidator._looks_like_researcher_question(
-                        quote
-                    ):
+                    if index is not None and isinstance(quote, str):
+                        contaminated = index.flag(
+                            "contamination",
+                            quote,
+                            PersonaEvidenceValidator._is_contaminated,
+                        )
+                    else:
+                        contaminated = PersonaEvidenceValidator._is_contaminated(quote)
+                    if contaminated:
                         cnt += 1
                         if len(examples) < 5:
                             examples.append(str(quote)[:160])
@@ -104,50 +372,8 @@ class PersonaEvidenceValidator:
         # Lowercase early for consistent comparisons
         t = t.lower().strip()
 
-        # Remove leading bracketed timestamps like "[12:40]" (simple, non-regex)
-        # Do it repeatedly in case of stacked prefixes
-        def strip_leading_timestamp(s: str) -> str:
-            s = s.lstrip()
-            while s.startswith("["):
-                close = s.find("]")
-                if 0 < close <= 8:
-                    inside = s[1:close]
-                    parts = inside.split(":")
-                    if (
-                        len(parts) == 2
-                        and all(p.isdigit() for p in parts)
-                        and len(parts[1]) in (2,)
-                    ):
-                        s = s[close + 1 :].lstrip()
-                        continue
-                break
-            return s
-
-        t = strip_leading_timestamp(t)
-
-        # Strip common speaker labels at the start (no heavy regex)
-        labels = [
-            "researcher",
-            "interviewer",
-            "moderator",
-            "interviewee",
-            "participant",
-            "speaker",
-            "user",
-            "customer",
-            "stakeholder",
-        ]
-
-        def strip_leading_label(s: str) -> str:
-            s0 = s.lstrip()
-            for lbl in labels:
-                if s0.startswith(lbl + ":"):
-                    return s0[len(lbl) + 1 :].lstrip()
-                if s0.startswith(lbl + " -"):
-                    return s0[len(lbl) + 2 :].lstrip()
-            return s0
-
-        t = strip_leading_label(t)
+        t = _strip_leading_timestamp(t)
+        t = _strip_leading_label(t)
 
         # Normalize smart quotes/apostrophes
         t = t.replace("\u201c", '"').replace("\u201d", '"').replace("\u2019", "'")
@@ -168,54 +394,48 @@ class PersonaEvidenceValidator:
         bt = set(b.split())
         return len(bt) >= 2 and len(at & bt) / max(1, len(bt)) >= 0.25
 
+    def build_index(
+        self,
+        transcript: Optional[StructuredTranscript] = None,
+        source_text: Optional[str] = None,
+    ) -> TranscriptIndex:
+        """Prepare one index per result, shared by all personas and checks."""
+        if transcript:
+            return TranscriptIndex.from_transcript(transcript, self.normalization)
+        return TranscriptIndex.from_text(source_text or "", self.normalization)
+
     def _find_in_text(
         self, source: str, quote: str
     ) -> Tuple[str, Optional[int], Optional[int]]:
-        """Try exact and normalized matching against a single source string."""
+        """Try exact, normalized and fuzzy matching against a single source string."""
         if not source or not quote:
             return ("no_match", None, None)
-        # Exact match
-        idx = source.find(quote)
-        if idx != -1:
-            return ("verbatim", idx, idx + len(quote))
-        # Normalized match
-        if self.normalization:
-            norm_src = self._normalize(source)
-            norm_quote = self._normalize(quote)
-            idx = norm_src.find(norm_quote)
-            if idx != -1:
-                # Best-effort: cannot easily map back to original offsets; leave None
-                return ("normalized", None, None)
-            # Fuzzy token overlap as last resort
-            if self._fuzzy_contains(source, quote):
-                return ("normalized", None, None)
-        return ("no_match", None, None)
+        mtype, s, e, _ = TranscriptIndex.from_text(source, self.normalization).find(quote)
+        return (mtype, s, e)
 
     def _find_in_transcript(
         self, transcript: StructuredTranscript, quote: str
     ) -> Tuple[str, Optional[int], Optional[int], Optional[str]]:
         """Search each segment's dialogue; return match type and speaker when found."""
-        global_offset = 0
-        for seg in transcript:
-            dialogue = seg.get("dialogue", "")
-            speaker = seg.get("speaker")
-            mtype, s, e = self._find_in_text(dialogue, quote)
-            if mtype != "no_match":
-                # Map offsets to transcript-level by accumulating if needed
-                if s is not None and e is not None:
-                    return (mtype, global_offset + s, global_offset + e, speaker)
-                return (mtype, None, None, speaker)
-            global_offset += len(dialogue) + 1  # +1 for separator
-        return ("no_match", None, None, None)
+        return TranscriptIndex.from_transcript(transcript, self.normalization).find(quote)
 
     def match_evidence(
         self,
         persona_ssot: Dict[str, Any],
         source_text: Optional[str] = None,
         transcript: Optional[StructuredTranscript] = None,
+        index: Optional[TranscriptIndex] = None,
     ) -> List[EvidenceMatch]:
-        """Match each evidence item across core traits and return matches with offsets."""
+        """
+        Match each evidence item across core traits and return matches with offsets.
+
+        Pass ``index`` (see ``build_index``) when validating several personas
+        against the same source so the transcript is only prepared once.
+        """
         matches: List[EvidenceMatch] = []
+        if index is None:
+            index = self.build_index(transcript=transcript, source_text=source_text)
+        require_speaker = transcript is not None or index.structured
 
         def iter_evidence_items(trait: Optional[Dict[str, Any]]):
             if not isinstance(trait, dict):
@@ -236,17 +456,17 @@ class PersonaEvidenceValidator:
                 evidence_pool.append((idx, item))
                 idx += 1
 
-        for index, item in evidence_pool:
+        for pos, item in evidence_pool:
             quote = item.get("quote", "")
             # Treat missing attribution metadata as a hard no-match
             missing_doc = not (item.get("document_id") or "").strip()
             missing_speaker = False
-            if transcript is not None:
+            if require_speaker:
                 missing_speaker = not (item.get("speaker") or "").strip()
             if missing_doc or missing_speaker:
                 matches.append(
                     EvidenceMatch(
-                        index=index,
+                        index=pos,
                         match_type="no_match",
                         start_char=None,
                         end_char=None,
@@ -254,14 +474,12 @@ class PersonaEvidenceValidator:
                     )
                 )
                 continue
-            if transcript:
-                mtype, s, e, sp = self._find_in_transcript(transcript, quote)
-            else:
-                mtype, s, e = self._find_in_text(source_text or "", quote)
+            mtype, s, e, sp = index.find(quote)
+            if not index.structured:
                 sp = item.get("speaker")
             matches.append(
                 EvidenceMatch(
-                    index=index, match_type=mtype, start_char=s, end_char=e, speaker=sp
+                    index=pos, match_type=mtype, start_char=s, end_char=e, speaker=sp
                 )
             )
         return matches
@@ -300,14 +518,19 @@ class PersonaEvidenceValidator:
 
     @staticmethod
     def check_speaker_consistency(
-        persona_ssot: Dict[str, Any], transcript: Optional[StructuredTranscript]
+        persona_ssot: Dict[str, Any],
+        transcript: Optional[StructuredTranscript],
+        index: Optional[TranscriptIndex] = None,
     ) -> Dict[str, Any]:
         """When transcript speakers are available, ensure evidence speaker fields align (if provided).
         Also count missing speakers so the summary can reflect unverifiable items.
         """
-        if not transcript:
+        if index is not None and index.structured:
+            speakers = index.speakers
+        elif transcript:
+            speakers = {seg.get("speaker") for seg in transcript if seg.get("speaker")}
+        else:
             return {"speaker_mismatches": [], "missing_speaker_total": 0}
-        speakers = {seg.get("speaker") for seg in transcript if seg.get("speaker")}
 
         mismatches: List[Dict[str, Any]] = []
         missing = 0
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+# Startup script for the AxWise background job worker
+# Runs queued analyses (ANALYSIS_QUEUE_ENABLED=true on the API) and scales
+# independently of the API service
+
+WORKER_CONCURRENCY=${WORKER_CONCURRENCY:-2}
+
+echo "Starting AxWise job worker (concurrency $WORKER_CONCURRENCY)"
+
+exec python -m backend.services.jobs.worker --concurrency $WORKER_CONCURRENCY
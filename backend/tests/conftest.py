@@ -6,6 +6,8 @@ import pytest
 import json
 from pathlib import Path
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
@@ -15,6 +17,16 @@ from backend.models import User, InterviewData
 import os
 
 
+# Postgres-only JSONB columns are rendered as plain JSON on the SQLite test database
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(element, compiler, **kw):
+    return "JSON"
+
+
+# Keep the shared LLM response cache in-process during tests (no durable tier file)
+os.environ.setdefault("LLM_CACHE_BACKEND", "memory")
+
+
 # Enable factory-based stakeholder agent and consensus service in tests (development behavior)
 @pytest.fixture(scope="session", autouse=True)
 def _enable_stakeholder_features_for_tests():
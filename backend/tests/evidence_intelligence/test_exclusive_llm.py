@@ -314,9 +314,9 @@ class TestCriticalBugFixes:
         return ExclusiveLLMIntelligence(mock_llm), mock_llm
 
     @pytest.mark.asyncio
-    async def test_bug1_researcher_questions_not_in_evidence(self):
+    async def test_bug1_researcher_questions_not_in_evidence(self, intelligence_with_responses):
         """Bug 1: Researcher questions should NEVER appear as persona evidence."""
-        intelligence, mock_llm = intelligence_with_responses()
+        intelligence, mock_llm = intelligence_with_responses
 
         # The problematic question that was appearing as evidence
         researcher_question = "Given your responsibility for modular product lines, what specific challenges do you face today?"
@@ -333,9 +333,9 @@ class TestCriticalBugFixes:
         assert not hasattr(intelligence, "researcher_patterns")
 
     @pytest.mark.asyncio
-    async def test_bug2_age_extraction_works(self):
+    async def test_bug2_age_extraction_works(self, intelligence_with_responses):
         """Bug 2: Age should be extracted from all 25 interviewees."""
-        intelligence, mock_llm = intelligence_with_responses()
+        intelligence, mock_llm = intelligence_with_responses
 
         # Test all the formats that were failing
         failing_formats = [
@@ -352,9 +352,9 @@ class TestCriticalBugFixes:
             assert age == expected_age, f"Failed on: {text}"
 
     @pytest.mark.asyncio
-    async def test_bug3_validation_reports_correct_mismatches(self):
+    async def test_bug3_validation_reports_correct_mismatches(self, intelligence_with_responses):
         """Bug 3: Validation should report actual mismatches, not false success."""
-        intelligence, mock_llm = intelligence_with_responses()
+        intelligence, mock_llm = intelligence_with_responses
 
         # Evidence that includes a researcher question (should be invalid)
         evidence = {
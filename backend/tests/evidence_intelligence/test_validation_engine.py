@@ -0,0 +1,179 @@
+"""
+Tests for the prepared-source token overlap in ValidationEngine.
+"""
+
+import asyncio
+import random
+import re
+
+import pytest
+
+from backend.services.evidence_intelligence.evidence_attribution import (
+    AttributedEvidence,
+    EvidenceType,
+)
+from backend.services.evidence_intelligence.speaker_intelligence import SpeakerRole
+from backend.services.evidence_intelligence.validation_engine import (
+    ValidationEngine,
+    ValidationStatus,
+)
+
+WORDS = "We The invoice invoices reconcile manual spreadsheet budget approval vendor".split()
+
+
+def _evidence(text):
+    return AttributedEvidence(
+        text=text,
+        normalized_text=text.lower(),
+        speaker_id="p1",
+        speaker_role=SpeakerRole.PARTICIPANT,
+        evidence_type=EvidenceType.PAIN_POINT,
+    )
+
+
+def _reference_overlap(evidence_text, source_text):
+    """The per-window set construction the vectorized version replaces."""
+    evidence_tokens = set(evidence_text.lower().split())
+    best_overlap, best_segment = 0.0, ""
+    words = source_text.split()
+    window_size = len(evidence_text.split()) * 2
+    for i in range(len(words) - window_size + 1):
+        segment = " ".join(words[i : i + window_size])
+        segment_tokens = set(segment.lower().split())
+        union = evidence_tokens | segment_tokens
+        if union:
+            overlap = len(evidence_tokens & segment_tokens) / len(union)
+            if overlap > best_overlap:
+                best_overlap, best_segment = overlap, segment
+    return best_overlap, best_segment
+
+
+def test_windowed_overlap_matches_reference():
+    rng = random.Random(7)
+    engine = ValidationEngine({})
+    source = " ".join(rng.choice(WORDS) for _ in range(400))
+    prepared = engine.prepare_source(source)
+
+    cases = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))) for _ in range(40)]
+    cases += ["unknown words only", "budget unseen", source]
+    for text in cases:
+        result = engine._calculate_token_overlap(_evidence(text), source, prepared)
+        assert (
+            result["token_overlap_ratio"],
+            result["best_matching_segment"],
+        ) == _reference_overlap(text, source), text
+
+
+@pytest.mark.asyncio
+async def test_batch_validate_prepares_source_once(monkeypatch):
+    engine = ValidationEngine({})
+    source = "Participant: honestly the manual invoice reconcile takes days every single month"
+    prepared = []
+    original = engine.prepare_source
+
+    def counting_prepare(text):
+        prepared.append(text)
+        return original(text)
+
+    monkeypatch.setattr(engine, "prepare_source", counting_prepare)
+
+    results = await engine.batch_validate(
+        [_evidence("manual invoice reconcile takes days"), _evidence("unrelated words here")],
+        source,
+    )
+
+    assert len(prepared) == 1
+    verified = results["manual invoice reconcile takes days"]
+    assert verified.exact_match
+    assert verified.token_overlap_ratio == pytest.approx(5 / 10)
+    assert results["unrelated words here"].status == ValidationStatus.REFUTED
+
+
+class _BatchLLM:
+    """Fake LLM service that agrees with every odd-numbered item of a batch."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze(self, request):
+        self.calls += 1
+        count = len(re.findall(r"^\s*\d+\. ", request["prompt"], re.MULTILINE))
+        return {
+            "validations": [
+                {"index": i, "semantic_match": i % 2 == 1} for i in range(1, count + 1)
+            ]
+        }
+
+
+@pytest.mark.asyncio
+async def test_batch_validate_escalates_only_ambiguous_items_in_batches(monkeypatch):
+    monkeypatch.setattr(ValidationEngine, "LLM_BATCH_SIZE", 4)
+    services = {"model_a": _BatchLLM(), "model_b": _BatchLLM()}
+    engine = ValidationEngine(services)
+    source = (
+        "Participant: honestly the manual invoice reconcile takes days every single month "
+        "and our budget approval workflow is slow because the vendor portal is broken"
+    )
+
+    quotes = ["manual invoice reconcile takes days", "budget approval workflow is slow"]
+    contaminated = ["Interviewer: can you tell me why you do that?"]
+    ambiguous = [f"reconcile vendor budget item{i}" for i in range(6)]
+
+    results = await engine.batch_validate(
+        [_evidence(t) for t in quotes + contaminated + ambiguous], source
+    )
+
+    assert len(results) == 9
+    for text in quotes:
+        assert results[text].exact_match and not results[text].llm_agreements
+        assert "Settled by deterministic checks" in results[text].validation_notes
+    assert results[contaminated[0]].status == ValidationStatus.CONTAMINATED
+
+    # 6 ambiguous items -> 2 batches, one call per service each
+    assert [s.calls for s in services.values()] == [2, 2]
+    stats = engine.last_batch_stats
+    assert stats["escalated_to_llm"] == 6
+    assert stats["llm_calls"] == 4
+    assert stats["llm_calls_avoided"] == {"deterministic": 6, "batching": 8}
+
+    agreed = [results[t].llm_agreements for t in ambiguous]
+    assert all(set(a) == {"model_a", "model_b"} for a in agreed)
+    assert sum(1 for a in agreed if a["model_a"]) == 3
+
+
+class _SelfLimitingLLM(_BatchLLM):
+    """Fake service whose client takes its own slot, like AsyncGenAIClient."""
+
+    def __init__(self, limiter):
+        super().__init__()
+        self.limiter = limiter
+
+    async def analyze(self, request):
+        async with self.limiter.slot():
+            return await super().analyze(request)
+
+
+@pytest.mark.asyncio
+async def test_batch_llm_validation_shares_provider_limiter_without_nesting(monkeypatch):
+    from backend.services.evidence_intelligence import validation_engine
+    from backend.services.llm.concurrency import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter(name="gemini", initial_limit=1, min_limit=1, max_limit=1)
+    providers = []
+
+    def get_limiter(provider="gemini"):
+        providers.append(provider)
+        return limiter
+
+    monkeypatch.setattr(validation_engine, "get_concurrency_limiter", get_limiter)
+    services = {"primary": _BatchLLM(), "secondary": _SelfLimitingLLM(limiter)}
+    engine = ValidationEngine(services)
+
+    # Holding an outer slot around the self-limiting client would never return
+    results = await asyncio.wait_for(
+        engine._batch_llm_validation([_evidence("reconcile vendor budget")], "source", services),
+        timeout=5,
+    )
+
+    assert results[0]["llm_agreements"] == {"primary": True, "secondary": True}
+    assert providers == ["gemini"]
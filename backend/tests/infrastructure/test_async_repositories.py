@@ -0,0 +1,112 @@
+"""
+Tests for the async database path of the repositories and UnitOfWork.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import User
+from backend.infrastructure.persistence.async_database import to_async_url
+from backend.infrastructure.persistence.pipeline_run_repository import (
+    PipelineRunRepository,
+)
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+
+
+@pytest_asyncio.fixture
+async def async_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _seed_user(factory):
+    async with factory() as session:
+        session.add(User(user_id="test-user-id", email="test@example.com"))
+        await session.commit()
+
+
+def test_to_async_url():
+    assert (
+        to_async_url("postgresql://u:p@db:5432/app?sslmode=require")
+        == "postgresql+asyncpg://u:p@db:5432/app?ssl=require"
+    )
+    assert to_async_url("postgres://u@db/app") == "postgresql+asyncpg://u@db/app"
+    assert to_async_url("sqlite:///./axwise.db") == "sqlite+aiosqlite:///./axwise.db"
+    with pytest.raises(ValueError):
+        to_async_url("mysql://u@db/app")
+
+
+@pytest.mark.asyncio
+async def test_interview_and_analysis_crud(async_session_factory):
+    await _seed_user(async_session_factory)
+
+    async with UnitOfWork(async_session_factory) as uow:
+        assert uow.is_async
+        data_id = await uow.interviews.save(
+            "test-user-id", "test.txt", "free_text", "Interview content"
+        )
+        result_id = await uow.analyses.create(
+            "test-user-id", data_id, "test-provider", "test-model"
+        )
+        await uow.commit()
+
+    async with UnitOfWork(async_session_factory) as uow:
+        interview = await uow.interviews.get_by_id(data_id, "test-user-id")
+        assert interview["content"] == "Interview content"
+        assert await uow.interviews.get_by_id(data_id, "other-user") is None
+        assert len(await uow.interviews.list_by_user("test-user-id")) == 1
+
+        assert await uow.analyses.update_status(
+            result_id, "test-user-id", "completed", progress=1.0
+        )
+        await uow.commit()
+
+    async with UnitOfWork(async_session_factory) as uow:
+        result = await uow.analyses.get_by_id(result_id, "test-user-id")
+        assert result["status"] == "completed"
+        assert result["user_id"] == "test-user-id"
+        assert len(await uow.analyses.get_by_data_id(data_id, "test-user-id")) == 1
+        assert await uow.analyses.get_by_data_id(data_id, "other-user") == []
+        assert await uow.analyses.get_by_id(result_id, "other-user") is None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(async_session_factory):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(async_session_factory) as uow:
+            await uow.pipeline_runs.create_pipeline_run(
+                job_id="job-1", business_context={"business_idea": "x"}
+            )
+            raise RuntimeError("boom")
+
+    async with UnitOfWork(async_session_factory) as uow:
+        assert await uow.pipeline_runs.get_by_job_id("job-1") is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_run_repository(async_session_factory):
+    async with async_session_factory() as session:
+        repo = PipelineRunRepository(session)
+        await repo.create_pipeline_run(job_id="job-2", business_context={})
+        await repo.update_pipeline_run_status("job-2", "running")
+        await session.commit()
+
+        assert (await repo.get_by_job_id("job-2")).status == "running"
+        assert await repo.count_pipeline_runs(status="running") == 1
+        assert len(await repo.get_all_pipeline_runs(status="running")) == 1
+        assert await repo.count() == 1
+
+
+def test_sync_context_rejects_async_factory():
+    factory = async_sessionmaker(
+        bind=create_async_engine("sqlite+aiosqlite://"), class_=AsyncSession
+    )
+    with pytest.raises(TypeError):
+        with UnitOfWork(factory):
+            pass
@@ -0,0 +1,402 @@
+"""
+Tests for the durable background job queue and worker.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.database import Base
+from backend.models import AnalysisResult, PipelineRun, User
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.services.jobs import ANALYSIS_JOB_TYPE, JobQueue, JobWorker
+from backend.utils.timezone_utils import utc_now
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    # File-backed so concurrent sessions use separate connections, as in production
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add_all(
+            [User(user_id="alice", email="a@example.com"), User(user_id="bob", email="b@example.com")]
+        )
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+@pytest.fixture
+def queue(session_factory):
+    return JobQueue(session_factory)
+
+
+async def _get(session_factory, job_id):
+    async with session_factory() as session:
+        result = await session.execute(select(PipelineRun).where(PipelineRun.job_id == job_id))
+        return result.scalars().first()
+
+
+async def _claim(queue, worker="w1", **limits):
+    limits.setdefault("global_limit", 10)
+    limits.setdefault("per_user_limit", 10)
+    return await queue.claim(worker, [ANALYSIS_JOB_TYPE], lease_seconds=60, **limits)
+
+
+@pytest.mark.asyncio
+async def test_claims_follow_priority_then_age(queue):
+    low = await queue.enqueue(ANALYSIS_JOB_TYPE, {"n": 1}, user_id="alice")
+    high = await queue.enqueue(ANALYSIS_JOB_TYPE, {"n": 2}, user_id="alice", priority=5)
+    low2 = await queue.enqueue(ANALYSIS_JOB_TYPE, {"n": 3}, user_id="alice")
+
+    claimed = [(await _claim(queue)).job_id for _ in range(3)]
+
+    assert claimed == [high, low, low2]
+    assert await _claim(queue) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_respects_per_user_and_global_caps(queue):
+    for _ in range(2):
+        await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="alice")
+    bob_job = await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="bob")
+
+    first = await _claim(queue, per_user_limit=1, global_limit=2)
+    assert first.user_id == "alice"
+    # Alice is at her cap, so Bob's newer job is claimed next
+    second = await _claim(queue, per_user_limit=1, global_limit=2)
+    assert second.job_id == bob_job
+    # Global cap reached
+    assert await _claim(queue, per_user_limit=1, global_limit=2) is None
+
+
+@pytest.mark.asyncio
+async def test_only_lease_owner_can_heartbeat_or_complete(queue, session_factory):
+    job_id = await queue.enqueue(ANALYSIS_JOB_TYPE, {"result_id": 7}, user_id="alice")
+    job = await _claim(queue, worker="w1")
+    assert job.payload == {"result_id": 7}
+    assert job.attempts == 1
+
+    assert await queue.heartbeat(job_id, "w1", 60)
+    assert not await queue.heartbeat(job_id, "w2", 60)
+    assert not await queue.complete(job_id, "w2")
+    assert await queue.complete(job_id, "w1")
+
+    row = await _get(session_factory, job_id)
+    assert row.status == "completed"
+    assert row.lease_owner is None
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_retry_until_max_attempts(queue, session_factory):
+    job_id = await queue.enqueue(
+        ANALYSIS_JOB_TYPE, {}, user_id="alice", max_attempts=2
+    )
+
+    await _claim(queue)
+    assert await queue.fail(job_id, "w1", "boom", retry_delay_seconds=3600) == "pending"
+    # Backoff keeps the job out of reach until available_at
+    assert await _claim(queue) is None
+
+    async with session_factory() as session:
+        await session.execute(
+            update(PipelineRun)
+            .where(PipelineRun.job_id == job_id)
+            .values(available_at=utc_now() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    job = await _claim(queue)
+    assert job.attempts == 2
+    assert await queue.fail(job_id, "w1", "boom again", retry_delay_seconds=0) == "failed"
+    assert await _claim(queue) is None
+
+    row = await _get(session_factory, job_id)
+    assert row.status == "failed"
+    assert row.error == "boom again"
+
+
+async def _add_analysis(session_factory):
+    async with session_factory() as session:
+        analysis = AnalysisResult(status="processing", results={"current_stage": "THEMES"})
+        session.add(analysis)
+        await session.commit()
+        return analysis.result_id
+
+
+async def _get_analysis(session_factory, result_id):
+    async with session_factory() as session:
+        return await session.get(AnalysisResult, result_id)
+
+
+@pytest.mark.asyncio
+async def test_exhausted_job_fails_its_analysis(queue, session_factory):
+    result_id = await _add_analysis(session_factory)
+    job_id = await queue.enqueue(
+        ANALYSIS_JOB_TYPE,
+        {"result_id": result_id},
+        user_id="alice",
+        max_attempts=2,
+        analysis_id=str(result_id),
+    )
+
+    await _claim(queue)
+    assert await queue.fail(job_id, "w1", "boom", retry_delay_seconds=0) == "pending"
+    # A retry is still coming, so the analysis keeps processing
+    assert (await _get_analysis(session_factory, result_id)).status == "processing"
+
+    await _claim(queue)
+    assert await queue.fail(job_id, "w1", "ValueError: no data", retry_delay_seconds=0) == "failed"
+
+    analysis = await _get_analysis(session_factory, result_id)
+    assert analysis.status == "failed"
+    assert analysis.error_message == "ValueError: no data"
+    assert analysis.completed_at is not None
+    assert analysis.results["status"] == "error"
+    assert analysis.results["error_details"] == "ValueError: no data"
+    assert analysis.results["current_stage"] == "THEMES"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_on_last_attempt_fails_its_analysis(queue, session_factory):
+    result_id = await _add_analysis(session_factory)
+    job_id = await queue.enqueue(
+        ANALYSIS_JOB_TYPE, {}, user_id="alice", max_attempts=1, analysis_id=str(result_id)
+    )
+    await _claim(queue, worker="dead-worker")
+
+    async with session_factory() as session:
+        await session.execute(
+            update(PipelineRun)
+            .where(PipelineRun.job_id == job_id)
+            .values(lease_expires_at=utc_now() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    assert await queue.requeue_expired([ANALYSIS_JOB_TYPE]) == 1
+    assert (await _get(session_factory, job_id)).status == "failed"
+    analysis = await _get_analysis(session_factory, result_id)
+    assert analysis.status == "failed"
+    assert "dead-worker" in analysis.error_message
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_requeued(queue, session_factory):
+    job_id = await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="alice")
+    await _claim(queue, worker="dead-worker")
+    assert await queue.requeue_expired([ANALYSIS_JOB_TYPE]) == 0
+
+    async with session_factory() as session:
+        await session.execute(
+            update(PipelineRun)
+            .where(PipelineRun.job_id == job_id)
+            .values(lease_expires_at=utc_now() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    assert await queue.requeue_expired([ANALYSIS_JOB_TYPE]) == 1
+    job = await _claim(queue, worker="w2")
+    assert job.job_id == job_id
+    assert job.attempts == 2
+    # The dead worker can no longer settle the job
+    assert not await queue.complete(job_id, "dead-worker")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_run_listings_exclude_queued_jobs(queue, session_factory):
+    await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="alice")
+
+    async with UnitOfWork(session_factory) as uow:
+        await uow.pipeline_runs.create_pipeline_run("pipeline-1", {}, user_id="alice")
+        await uow.commit()
+
+    async with UnitOfWork(session_factory) as uow:
+        runs = await uow.pipeline_runs.get_all_pipeline_runs(user_id="alice")
+        assert [r.job_id for r in runs] == ["pipeline-1"]
+        assert await uow.pipeline_runs.count_pipeline_runs(user_id="alice") == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_jobs_and_records_failures(queue, session_factory):
+    seen = []
+
+    async def handler(job):
+        seen.append(job.payload["n"])
+        if job.payload["n"] == 2:
+            raise RuntimeError("handler failed")
+
+    ok_id = await queue.enqueue(ANALYSIS_JOB_TYPE, {"n": 1}, user_id="alice")
+    bad_id = await queue.enqueue(
+        ANALYSIS_JOB_TYPE, {"n": 2}, user_id="bob", max_attempts=1
+    )
+
+    worker = JobWorker(
+        {ANALYSIS_JOB_TYPE: handler},
+        queue=queue,
+        worker_id="w1",
+        concurrency=2,
+        poll_interval=0.01,
+        lease_seconds=60,
+        heartbeat_seconds=30,
+    )
+    stop = asyncio.Event()
+    run = asyncio.create_task(worker.run(stop))
+    for _ in range(200):
+        if len(seen) == 2 and not worker._tasks:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(run, timeout=5)
+
+    assert sorted(seen) == [1, 2]
+    assert (await _get(session_factory, ok_id)).status == "completed"
+    failed = await _get(session_factory, bad_id)
+    assert failed.status == "failed"
+    assert "handler failed" in failed.error
+
+
+@pytest.mark.asyncio
+async def test_worker_abandons_job_when_lease_is_lost(queue, session_factory):
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def handler(job):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    job_id = await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="alice")
+    worker = JobWorker(
+        {ANALYSIS_JOB_TYPE: handler},
+        queue=queue,
+        worker_id="w1",
+        lease_seconds=60,
+        heartbeat_seconds=0.01,
+    )
+    execution = asyncio.create_task(worker.run_once())
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    # Another node took the job over
+    async with session_factory() as session:
+        await session.execute(
+            update(PipelineRun)
+            .where(PipelineRun.job_id == job_id)
+            .values(lease_owner="w2")
+        )
+        await session.commit()
+
+    assert await asyncio.wait_for(execution, timeout=5)
+    assert cancelled.is_set()
+    assert (await _get(session_factory, job_id)).status == "running"
+
+
+@pytest.mark.asyncio
+async def test_job_trace_is_stored_and_found_by_analysis(queue, session_factory):
+    from backend.infrastructure.persistence.pipeline_run_repository import (
+        PipelineRunRepository,
+    )
+
+    job_id = await queue.enqueue(ANALYSIS_JOB_TYPE, {}, user_id="alice", analysis_id="17")
+    trace = [{"stage_name": "theme_extraction", "status": "completed", "duration_seconds": 1.5}]
+
+    async with session_factory() as session:
+        repo = PipelineRunRepository(session)
+        await repo.record_job_trace(job_id, trace)
+        await session.commit()
+
+    async with session_factory() as session:
+        run = await PipelineRunRepository(session).get_latest_for_analysis("17")
+        assert run.job_id == job_id
+        assert run.execution_trace == trace
+
+
+@pytest.fixture
+def analysis_db(tmp_path, monkeypatch):
+    """Sync session used by AnalysisService._run_data_task, with one processing analysis."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import backend.database
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'analysis.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with factory() as session:
+        analysis = AnalysisResult(status="processing", results={"current_stage": "PREPROCESSING"})
+        session.add(analysis)
+        session.commit()
+        result_id = analysis.result_id
+
+    def get_db():
+        yield factory()
+
+    monkeypatch.setattr(backend.database, "get_db", get_db)
+    yield factory, result_id
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "error, final_attempt, retried",
+    [
+        (httpx.ConnectError("connection refused"), False, True),
+        (RuntimeError("stage failed"), False, True),
+        (httpx.ConnectError("connection refused"), True, False),
+        (ValueError("bad transcript"), False, False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_transient_analysis_errors_are_left_to_the_queue(
+    analysis_db, monkeypatch, error, final_attempt, retried
+):
+    from backend.services import analysis_service
+
+    factory, result_id = analysis_db
+    if isinstance(error, RuntimeError):
+        # Transient errors wrapped by a pipeline stage still count
+        try:
+            raise error from asyncio.TimeoutError()
+        except RuntimeError:
+            pass
+
+    async def process_data(**kwargs):
+        raise error
+
+    monkeypatch.setattr(analysis_service, "process_data", process_data)
+    service = analysis_service.AnalysisService(None, None)
+
+    if retried:
+        with pytest.raises(type(error)):
+            await service._run_data_task(result_id, None, None, {}, {}, final_attempt)
+    else:
+        await service._run_data_task(result_id, None, None, {}, {}, final_attempt)
+
+    with factory() as session:
+        analysis = session.get(AnalysisResult, result_id)
+    assert analysis.status == ("processing" if retried else "failed")
+
+
+@pytest.mark.parametrize(
+    "usage_data, subscription_status, expected",
+    [
+        (None, None, 0),
+        ({"subscription": {"tier": "pro", "status": "active"}}, "active", 2),
+        ({"subscription": {"tier": "enterprise"}}, None, 3),
+        ({}, "trialing", 2),
+    ],
+)
+def test_queue_priority_follows_subscription_tier(usage_data, subscription_status, expected):
+    from backend.services.analysis_service import AnalysisService
+
+    user = User(user_id="alice", usage_data=usage_data, subscription_status=subscription_status)
+    assert AnalysisService(None, user)._queue_priority() == expected
@@ -0,0 +1,121 @@
+"""
+Tests for pipeline spans, per-analysis traces and the Prometheus exporter.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.infrastructure.tracing import (
+    PipelineMetrics,
+    llm_span,
+    pipeline_metrics,
+    record_llm_cache_hit,
+    span,
+    trace_pipeline,
+)
+
+
+def _response(prompt, completion):
+    usage = SimpleNamespace(prompt_token_count=prompt, candidates_token_count=completion)
+    return SimpleNamespace(usage_metadata=usage)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    pipeline_metrics.reset()
+    yield
+    pipeline_metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_are_attributed_to_innermost_stage():
+    async def persona_call():
+        with llm_span("persona_formation", "gemini") as call:
+            call.retry()
+            call.record_usage(_response(120, 30))
+
+    with trace_pipeline(42) as trace:
+        with span("nlp_pipeline"):
+            with span("theme_extraction"):
+                with llm_span("theme_analysis") as call:
+                    call.record_usage(_response(100, 20))
+                record_llm_cache_hit()
+            with span("persona_formation"):
+                # Tasks inherit the enclosing stage
+                await asyncio.gather(persona_call(), persona_call())
+
+    stages = trace.stages
+    assert stages["theme_extraction"].llm_calls == 1
+    assert stages["theme_extraction"].prompt_tokens == 100
+    assert stages["theme_extraction"].cache_hits == 1
+    assert stages["persona_formation"].llm_calls == 2
+    assert stages["persona_formation"].retries == 2
+    assert stages["persona_formation"].completion_tokens == 60
+    assert stages["nlp_pipeline"].llm_calls == 0
+
+    parents = {s["name"]: s["parent"] for s in trace.spans if s["kind"] == "stage"}
+    assert parents == {
+        "theme_extraction": "nlp_pipeline",
+        "persona_formation": "nlp_pipeline",
+        "nlp_pipeline": None,
+    }
+
+
+def test_trace_summary_and_stage_traces():
+    with trace_pipeline(7) as trace:
+        with span("theme_extraction"):
+            with llm_span("theme_analysis") as call:
+                call.record_usage(_response(10, 5))
+        with pytest.raises(ValueError):
+            with span("insight_generation"):
+                raise ValueError("boom")
+
+    summary = trace.to_dict()
+    assert summary["analysis_id"] == 7
+    assert summary["llm"]["calls"] == 1
+    assert summary["llm"]["prompt_tokens"] == 10
+    walls = [stats["wall_seconds"] for stats in summary["stages"].values()]
+    assert walls == sorted(walls, reverse=True)
+
+    entries = trace.to_stage_traces()
+    assert [e["stage_name"] for e in entries] == ["theme_extraction", "insight_generation"]
+    assert entries[0]["status"] == "completed"
+    assert entries[0]["outputs"]["llm_calls"] == 1
+    assert entries[1]["status"] == "failed"
+    assert entries[0]["started_at"] <= entries[0]["completed_at"]
+
+
+def test_spans_without_trace_only_feed_metrics():
+    with span("transcript_parsing"):
+        pass
+    with pytest.raises(RuntimeError):
+        with llm_span("analysis") as call:
+            call.retry()
+            raise RuntimeError("quota")
+
+    assert pipeline_metrics.stage_seconds["transcript_parsing"].count == 1
+    assert pipeline_metrics.llm_errors == {"analysis": 1}
+    assert pipeline_metrics.llm_retries == {"analysis": 1}
+
+
+def test_render_prometheus():
+    metrics = PipelineMetrics()
+    metrics.observe_stage("theme_extraction", 0.3)
+    metrics.observe_stage("theme_extraction", 7.0, error=True)
+    metrics.observe_llm("theme_analysis", 2.0, prompt_tokens=100, completion_tokens=20)
+    metrics.record_cache_hit()
+
+    text = metrics.render_prometheus()
+
+    assert "# TYPE axwise_pipeline_stage_seconds histogram" in text
+    assert 'axwise_pipeline_stage_seconds_bucket{stage="theme_extraction",le="0.5"} 1' in text
+    assert 'axwise_pipeline_stage_seconds_bucket{stage="theme_extraction",le="10.0"} 2' in text
+    assert 'axwise_pipeline_stage_seconds_bucket{stage="theme_extraction",le="+Inf"} 2' in text
+    assert 'axwise_pipeline_stage_seconds_count{stage="theme_extraction"} 2' in text
+    assert 'axwise_pipeline_stage_errors_total{stage="theme_extraction"} 1' in text
+    assert 'axwise_llm_tokens_total{task="theme_analysis",kind="prompt"} 100' in text
+    assert "axwise_llm_cache_hits_total 1" in text
+    assert metrics.stage_seconds["theme_extraction"].quantile(0.5) == 0.5
+    assert metrics.stage_seconds["theme_extraction"].quantile(0.95) == 10
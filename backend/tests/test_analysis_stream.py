@@ -0,0 +1,102 @@
+"""
+Tests for streaming partial analysis results over server-sent events.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.infrastructure.events.analysis_stream import (
+    analysis_stream,
+    publish_analysis_event,
+    stream_analysis_events,
+)
+
+
+def _parse(chunk):
+    if chunk.startswith(":"):
+        return ("keepalive", None)
+    lines = chunk.strip().split("\n")
+    return (lines[0][len("event: "):], json.loads(lines[1][len("data: "):]))
+
+
+async def _collect(stream):
+    return [_parse(chunk) async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_delivers_artifacts_in_order_then_completes():
+    analysis_id = 9001
+
+    async def load_status():
+        return "processing"
+
+    consumer = asyncio.create_task(
+        _collect(stream_analysis_events(analysis_id, load_status, keepalive_seconds=5))
+    )
+    await asyncio.sleep(0)  # let the consumer subscribe
+
+    await publish_analysis_event(analysis_id, "themes", [{"name": "Manual reconciliation"}])
+    await publish_analysis_event(analysis_id, "patterns", [{"name": "Workarounds"}])
+    await publish_analysis_event(9002, "themes", [{"name": "Other analysis"}])
+    await publish_analysis_event(analysis_id, "personas", [{"name": "Controller"}])
+    await publish_analysis_event(
+        analysis_id, "complete", {"result_id": analysis_id, "status": "completed"}
+    )
+
+    events = await asyncio.wait_for(consumer, timeout=5)
+
+    assert [kind for kind, _ in events] == ["themes", "patterns", "personas", "complete"]
+    assert events[0][1] == [{"name": "Manual reconciliation"}]
+    assert analysis_id not in analysis_stream._subscribers
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_receives_artifacts_already_produced():
+    analysis_id = 9003
+    await publish_analysis_event(analysis_id, "progress", {"progress": 0.2})
+    await publish_analysis_event(analysis_id, "themes", ["a"])
+    await publish_analysis_event(analysis_id, "progress", {"progress": 0.45})
+
+    async def load_status():
+        return "processing"
+
+    stream = stream_analysis_events(analysis_id, load_status, keepalive_seconds=5)
+    first = _parse(await stream.__anext__())
+    second = _parse(await stream.__anext__())
+    await stream.aclose()
+
+    # Only the latest progress is replayed
+    assert {first[0], second[0]} == {"progress", "themes"}
+    assert ("progress", {"progress": 0.45}) in (first, second)
+
+    await publish_analysis_event(analysis_id, "error", {"status": "failed"})
+    assert analysis_id not in analysis_stream._snapshots
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_to_stored_status():
+    statuses = iter(["processing", "processing", "completed"])
+
+    async def load_status():
+        return next(statuses)
+
+    events = await _collect(
+        stream_analysis_events(9004, load_status, keepalive_seconds=0.01)
+    )
+
+    assert events == [
+        ("keepalive", None),
+        ("complete", {"result_id": 9004, "status": "completed"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_finished_analysis_closes_immediately():
+    async def load_status():
+        return "failed"
+
+    events = await _collect(stream_analysis_events(9005, load_status))
+
+    assert events == [("error", {"result_id": 9005, "status": "failed"})]
@@ -275,3 +275,56 @@ def test_v2_scoped_offsets_speaker_and_dedup(mock_llm_service):
         pytest.approx(metrics.get("cross_field_duplicate_ratio", 0.0), rel=1e-6) == 0.0
     )
     assert metrics.get("rejection_rate_overlap", 0.0) >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_llm_filter_quotes_batch_single_call(service, mock_llm_service):
+    """All fields are gated in one LLM call."""
+    service.enable_llm_filter = True
+    mock_llm_service.analyze.return_value = {
+        "fields": [
+            {"field": "goals", "approved_indices": [0]},
+            {"field": "skills", "approved_indices": [1, 7]},
+        ]
+    }
+
+    result = await service.llm_filter_quotes_batch(
+        {"goals": ["I want x", "Interviewer: why?"], "skills": ["Q: tools?", "Figma"]},
+        {"speaker": "Alex"},
+    )
+
+    assert result == {"goals": {0}, "skills": {1}}
+    assert mock_llm_service.analyze.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_filter_quotes_batch_falls_back_per_field(service, mock_llm_service):
+    """Fields missing from the batched answer are gated individually."""
+    service.enable_llm_filter = True
+    mock_llm_service.analyze.side_effect = [
+        {"fields": [{"field": "goals", "approved_indices": [1]}]},
+        {"approved_indices": [0]},
+    ]
+
+    result = await service.llm_filter_quotes_batch(
+        {"goals": ["a", "b"], "skills": ["c", "d"], "empty": []}
+    )
+
+    assert result == {"goals": {1}, "skills": {0}, "empty": set()}
+    assert mock_llm_service.analyze.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_filter_quotes_batch_fails_open(service, mock_llm_service):
+    """Errors and a disabled gate approve every quote."""
+    service.enable_llm_filter = True
+    mock_llm_service.analyze.side_effect = RuntimeError("boom")
+
+    result = await service.llm_filter_quotes_batch({"goals": ["a", "b"]})
+    assert result == {"goals": {0, 1}}
+
+    service.enable_llm_filter = False
+    mock_llm_service.analyze.reset_mock()
+    result = await service.llm_filter_quotes_batch({"goals": ["a"]})
+    assert result == {"goals": {0}}
+    mock_llm_service.analyze.assert_not_awaited()
@@ -0,0 +1,140 @@
+"""
+Tests for incremental parsing of streamed LLM JSON responses.
+"""
+
+import json
+import random
+
+import pytest
+
+from backend.services.llm.async_genai_client import AsyncGenAIClient
+from backend.services.llm.base_llm_service import BaseLLMService
+from backend.services.llm.response_cache import (
+    LLMResponseCache,
+    MemoryLRUBackend,
+    set_llm_response_cache,
+)
+from backend.utils.json.incremental_parser import (
+    IncrementalJSONParser,
+    iter_json_items,
+    select_items,
+)
+
+RESPONSE = {
+    "summary": "Brackets [ and ] and braces { } inside strings",
+    "themes": [
+        {
+            "name": f"Theme {i}",
+            "statements": ['She said "it\'s slow" \\ twice', "Export, then fix"],
+            "frequency": i / 10,
+        }
+        for i in range(4)
+    ],
+    "keywords": ["invoice", "export"],
+}
+
+
+def _feed_randomly(parser, text, seed):
+    rng = random.Random(seed)
+    items, pos = [], 0
+    while pos < len(text):
+        size = rng.randint(1, 8)
+        items.extend(parser.feed(text[pos : pos + size]))
+        pos += size
+    return items
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.parametrize("item_key", [None, "themes", "keywords", "missing"])
+def test_items_are_emitted_regardless_of_chunk_boundaries(item_key):
+    text = "```json\n" + json.dumps(RESPONSE, indent=2) + "\n```"
+    for seed in range(20):
+        parser = IncrementalJSONParser(item_key)
+        assert _feed_randomly(parser, text, seed) == select_items(RESPONSE, item_key)
+        assert parser.close().value == RESPONSE
+
+
+def test_each_element_is_emitted_when_it_closes():
+    parser = IncrementalJSONParser()
+    assert parser.feed('[{"name": "A"}, {"name": "B", "tags": ["x"') == [{"name": "A"}]
+    assert parser.feed("]}") == [{"name": "B", "tags": ["x"]}]
+    # Scalars complete at the following comma or the closing bracket
+    assert parser.feed(', "c", 3') == ["c"]
+    assert parser.feed("]") == [3]
+    # Text after the document is ignored
+    assert parser.feed(' {"late": 1}') == []
+    assert parser.items_emitted == 4
+
+
+@pytest.mark.asyncio
+async def test_truncated_last_element_is_recovered_on_close():
+    items = [
+        item
+        async for item in iter_json_items(
+            _chunks('{"personas": [{"name": "Ann"}, ', '{"name": "Bo", "goals": ["save ti')
+        )
+    ]
+    assert items == [{"name": "Ann"}, {"name": "Bo", "goals": ["save ti"]}]
+
+
+class _StreamingClient(AsyncGenAIClient):
+    def __init__(self, parts):
+        self.default_model = "gemini-test"
+        self.parts = parts
+        self.streams = 0
+
+    async def generate_content_stream(self, task, prompt, **kwargs):
+        self.streams += 1
+        for part in self.parts:
+            yield part
+
+
+@pytest.mark.asyncio
+async def test_client_streams_items_and_caches_the_response():
+    set_llm_response_cache(LLMResponseCache([MemoryLRUBackend()]))
+    try:
+        client = _StreamingClient(['{"themes": [{"name": "A"},', ' {"name": "B"}]}'])
+        config = {"temperature": 0.0}
+
+        first = [
+            item
+            async for item in client.generate_content_items(
+                "theme_analysis", "text", custom_config=config
+            )
+        ]
+        second = [
+            item
+            async for item in client.generate_content_items(
+                "theme_analysis", "text", custom_config=config
+            )
+        ]
+    finally:
+        set_llm_response_cache(None)
+
+    assert first == second == [{"name": "A"}, {"name": "B"}]
+    assert client.streams == 1
+
+
+class _BatchService(BaseLLMService):
+    def _get_system_message(self, task, request):
+        return ""
+
+    async def _call_llm_api(self, system_message, text, task, request):
+        return {"themes": [{"name": "A"}, {"name": "B"}], "error": None}
+
+    def _parse_llm_response(self, response, task):
+        return response
+
+    def _post_process_results(self, result, task):
+        return result
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_services_yield_items_after_analyze():
+    service = _BatchService({})
+    items = [item async for item in service.analyze_stream({"task": "theme_analysis"})]
+    assert items == [{"name": "A"}, {"name": "B"}]
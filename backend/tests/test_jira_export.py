@@ -2,13 +2,15 @@
 Tests for Jira export functionality.
 """
 
+import base64
+import json
+import re
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from backend.models.jira_export import (
-    JiraCredentials,
-    JiraExportRequest,
-    JiraConnectionTestRequest,
-)
+from unittest.mock import Mock, patch
+from backend.models.jira_export import JiraCredentials, JiraExportRequest
+from backend.services.export.jira_client import AsyncJiraClient
 from backend.services.export.jira_exporter import JiraExporter
 
 
@@ -82,173 +84,388 @@ def test_jira_export_request_validation():
     assert request.include_acceptance_criteria is True
 
 
-def test_get_auth_headers(jira_exporter, jira_credentials):
-    """Test authentication headers generation."""
-    headers = jira_exporter._get_auth_headers(jira_credentials)
-    
-    assert "Authorization" in headers
-    assert headers["Authorization"].startswith("Basic ")
-    assert headers["Content-Type"] == "application/json"
-    assert headers["Accept"] == "application/json"
+def _client(credentials, handler):
+    return AsyncJiraClient(credentials, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_client_sends_basic_auth_headers(jira_credentials):
+    """Test authentication headers are sent with every request."""
+    seen = []
 
+    def handler(request):
+        seen.append(request.headers)
+        return httpx.Response(200, json={"displayName": "Test User"})
 
-@patch('backend.services.export.jira_exporter.requests.get')
-def test_test_connection_success(mock_get, jira_exporter, jira_credentials):
+    async with _client(jira_credentials, handler) as client:
+        await client.get_myself()
+
+    token = base64.b64encode(b"test@example.com:test-token").decode("ascii")
+    assert seen[0]["Authorization"] == f"Basic {token}"
+    assert seen[0]["Content-Type"] == "application/json"
+    assert seen[0]["Accept"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_test_connection_async_success(jira_exporter, jira_credentials):
     """Test successful Jira connection."""
-    # Mock user response
-    user_response = Mock()
-    user_response.status_code = 200
-    user_response.json.return_value = {"displayName": "Test User"}
-    
-    # Mock project response
-    project_response = Mock()
-    project_response.status_code = 200
-    project_response.json.return_value = {"name": "Test Project"}
-    
-    # Configure mock to return different responses
-    mock_get.side_effect = [user_response, project_response]
-    
-    result = jira_exporter.test_connection(jira_credentials)
-    
+    def handler(request):
+        if request.url.path == "/rest/api/3/myself":
+            return httpx.Response(200, json={"displayName": "Test User"})
+        return httpx.Response(200, json={"name": "Test Project"})
+
+    async with _client(jira_credentials, handler) as client:
+        result = await jira_exporter.test_connection_async(jira_credentials, client)
+
     assert result.success is True
     assert result.user_name == "Test User"
     assert result.project_name == "Test Project"
     assert "successful" in result.message.lower()
 
 
-@patch('backend.services.export.jira_exporter.requests.get')
-def test_test_connection_auth_failure(mock_get, jira_exporter, jira_credentials):
-    """Test Jira connection with authentication failure."""
-    # Mock failed authentication
-    user_response = Mock()
-    user_response.status_code = 401
-    user_response.text = "Unauthorized"
-    
-    mock_get.return_value = user_response
-    
-    result = jira_exporter.test_connection(jira_credentials)
-    
-    assert result.success is False
-    assert "Authentication failed" in result.message
+@pytest.mark.asyncio
+async def test_test_connection_async_project_access_failure(jira_exporter, jira_credentials):
+    """Test Jira connection with project access failure."""
+    def handler(request):
+        if request.url.path == "/rest/api/3/myself":
+            return httpx.Response(200, json={"displayName": "Test User"})
+        return httpx.Response(404, text="Project not found")
 
+    async with _client(jira_credentials, handler) as client:
+        result = await jira_exporter.test_connection_async(jira_credentials, client)
 
-@patch('backend.services.export.jira_exporter.requests.get')
-def test_test_connection_project_access_failure(mock_get, jira_exporter, jira_credentials):
-    """Test Jira connection with project access failure."""
-    # Mock successful user auth but failed project access
-    user_response = Mock()
-    user_response.status_code = 200
-    user_response.json.return_value = {"displayName": "Test User"}
-    
-    project_response = Mock()
-    project_response.status_code = 404
-    project_response.text = "Project not found"
-    
-    mock_get.side_effect = [user_response, project_response]
-    
-    result = jira_exporter.test_connection(jira_credentials)
-    
     assert result.success is False
     assert "Project access failed" in result.message
 
 
-@patch('backend.services.export.jira_exporter.requests.post')
-def test_create_epic_success(mock_post, jira_exporter, jira_credentials):
-    """Test successful epic creation."""
-    # Mock successful epic creation
-    response = Mock()
-    response.status_code = 201
-    response.json.return_value = {
-        "key": "TEST-100",
-        "id": "10001"
-    }
-    
-    mock_post.return_value = response
-    
-    epic = jira_exporter._create_epic(
-        jira_credentials,
-        "Test Epic",
-        "Test Description"
-    )
-    
-    assert epic is not None
-    assert epic.key == "TEST-100"
-    assert epic.id == "10001"
-    assert epic.issue_type == "Epic"
-    assert "TEST-100" in epic.url
-
-
-@patch('backend.services.export.jira_exporter.requests.post')
-def test_create_epic_failure(mock_post, jira_exporter, jira_credentials):
-    """Test failed epic creation."""
-    # Mock failed epic creation
-    response = Mock()
-    response.status_code = 400
-    response.text = "Bad Request"
-    
-    mock_post.return_value = response
-    
-    epic = jira_exporter._create_epic(
-        jira_credentials,
-        "Test Epic",
-        "Test Description"
+@pytest.mark.asyncio
+async def test_create_issue_success(jira_credentials):
+    """Test successful issue creation."""
+    sent = []
+
+    def handler(request):
+        sent.append(json.loads(request.content))
+        return httpx.Response(201, json={"key": "TEST-100", "id": "10001"})
+
+    async with _client(jira_credentials, handler) as client:
+        created = await client.create_issue(
+            {"summary": "Test Epic", "issuetype": {"name": "Epic"}}
+        )
+
+    assert created == {"key": "TEST-100", "id": "10001"}
+    assert sent[0]["fields"]["summary"] == "Test Epic"
+
+
+@pytest.mark.asyncio
+async def test_create_issue_failure(jira_credentials):
+    """Test failed issue creation."""
+    def handler(request):
+        return httpx.Response(400, text="Bad Request")
+
+    async with _client(jira_credentials, handler) as client:
+        created = await client.create_issue(
+            {"summary": "Test Epic", "issuetype": {"name": "Epic"}}
+        )
+
+    assert created is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_links_parents(jira_exporter, jira_credentials):
+    """Test stories and sub-tasks are created with their parent keys."""
+    sent = []
+
+    def handler(request):
+        updates = json.loads(request.content)["issueUpdates"]
+        sent.extend(update["fields"] for update in updates)
+        return httpx.Response(
+            201,
+            json={"issues": [{"key": "TEST-101", "id": "10002"}, {"key": "TEST-102", "id": "10003"}]},
+        )
+
+    story = jira_exporter._issue_fields(
+        jira_credentials, "Test Story", {}, "Story", parent_key="TEST-100"
     )
-    
-    assert epic is None
-
-
-@patch('backend.services.export.jira_exporter.requests.post')
-def test_create_story_success(mock_post, jira_exporter, jira_credentials):
-    """Test successful story creation."""
-    # Mock successful story creation
-    response = Mock()
-    response.status_code = 201
-    response.json.return_value = {
-        "key": "TEST-101",
-        "id": "10002"
-    }
-    
-    mock_post.return_value = response
-    
-    story = jira_exporter._create_story(
-        jira_credentials,
-        "Test Story",
-        "Test Description",
-        epic_key="TEST-100"
+    task = jira_exporter._issue_fields(
+        jira_credentials, "Test Task", {}, "Sub-task", parent_key="TEST-101"
     )
-    
-    assert story is not None
-    assert story.key == "TEST-101"
-    assert story.id == "10002"
-    assert story.issue_type == "Story"
-
-
-@patch('backend.services.export.jira_exporter.requests.post')
-def test_create_task_success(mock_post, jira_exporter, jira_credentials):
-    """Test successful task creation."""
-    # Mock successful task creation
-    response = Mock()
-    response.status_code = 201
-    response.json.return_value = {
-        "key": "TEST-102",
-        "id": "10003"
+    async with _client(jira_credentials, handler) as client:
+        created = await client.bulk_create([story, task])
+
+    assert [c["key"] for c in created] == ["TEST-101", "TEST-102"]
+    assert [f["parent"]["key"] for f in sent] == ["TEST-100", "TEST-101"]
+    assert [f["issuetype"]["name"] for f in sent] == ["Story", "Sub-task"]
+
+
+class FakeJira:
+    """In-memory Jira Cloud server for httpx.MockTransport."""
+
+    def __init__(self, throttle_first_bulk=False):
+        self.issues = {}
+        self.calls = []
+        self.throttle_first_bulk = throttle_first_bulk
+        self._next_id = 10000
+
+    def add(self, summary, issue_type):
+        self._next_id += 1
+        issue_id = str(self._next_id)
+        self.issues[issue_id] = {
+            "id": issue_id,
+            "key": f"TEST-{self._next_id}",
+            "fields": {"summary": summary, "issuetype": {"name": issue_type}},
+        }
+        return {"id": issue_id, "key": f"TEST-{self._next_id}"}
+
+    def count(self, method, path):
+        return self.calls.count((method, path))
+
+    def handler(self, request):
+        path = request.url.path
+        self.calls.append((request.method, path))
+        body = json.loads(request.content) if request.content else {}
+
+        if path == "/rest/api/3/myself":
+            return httpx.Response(200, json={"displayName": "Test User"})
+        if path == "/rest/api/3/project/TEST":
+            return httpx.Response(200, json={"name": "Test Project"})
+        if path == "/rest/api/3/search":
+            # summary ~ is a text search: return every issue containing a term
+            terms = []
+            for literal in re.findall(r'summary ~ "((?:[^"\\]|\\.)*)"', body["jql"]):
+                lucene = re.sub(r"\\(.)", r"\1", literal)
+                # Like Jira, reject Lucene operators that were not escaped
+                if re.search(r'(?<!\\)[\[\]{}()^~*?:!+]', lucene):
+                    return httpx.Response(400, json={"errorMessages": ["Bad query"]})
+                terms.append(re.sub(r"\\(.)", r"\1", lucene))
+            hits = [
+                issue
+                for issue in self.issues.values()
+                if any(t.lower() in issue["fields"]["summary"].lower() for t in terms)
+            ]
+            hits.sort(key=lambda issue: -int(issue["id"]))
+            start, size = body["startAt"], body["maxResults"]
+            return httpx.Response(
+                200, json={"issues": hits[start : start + size], "total": len(hits)}
+            )
+        if path == "/rest/api/3/issue":
+            fields = body["fields"]
+            return httpx.Response(
+                201, json=self.add(fields["summary"], fields["issuetype"]["name"])
+            )
+        if path == "/rest/api/3/issue/bulk":
+            if self.throttle_first_bulk:
+                self.throttle_first_bulk = False
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            created, errors = [], []
+            for index, update in enumerate(body["issueUpdates"]):
+                fields = update["fields"]
+                if fields["summary"].startswith("FAIL"):
+                    errors.append({
+                        "status": 400,
+                        "failedElementNumber": index,
+                        "elementErrors": {"errors": {"summary": "rejected"}},
+                    })
+                else:
+                    created.append(self.add(fields["summary"], fields["issuetype"]["name"]))
+            return httpx.Response(
+                400 if errors else 201, json={"issues": created, "errors": errors}
+            )
+        if request.method == "PUT" and path.startswith("/rest/api/3/issue/"):
+            return httpx.Response(204)
+        return httpx.Response(404, text="Not found")
+
+
+def _prd(story_count, task_count):
+    return {
+        "operational_prd": {
+            "brd": {
+                "stakeholder_scenarios": [
+                    {
+                        "scenario": f"Story {i}",
+                        "justification": {"impact_score": "High"},
+                        "acceptance_criteria": ["Works"],
+                    }
+                    for i in range(story_count)
+                ]
+            }
+        },
+        "technical_prd": {
+            "implementation_requirements": [
+                {"title": f"Task {i}", "description": "Build it"}
+                for i in range(task_count)
+            ]
+        },
     }
-    
-    mock_post.return_value = response
-    
-    task = jira_exporter._create_task(
-        jira_credentials,
-        "Test Task",
-        "Test Description",
-        parent_key="TEST-101"
+
+
+async def _export(fake, prd, **request_fields):
+    """Run export_prd_to_jira against the fake server with a stubbed PRD."""
+    exporter = JiraExporter(Mock(), Mock(), transport=httpx.MockTransport(fake.handler))
+
+    results_service = Mock()
+    results_service.get_analysis_result.return_value = {"status": "completed", "results": {}}
+    container = Mock()
+    container.get_results_service.return_value = lambda db, user: results_service
+
+    async def generate_prd(**kwargs):
+        return prd
+
+    prd_service = Mock()
+    prd_service.generate_prd = generate_prd
+
+    request = JiraExportRequest(
+        result_id=1,
+        credentials=JiraCredentials(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token",
+            project_key="TEST"
+        ),
+        epic_name="Research PRD",
+        **request_fields
     )
-    
-    assert task is not None
-    assert task.key == "TEST-102"
-    assert task.id == "10003"
-    assert task.issue_type == "Sub-task"
+    with patch("backend.api.dependencies.get_container", return_value=container), \
+            patch("backend.services.export.jira_exporter.LLMServiceFactory"), \
+            patch("backend.services.export.jira_exporter.PRDGenerationService", return_value=prd_service):
+        return await exporter.export_prd_to_jira(request)
+
+
+@pytest.mark.asyncio
+async def test_export_bulk_creates_issues_in_chunks():
+    """Test stories and tasks go through the bulk endpoint and a 429 is retried."""
+    fake = FakeJira(throttle_first_bulk=True)
+
+    result = await _export(fake, _prd(story_count=60, task_count=3))
+
+    assert result.success, result.errors
+    assert result.stories_created == 60
+    assert result.tasks_created == 3
+    assert result.total_issues_created == 64
+    assert [s.summary for s in result.stories] == [f"Story {i}" for i in range(60)]
+    assert result.tasks[0].issue_type == "Sub-task"
+    # One epic create; two bulk chunks (50 + 13) plus the throttled attempt
+    assert fake.count("POST", "/rest/api/3/issue") == 1
+    assert fake.count("POST", "/rest/api/3/issue/bulk") == 3
+    assert fake.count("POST", "/rest/api/3/search") == 0
+
+
+@pytest.mark.asyncio
+async def test_export_update_existing_resolves_issues_in_one_search():
+    """Test existing issues are found with one batched search and updated."""
+    fake = FakeJira()
+    epic = fake.add("Research PRD", "Epic")
+    story = fake.add("Story 1", "Story")
+    # The text search also returns this one; it must not be taken for "Story 1"
+    fake.add("Story 1 follow-up", "Story")
+
+    result = await _export(fake, _prd(story_count=3, task_count=1), update_existing=True)
+
+    assert result.success, result.errors
+    assert result.epic.key == epic["key"]
+    assert result.stories[1].key == story["key"]
+    assert fake.count("POST", "/rest/api/3/search") == 1
+    assert fake.count("POST", "/rest/api/3/issue") == 0
+    assert fake.count("POST", "/rest/api/3/issue/bulk") == 1
+    assert fake.count("PUT", f"/rest/api/3/issue/{story['id']}") == 1
+    assert "2 updated" in result.message
+
+
+@pytest.mark.asyncio
+async def test_export_reports_failed_elements_of_a_bulk_request():
+    """Test issues rejected inside a bulk request are reported individually."""
+    fake = FakeJira()
+    prd = _prd(story_count=2, task_count=0)
+    prd["operational_prd"]["brd"]["stakeholder_scenarios"][0]["scenario"] = "FAIL story"
+
+    result = await _export(fake, prd)
+
+    assert result.success
+    assert [s.summary for s in result.stories] == ["Story 1"]
+    assert result.errors == ["Failed to create story: FAIL story"]
+
+
+@pytest.mark.asyncio
+async def test_test_connection_async_auth_failure(jira_exporter, jira_credentials):
+    """Test async connection test with authentication failure."""
+    def handler(request):
+        if request.url.path == "/rest/api/3/myself":
+            return httpx.Response(401, text="Unauthorized")
+        return httpx.Response(200, json={"name": "Test Project"})
+
+    async with AsyncJiraClient(jira_credentials, transport=httpx.MockTransport(handler)) as client:
+        result = await jira_exporter.test_connection_async(jira_credentials, client)
+
+    assert result.success is False
+    assert "Authentication failed" in result.message
 
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
+
+@pytest.mark.asyncio
+async def test_summary_search_escapes_lucene_operators():
+    """Test summaries with Lucene operators are matched instead of failing the search."""
+    fake = FakeJira()
+    fake.add("Research PRD", "Epic")
+    story = fake.add("Story 0 [draft]: v2?", "Story")
+    prd = _prd(story_count=2, task_count=0)
+    prd["operational_prd"]["brd"]["stakeholder_scenarios"][0]["scenario"] = "Story 0 [draft]: v2?"
+
+    result = await _export(fake, prd, update_existing=True)
+
+    assert result.success, result.errors
+    assert result.stories[0].key == story["key"]
+    assert fake.count("POST", "/rest/api/3/search") == 1
+    assert fake.count("PUT", f"/rest/api/3/issue/{story['id']}") == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_search_falls_back_to_single_summaries(jira_credentials):
+    """Test one unsearchable summary does not lose the matches of the others."""
+    fake = FakeJira()
+    story = fake.add("Story 1", "Story")
+
+    rejected = []
+
+    def handler(request):
+        if request.url.path == "/rest/api/3/search" and "Unsearchable" in request.content.decode():
+            rejected.append(request)
+            return httpx.Response(400, json={"errorMessages": ["Bad query"]})
+        return fake.handler(request)
+
+    async with AsyncJiraClient(jira_credentials, transport=httpx.MockTransport(handler)) as client:
+        found = await client.find_issues_by_summary(["Story 1", "Unsearchable"], ["Story"])
+
+    assert found[("Story", "story 1")]["key"] == story["key"]
+    # The batch and the lone "Unsearchable" search are rejected; "Story 1" alone succeeds
+    assert len(rejected) == 2
+    assert fake.count("POST", "/rest/api/3/search") == 1
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_after_it_may_have_been_sent(jira_credentials):
+    """Test only errors raised before sending are retried for non-idempotent requests."""
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if request.method == "POST" and len(calls) == 2:
+            raise httpx.ReadTimeout("no answer", request=request)
+        if request.method == "GET" and len(calls) == 3:
+            raise httpx.ReadTimeout("no answer", request=request)
+        return httpx.Response(201, json={"id": "1", "key": "TEST-1"})
+
+    transport = httpx.MockTransport(handler)
+    async with AsyncJiraClient(jira_credentials, transport=transport, retry_delay=0) as client:
+        # Connection refused: retried; read timeout: the issue may exist, so raised
+        with pytest.raises(httpx.ReadTimeout):
+            await client.create_issue({"summary": "Story"})
+        assert calls == [("POST", "/rest/api/3/issue")] * 2
+
+        # Reads are retried on any transport error
+        response = await client.get_myself()
+        assert response.status_code == 201
+        assert calls[2:] == [("GET", "/rest/api/3/myself")] * 2
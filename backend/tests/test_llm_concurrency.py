@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from backend.services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+    is_overload_error,
+)
+
+
+async def _run(limiter, count, delay=0.01, error=None):
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+
+    await asyncio.gather(*(request() for _ in range(count)), return_exceptions=True)
+    return peak
+
+
+def test_overload_detection():
+    assert is_overload_error(Exception("429 Too Many Requests"))
+    assert is_overload_error(Exception("503 UNAVAILABLE: model is overloaded"))
+    assert is_overload_error(Exception("RESOURCE_EXHAUSTED"))
+    assert not is_overload_error(ValueError("bad request"))
+
+
+@pytest.mark.asyncio
+async def test_limit_caps_concurrency_and_grows_while_healthy():
+    capped = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    assert await _run(capped, 8) == 2
+    assert capped.in_flight == 0
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=6)
+    for _ in range(10):
+        await _run(limiter, 12)
+    assert limiter.limit == 6
+
+
+@pytest.mark.asyncio
+async def test_overload_halves_limit_once_per_cooldown():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, cooldown_seconds=60)
+
+    await _run(limiter, 8, error=RuntimeError("429 rate limit exceeded"))
+    assert limiter.limit == 4
+    assert limiter.stats()["backoffs"] == 1
+
+    # Ordinary errors neither grow nor shrink the limit
+    await _run(limiter, 8, error=ValueError("invalid argument"))
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+
+    assert limiter.in_flight == 0
+    assert limiter.stats()["waiting"] == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+def test_limiter_is_shared_per_provider():
+    assert get_concurrency_limiter("gemini") is get_concurrency_limiter("gemini")
+    assert get_concurrency_limiter("gemini") is not get_concurrency_limiter("openai")
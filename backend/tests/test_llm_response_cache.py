@@ -0,0 +1,140 @@
+"""
+Tests for the shared, content-addressed LLM response cache.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.llm.response_cache import (
+    DatabaseCacheBackend,
+    LLMResponseCache,
+    MemoryLRUBackend,
+    build_cache_key,
+    create_llm_response_cache_from_env,
+    is_cacheable_result,
+)
+
+
+def _key(content, **overrides):
+    params = dict(model="gemini-x", task="theme_analysis", content=content, temperature=0.0)
+    params.update(overrides)
+    return build_cache_key(**params)
+
+
+def test_cache_key_normalizes_line_endings_and_trailing_space():
+    assert _key("Speaker A: hi  \r\nSpeaker B: yo\r\n") == _key("Speaker A: hi\nSpeaker B: yo")
+    # Line structure is significant
+    assert _key("Speaker A: hi Speaker B: yo") != _key("Speaker A: hi\nSpeaker B: yo")
+
+
+def test_cache_key_includes_model_template_and_temperature():
+    base = _key("text")
+    assert _key("text", model="other") != base
+    assert _key("text", prompt_template="Prompt v2") != base
+    assert _key("text", temperature=0.2) != base
+    assert _key("text", params={"max_tokens": 10}) != base
+
+
+def test_memory_backend_evicts_by_bytes_lru():
+    backend = MemoryLRUBackend(max_entries=10, max_bytes=10)
+    backend.set("a", b"12345")
+    backend.set("b", b"12345")
+    backend.get("a")  # a is now most recently used
+    backend.set("c", b"12345")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"12345"
+    assert backend.stats()["evictions"] == 1
+    assert backend.stats()["bytes"] == 10
+
+
+def test_database_backend_is_shared_between_instances(tmp_path):
+    url = f"sqlite:///{tmp_path / 'cache.db'}"
+    writer = DatabaseCacheBackend(url)
+    reader = DatabaseCacheBackend(url)
+
+    writer.set("k", b'{"themes": []}')
+    assert reader.get("k") == b'{"themes": []}'
+
+    writer.set("expired", b"1", ttl=-1)
+    assert reader.get("expired") is None
+
+
+def test_database_backend_evicts_least_recently_used(tmp_path):
+    backend = DatabaseCacheBackend(f"sqlite:///{tmp_path / 'cache.db'}", max_bytes=8)
+    backend.set("old", b"1234")
+    backend.set("new", b"5678")
+    backend.set("newest", b"9999")
+
+    assert backend.evict() == 1
+    assert backend.get("old") is None
+    assert backend.get("newest") == b"9999"
+
+
+def test_durable_tier_requires_an_explicit_database_url(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_CACHE_BACKEND", "tiered")
+    monkeypatch.delenv("LLM_CACHE_DATABASE_URL", raising=False)
+
+    cache = create_llm_response_cache_from_env()
+    assert [b.name for b in cache.backends] == ["memory"]
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setenv("LLM_CACHE_DATABASE_URL", f"sqlite:///{tmp_path / 'cache.db'}")
+    cache = create_llm_response_cache_from_env()
+    assert [b.name for b in cache.backends] == ["memory", "database"]
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_backfills_memory_from_durable_tier(tmp_path):
+    url = f"sqlite:///{tmp_path / 'cache.db'}"
+    worker_a = LLMResponseCache([MemoryLRUBackend(), DatabaseCacheBackend(url)])
+    worker_b = LLMResponseCache([MemoryLRUBackend(), DatabaseCacheBackend(url)])
+
+    await worker_a.set("k", {"themes": ["a"]})
+    assert await worker_b.get("k") == {"themes": ["a"]}
+    assert await worker_b.get("k") == {"themes": ["a"]}
+
+    stats = worker_b.stats()
+    assert stats["hits"] == 2
+    assert [tier["hits"] for tier in stats["tiers"]] == [1, 1]
+    assert stats["bytes_read"] > 0
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_shares_in_flight_computation():
+    cache = LLMResponseCache([MemoryLRUBackend()])
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"text": "done"}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r == {"text": "done"} for r in results)
+    assert await cache.get_or_compute("k", compute) == {"text": "done"}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_error_results_are_not_stored():
+    cache = LLMResponseCache([MemoryLRUBackend()])
+
+    async def failing():
+        return {"error": "quota"}
+
+    await cache.get_or_compute("k", failing, should_store=is_cacheable_result)
+    assert await cache.get("k") is None
+
+
+def test_hot_temperature_bypasses_cache():
+    cache = LLMResponseCache([MemoryLRUBackend()], max_temperature=0.5)
+    assert cache.is_cacheable(0.0)
+    assert not cache.is_cacheable(0.9)
+    assert cache.stats()["bypassed"] == 1
+    assert not LLMResponseCache([MemoryLRUBackend()], enabled=False).is_cacheable(0.0)
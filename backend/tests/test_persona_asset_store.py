@@ -0,0 +1,101 @@
+"""
+Tests for the content-addressed persona image store and its asset endpoint.
+"""
+
+import base64
+import hashlib
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.routes import perpetual_personas
+from backend.database import Base, get_db
+from backend.models import BinaryAsset
+from backend.services.generative.asset_store import (
+    AssetStore,
+    asset_url,
+    map_persona_images,
+)
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+PNG_URI = "data:image/png;base64," + base64.b64encode(PNG_BYTES).decode("ascii")
+DIGEST = hashlib.sha256(PNG_BYTES).hexdigest()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_images_are_stored_once_and_referenced_by_digest(session_factory):
+    db = session_factory()
+    store = AssetStore(db)
+    results = {
+        "personas": [
+            {"id": "p1", "avatar_data_uri": PNG_URI, "food_images": {"lunch": PNG_URI}},
+            {"id": "p2", "avatar_data_uri": "https://example.com/a.png"},
+        ]
+    }
+
+    assert map_persona_images(results, store.put_data_uri) == 2
+    db.commit()
+
+    assert results["personas"][0]["avatar_data_uri"] == asset_url(DIGEST)
+    assert results["personas"][0]["food_images"]["lunch"] == asset_url(DIGEST)
+    assert results["personas"][1]["avatar_data_uri"] == "https://example.com/a.png"
+    assert db.query(BinaryAsset).count() == 1
+
+    assert store.get_metadata(DIGEST) == ("image/png", len(PNG_BYTES))
+    assert b"".join(store.iter_chunks(DIGEST, len(PNG_BYTES), chunk_size=100)) == PNG_BYTES
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_asset_endpoint_streams_with_etag(session_factory, monkeypatch):
+    db = session_factory()
+    AssetStore(db).put(PNG_BYTES, "image/png")
+    db.commit()
+    db.close()
+
+    monkeypatch.setattr(perpetual_personas, "SessionLocal", session_factory)
+    app = FastAPI()
+    app.include_router(perpetual_personas.router)
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(asset_url(DIGEST))
+        cached = await client.get(
+            asset_url(DIGEST), headers={"If-None-Match": f'"{DIGEST}"'}
+        )
+        missing = await client.get(asset_url("0" * 64))
+        malformed = await client.get(asset_url("not-a-digest"))
+
+    assert response.status_code == 200
+    assert response.content == PNG_BYTES
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["etag"] == f'"{DIGEST}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    assert missing.status_code == 404
+    assert malformed.status_code == 404
@@ -1,6 +1,9 @@
 import pytest
 
-from backend.services.validation.persona_evidence_validator import PersonaEvidenceValidator
+from backend.services.validation.persona_evidence_validator import (
+    PersonaEvidenceValidator,
+    _normalize_with_offsets,
+)
 
 
 def test_timestamp_and_interviewee_prefix_matching_transcript():
@@ -61,3 +64,72 @@ def test_match_evidence_with_prefixes_counts_as_match():
     matches = validator.match_evidence(persona_ssot=persona, source_text=None, transcript=transcript)
     assert any(m.match_type != "no_match" for m in matches), "Expected at least one match"
 
+
+
+def _reference_find_in_transcript(validator, transcript, quote):
+    """The pre-index per-segment scan, kept here as the parity oracle."""
+    global_offset = 0
+    for seg in transcript:
+        dialogue = seg.get("dialogue", "")
+        if dialogue and quote:
+            idx = dialogue.find(quote)
+            if idx != -1:
+                return ("verbatim", global_offset + idx, global_offset + idx + len(quote), seg.get("speaker"))
+            if validator._normalize(quote) in validator._normalize(dialogue):
+                return ("normalized", seg.get("speaker"))
+            if validator._fuzzy_contains(dialogue, quote):
+                return ("normalized", seg.get("speaker"))
+        global_offset += len(dialogue) + 1
+    return ("no_match", None, None, None)
+
+
+def test_normalize_with_offsets_matches_normalize():
+    samples = [
+        "[12:40] Interviewee: We’re  “drowning” in spreadsheets… ",
+        "  Researcher - (what do you mean?)  ",
+        "Plain text\n\twith   tabs​ and dashes – — ok.",
+        "",
+    ]
+    for text in samples:
+        norm, offsets = _normalize_with_offsets(text)
+        assert norm == PersonaEvidenceValidator._normalize(text)
+        assert offsets is not None and len(offsets) == len(norm)
+        assert offsets == sorted(offsets)
+
+
+def test_transcript_index_matches_per_segment_scan():
+    validator = PersonaEvidenceValidator()
+    transcript = [
+        {"speaker": "Interviewer", "dialogue": "How do you handle month-end reporting?"},
+        {"speaker": "Interviewee", "dialogue": "[03:10] Interviewee: We’re  drowning in spreadsheets… every Friday."},
+        {"speaker": "Interviewee", "dialogue": ""},
+        {"speaker": "Interviewee", "dialogue": "The vendor portal exports broken CSV files twice a week."},
+    ]
+    quotes = [
+        "How do you handle",
+        "we're drowning in spreadsheets...",
+        "vendor portal exports broken CSV",
+        "csv files portal",
+        "completely unrelated words here",
+        "",
+    ]
+    index = validator.build_index(transcript=transcript)
+    for quote in quotes:
+        found = index.find(quote)
+        expected = _reference_find_in_transcript(validator, transcript, quote)
+        assert found[0] == expected[0]
+        assert found[3] == expected[-1]
+        if found[0] == "verbatim":
+            assert found[1:3] == expected[1:3]
+
+
+def test_normalized_match_reports_original_offsets():
+    validator = PersonaEvidenceValidator()
+    transcript = [
+        {"speaker": "Interviewer", "dialogue": "Tell me more."},
+        {"speaker": "Interviewee", "dialogue": "Honestly, WE’RE   drowning in spreadsheets."},
+    ]
+    mtype, s, e, sp = validator._find_in_transcript(transcript, "we're drowning in spreadsheets")
+    assert (mtype, sp) == ("normalized", "Interviewee")
+    joined = "\n".join(seg["dialogue"] for seg in transcript)
+    assert joined[s:e] == "WE’RE   drowning in spreadsheets"
@@ -0,0 +1,101 @@
+"""
+Tests for QuoteAttributionIndex used to attribute theme statements to interviews.
+"""
+
+import random
+
+from backend.services.processing.quote_attribution import (
+    QuoteAttributionIndex,
+    tokenize_with_spans,
+)
+
+WORDS = (
+    "invoice reconcile manual spreadsheet export budget approval workflow "
+    "customer dashboard report deadline vendor payment audit finance team "
+    "automation integration onboarding tooling pipeline latency"
+).split()
+
+
+def _make_documents(n_docs: int, n_words: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        (f"interview_{i + 1}", " ".join(rng.choice(WORDS) for _ in range(n_words)) + ".")
+        for i in range(n_docs)
+    ]
+
+
+def _reference_doc_id(documents, quote):
+    """Linear scan over token sequences, kept here as the parity oracle."""
+    q = tokenize_with_spans(quote)[0]
+    for did, text in documents:
+        toks = tokenize_with_spans(text)[0]
+        for i in range(len(toks) - len(q) + 1):
+            if toks[i : i + len(q)] == q:
+                return did
+    return None
+
+
+def test_exact_match_reports_document_and_offsets():
+    documents = [
+        ("a", "Interviewer: hi. Interviewee: We reconcile invoices by hand, every Friday."),
+        ("b", "I hate the dashboard; it is slow and the export breaks every week."),
+    ]
+    index = QuoteAttributionIndex(documents)
+
+    match = index.resolve("we reconcile INVOICES by hand")
+    assert match.document_id == "a"
+    assert match.match_type == "exact"
+    assert documents[0][1][match.start_char : match.end_char] == "We reconcile invoices by hand"
+
+    match = index.resolve("“the export breaks”")
+    assert match.document_id == "b"
+    assert documents[1][1][match.start_char : match.end_char] == "the export breaks"
+
+
+def test_first_document_wins_and_unresolved_quotes_return_none():
+    documents = [("a", "the budget approval is slow"), ("b", "the budget approval is slow too")]
+    index = QuoteAttributionIndex(documents)
+    first, missing, empty = index.resolve_all(["budget approval", "vendor latency audit", "  "])
+    assert first.document_id == "a"
+    assert missing is None
+    assert empty is None
+
+
+def test_prefix_and_fuzzy_tiers():
+    documents = [
+        ("a", "We reconcile invoices by hand, every single Friday afternoon."),
+        ("b", "I hate the dashboard; it is slow and the export breaks every week."),
+    ]
+    index = QuoteAttributionIndex(documents)
+
+    prefix = index.resolve("we reconcile invoices by hand every single Monday morning")
+    assert prefix.document_id == "a"
+    assert prefix.match_type == "prefix"
+
+    fuzzy = index.resolve("the dashboard is slow and the export breaks weekly")
+    assert fuzzy.document_id == "b"
+    assert fuzzy.match_type == "fuzzy"
+    assert 0.6 <= fuzzy.score < 1.0
+
+    assert index.resolve("the dashboard is slow and the export breaks weekly", fuzzy=False) is None
+
+
+def test_batch_resolution_matches_linear_scan():
+    documents = _make_documents(n_docs=12, n_words=300)
+    rng = random.Random(11)
+    quotes = []
+    for _ in range(200):
+        did, text = rng.choice(documents)
+        toks = text.rstrip(".").split()
+        start = rng.randrange(len(toks) - 6)
+        quotes.append(" ".join(toks[start : start + rng.randint(2, 6)]))
+    quotes.append("quantum spaghetti")
+
+    matches = QuoteAttributionIndex(documents).resolve_all(quotes, fuzzy=False)
+
+    for quote, match in zip(quotes, matches):
+        expected = _reference_doc_id(documents, quote)
+        assert (match.document_id if match else None) == expected
+        if match:
+            text = dict(documents)[match.document_id]
+            assert text[match.start_char : match.end_char].lower() == quote.lower()
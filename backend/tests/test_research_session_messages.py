@@ -0,0 +1,133 @@
+"""
+Tests for the append-only research session message log and its summary fields.
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models.research_session import (
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionMessage,
+    ResearchSessionUpdate,
+)
+from backend.services.research_session_service import ResearchSessionService
+
+
+@pytest.fixture
+def service():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield ResearchSessionService(db)
+    finally:
+        db.close()
+
+
+def _message(i, role="user"):
+    return {
+        "id": f"m{i}",
+        "role": role,
+        "content": f"Message {i}",
+        "timestamp": f"2026-01-01T10:00:{i:02d}Z",
+    }
+
+
+def test_messages_are_appended_and_summarised(service):
+    session = service.create_session(
+        ResearchSessionCreate(user_id="u1", messages=[_message(0)]), "s1"
+    )
+    assert session.message_count == 1
+
+    service.add_message("s1", _message(1, role="assistant"))
+
+    # The client sends its full history on each turn; only the tail is new
+    history = [_message(i) for i in range(4)]
+    session = service.update_session(
+        "s1",
+        ResearchSessionUpdate(
+            messages=history,
+            research_questions={
+                "primaryStakeholders": [
+                    {"questions": {"problemDiscovery": ["a", "b"], "followUp": ["c"]}}
+                ],
+                "secondaryStakeholders": [{"questions": {"solutionValidation": ["d"]}}],
+            },
+        ),
+    )
+
+    assert session.message_count == 4
+    assert session.last_message_at == datetime(2026, 1, 1, 10, 0, 3)
+    assert (session.question_count, session.stakeholder_count) == (4, 2)
+    assert session.messages is None
+
+    rows = service.db.query(ResearchSessionMessage).order_by(ResearchSessionMessage.id)
+    assert [r.role for r in rows] == ["user", "assistant", "user", "user"]
+
+    service.delete_session("s1")
+    assert service.db.query(ResearchSessionMessage).count() == 0
+    assert service.db.query(ResearchSession).count() == 0
+
+
+def test_messages_are_read_with_a_keyset_cursor(service):
+    service.create_session(ResearchSessionCreate(user_id="u1"), "s1")
+    service.create_session(ResearchSessionCreate(user_id="u1"), "s2")
+    service.add_messages("s1", [_message(i) for i in range(5)])
+    service.add_messages("s2", [_message(9)])
+
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = service.get_messages("s1", limit=2, cursor=cursor)
+        pages.append([m["id"] for m in page])
+        if cursor is None:
+            break
+
+    assert pages == [["m0", "m1"], ["m2", "m3"], ["m4"]]
+    assert [m["id"] for m in service.get_messages("s1")[0]] == [
+        f"m{i}" for i in range(5)
+    ]
+
+    with pytest.raises(HTTPException) as exc:
+        service.get_messages("s1", limit=2, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_update_session_appends_only_unknown_messages(service):
+    service.create_session(
+        ResearchSessionCreate(user_id="u1", messages=[_message(i) for i in range(4)]), "s1"
+    )
+
+    # Resending the same history appends nothing
+    session = service.update_session(
+        "s1", ResearchSessionUpdate(messages=[_message(i) for i in range(4)])
+    )
+    assert session.message_count == 4
+
+    # A trimmed window is matched by ID rather than by position
+    session = service.update_session(
+        "s1", ResearchSessionUpdate(messages=[_message(i) for i in (2, 3, 4, 5)])
+    )
+    assert session.message_count == 6
+
+    # A history that no longer lines up with the log keeps its new turns only
+    edited = [_message(i) for i in range(6)]
+    del edited[1]
+    edited.append(_message(6))
+    session = service.update_session("s1", ResearchSessionUpdate(messages=edited))
+
+    assert session.message_count == 7
+    assert [m["id"] for m in service.get_messages("s1")[0]] == [
+        f"m{i}" for i in range(7)
+    ]
@@ -0,0 +1,286 @@
+"""
+Tests for materialized persona evidence hydration on analysis results.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.routes.analysis import _apply_materialized_hydration
+from backend.database import Base
+from backend.models import AnalysisResult, InterviewData, User
+from backend.services.results import hydration
+from backend.services.results.hydration import (
+    HYDRATION_KEY,
+    HYDRATION_VERSION,
+    is_hydration_current,
+    materialize_persona_hydration,
+    refresh_persona_hydration,
+)
+
+QUOTE = "I spend most mornings reconciling invoices by hand."
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _results_payload():
+    return {
+        "status": "completed",
+        "themes": [],
+        "transcript": [
+            {"speaker": "Interviewer", "dialogue": "Tell me about your day."},
+            {"speaker": "Interviewee", "dialogue": QUOTE},
+        ],
+        "personas": [
+            {
+                "name": "Ops Lead",
+                "description": "Runs finance operations",
+                "archetype": "Operator",
+                "demographics": {"value": "Finance operations lead", "evidence": []},
+                "goals_and_motivations": {
+                    "value": "Automate invoice reconciliation",
+                    "evidence": [],
+                },
+                "challenges_and_frustrations": {
+                    "value": "reconciling invoices by hand",
+                    "evidence": [],
+                },
+                "key_quotes": {"value": QUOTE, "evidence": [QUOTE]},
+            }
+        ],
+    }
+
+
+def _seed(db, results):
+    db.add(User(user_id="user_a", email="a@example.com"))
+    interview = InterviewData(user_id="user_a", input_type="text", filename="a.txt")
+    db.add(interview)
+    db.flush()
+    row = AnalysisResult(
+        data_id=interview.id, results=json.dumps(results), status="completed"
+    )
+    db.add(row)
+    db.commit()
+    return row.result_id
+
+
+def test_materialize_stamps_and_links_evidence():
+    results = _results_payload()
+    stamp = materialize_persona_hydration(results)
+
+    assert results[HYDRATION_KEY] is stamp
+    assert stamp["version"] == HYDRATION_VERSION
+    assert stamp["validation_summary"]["method"] == "persona_evidence_validator_v1"
+    assert stamp["validation_status"] in ("pass", "warning")
+
+    persona = results["personas"][0]
+    assert "_evidence_linking_v2" in persona
+    for items in persona["_evidence_linking_v2"]["evidence_map"].values():
+        assert all(it.get("document_id") for it in items if isinstance(it, dict))
+
+
+def test_materialize_without_personas_still_stamps():
+    results = {"status": "completed", "personas": []}
+    stamp = materialize_persona_hydration(results)
+    assert is_hydration_current(stamp)
+    assert "validation_summary" not in stamp
+
+
+def test_refresh_recomputes_stale_rows_once(session_factory):
+    stale = _results_payload()
+    stale[HYDRATION_KEY] = {"version": HYDRATION_VERSION - 1}
+    db = session_factory()
+    result_id = _seed(db, stale)
+    db.close()
+
+    assert refresh_persona_hydration(result_id, session_factory) is True
+    # Already current: nothing left to do
+    assert refresh_persona_hydration(result_id, session_factory) is False
+
+    db = session_factory()
+    stored = json.loads(db.get(AnalysisResult, result_id).results)
+    assert is_hydration_current(stored[HYDRATION_KEY])
+    db.close()
+
+
+def _write_during_recompute(monkeypatch, session_factory, result_id, change):
+    """Apply ``change`` to the stored results while the refresh is recomputing."""
+    original = hydration.materialize_persona_hydration
+
+    def materialize(results):
+        db = session_factory()
+        row = db.get(AnalysisResult, result_id)
+        stored = json.loads(row.results)
+        change(stored)
+        row.results = json.dumps(stored)
+        db.commit()
+        db.close()
+        return original(results)
+
+    monkeypatch.setattr(hydration, "materialize_persona_hydration", materialize)
+
+
+def test_refresh_keeps_fields_written_during_recompute(session_factory, monkeypatch):
+    db = session_factory()
+    result_id = _seed(db, _results_payload())
+    db.close()
+    _write_during_recompute(
+        monkeypatch, session_factory, result_id, lambda r: r.update(themes=[{"name": "New"}])
+    )
+
+    assert refresh_persona_hydration(result_id, session_factory) is True
+
+    db = session_factory()
+    stored = json.loads(db.get(AnalysisResult, result_id).results)
+    db.close()
+    assert stored["themes"] == [{"name": "New"}]
+    assert is_hydration_current(stored[HYDRATION_KEY])
+    assert "_evidence_linking_v2" in stored["personas"][0]
+
+
+def test_refresh_discards_hydration_of_replaced_personas(session_factory, monkeypatch):
+    db = session_factory()
+    result_id = _seed(db, _results_payload())
+    db.close()
+    _write_during_recompute(
+        monkeypatch, session_factory, result_id, lambda r: r.update(personas=[{"name": "Other"}])
+    )
+
+    assert refresh_persona_hydration(result_id, session_factory) is False
+
+    db = session_factory()
+    stored = json.loads(db.get(AnalysisResult, result_id).results)
+    db.close()
+    assert stored["personas"] == [{"name": "Other"}]
+    assert HYDRATION_KEY not in stored
+
+
+def test_refresh_stamps_failed_results_without_hydrating(session_factory, monkeypatch):
+    failed = _results_payload()
+    failed["error"] = "Analysis failed"
+    db = session_factory()
+    result_id = _seed(db, failed)
+    db.close()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("failed results must not be hydrated")
+
+    monkeypatch.setattr(hydration, "materialize_persona_hydration", _fail)
+
+    assert refresh_persona_hydration(result_id, session_factory) is True
+    # The stamp stops every later read from scheduling another refresh
+    assert refresh_persona_hydration(result_id, session_factory) is False
+
+    db = session_factory()
+    stored = json.loads(db.get(AnalysisResult, result_id).results)
+    db.close()
+    assert is_hydration_current(stored[HYDRATION_KEY])
+    assert stored["personas"] == failed["personas"]
+
+
+def test_refresh_skips_when_already_in_flight(session_factory, monkeypatch):
+    monkeypatch.setattr(hydration, "_inflight", {42})
+    assert refresh_persona_hydration(42, session_factory) is False
+
+
+def test_results_service_serves_stored_validation(session_factory, monkeypatch):
+    from backend.services.results_service import ResultsService
+    from backend.services.validation.persona_evidence_validator import (
+        PersonaEvidenceValidator,
+    )
+
+    results = _results_payload()
+    materialize_persona_hydration(results)
+    results[HYDRATION_KEY]["validation_summary"]["counts"] = {"marker": 1}
+    db = session_factory()
+    result_id = _seed(db, results)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("validator should not run on read")
+
+    monkeypatch.setattr(PersonaEvidenceValidator, "match_evidence", _fail)
+    payload = ResultsService(db, SimpleNamespace(user_id="user_a")).get_analysis_result(
+        result_id
+    )
+    db.close()
+
+    formatted = payload["results"]
+    assert formatted["validation_summary"]["counts"] == {"marker": 1}
+    assert is_hydration_current(formatted[HYDRATION_KEY])
+
+
+def test_results_service_does_not_validate_stale_rows_on_read(
+    session_factory, monkeypatch
+):
+    from backend.services.results_service import ResultsService
+    from backend.services.validation.persona_evidence_validator import (
+        PersonaEvidenceValidator,
+    )
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("validator should not run on read")
+
+    # A stale stamp still serves its stored validation
+    stale = _results_payload()
+    materialize_persona_hydration(stale)
+    stale[HYDRATION_KEY]["version"] = HYDRATION_VERSION - 1
+    stale[HYDRATION_KEY]["validation_summary"]["counts"] = {"marker": 2}
+    db = session_factory()
+    stale_id = _seed(db, stale)
+    monkeypatch.setattr(PersonaEvidenceValidator, "match_evidence", _fail)
+    monkeypatch.setattr(PersonaEvidenceValidator, "build_index", _fail)
+    service = ResultsService(db, SimpleNamespace(user_id="user_a"))
+    formatted = service.get_analysis_result(stale_id)["results"]
+    assert formatted["validation_summary"]["counts"] == {"marker": 2}
+    assert not is_hydration_current(formatted[HYDRATION_KEY])
+
+    # Without any stamp there is no validation until the refresh runs
+    row = AnalysisResult(
+        data_id=db.query(InterviewData).first().id,
+        results=json.dumps(_results_payload()),
+        status="completed",
+    )
+    db.add(row)
+    db.commit()
+    formatted = service.get_analysis_result(row.result_id)["results"]
+    db.close()
+    assert formatted["validation_summary"] is None
+    assert formatted["personas_ssot"]
+
+
+def test_route_schedules_background_refresh_only_when_stale():
+    current = {
+        "results": {
+            "personas": [{"name": "P"}],
+            HYDRATION_KEY: {
+                "version": HYDRATION_VERSION,
+                "validation_summary": {"counts": {"verbatim": 3}},
+            },
+        }
+    }
+    tasks = BackgroundTasks()
+    _apply_materialized_hydration(current, 1, tasks)
+    assert tasks.tasks == []
+    assert HYDRATION_KEY not in current["results"]
+    assert current["results"]["validation_summary"] == {"counts": {"verbatim": 3}}
+
+    stale = {"results": {"personas": [{"name": "P"}]}}
+    tasks = BackgroundTasks()
+    _apply_materialized_hydration(stale, 7, tasks)
+    assert len(tasks.tasks) == 1
+    assert tasks.tasks[0].func is refresh_persona_hydration
+    assert tasks.tasks[0].args == (7,)
@@ -0,0 +1,149 @@
+"""
+Tests for the analyses list summary projection and keyset pagination.
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import AnalysisResult, InterviewData, User
+from backend.services.results.summary import (
+    SUMMARY_VERSION,
+    build_analysis_summary,
+)
+from backend.services.results_service import ResultsService
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _results_payload(n_themes: int = 7):
+    return {
+        "themes": [
+            {"name": f"Theme {i}", "frequency": i / 10.0} for i in range(n_themes)
+        ],
+        "patterns": [{"name": "Pattern"}],
+        "personas": [{"name": "P1"}, {"name": "P2"}],
+        "insights": [],
+        "sentimentOverview": {"positive": 0.5, "neutral": 0.3, "negative": 0.2},
+    }
+
+
+def _seed(db, count=5, user_id="user_a"):
+    db.add(User(user_id=user_id, email=f"{user_id}@example.com"))
+    base = datetime(2026, 1, 1)
+    ids = []
+    for i in range(count):
+        interview = InterviewData(
+            user_id=user_id, input_type="text", filename=f"file_{i}.txt"
+        )
+        db.add(interview)
+        db.flush()
+        result = AnalysisResult(
+            data_id=interview.id,
+            analysis_date=base + timedelta(minutes=i),
+            # Writers commonly store a JSON string in the JSON column
+            results=json.dumps(_results_payload()),
+            status="completed",
+        )
+        db.add(result)
+        db.flush()
+        ids.append(result.result_id)
+    db.commit()
+    return ids
+
+
+def test_build_analysis_summary_counts_and_top_themes():
+    summary = build_analysis_summary(_results_payload(), "completed", top_n=3)
+
+    assert summary["version"] == SUMMARY_VERSION
+    assert summary["themeCount"] == 7
+    assert summary["patternCount"] == 1
+    assert summary["personaCount"] == 2
+    assert summary["topThemes"] == ["Theme 6", "Theme 5", "Theme 4"]
+    assert summary["sentimentOverview"]["positive"] == 0.5
+
+
+def test_build_analysis_summary_surfaces_error_only_for_failed():
+    assert "error" not in build_analysis_summary({"error": "boom"}, "completed")
+    assert build_analysis_summary({"error": "boom"}, "failed")["error"] == "boom"
+    assert build_analysis_summary("not json", None)["themeCount"] == 0
+
+
+def test_summary_is_maintained_on_write(session):
+    ids = _seed(session, count=1)
+    row = session.get(AnalysisResult, ids[0])
+    assert row.summary["themeCount"] == 7
+
+    row.results = {"themes": [{"name": "Only"}], "status": "completed"}
+    session.commit()
+    session.refresh(row)
+    assert row.summary["themeCount"] == 1
+    assert row.summary["topThemes"] == ["Only"]
+
+
+def test_summary_view_pages_with_keyset_cursor(session):
+    ids = _seed(session, count=5)
+    service = ResultsService(session, SimpleNamespace(user_id="user_a"))
+
+    first, cursor = service.get_analyses_page(view="summary", limit=2)
+    assert [item["id"] for item in first] == [str(ids[4]), str(ids[3])]
+    assert cursor
+    assert "themes" not in first[0]
+    assert first[0]["themeCount"] == 7
+    assert first[0]["fileName"] == "file_4.txt"
+
+    second, cursor = service.get_analyses_page(view="summary", limit=2, cursor=cursor)
+    assert [item["id"] for item in second] == [str(ids[2]), str(ids[1])]
+
+    third, cursor = service.get_analyses_page(view="summary", limit=2, cursor=cursor)
+    assert [item["id"] for item in third] == [str(ids[0])]
+    assert cursor is None
+
+
+def test_summary_view_backfills_legacy_rows(session):
+    ids = _seed(session, count=2)
+    session.query(AnalysisResult).update({AnalysisResult.summary: None})
+    session.commit()
+
+    service = ResultsService(session, SimpleNamespace(user_id="user_a"))
+    items = service.get_all_analyses(view="summary")
+
+    assert all(item["personaCount"] == 2 for item in items)
+    assert session.get(AnalysisResult, ids[0]).summary["version"] == SUMMARY_VERSION
+
+
+def test_fields_filter_and_full_view_filename(session):
+    _seed(session, count=2)
+    service = ResultsService(session, SimpleNamespace(user_id="user_a"))
+
+    trimmed = service.get_all_analyses(view="summary", fields=["status"])
+    assert set(trimmed[0].keys()) == {"id", "status"}
+
+    full = service.get_all_analyses(sort_by="fileName", sort_direction="asc")
+    assert [item["fileName"] for item in full] == ["file_0.txt", "file_1.txt"]
+    assert len(full[0]["themes"]) == 7
+
+
+def test_other_users_rows_are_not_listed(session):
+    _seed(session, count=2, user_id="user_a")
+    service = ResultsService(session, SimpleNamespace(user_id="user_b"))
+    assert service.get_all_analyses(view="summary") == []
@@ -0,0 +1,107 @@
+"""
+Tests for the SentenceIndex used by EvidenceLinkingService V2.
+"""
+
+import random
+import re
+
+from backend.services.processing.evidence_linking_service import (
+    EvidenceLinkingService,
+)
+from backend.services.processing.sentence_index import (
+    SentenceIndex,
+    SpanSet,
+    get_sentence_index,
+)
+
+WORDS = (
+    "invoice reconcile manual spreadsheet export budget approval workflow "
+    "customer dashboard report deadline vendor payment audit finance team "
+    "automation integration onboarding tooling pipeline latency"
+).split()
+
+
+def _make_text(n_sentences: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(n_sentences):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+        if i % 9 == 0:
+            lines.append(f"Interviewer: why is the {words}?")
+        elif i % 13 == 0:
+            lines.append(f"Department: {words}.")
+        else:
+            lines.append(f"I think our {words}.")
+    return "\n".join(lines)
+
+
+def _reference_candidates(svc, trait_value, text, used_spans, limit):
+    """The pre-index linear scan, kept here as the parity oracle."""
+
+    def tok(t):
+        return [w for w in re.findall(r"\b[\w-]+\b", t.lower()) if len(w) > 3]
+
+    candidates = []
+    for s, e, sent in svc._iter_sentences_with_spans(text):
+        a_set, b_set = set(tok(trait_value)), set(tok(sent))
+        if not a_set or not b_set:
+            continue
+        inter = a_set & b_set
+        jacc = len(inter) / max(1, len(a_set | b_set))
+        if not (len(inter) >= 2 or jacc >= 0.25):
+            continue
+        if svc._looks_like_metadata(sent) or svc._looks_like_question(sent):
+            continue
+        if any(svc._span_overlaps((s, e), u) for u in used_spans):
+            continue
+        candidates.append((s, e, sent, jacc))
+    candidates.sort(key=lambda t: (t[3], len(t[2])), reverse=True)
+    return candidates[:limit]
+
+
+def test_candidates_match_linear_scan():
+    svc = EvidenceLinkingService(None)
+    text = _make_text(400)
+    index = SentenceIndex(text)
+    used = [(s, e) for s, e, _ in index.sentences[::5]]
+
+    for trait in (
+        "Manual invoice reconcile work in spreadsheet",
+        "vendor payment audit",
+        "dashboard",
+        "",
+    ):
+        expected = _reference_candidates(svc, trait, text, used, limit=8)
+        got = svc._select_candidate_spans(
+            trait, text, SpanSet(used), limit=8, index=index
+        )
+        assert got == expected
+        # Plain list of used spans is still accepted
+        assert svc._select_candidate_spans(trait, text, used, limit=8) == expected
+
+
+def test_metrics_are_preserved():
+    svc = EvidenceLinkingService(None)
+    text = _make_text(50)
+    metrics = {}
+    svc._select_candidate_spans("invoice budget workflow", text, [], metrics=metrics)
+    assert metrics["checked_sentences"] == len(get_sentence_index(text))
+    assert metrics["rejected_low_overlap"] <= metrics["checked_sentences"]
+
+
+def test_span_set_overlaps():
+    spans = SpanSet([(10, 20), (30, 40)])
+    assert spans.overlaps((15, 16))
+    assert spans.overlaps((5, 11))
+    assert not spans.overlaps((20, 30))
+    assert not spans.overlaps((41, 50))
+
+    spans.append((0, 100))
+    assert spans.overlaps((60, 70))
+    assert list(spans) == [(0, 100), (10, 20), (30, 40)]
+
+
+def test_index_is_shared_per_text():
+    text = _make_text(20, seed=3)
+    assert get_sentence_index(text) is get_sentence_index(text)
+    assert get_sentence_index(text + " ") is not get_sentence_index(text)
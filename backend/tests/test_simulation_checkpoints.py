@@ -0,0 +1,164 @@
+"""
+Tests for per-interview simulation checkpoints and resuming.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.api.research.simulation_bridge.models import (
+    BusinessContext,
+    InterviewResponse,
+    QuestionsData,
+    SimulatedInterview,
+    SimulatedPerson,
+    SimulationConfig,
+    Stakeholder,
+)
+from backend.api.research.simulation_bridge.services import (
+    orchestrator as orchestrator_module,
+)
+from backend.api.research.simulation_bridge.services import (
+    parallel_interview_simulator as simulator_module,
+)
+from backend.infrastructure.persistence.simulation_repository import (
+    SimulationRepository,
+)
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+
+STAKEHOLDER = Stakeholder(
+    id="s1", name="Finance Lead", description="Owns budgets", questions=["Why?"]
+)
+BUSINESS = BusinessContext(
+    business_idea="Invoice automation",
+    target_customer="SMB finance teams",
+    problem="Manual reconciliation",
+)
+
+
+def _persona(pid):
+    return SimulatedPerson(
+        id=pid,
+        name=f"Person {pid}",
+        age=40,
+        background="Finance",
+        motivations=["speed"],
+        pain_points=["spreadsheets"],
+        communication_style="direct",
+        stakeholder_type="Finance Lead",
+        demographic_details={},
+    )
+
+
+def _interview(pid):
+    return SimulatedInterview(
+        person_id=pid,
+        stakeholder_type="Finance Lead",
+        responses=[
+            InterviewResponse(
+                question="Why?", response="Because.", sentiment="neutral", key_insights=[]
+            )
+        ],
+        interview_duration_minutes=10,
+        overall_sentiment="neutral",
+        key_themes=["automation"],
+    )
+
+
+@pytest_asyncio.fixture
+async def session_factory(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(orchestrator_module, "SessionLocal", factory)
+    yield factory
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_resume_simulates_only_missing_personas(session_factory):
+    personas = [_persona(pid) for pid in ("p1", "p2", "p3")]
+    async with UnitOfWork(session_factory) as uow:
+        repo = SimulationRepository(uow.session)
+        await repo.create_simulation(
+            simulation_id="sim-1",
+            user_id="u1",
+            business_context=BUSINESS.model_dump(),
+            questions_data=QuestionsData(
+                stakeholders={"primary": [STAKEHOLDER]}
+            ).model_dump(),
+            simulation_config=SimulationConfig(people_per_stakeholder=3).model_dump(),
+        )
+        await repo.save_personas("sim-1", [p.model_dump() for p in personas])
+        await repo.save_interview("sim-1", "p1", _interview("p1").model_dump())
+        await uow.commit()
+
+    orchestrator = orchestrator_module.SimulationOrchestrator(use_parallel=True)
+    simulated = []
+
+    async def fake_simulate(persona, stakeholder, business_context, config, callback):
+        simulated.append(persona.id)
+        callback("done", 100)
+        return _interview(persona.id)
+
+    orchestrator.parallel_interview_simulator.simulate_interview_with_semaphore = (
+        fake_simulate
+    )
+
+    response = await orchestrator.resume_simulation("sim-1")
+
+    assert response.success, response.message
+    assert sorted(simulated) == ["p2", "p3"]
+    assert [i.person_id for i in response.interviews] == ["p1", "p2", "p3"]
+    assert response.metadata["resumed_interviews"] == 1
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = SimulationRepository(uow.session)
+        simulation = await repo.get_by_simulation_id("sim-1")
+        records = await repo.get_interviews("sim-1")
+        assert simulation.status == "completed"
+        assert simulation.total_interviews == 3
+        assert sorted(r.persona_id for r in records) == ["p1", "p2", "p3"]
+
+    again = await orchestrator.resume_simulation("sim-1")
+    assert not again.success
+    assert again.message == "Simulation already completed"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_a_bounded_lru(monkeypatch):
+    monkeypatch.setattr(simulator_module, "RESPONSE_CACHE_SIZE", 2)
+    simulator = simulator_module.ParallelInterviewSimulator(model=None)
+    calls = []
+
+    class Result:
+        def __init__(self, output):
+            self.output = output
+
+    async def fake_run(prompt, model_settings=None):
+        calls.append(prompt)
+        return Result(_interview("x"))
+
+    simulator.agent.run = fake_run
+    config = SimulationConfig()
+
+    async def simulate(pid, stakeholder=STAKEHOLDER):
+        return await simulator._simulate_interview_internal(
+            _persona(pid), stakeholder, BUSINESS, config
+        )
+
+    await simulate("p1")
+    await simulate("p2")
+    await simulate("p1")  # hit; p2 becomes least recently used
+    await simulate("p3")  # evicts p2
+    assert len(calls) == 3
+    assert [key[0] for key in simulator._response_cache] == ["p1", "p3"]
+
+    # A different question set for the same persona is a separate entry
+    other = STAKEHOLDER.model_copy(update={"questions": ["Why not?"]})
+    await simulate("p1", other)
+    assert len(calls) == 4
+    assert simulator.get_cache_stats()["cache_size"] == 2
@@ -0,0 +1,58 @@
+from backend.services.processing.persona_formation.speakers.partition import (
+    build_scoped_text,
+    merge_buckets,
+    partition_transcript,
+    strip_block_prefix,
+)
+
+
+def _key(seg):
+    return (
+        strip_block_prefix(seg.get("speaker_id") or ""),
+        seg.get("document_id") or "original_text",
+    )
+
+
+TRANSCRIPT = [
+    {"speaker_id": "Interviewer", "role": "Interviewer", "dialogue": "Why?", "document_id": "d1"},
+    {"speaker_id": "I1|Ana", "role": "Participant", "dialogue": "Because.", "document_id": "d1"},
+    {"metadata": {"source": "upload"}},
+    "not a segment",
+    {"speaker_id": "Ana", "role": "Participant", "dialogue": "Later.", "document_id": "d2"},
+    {"speaker_id": "I1|Ana", "role": "", "text": "Also.", "document_id": "d1"},
+    {"speaker_id": "Ana", "dialogue": "", "document_id": "d3"},
+]
+
+
+def test_partition_groups_by_key_in_transcript_order():
+    buckets = partition_transcript(TRANSCRIPT, key=_key)
+
+    assert list(buckets) == [
+        ("Interviewer", "d1"),
+        ("Ana", "d1"),
+        ("", "original_text"),
+        ("Ana", "d2"),
+        ("Ana", "d3"),
+    ]
+    ana_d1 = buckets[("Ana", "d1")]
+    assert [t.position for t in ana_d1.turns] == [1, 5]
+    assert [t.text for t in ana_d1.turns] == ["Because.", "Also."]
+    assert ana_d1.role_counts == {"participant": 2}
+    assert ana_d1.document_ids == {"d1": 2}
+
+
+def test_merged_scoped_text_and_doc_spans():
+    buckets = partition_transcript(TRANSCRIPT, key=_key)
+    ana = merge_buckets(
+        buckets[k] for k in [("Ana", "d3"), ("Ana", "d2"), ("Ana", "d1")]
+    )
+
+    text, spans = build_scoped_text(ana.turns)
+
+    assert text == "Because.\nAlso.\n\nLater.\n\n"
+    assert spans == [
+        {"document_id": "d1", "start": 0, "end": 14},
+        {"document_id": "d2", "start": 16, "end": 22},
+        {"document_id": "d3", "start": 24, "end": 24},
+    ]
+    assert ana.document_ids.most_common(1)[0][0] == "d1"
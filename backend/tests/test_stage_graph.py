@@ -0,0 +1,306 @@
+"""
+Tests for the analysis stage graph scheduler and its use in NLPProcessor.
+"""
+
+import asyncio
+import copy
+import json
+
+import pytest
+
+from backend.services.nlp.stage_graph import COMPLETED, DEGRADED, Stage, StageGraph
+
+
+def _sleeper(seconds, value, log=None, name=None):
+    async def run(deps):
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(("end", name))
+        return value(deps) if callable(value) else value
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap_to_critical_path():
+    graph = StageGraph(
+        [
+            Stage("theme", _sleeper(0.1, "themes")),
+            Stage("industry", _sleeper(0.05, "tech")),
+            Stage("pattern", _sleeper(0.1, lambda d: f"patterns:{d['industry']}"), ("industry",)),
+            Stage("persona", _sleeper(0.1, "personas"), ("industry",)),
+            Stage(
+                "insight",
+                _sleeper(0.05, lambda d: sorted(d)),
+                ("theme", "pattern", "persona"),
+            ),
+        ]
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await graph.run()
+    elapsed = loop.time() - started
+
+    assert results["pattern"] == "patterns:tech"
+    assert results["insight"] == ["pattern", "persona", "theme"]
+    # Critical path is industry -> pattern/persona -> insight = 0.2s; the sum is 0.4s
+    assert elapsed < 0.3
+    assert set(graph.outcomes.values()) == {COMPLETED}
+
+
+@pytest.mark.asyncio
+async def test_llm_budget_limits_concurrent_stages():
+    log = []
+    graph = StageGraph(
+        [
+            Stage("a", _sleeper(0.02, 1, log, "a")),
+            Stage("b", _sleeper(0.02, 2, log, "b")),
+            Stage("local", _sleeper(0.02, 3, log, "local"), uses_llm=False),
+        ],
+        max_concurrency=1,
+    )
+
+    await graph.run()
+
+    # "b" waits for the single budget slot; "local" does not need one
+    assert log.index(("end", "a")) < log.index(("start", "b"))
+    assert log.index(("start", "local")) < log.index(("end", "a"))
+
+
+@pytest.mark.asyncio
+async def test_timeout_falls_back_and_dependents_still_run():
+    graph = StageGraph(
+        [
+            Stage("pattern", _sleeper(5, "never"), timeout=0.01, on_error=lambda e: []),
+            Stage("insight", _sleeper(0, lambda d: d["pattern"]), ("pattern",)),
+        ]
+    )
+
+    results = await graph.run()
+
+    assert results == {"pattern": [], "insight": []}
+    assert graph.outcomes["pattern"] == DEGRADED
+
+
+@pytest.mark.asyncio
+async def test_required_stage_failure_cancels_remaining_stages():
+    cancelled = asyncio.Event()
+
+    async def slow(_deps):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def broken(_deps):
+        raise RuntimeError("LLM unavailable")
+
+    graph = StageGraph(
+        [
+            Stage("theme", broken),
+            Stage("persona", slow),
+            Stage("insight", _sleeper(0, "x"), ("theme", "persona")),
+        ]
+    )
+
+    with pytest.raises(RuntimeError, match="LLM unavailable"):
+        await graph.run()
+    assert cancelled.is_set()
+
+
+def test_invalid_graphs_are_rejected():
+    noop = _sleeper(0, None)
+    with pytest.raises(ValueError, match="unknown stage"):
+        StageGraph([Stage("a", noop, ("missing",))])
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([Stage("a", noop, ("b",)), Stage("b", noop, ("a",))])
+
+
+class _FakeLLM:
+    def __init__(self, order):
+        self.order = order
+        self.insight_payload = None
+
+    async def analyze(self, payload):
+        if payload["task"] == "theme_analysis_enhanced":
+            await asyncio.sleep(0.05)
+            self.order.append("themes")
+            return {
+                "themes": [
+                    {"name": "Manual work", "statements": ["We reconcile invoices by hand"]}
+                ]
+            }
+        if payload["task"] == "extract_insights":
+            self.insight_payload = copy.deepcopy(payload)
+            return {"insights": [{"topic": "Automation"}]}
+        raise AssertionError(f"unexpected task {payload['task']}")
+
+
+class _StreamingLLM(_FakeLLM):
+    """Streams themes the way EnhancedGeminiLLMService.analyze_stream does."""
+
+    async def analyze_stream(self, payload, item_key=None):
+        assert payload["task"] == "theme_analysis_enhanced"
+        self.order.append("themes")
+        yield {"name": "Manual work", "statements": ["We reconcile invoices by hand"]}
+        yield {"name": "Month-end crunch", "sentiment": -0.4}
+
+
+def _stub_stages(monkeypatch, processor, order):
+    async def detect_industry(text, llm_service):
+        order.append("industry")
+        return "finance"
+
+    async def extract_patterns(transcript, themes, industry):
+        order.append("patterns")
+        assert industry == "finance"
+        return {"patterns": [{"name": "Spreadsheet workarounds"}]}
+
+    async def generate_personas(combined_text, industry, llm_service, progress_callback=None):
+        order.append("personas")
+        return [{"name": "Controller"}]
+
+    async def passthrough(results, llm_service, config=None):
+        return results
+
+    monkeypatch.setattr(processor, "_detect_industry", detect_industry)
+    monkeypatch.setattr(processor, "extract_patterns", extract_patterns, raising=False)
+    monkeypatch.setattr(processor, "_generate_personas", generate_personas)
+    monkeypatch.setattr(processor, "extract_insights", passthrough)
+
+
+_DATA = {
+    "interviews": [
+        {"responses": [{"question": "How?", "answer": "We reconcile invoices by hand"}]}
+    ]
+}
+
+
+@pytest.mark.asyncio
+async def test_processor_runs_stages_through_graph(monkeypatch):
+    from backend.services.nlp.processor import NLPProcessor
+
+    processor = NLPProcessor()
+    order = []
+    llm = _FakeLLM(order)
+    _stub_stages(monkeypatch, processor, order)
+
+    results = await processor.process_interview_data(copy.deepcopy(_DATA), llm)
+
+    # Industry, patterns and personas finish while themes are still running
+    assert order[0] == "industry"
+    assert set(order[1:3]) == {"patterns", "personas"}
+    assert order[3] == "themes"
+    assert results["themes"][0]["name"] == "Manual work"
+    assert results["themes"][0]["statements_detailed"][0]["document_id"] == "interview_1"
+    assert "statements_detailed" not in llm.insight_payload["themes"][0]
+    assert llm.insight_payload["personas"] == [{"name": "Controller"}]
+    assert results["patterns"] == [{"name": "Spreadsheet workarounds"}]
+    assert results["insights"] == [{"topic": "Automation"}]
+    assert results["industry"] == "finance"
+    assert set(results["metadata"]["stage_outcomes"].values()) == {COMPLETED}
+
+
+@pytest.mark.asyncio
+async def test_processor_streams_themes_with_defaults(monkeypatch):
+    from backend.services.nlp import processor as processor_module
+
+    processor = processor_module.NLPProcessor()
+    llm = _StreamingLLM([])
+    _stub_stages(monkeypatch, processor, llm.order)
+    published = []
+
+    async def publish(analysis_id, kind, data=None):
+        if kind == "themes":
+            published.append(copy.deepcopy(data))
+
+    monkeypatch.setattr(processor_module, "publish_analysis_event", publish)
+
+    results = await processor.process_interview_data(copy.deepcopy(_DATA), llm, analysis_id=1)
+
+    # One partial per streamed theme, then the final list
+    assert [len(themes) for themes in published] == [1, 2, 2]
+    assert published[0][0]["frequency"] == 0.5
+    crunch = results["themes"][1]
+    assert crunch["name"] == "Month-end crunch"
+    assert crunch["sentiment"] == -0.4
+    assert (crunch["frequency"], crunch["statements"], crunch["keywords"], crunch["codes"]) == (
+        0.5,
+        [],
+        [],
+        [],
+    )
+    assert results["themes"][0]["statements_detailed"][0]["document_id"] == "interview_1"
+
+
+@pytest.mark.asyncio
+async def test_processor_builds_fallback_patterns_from_themes(monkeypatch):
+    from backend.services.nlp.processor import NLPProcessor
+
+    class _ThemedLLM(_FakeLLM):
+        async def analyze(self, payload):
+            if payload["task"] == "theme_analysis_enhanced":
+                return {
+                    "themes": [
+                        {
+                            "name": "Manual work",
+                            "definition": "Invoices are reconciled by hand",
+                            "statements": ["We reconcile invoices by hand"],
+                        }
+                    ]
+                }
+            if payload["task"] == "pattern_enhancement":
+                return {}
+            return await super().analyze(payload)
+
+    processor = NLPProcessor()
+    order = []
+    _stub_stages(monkeypatch, processor, order)
+
+    async def no_patterns(transcript, themes, industry):
+        return {"patterns": []}
+
+    monkeypatch.setattr(processor, "extract_patterns", no_patterns, raising=False)
+
+    results = await processor.process_interview_data(copy.deepcopy(_DATA), _ThemedLLM(order))
+
+    assert [p["name"] for p in results["patterns"]] == ["Pattern: Manual work"]
+    assert results["patterns"][0]["evidence"] == ["We reconcile invoices by hand"]
+
+
+@pytest.mark.asyncio
+async def test_processor_streams_themes_from_the_enhanced_themes_array(monkeypatch):
+    from backend.utils.json.incremental_parser import IncrementalJSONParser
+
+    response = json.dumps(
+        {
+            "keywords": ["invoice", "export"],
+            "enhanced_themes": [
+                {"name": "Manual work", "statements": ["We reconcile invoices by hand"]},
+                {"name": "Month-end crunch"},
+            ],
+        }
+    )
+
+    class _ChunkStreamingLLM(_FakeLLM):
+        """Streams the raw response through the parser, like the Gemini client."""
+
+        async def analyze_stream(self, payload, item_key=None):
+            parser = IncrementalJSONParser(item_key)
+            for start in range(0, len(response), 16):
+                for item in parser.feed(response[start : start + 16]):
+                    yield item
+
+    from backend.services.nlp.processor import NLPProcessor
+
+    processor = NLPProcessor()
+    llm = _ChunkStreamingLLM([])
+    _stub_stages(monkeypatch, processor, llm.order)
+
+    results = await processor.process_interview_data(copy.deepcopy(_DATA), llm)
+
+    assert [theme["name"] for theme in results["themes"]] == ["Manual work", "Month-end crunch"]
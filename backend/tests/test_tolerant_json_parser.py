@@ -0,0 +1,99 @@
+"""
+Tests for the single-pass tolerant JSON parser and the parsers built on it.
+"""
+
+import json
+
+import pytest
+
+from backend.utils.json.enhanced_json_repair import EnhancedJSONRepair
+from backend.utils.json.json_processor import JSONProcessor
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
+
+
+def test_valid_json_needs_no_repairs():
+    result = parse_tolerant('{"a": [1, 2.5, true, null], "b": "x"}')
+    assert result.value == {"a": [1, 2.5, True, None], "b": "x"}
+    assert result.repairs == {}
+    assert not result.truncated
+
+
+@pytest.mark.parametrize(
+    "text, expected, repairs",
+    [
+        (
+            'Sure:\n```json\n{"themes": [{"name": "Cost"}]}\n```',
+            {"themes": [{"name": "Cost"}]},
+            {"markdown_fence"},
+        ),
+        (
+            '{"a": [1, 2,], "b": 3,}',
+            {"a": [1, 2], "b": 3},
+            {"trailing_comma"},
+        ),
+        (
+            '{"a": "x"\n "b": [{"c": 1} {"c": 2}]}',
+            {"a": "x", "b": [{"c": 1}, {"c": 2}]},
+            {"missing_comma"},
+        ),
+        (
+            "{name: 'Ann', 'active': True, \"note\": 'it\\'s'}",
+            {"name": "Ann", "active": True, "note": "it's"},
+            {"unquoted_key", "single_quotes", "python_literal"},
+        ),
+        (
+            '{"quote": "She said "fine" and left", "n": 1}',
+            {"quote": 'She said "fine" and left', "n": 1},
+            {"unescaped_quote"},
+        ),
+        (
+            '{"a": {"b": [1, 2}, "c": 3}',
+            {"a": {"b": [1, 2]}, "c": 3},
+            {"mismatched_bracket"},
+        ),
+    ],
+)
+def test_common_llm_mistakes_are_repaired(text, expected, repairs):
+    result = parse_tolerant(text)
+    assert result.value == expected
+    assert set(result.repairs) == repairs
+
+
+def test_truncated_output_closes_open_containers():
+    result = parse_tolerant(
+        '{"personas": [{"name": "Ann", "goals": ["save time", "automate rep'
+    )
+    assert result.truncated
+    assert result.value == {
+        "personas": [{"name": "Ann", "goals": ["save time", "automate rep"]}]
+    }
+    assert result.repairs == {"unterminated_string": 1, "unclosed_container": 4}
+
+    # A half-written key or bare literal is dropped rather than guessed
+    result = parse_tolerant('{"a": 1, "b": [tr')
+    assert result.value == {"a": 1, "b": []}
+    result = parse_tolerant('{"a": 1, "bro')
+    assert result.value == {"a": 1}
+
+
+def test_text_without_json_raises():
+    with pytest.raises(TolerantJSONError):
+        parse_tolerant("I could not produce any output.")
+    # Callers that catch JSONDecodeError keep working
+    with pytest.raises(json.JSONDecodeError):
+        parse_tolerant("")
+
+
+def test_repair_json_and_processor_use_the_tolerant_parser():
+    text = '```json\n{"patterns": [{"name": "Manual export",}]\n```'
+
+    repaired = EnhancedJSONRepair.repair_json(text)
+    assert json.loads(repaired) == {"patterns": [{"name": "Manual export"}]}
+    assert EnhancedJSONRepair.repair_json('{"a": 1}') == '{"a": 1}'
+    assert EnhancedJSONRepair.parse_json("no json here", default_value=[]) == []
+
+    assert JSONProcessor.parse_patterns(text) == {
+        "patterns": [{"name": "Manual export"}]
+    }
+    with pytest.raises(ValueError):
+        JSONProcessor.parse(text, repair=False)
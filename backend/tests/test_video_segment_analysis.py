@@ -0,0 +1,108 @@
+import asyncio
+import importlib
+import os
+
+import pytest
+
+from backend.infrastructure.config.settings import settings
+
+
+@pytest.fixture(scope="module")
+def video_analysis():
+    """
+    Import the video analysis routes offline.
+
+    Importing the axpersona routes package builds the conversation routine
+    service at module level, which constructs a GeminiService and a PydanticAI
+    Google provider. Without a key the service is stubbed and the provider
+    gets a placeholder key; neither makes a request during these tests.
+    """
+    from backend.services.llm.gemini_service import GeminiService
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GeminiService, "__init__", lambda self, config=None: None)
+        if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
+            mp.setenv("GEMINI_API_KEY", "offline-test-key")
+        return importlib.import_module("backend.api.axpersona.routes.video_analysis")
+
+
+@pytest.fixture
+def analyzer(video_analysis, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    return video_analysis.GeminiVideoAnalyzer()
+
+
+@pytest.mark.asyncio
+async def test_segments_run_concurrently_and_merge_in_order(analyzer, monkeypatch):
+    monkeypatch.setattr(settings, "video_segment_concurrency", 2, raising=False)
+    in_flight = peak = 0
+
+    async def analyze_segment(start_offset, end_offset, segment_num, total_segments, total_duration, video_url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later segments finish first
+        await asyncio.sleep(0.01 * (total_segments - segment_num))
+        in_flight -= 1
+        if segment_num == 3:
+            raise RuntimeError("segment failed")
+        start = analyzer._seconds_to_timestamp(start_offset)
+        annotations = [{"timestamp_start": start, "description": f"Segment {segment_num}"}]
+        if segment_num == 2:
+            # Event at the 1/2 boundary reported by both segments
+            annotations.insert(0, {"timestamp_start": "04:58", "description": "Crowd  at gate"})
+        if segment_num == 1:
+            annotations.append({"timestamp_start": "04:55", "description": "crowd at gate"})
+        return annotations
+
+    result = await analyzer._analyze_segments(
+        1100, 300, analyze_segment, video_url="https://youtu.be/x"
+    )
+
+    assert peak == 2
+    assert [a["description"] for a in result] == [
+        "Segment 1",
+        "crowd at gate",
+        "Segment 2",
+        "Segment 4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_all_segments_failing_raises(analyzer):
+    async def analyze_segment(**kwargs):
+        raise RuntimeError("quota")
+
+    with pytest.raises(RuntimeError, match="quota"):
+        await analyzer._analyze_segments(900, 300, analyze_segment)
+
+
+@pytest.mark.asyncio
+async def test_metadata_lookup_is_shared_and_cached(analyzer, video_analysis, monkeypatch):
+    calls = []
+
+    async def fake_yt_dlp(url):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        if "bad" in url:
+            raise video_analysis.VideoMetadataError("not found")
+        return {"duration": 640.0}
+
+    monkeypatch.setattr(video_analysis, "_run_yt_dlp", fake_yt_dlp)
+    monkeypatch.setattr(video_analysis, "_metadata_cache", video_analysis.OrderedDict())
+    url = "https://youtu.be/abc"
+
+    first, second = await asyncio.gather(
+        video_analysis.fetch_video_metadata(url),
+        video_analysis.fetch_video_metadata(url),
+    )
+    assert first == second == {"duration": 640.0}
+    assert await analyzer._resolve_video_duration(url) == 640
+    assert calls == [url]
+
+    # Failures are not cached
+    for _ in range(2):
+        with pytest.raises(video_analysis.VideoMetadataError):
+            await video_analysis.fetch_video_metadata("https://youtu.be/bad")
+    assert calls.count("https://youtu.be/bad") == 2
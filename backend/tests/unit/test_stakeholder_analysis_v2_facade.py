@@ -358,3 +358,112 @@ class TestStakeholderAnalysisFacade:
             stakeholder_facade.report_assembler, StakeholderReportAssembler
         )
         assert isinstance(stakeholder_facade.validator, StakeholderAnalysisValidation)
+
+
+class TestConcurrentPhases:
+    """Phases after detection are scheduled concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_phases_after_detection_overlap_and_are_timed(
+        self, stakeholder_facade, sample_base_analysis, sample_files
+    ):
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        def slow(result):
+            async def _run(*args, **kwargs):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.05)
+                running -= 1
+                return result
+
+            return _run
+
+        with patch.object(
+            stakeholder_facade.detector,
+            "detect_stakeholders",
+            new=AsyncMock(return_value=[]),
+        ), patch.object(
+            stakeholder_facade.influence_calculator,
+            "analyze_patterns",
+            new=slow(CrossStakeholderPatterns()),
+        ), patch.object(
+            stakeholder_facade.report_assembler,
+            "generate_summary",
+            new=slow(
+                MultiStakeholderSummary(
+                    total_stakeholders=0, consensus_score=0.0, conflict_score=0.0
+                )
+            ),
+        ), patch.object(
+            stakeholder_facade.theme_analyzer,
+            "enhance_themes_with_attribution",
+            new=slow([]),
+        ), patch.object(
+            stakeholder_facade.evidence_aggregator,
+            "aggregate_evidence",
+            new=slow({}),
+        ), patch.object(
+            stakeholder_facade.report_assembler, "assemble_final_result"
+        ) as mock_assemble, patch.object(
+            stakeholder_facade.validator, "validate_analysis_result"
+        ) as mock_validate:
+            mock_assemble.return_value = sample_base_analysis
+            mock_validate.return_value = sample_base_analysis
+
+            await stakeholder_facade.enhance_analysis_with_stakeholder_intelligence(
+                sample_base_analysis, sample_files
+            )
+
+        # Patterns, themes and evidence run together; summary waits for patterns
+        assert peak == 3
+        intelligence = mock_assemble.call_args.kwargs["stakeholder_intelligence"]
+        timings = intelligence.processing_metadata["phase_timings"]
+        assert set(timings) == {
+            "detection",
+            "cross_patterns",
+            "summary",
+            "theme_attribution",
+            "evidence_aggregation",
+            "total",
+        }
+        assert timings["total"] < 0.15
+
+    @pytest.mark.asyncio
+    async def test_evidence_aggregation_fans_out_with_bound(
+        self, stakeholder_facade, sample_detected_stakeholders
+    ):
+        import asyncio
+
+        aggregator = stakeholder_facade.evidence_aggregator
+        aggregator.max_concurrency = 1
+        running = 0
+        peak = 0
+
+        async def fake(stakeholder, content, files):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"evidence_items": [{"text": stakeholder.stakeholder_id}]}
+
+        with patch.object(aggregator, "_aggregate_stakeholder_evidence", new=fake):
+            result = await aggregator.aggregate_evidence(
+                sample_detected_stakeholders, ["content"]
+            )
+        assert peak == 1
+        assert list(result["stakeholder_evidence"]) == ["stakeholder_1", "stakeholder_2"]
+        assert result["total_evidence_count"] == 2
+
+        aggregator.max_concurrency = 4
+        peak = 0
+        with patch.object(aggregator, "_aggregate_stakeholder_evidence", new=fake):
+            await aggregator.aggregate_evidence(
+                sample_detected_stakeholders, ["content"]
+            )
+        assert peak == 2
@@ -0,0 +1,252 @@
+"""
+Incremental JSON parsing of streamed LLM responses.
+
+``IncrementalJSONParser`` is fed the text chunks of a streaming response and
+returns each element of the response's item array (themes, patterns, personas,
+transcript segments) as soon as the element is complete, so callers can act
+on early items while the model is still generating the rest.
+
+The item array is the top-level array, the array under ``item_key`` in the
+top-level object, or, without a key, the first array-valued member of the
+top-level object. ``select_items`` applies the same rule to a parsed value.
+"""
+
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional
+
+from backend.utils.json.tolerant_parser import (
+    TolerantJSONError,
+    TolerantParseResult,
+    parse_tolerant,
+)
+
+_STRUCTURAL = re.compile(r'[\[\]{}",:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_ROOT_START = re.compile(r"[\[{]")
+_NON_SPACE = re.compile(r"\S")
+
+
+def select_items(value: Any, item_key: Optional[str] = None) -> List[Any]:
+    """Return the item array of a parsed response, or an empty list."""
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, dict):
+        return []
+    if item_key is not None:
+        items = value.get(item_key)
+        return items if isinstance(items, list) else []
+    for member in value.values():
+        if isinstance(member, list):
+            return member
+    return []
+
+
+class IncrementalJSONParser:
+    """
+    Emit the elements of a streamed JSON array as they complete.
+
+    Each chunk is scanned once; only the text of the element in progress is
+    kept for decoding. ``close`` parses the whole document tolerantly, which
+    also recovers a final element cut off by truncation.
+    """
+
+    def __init__(self, item_key: Optional[str] = None):
+        self.item_key = item_key
+        self.items_emitted = 0
+
+        self._chunks: List[str] = []
+        # Text not yet discarded, starting at absolute offset _base
+        self._buffer = ""
+        self._base = 0
+        self._pos = 0
+
+        self._stack: List[str] = []
+        self._in_string = False
+        self._string_start = -1
+        # Top-level object bookkeeping, to find the array under item_key
+        self._expect_key = False
+        self._key: Optional[str] = None
+        self._item_depth: Optional[int] = None
+        self._done = False
+        # Absolute offset of the element in progress, or -1
+        self._item_start = -1
+        self._await_item = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume the next chunk; returns the elements it completed."""
+        if not chunk:
+            return []
+        self._chunks.append(chunk)
+        if self._done:
+            return []
+        self._buffer += chunk
+        items: List[Any] = []
+        self._scan(items)
+        self._trim()
+        return items
+
+    def close(self) -> TolerantParseResult:
+        """
+        Parse the complete response text.
+
+        Raises:
+            TolerantJSONError: If the response contains no JSON at all
+        """
+        return parse_tolerant(self.text)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def _scan(self, items: List[Any]) -> None:
+        buffer, base = self._buffer, self._base
+        end = base + len(buffer)
+        pos = self._pos
+
+        while pos < end:
+            if self._await_item:
+                match = _NON_SPACE.search(buffer, pos - base)
+                if not match:
+                    pos = end
+                    break
+                self._await_item = False
+                if buffer[match.start()] != "]":
+                    self._item_start = base + match.start()
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos - base)
+                if not match:
+                    pos = end
+                    break
+                pos = base + match.end()
+                if match.group() == "\\":
+                    if pos >= end:
+                        # Resume on the escaped character with the next chunk
+                        pos -= 1
+                        break
+                    pos += 1
+                    continue
+                self._in_string = False
+                if self._string_start >= 0:
+                    self._key = json.loads(buffer[self._string_start - base : pos - base])
+                    self._string_start = -1
+                continue
+
+            if not self._stack:
+                match = _ROOT_START.search(buffer, pos - base)
+                if not match:
+                    pos = end
+                    break
+                char = match.group()
+                pos = base + match.end()
+                self._stack.append(char)
+                if char == "[":
+                    self._open_items()
+                self._expect_key = char == "{"
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos - base)
+            if not match:
+                pos = end
+                break
+            char = match.group()
+            pos = base + match.end()
+            depth = len(self._stack)
+
+            if char == '"':
+                self._in_string = True
+                if depth == 1 and self._expect_key:
+                    self._string_start = pos - 1
+            elif char in "{[":
+                if (
+                    depth == 1
+                    and char == "["
+                    and self._item_depth is None
+                    and self._stack[0] == "{"
+                    and (self.item_key is None or self._key == self.item_key)
+                ):
+                    self._stack.append(char)
+                    self._open_items()
+                    continue
+                self._stack.append(char)
+            elif char in "}]":
+                self._stack.pop()
+                depth -= 1
+                if depth == self._item_depth:
+                    self._emit(pos, items)
+                elif not self._stack or (
+                    self._item_depth is not None and depth < self._item_depth
+                ):
+                    # The item array or the whole document closed
+                    self._emit(pos - 1, items)
+                    self._done = True
+                    pos = end
+                    break
+            elif char == ",":
+                if depth == 1 and self._stack[0] == "{":
+                    self._expect_key = True
+                if depth == self._item_depth:
+                    self._emit(pos - 1, items)
+                    self._await_item = True
+            elif char == ":" and depth == 1:
+                self._expect_key = False
+
+        self._pos = pos
+
+    def _open_items(self) -> None:
+        self._item_depth = len(self._stack)
+        self._await_item = True
+
+    def _emit(self, end: int, items: List[Any]) -> None:
+        """Decode the element in progress, which ends before offset ``end``."""
+        if self._item_start < 0:
+            return
+        text = self._buffer[self._item_start - self._base : end - self._base].strip()
+        self._item_start = -1
+        if not text:
+            return
+        try:
+            value = json.loads(text)
+        except ValueError:
+            try:
+                value = parse_tolerant(text).value
+            except TolerantJSONError:
+                # Bare scalar the tolerant parser cannot place; close() keeps it
+                return
+        items.append(value)
+        self.items_emitted += 1
+
+    def _trim(self) -> None:
+        """Drop scanned text no longer needed for the element in progress."""
+        keep = self._pos
+        if self._item_start >= 0:
+            keep = min(keep, self._item_start)
+        if self._string_start >= 0:
+            keep = min(keep, self._string_start)
+        if keep > self._base:
+            self._buffer = self._buffer[keep - self._base :]
+            self._base = keep
+
+
+async def iter_json_items(
+    chunks: AsyncIterable[str], item_key: Optional[str] = None
+) -> AsyncIterator[Any]:
+    """
+    Yield the item array elements of a streamed JSON response.
+
+    Elements are yielded as soon as they complete; once the stream ends, any
+    element the incremental scan could not emit (a truncated last element)
+    is recovered from a tolerant parse of the whole response.
+    """
+    parser = IncrementalJSONParser(item_key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+
+    try:
+        result = parser.close()
+    except TolerantJSONError:
+        return
+    for item in select_items(result.value, item_key)[parser.items_emitted :]:
+        yield item
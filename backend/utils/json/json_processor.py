@@ -14,9 +14,9 @@ from pydantic import BaseModel, ValidationError
 from backend.utils.json.json_repair import (
     repair_json,
     repair_enhanced_themes_json,
-    parse_json_safely,
     parse_json_array_safely,
 )
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
 
 logger = logging.getLogger(__name__)
 
@@ -57,24 +57,29 @@ class JSONProcessor:
         if not json_str:
             return {}
 
-        try:
-            # First attempt: direct parsing
-            parsed = json.loads(json_str)
-
-            # Validate against schema if provided
-            if schema:
-                # TODO: Implement schema validation
-                pass
-
-            return parsed
-        except json.JSONDecodeError as e:
-            if not repair:
+        if not repair:
+            try:
+                parsed = json.loads(json_str)
+            except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON: {str(e)}")
-
-            logger.warning(f"Initial JSON parsing failed: {e}. Attempting repair.")
-
-            # Use existing repair functionality
-            return parse_json_safely(json_str, task_type=task_type)
+        else:
+            try:
+                result = parse_tolerant(json_str)
+            except TolerantJSONError as e:
+                logger.error(f"Failed to parse JSON even after repair: {e}")
+                return [] if json_str.strip().startswith("[") else {}
+            if result.repaired:
+                logger.warning(
+                    f"Repaired malformed JSON (task: {task_type}): {result.repairs}"
+                )
+            parsed = result.value
+
+        # Validate against schema if provided
+        if schema:
+            # TODO: Implement schema validation
+            pass
+
+        return parsed
 
     @staticmethod
     def validate(
@@ -210,7 +215,6 @@ class JSONProcessor:
             Parsed enhanced themes data
         """
         try:
-            # Use specialized repair for enhanced themes
             data = cls.parse(json_str, repair=True, task_type="theme_analysis_enhanced")
 
             # Check if we have an enhanced_themes array
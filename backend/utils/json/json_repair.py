@@ -10,6 +10,8 @@ import re
 import logging
 from typing import Any, Dict, List, Union, Optional
 
+from backend.utils.json.tolerant_parser import TolerantJSONError, parse_tolerant
+
 logger = logging.getLogger(__name__)
 
 def repair_json(json_str: str) -> str:
@@ -132,7 +134,7 @@ def parse_json_safely(json_str: str, default_type: str = "object", task_type: Op
     Args:
         json_str: The JSON string to parse
         default_type: The default type to return if parsing fails ("object" or "array")
-        task_type: Optional task type to use specialized repair functions
+        task_type: Optional task type, used for logging
 
     Returns:
         The parsed JSON object/array or an empty dict/list if parsing fails
@@ -144,37 +146,15 @@ def parse_json_safely(json_str: str, default_type: str = "object", task_type: Op
     logger.info(f"Attempting to parse JSON safely (first 100 chars): {json_str[:100]}...")
 
     try:
-        # First attempt: direct parsing
-        parsed = json.loads(json_str)
-        logger.info(f"Successfully parsed JSON directly: {type(parsed).__name__}")
-        return parsed
-    except json.JSONDecodeError as e:
-        logger.warning(f"Initial JSON parsing failed: {e}. Attempting repair.")
+        result = parse_tolerant(json_str)
+    except TolerantJSONError as e:
+        logger.error(f"Failed to parse JSON even after repair: {e}")
+        return {} if default_type == "object" else []
 
-        # Second attempt: repair and parse
-        try:
-            # Use specialized repair function if task_type is provided
-            if task_type == "theme_analysis_enhanced":
-                repaired = repair_enhanced_themes_json(json_str)
-            else:
-                repaired = repair_json(json_str)
-
-            parsed = json.loads(repaired)
-            logger.info(f"Successfully parsed JSON after repair: {type(parsed).__name__}")
-            return parsed
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON even after repair: {e}")
-
-            # Determine what type of structure we should return based on the content
-            if json_str.strip().startswith('['):
-                logger.warning("JSON appears to be an array. Returning empty array.")
-                return []
-            else:
-                logger.warning("JSON appears to be an object. Returning empty object.")
-                return {}
-        except Exception as e:
-            logger.error(f"Unexpected error during JSON repair: {e}")
-            return {} if default_type == "object" else []
+    if result.repaired:
+        logger.warning(f"Repaired malformed JSON (task: {task_type}): {result.repairs}")
+    logger.info(f"Successfully parsed JSON: {type(result.value).__name__}")
+    return result.value
 
 
 def parse_json_array_safely(json_str: str) -> List[Any]:
@@ -0,0 +1,351 @@
+"""
+Single-pass tolerant JSON parser for LLM output.
+
+The parser walks the text once with an explicit container stack and builds the
+Python objects directly, absorbing the mistakes LLMs commonly make instead of
+rewriting the whole string with regexes and retrying ``json.loads``:
+
+- markdown code fences and prose around the JSON value
+- trailing, missing, or doubled commas, and missing colons
+- single-quoted strings, unquoted keys and bare-word values
+- Python literals (``True``, ``False``, ``None``)
+- raw newlines and other control characters inside strings
+- mismatched closing brackets
+- truncated output, by closing the open string and containers
+
+Well-formed JSON, and every well-formed object or array nested inside broken
+JSON, is decoded by the C scanner; the Python loop only walks the containers
+that need repair. Every repair applied is counted in the report.
+"""
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, Dict, List, Optional, Tuple
+
+_DECODER = json.JSONDecoder()
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.])")
+_WORD = re.compile(r"-?[A-Za-z_$][\w$]*")
+_UNQUOTED_KEY = re.compile(r"[^\s:,{}\[\]\"']+")
+_BARE_VALUE = re.compile(r"[^,\]}\n]+")
+_CONTROL = re.compile(r"[\x00-\x1f]")
+_STRING_RUN = {'"': re.compile(r'[^"\\]+'), "'": re.compile(r"[^'\\]+")}
+_HEX4 = re.compile(r"[0-9a-fA-F]{4}")
+_VALUE_START = re.compile(r"[\w\"'{\[$-]")
+# A quote followed by more words on the same line is part of the text
+_INNER_QUOTE = re.compile(r"[ \t]*[\w(]")
+_FENCE_TAG = re.compile(r"^[\w-]*")
+
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS = {
+    "true": (True, None),
+    "false": (False, None),
+    "null": (None, None),
+    "NaN": (float("nan"), None),
+    "Infinity": (float("inf"), None),
+    "-Infinity": (float("-inf"), None),
+    "True": (True, "python_literal"),
+    "False": (False, "python_literal"),
+    "None": (None, "python_literal"),
+}
+
+# Parser states for the innermost open container
+_KEY, _COLON, _VALUE, _COMMA = range(4)
+
+
+class TolerantJSONError(json.JSONDecodeError):
+    """Raised when the text holds no JSON object or array to recover."""
+
+
+@dataclass
+class TolerantParseResult:
+    """Parsed value plus a count of each repair needed to produce it."""
+
+    value: Any
+    repairs: Dict[str, int] = field(default_factory=dict)
+    truncated: bool = False
+
+    @property
+    def repaired(self) -> bool:
+        return bool(self.repairs)
+
+
+def parse_tolerant(text: str) -> TolerantParseResult:
+    """
+    Parse possibly malformed JSON in a single pass.
+
+    Args:
+        text: Raw LLM output, optionally fenced or surrounded by prose
+
+    Returns:
+        TolerantParseResult with the decoded value and the repair report
+
+    Raises:
+        TolerantJSONError: If no object or array can be found in the text
+    """
+    if not isinstance(text, str):
+        raise TolerantJSONError("Expected a string", str(text), 0)
+
+    try:
+        return TolerantParseResult(json.loads(text))
+    except ValueError:
+        pass
+
+    repairs: Counter = Counter()
+    start = _find_start(text, repairs)
+
+    # Valid JSON wrapped in fences or prose still decodes in C
+    try:
+        value, end = _DECODER.raw_decode(text, start)
+    except ValueError:
+        value, end, truncated = _Parser(text, repairs).parse(start)
+    else:
+        truncated = False
+
+    if not truncated:
+        trailing = text[end:].strip().strip("`").strip()
+        if trailing:
+            repairs["trailing_text"] += 1
+    return TolerantParseResult(value, dict(repairs), truncated)
+
+
+def _find_start(text: str, repairs: Counter) -> int:
+    """Locate the first object or array, recording what was skipped before it."""
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise TolerantJSONError("No JSON object or array found", text, 0)
+    start = min(starts)
+    prefix = text[:start]
+    if "```" in prefix:
+        repairs["markdown_fence"] += 1
+        prefix = _FENCE_TAG.sub("", prefix[prefix.rfind("```") + 3 :])
+    if prefix.strip():
+        repairs["leading_text"] += 1
+    return start
+
+
+class _Parser:
+    """Stack machine over one text; see ``parse_tolerant``."""
+
+    def __init__(self, text: str, repairs: Counter):
+        self.text = text
+        self.length = len(text)
+        self.repairs = repairs
+
+    def parse(self, start: int) -> Tuple[Any, int, bool]:
+        """Parse the container opening at ``start``; returns (value, end, truncated)."""
+        text, length, repairs = self.text, self.length, self.repairs
+        root: Any = {} if text[start] == "{" else []
+        stack: List[Any] = [root]
+        state = _KEY if isinstance(root, dict) else _VALUE
+        after_comma = False
+        key: Optional[str] = None
+        pos = start + 1
+
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= length:
+                break
+            char = text[pos]
+            container = stack[-1]
+            in_object = isinstance(container, dict)
+
+            if char in "}]":
+                if state in (_COLON, _VALUE) and key is not None:
+                    repairs["missing_value"] += 1
+                    key = None
+                elif after_comma:
+                    repairs["trailing_comma"] += 1
+                closer = "}" if in_object else "]"
+                if char == closer:
+                    pos += 1
+                else:
+                    repairs["mismatched_bracket"] += 1
+                    # Leave the bracket for an outer container it does match
+                    if not any(
+                        isinstance(outer, dict) == (char == "}") for outer in stack[:-1]
+                    ):
+                        pos += 1
+                stack.pop()
+                if not stack:
+                    return root, pos, False
+                state, after_comma = _COMMA, False
+                continue
+
+            if state == _COMMA:
+                if char == ",":
+                    pos += 1
+                    state = _KEY if in_object else _VALUE
+                    after_comma = True
+                elif _VALUE_START.match(char):
+                    repairs["missing_comma"] += 1
+                    state = _KEY if in_object else _VALUE
+                    after_comma = False
+                else:
+                    repairs["stray_character"] += 1
+                    pos += 1
+                continue
+
+            if char == ",":
+                if key is not None:
+                    repairs["missing_value"] += 1
+                    key = None
+                else:
+                    repairs["extra_comma"] += 1
+                pos += 1
+                state = _KEY if in_object else _VALUE
+                after_comma = True
+                continue
+
+            if state == _KEY:
+                if char == '"' or char == "'":
+                    key, pos, closed = self._string(pos)
+                    if not closed:
+                        key = None
+                        break
+                else:
+                    match = _UNQUOTED_KEY.match(text, pos)
+                    if not match:
+                        repairs["stray_character"] += 1
+                        pos += 1
+                        continue
+                    repairs["unquoted_key"] += 1
+                    key, pos = match.group(), match.end()
+                state = _COLON
+                continue
+
+            if state == _COLON:
+                if char == ":":
+                    pos += 1
+                else:
+                    repairs["missing_colon"] += 1
+                state = _VALUE
+                continue
+
+            # state == _VALUE
+            after_comma = False
+            if char == "{" or char == "[":
+                # Well-formed subtrees decode in C; only broken ones are walked here
+                try:
+                    value, pos = _DECODER.raw_decode(text, pos)
+                except ValueError:
+                    pass
+                else:
+                    if in_object:
+                        container[key] = value
+                        key = None
+                    else:
+                        container.append(value)
+                    state = _COMMA
+                    continue
+                child: Any = {} if char == "{" else []
+                if in_object:
+                    container[key] = child
+                    key = None
+                else:
+                    container.append(child)
+                stack.append(child)
+                state = _KEY if char == "{" else _VALUE
+                pos += 1
+                continue
+
+            value, pos, complete = self._scalar(pos)
+            if not complete and value is _INCOMPLETE:
+                break
+            if in_object:
+                container[key] = value
+                key = None
+            else:
+                container.append(value)
+            if not complete:
+                break
+            state = _COMMA
+
+        repairs["unclosed_container"] += len(stack)
+        return root, length, True
+
+    def _string(self, pos: int, is_value: bool = False) -> Tuple[str, int, bool]:
+        """Read a quoted string at ``pos``; returns (value, end, closed)."""
+        text = self.text
+        quote = text[pos]
+        chunks = []
+        i = pos + 1
+        if quote == '"':
+            while True:
+                try:
+                    value, end = scanstring(text, i, False)
+                except ValueError:
+                    break
+                if _CONTROL.search(text, i, end):
+                    self.repairs["control_character"] += 1
+                if is_value and _INNER_QUOTE.match(text, end):
+                    self.repairs["unescaped_quote"] += 1
+                    chunks.append(value + '"')
+                    i = end
+                    continue
+                chunks.append(value)
+                return "".join(chunks), end, True
+        else:
+            self.repairs["single_quotes"] += 1
+
+        run = _STRING_RUN[quote]
+        while i < self.length:
+            match = run.match(text, i)
+            if match:
+                chunks.append(match.group())
+                i = match.end()
+                continue
+            if text[i] == quote:
+                return "".join(chunks), i + 1, True
+            # Backslash escape; unknown escapes keep the escaped character
+            if i + 1 >= self.length:
+                break
+            escaped = text[i + 1]
+            if escaped == "u" and _HEX4.match(text, i + 2):
+                chunks.append(chr(int(text[i + 2 : i + 6], 16)))
+                i += 6
+                continue
+            if escaped not in _ESCAPES and escaped not in "\"'\\/":
+                self.repairs["invalid_escape"] += 1
+            chunks.append(_ESCAPES.get(escaped, escaped))
+            i += 2
+
+        self.repairs["unterminated_string"] += 1
+        return "".join(chunks), self.length, False
+
+    def _scalar(self, pos: int) -> Tuple[Any, int, bool]:
+        """Read a string, number, literal or bare word; returns (value, end, complete)."""
+        text = self.text
+        char = text[pos]
+        if char == '"' or char == "'":
+            return self._string(pos, is_value=True)
+
+        match = _NUMBER.match(text, pos)
+        if match:
+            number = match.group()
+            end = match.end()
+            if "." in number or "e" in number or "E" in number:
+                return float(number), end, True
+            return int(number), end, True
+
+        match = _WORD.match(text, pos)
+        if match and match.group() in _LITERALS:
+            value, repair = _LITERALS[match.group()]
+            if repair:
+                self.repairs[repair] += 1
+            return value, match.end(), True
+
+        match = _BARE_VALUE.match(text, pos)
+        end = match.end()
+        if end >= self.length:
+            # A bare word cut off by truncation cannot be trusted
+            return _INCOMPLETE, end, False
+        self.repairs["unquoted_value"] += 1
+        return match.group().strip(), end, True
+
+
+_INCOMPLETE = object()
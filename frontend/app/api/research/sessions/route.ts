@@ -99,7 +99,8 @@ export async function GET(request: NextRequest) {
         }
       }
 
-      return { ...session, messages, message_count: messages.length };
+      // The backend list carries no message bodies, only the stored count
+      return { ...session, messages, message_count: session.message_count ?? messages.length };
     }));
 
     return NextResponse.json(convertedSessions, {
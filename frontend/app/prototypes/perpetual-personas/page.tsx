@@ -29,6 +29,12 @@ interface Persona {
     structured_demographics?: any;
 }
 
+// Generated images are stored as backend asset paths (/api/personas/assets/<sha256>)
+function resolveAssetUrl(baseUrl: string, value?: string | null): string | null {
+    if (!value) return null;
+    return value.startsWith('/api/') ? `${baseUrl.replace(/\/$/, '')}${value}` : value;
+}
+
 interface AnalysisResultItem {
     result_id: number;
     label: string;
@@ -259,7 +265,7 @@ function PersonaCard({ persona, useBackend, config, onViewImage }: { persona: Pe
     const { toast } = useToast();
 
     useEffect(() => {
-        if (persona.avatar_data_uri) setAvatarUrl(persona.avatar_data_uri);
+        if (persona.avatar_data_uri) setAvatarUrl(resolveAssetUrl(config.baseUrl, persona.avatar_data_uri));
         if (persona.quote) setQuote(persona.quote);
         if (persona.city_profile || persona.berlin_profile) setCityProfile(persona.city_profile || persona.berlin_profile);
         if (persona.food_images) setFoodImages(persona.food_images);
@@ -283,7 +289,7 @@ function PersonaCard({ persona, useBackend, config, onViewImage }: { persona: Pe
             });
             const data = await res.json();
             if (data.avatar_data_uri) {
-                setAvatarUrl(data.avatar_data_uri);
+                setAvatarUrl(resolveAssetUrl(config.baseUrl, data.avatar_data_uri));
                 toast({ title: "Avatar Generated", description: `New look for ${persona.name}` });
             }
         } catch (e) {
@@ -435,7 +441,7 @@ function PersonaCard({ persona, useBackend, config, onViewImage }: { persona: Pe
                                 if (recs.length === 0) return null;
                                 const r = recs[0]; // Just show first for prototype
                                 const imageKey = getFoodImageKey(meal, r.name, r.typical_order, r.drink);
-                                const imageUrl = foodImages[imageKey];
+                                const imageUrl = resolveAssetUrl(config.baseUrl, foodImages[imageKey]) ?? undefined;
 
                                 return (
                                     <div key={meal} className="bg-slate-50 dark:bg-slate-800/50 rounded-lg p-3 border border-slate-100 dark:border-slate-700">
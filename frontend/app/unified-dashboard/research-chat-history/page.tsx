@@ -65,6 +65,11 @@ import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle } f
 import { ScrollArea } from '@/components/ui/scroll-area';
 
 
+// Backend list items carry counts instead of message bodies; local sessions keep their messages
+const getMessageCount = (session: ResearchSession): number =>
+  session.message_count ?? session.messages?.length ?? 0;
+
+
 export default function ResearchChatHistory() {
   const router = useRouter();
   const { showToast } = useToast();
@@ -143,7 +148,7 @@ export default function ResearchChatHistory() {
         }
 
         const hasBusinessIdea = session.business_idea && session.business_idea.trim().length > 0;
-        const hasMessages = session.messages && session.messages.length > 1;
+        const hasMessages = getMessageCount(session) > 1;
         return hasBusinessIdea && hasMessages;
       });
       setSessions(sessionsWithQuestionnaires);
@@ -219,8 +224,13 @@ export default function ResearchChatHistory() {
               console.error(`Error loading local session ${session.session_id}:`, error);
               stats[session.session_id] = { questions: 0, stakeholders: 0 };
             }
+          } else if (session.question_count !== undefined) {
+            // Backend sessions come with counts maintained on write
+            stats[session.session_id] = {
+              questions: session.question_count,
+              stakeholders: session.stakeholder_count ?? 0,
+            };
           } else {
-            // For backend sessions, use the session data we already have
             stats[session.session_id] = calculateQuestionnaireStats(session);
           }
         }
@@ -248,7 +258,7 @@ export default function ResearchChatHistory() {
         questions_generated: session.questions_generated,
         status: session.status,
         stage: session.stage,
-        hasMessages: session.messages?.length || 0,
+        hasMessages: getMessageCount(session),
         hasQuestionnaireMessage: session.messages?.some(msg =>
           msg.content === 'COMPREHENSIVE_QUESTIONS_COMPONENT' ||
           msg.metadata?.comprehensiveQuestions
@@ -301,7 +311,7 @@ export default function ResearchChatHistory() {
         const existingStable = stableSessionData.get(session.session_id);
         if (existingStable &&
             existingStable.questions_generated === session.questions_generated &&
-            existingStable.messages?.length === session.messages?.length) {
+            getMessageCount(existingStable) === getMessageCount(session)) {
           // Keep stable version to prevent flickering
           newStableData.set(session.session_id, existingStable);
           console.log(`📋 Using stable data for session: ${session.session_id}`);
@@ -320,14 +330,14 @@ export default function ResearchChatHistory() {
             questions_generated: session.questions_generated,
             status: session.status,
             stage: session.stage,
-            messages_count: session.messages?.length || 0,
+            messages_count: getMessageCount(session),
             has_questionnaire_message: session.messages?.some(msg =>
               msg.content === 'COMPREHENSIVE_QUESTIONS_COMPONENT' ||
               msg.metadata?.comprehensiveQuestions
             ),
             using_stable_data: existingStable &&
               existingStable.questions_generated === session.questions_generated &&
-              existingStable.messages?.length === session.messages?.length
+              getMessageCount(existingStable) === getMessageCount(session)
           });
         }
       });
@@ -359,7 +369,7 @@ export default function ResearchChatHistory() {
 
         // Include sessions with any meaningful content (more inclusive)
         const hasBusinessIdea = session.business_idea && session.business_idea.trim().length > 0;
-        const hasMessages = session.messages && session.messages.length > 0; // Any messages
+        const hasMessages = getMessageCount(session) > 0; // Any messages
         const hasTargetCustomer = session.target_customer && session.target_customer.trim().length > 0;
         const hasProblem = session.problem && session.problem.trim().length > 0;
 
@@ -376,7 +386,7 @@ export default function ResearchChatHistory() {
           session_id: debugSession.session_id,
           business_idea: debugSession.business_idea || 'N/A',
           questions_generated: debugSession.questions_generated,
-          messages_count: debugSession.messages?.length || 0,
+          messages_count: getMessageCount(debugSession),
           included_in_questionnaire_filter: sessionsWithQuestionnaires.some(s => s.session_id === debugSession.session_id)
         });
       } else {
@@ -893,7 +903,7 @@ export default function ResearchChatHistory() {
                             <div className="flex items-center gap-4 text-sm text-muted-foreground">
                               <span className="flex items-center gap-1">
                                 <MessageSquare className="h-3 w-3" />
-                                {session.message_count || session.messages?.length || 0} messages
+                                {getMessageCount(session)} messages
                               </span>
 
                               {stage.questionnaire && (
@@ -143,6 +143,8 @@ export interface ResearchSession {
   updated_at: string;
   completed_at?: string;
   message_count?: number;
+  question_count?: number; // Maintained by the backend; list items carry no messages
+  stakeholder_count?: number;
   messages?: Message[]; // For local storage
   conversation_context?: string; // Short executive summary/narrative for sidebar
   isLocal?: boolean; // Flag to indicate local storage
@@ -1290,6 +1292,8 @@ export async function getResearchSessions(limit: number = 20, userId?: string):
           updated_at: session.updated_at,
           completed_at: session.completed_at,
           message_count: session.message_count,
+          question_count: session.question_count,
+          stakeholder_count: session.stakeholder_count,
           messages: messages,
           isLocal: false
         };